@@ -0,0 +1,33 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _import_bundle() -> None:
+    """Put the ``acmake`` package embedded in ``tools/arduino_cmake.py`` on ``sys.path``."""
+    spec = importlib.util.spec_from_file_location("arduino_cmake", REPO_ROOT / "tools" / "arduino_cmake.py")
+    portable = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(portable)
+    zip_path = portable._bundle_zip()
+    if zip_path not in sys.path:
+        sys.path.insert(0, zip_path)
+
+
+_import_bundle()
+
+
+@pytest.fixture
+def write(tmp_path):
+    """Write *text* to *name* under ``tmp_path`` (parents created) and return its path."""
+
+    def _write(name: str, text: str = "") -> Path:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    return _write
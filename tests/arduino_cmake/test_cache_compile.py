@@ -0,0 +1,49 @@
+import os
+
+from acmake.cache_compile import _write_pch_key, pch_identity
+
+
+def test_pch_identity_missing(tmp_path):
+    assert pch_identity(str(tmp_path / "Arduino.h.gch")) == "missing"
+
+
+def test_pch_identity_without_key_uses_stat(tmp_path):
+    gch = tmp_path / "Arduino.h.gch"
+    gch.write_bytes(b"pch")
+    st = gch.stat()
+    assert pch_identity(str(gch)) == f"stat:{st.st_size}:{st.st_mtime_ns}"
+
+
+def test_pch_identity_uses_recorded_key(tmp_path):
+    gch = tmp_path / "Arduino.h.gch"
+    gch.write_bytes(b"pch")
+    _write_pch_key(gch, "abc123")
+    assert pch_identity(str(gch)) == "abc123"
+
+
+def test_pch_identity_ignores_stale_key(tmp_path):
+    gch = tmp_path / "Arduino.h.gch"
+    gch.write_bytes(b"pch")
+    _write_pch_key(gch, "abc123")
+    # Rebuilt (or touched) after the key was recorded: the key no longer stands for it.
+    gch.write_bytes(b"rebuilt pch")
+    st = gch.stat()
+    os.utime(gch, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    st = gch.stat()
+    assert pch_identity(str(gch)) == f"stat:{st.st_size}:{st.st_mtime_ns}"
+
+
+def test_pch_identity_ignores_malformed_key(tmp_path):
+    gch = tmp_path / "Arduino.h.gch"
+    gch.write_bytes(b"pch")
+    (tmp_path / "Arduino.h.gch.key").write_text("garbage\n", encoding="utf-8")
+    assert pch_identity(str(gch)).startswith("stat:")
+
+
+def test_write_pch_key_without_key_drops_stamp(tmp_path):
+    gch = tmp_path / "Arduino.h.gch"
+    gch.write_bytes(b"pch")
+    _write_pch_key(gch, "abc123")
+    _write_pch_key(gch, None)
+    assert not (tmp_path / "Arduino.h.gch.key").exists()
+    assert pch_identity(str(gch)).startswith("stat:")
@@ -0,0 +1,71 @@
+from acmake.ninja_log import NinjaLogEntry, last_ninja_run, mark_ninja_run
+
+HEADER = "# ninja log v6\n"
+
+
+def _entry(start: int, end: int, output: str) -> str:
+    return f"{start}\t{end}\t0\t{output}\t{output}hash\n"
+
+
+def _append(path, text: str) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_last_ninja_run_without_mark(tmp_path):
+    (tmp_path / ".ninja_log").write_text(HEADER + _entry(0, 5, "a.o"), encoding="utf-8")
+    assert last_ninja_run(tmp_path) is None
+
+
+def test_last_ninja_run_first_run(tmp_path):
+    mark_ninja_run(tmp_path)
+    (tmp_path / ".ninja_log").write_text(HEADER + _entry(0, 5, "a.o") + _entry(1, 9, "b.o"), encoding="utf-8")
+    assert last_ninja_run(tmp_path) == [
+        NinjaLogEntry(0, 5, 0, "a.o", "a.ohash"),
+        NinjaLogEntry(1, 9, 0, "b.o", "b.ohash"),
+    ]
+
+
+def test_last_ninja_run_only_new_entries(tmp_path):
+    log = tmp_path / ".ninja_log"
+    log.write_text(HEADER + _entry(0, 5, "a.o"), encoding="utf-8")
+    mark_ninja_run(tmp_path)
+    _append(log, _entry(0, 3, "b.o"))
+    assert [e.output for e in last_ninja_run(tmp_path)] == ["b.o"]
+
+
+def test_last_ninja_run_no_work(tmp_path):
+    log = tmp_path / ".ninja_log"
+    log.write_text(HEADER + _entry(0, 5, "a.o"), encoding="utf-8")
+    mark_ninja_run(tmp_path)
+    assert last_ninja_run(tmp_path) == []
+
+
+def test_last_ninja_run_log_replaced(tmp_path):
+    log = tmp_path / ".ninja_log"
+    log.write_text(HEADER + _entry(0, 5, "a.o") + _entry(0, 6, "a.o"), encoding="utf-8")
+    mark_ninja_run(tmp_path)
+    # Recompaction writes a new (here shorter) file in place of the old one.
+    replacement = tmp_path / ".ninja_log.tmp"
+    replacement.write_text(HEADER + _entry(0, 6, "a.o"), encoding="utf-8")
+    replacement.replace(log)
+    assert last_ninja_run(tmp_path) is None
+
+
+def test_last_ninja_run_log_replaced_same_size(tmp_path):
+    log = tmp_path / ".ninja_log"
+    log.write_text(HEADER + _entry(0, 5, "a.o"), encoding="utf-8")
+    mark_ninja_run(tmp_path)
+    # Keep the old file alive so the replacement cannot reuse its inode.
+    old = tmp_path / "old_log"
+    log.rename(old)
+    log.write_text(HEADER + _entry(0, 7, "b.o"), encoding="utf-8")
+    assert last_ninja_run(tmp_path) is None
+
+
+def test_last_ninja_run_skips_malformed_lines(tmp_path):
+    log = tmp_path / ".ninja_log"
+    log.write_text(HEADER, encoding="utf-8")
+    mark_ninja_run(tmp_path)
+    _append(log, "truncated\tline\n" + "x\t1\t0\tc.o\th\n" + _entry(2, 4, "d.o"))
+    assert [e.output for e in last_ninja_run(tmp_path)] == ["d.o"]
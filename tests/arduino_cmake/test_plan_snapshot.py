@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import pytest
+
+from acmake.build import BuildPlan
+from acmake.config import ArduinoPaths
+from acmake.fqbn import FQBN
+from acmake.libraries import Library, LibraryTree
+from acmake.plan_snapshot import _collect_inputs
+
+
+@pytest.fixture
+def plan(tmp_path, write, monkeypatch):
+    root = tmp_path / "hardware" / "vendor" / "arch"
+    write("hardware/vendor/arch/platform.txt", "name=Test\n")
+    write("hardware/vendor/arch/boards.txt", "board.name=Board\n")
+    write("hardware/vendor/arch/cores/core/Arduino.h")
+    write("hardware/vendor/arch/variants/board/pins_arduino.h")
+    write("hardware/vendor/arch/partitions.csv", "nvs, data, nvs, 0x9000, 0x5000\n")
+
+    write("Sketch/Sketch.ino", "void setup() {}\nvoid loop() {}\n")
+    write("Sketch/src/helper.h", "#pragma once\n")
+    write("Sketch/.git/HEAD", "ref: refs/heads/main\n")
+    write("Sketch/build/Sketch.ino.bin")
+    write("Sketch/out/CMakeLists.txt")
+
+    write("user/libraries/Used/library.properties", "name=Used\n")
+    write("user/libraries/Used/src/Used.cpp")
+    write("user/libraries/Other/library.properties", "name=Other\n")
+    write("user/libraries/Other/src/Other.cpp")
+
+    used = Library(tmp_path / "user/libraries/Used", "Used", "*", (), None)
+    # The library scan skips ``tmp`` path components, and its trees are process-wide.
+    tree = LibraryTree(
+        headers=(),
+        sources=(str(used.root / "src" / "Used.cpp"),),
+        dirs=((str(used.root / "src"), 0),),
+    )
+    monkeypatch.setattr("acmake.plan_snapshot.known_library_trees", lambda: [tree])
+    monkeypatch.setattr("acmake.plan_snapshot.library_tree", lambda lib: tree)
+    return BuildPlan(
+        fqbn=FQBN.parse("vendor:arch:board"),
+        platform_root=root,
+        sketch_dir=tmp_path / "Sketch",
+        build_dir=tmp_path / "Sketch" / "out",
+        expanded={
+            "build.core.path": str(root / "cores" / "core"),
+            "build.variant.path": str(root / "variants" / "board"),
+            "recipe.hooks.prebuild.1.pattern": f"cp {root / 'partitions.csv'} {tmp_path / 'Sketch' / 'out'}",
+        },
+        libraries=[used],
+    )
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return ArduinoPaths(data_dir=tmp_path / "data", user_dir=tmp_path / "user")
+
+
+def test_collect_inputs_files(tmp_path, plan, paths):
+    files, _dirs = _collect_inputs(plan, paths)
+    assert files == sorted(files)
+    seen = {Path(p).relative_to(tmp_path).as_posix(): (size, mtime) for p, size, mtime in files}
+    for name in (
+        "hardware/vendor/arch/platform.txt",
+        "hardware/vendor/arch/boards.txt",
+        "hardware/vendor/arch/partitions.csv",
+        "Sketch/Sketch.ino",
+        "Sketch/src/helper.h",
+        "Sketch/out/CMakeLists.txt",
+        "user/libraries/Used/library.properties",
+        "user/libraries/Other/library.properties",
+        "user/libraries/Used/src/Used.cpp",
+    ):
+        assert name in seen, name
+        assert seen[name][0] >= 0, name
+    # Files that do not exist yet are recorded as missing, so creating one is a change.
+    assert seen["hardware/vendor/arch/platform.local.txt"] == (-1, -1)
+    assert seen["Sketch/out/build_opt.h"] == (-1, -1)
+    # Not inputs: hidden folders, the export folder and sources of unlinked libraries.
+    assert "Sketch/.git/HEAD" not in seen
+    assert "Sketch/build/Sketch.ino.bin" not in seen
+    assert "user/libraries/Other/src/Other.cpp" not in seen
+
+
+def test_collect_inputs_dirs(tmp_path, plan, paths):
+    _files, dirs = _collect_inputs(plan, paths)
+    assert dirs == sorted(dirs)
+    seen = {Path(p).relative_to(tmp_path).as_posix() for p, _mtime in dirs}
+    for name in (
+        "Sketch",
+        "Sketch/src",
+        "Sketch/libraries",
+        "user/libraries",
+        "user/libraries/Used",
+        "user/libraries/Other",
+        "user/libraries/Used/src",
+        "hardware/vendor/arch/libraries",
+        "hardware/vendor/arch/cores/core",
+        "hardware/vendor/arch/variants/board",
+        # Missing install folders and their nearest existing ancestor (creation).
+        "data/packages",
+        "user/hardware/vendor/arch",
+        "user",
+    ):
+        assert name in seen, name
+    assert "Sketch/.git" not in seen
+    assert "Sketch/build" not in seen
+    assert "Sketch/out" not in seen
+
+
+def test_collect_inputs_stable(plan, paths):
+    assert _collect_inputs(plan, paths) == _collect_inputs(plan, paths)
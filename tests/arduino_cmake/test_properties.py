@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import pytest
+
+from acmake.expand_graph import PropertyGraph
+from acmake.properties import (
+    EXPAND_FIXPOINT,
+    EXPAND_GRAPH,
+    default_menu_options_for_board,
+    expand_properties,
+    expand_properties_fixpoint,
+    load_boards,
+    load_platform,
+    merge_board_properties,
+    merge_platform_and_board,
+    with_build_paths,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+SAMPLES = {
+    "chain": {"a": "{b}/a", "b": "{c}/b", "c": "root"},
+    "unknown placeholder kept": {"a": "{b} {missing}", "b": "x"},
+    "nested key": {
+        "tools": "{tools.{build.tarch}-gcc.path}/bin",
+        "build.tarch": "xtensa",
+        "tools.xtensa-gcc.path": "/opt",
+    },
+    "string define": {"flags": "-DARDUINO_FQBN={build.fqbn} -DX=1", "build.fqbn": "esp32:esp32:esp32"},
+    "define across values": {"flags": "-DNAME={part}", "part": "{a}{b}", "a": "x", "b": "y"},
+    "define built from pieces": {"flags": "-DNAME={open}key}", "open": "{", "key": "v"},
+    "cycle": {"a": "{b}", "b": "{a}"},
+    "unbalanced": {"a": "{b", "b": "c}", "c": "d"},
+    "empty value": {"a": "[{b}]", "b": ""},
+}
+
+
+@pytest.mark.parametrize("props", SAMPLES.values(), ids=SAMPLES.keys())
+def test_graph_matches_fixpoint(props):
+    assert PropertyGraph(props).expanded() == expand_properties_fixpoint(props)
+    assert expand_properties(props, engine=EXPAND_GRAPH) == expand_properties(props, engine=EXPAND_FIXPOINT)
+
+
+def test_expand_properties_results():
+    assert expand_properties(SAMPLES["chain"])["a"] == "root/b/a"
+    assert expand_properties(SAMPLES["unknown placeholder kept"])["a"] == "x {missing}"
+    assert expand_properties(SAMPLES["nested key"])["tools"] == "/opt/bin"
+    assert expand_properties(SAMPLES["string define"])["flags"] == '-DARDUINO_FQBN="esp32:esp32:esp32" -DX=1'
+
+
+def test_expand_properties_extra_overrides():
+    assert expand_properties({"a": "{b}", "b": "x"}, {"b": "y"})["a"] == "y"
+
+
+def test_expand_properties_unknown_engine():
+    with pytest.raises(ValueError):
+        expand_properties({}, engine="bogus")
+
+
+def _board_ids():
+    boards = load_boards(REPO_ROOT)
+    return sorted({k.split(".", 1)[0] for k in boards if k.endswith(".name")})
+
+
+@pytest.fixture(scope="module")
+def platform_txt():
+    return load_platform(REPO_ROOT)
+
+
+@pytest.fixture(scope="module")
+def boards_txt():
+    return load_boards(REPO_ROOT)
+
+
+def _merged(board_id, platform_txt, boards_txt):
+    options = default_menu_options_for_board(board_id, boards_txt)
+    return merge_platform_and_board(platform_txt, merge_board_properties(board_id, boards_txt, options))
+
+
+@pytest.mark.parametrize("board_id", _board_ids())
+def test_graph_matches_fixpoint_for_board(board_id, platform_txt, boards_txt):
+    merged = _merged(board_id, platform_txt, boards_txt)
+    graph = PropertyGraph(merged)
+    assert graph.expanded() == expand_properties_fixpoint(merged)
+
+
+@pytest.mark.parametrize("board_id", ["esp32", "esp32s3", "esp32c6"])
+def test_rebased_graph_matches_fixpoint(board_id, platform_txt, boards_txt, tmp_path):
+    graph = PropertyGraph(_merged(board_id, platform_txt, boards_txt))
+    with_paths = with_build_paths(
+        graph.expanded(),
+        runtime_platform_path=f"{REPO_ROOT}/",
+        build_path=f"{tmp_path}/build/",
+        build_project_name="Sketch.ino",
+        sketch_path=f"{tmp_path}/Sketch/",
+        fqbn_string=f"espressif:esp32:{board_id}",
+        fqbn_arch="esp32",
+    )
+    assert graph.rebased(with_paths).expanded() == expand_properties_fixpoint(with_paths)
@@ -0,0 +1,150 @@
+import shutil
+import subprocess
+
+import pytest
+
+from acmake.prototypes import PROTOTYPE_BLOCK_HEADER, generate_sketch_cpp, sketch_prototypes
+
+
+def _declarations(inos):
+    return [(p.name, p.declaration, p.conditions) for p in sketch_prototypes(inos)]
+
+
+def test_plain_functions(write):
+    ino = write(
+        "Sketch/Sketch.ino",
+        "#include <Arduino.h>\n"
+        "int twice(int v) { return v * 2; }\n"
+        "const char *label(const String &s);  // declared only\n"
+        "void setup() {}\n"
+        "void loop() {}\n",
+    )
+    assert _declarations([ino]) == [("twice", "int twice(int v);", ())]
+
+
+def test_skips_setup_loop_and_static(write):
+    ino = write(
+        "Sketch/Sketch.ino",
+        "static int hidden() { return 1; }\n" "void setup() {}\n" "void loop() {}\n",
+    )
+    assert _declarations([ino]) == []
+
+
+def test_multi_line_signature_and_default_arguments(write):
+    ino = write(
+        "Sketch/Sketch.ino",
+        "void blink(int pin,\n"
+        "           int times = 3,   // repeat count\n"
+        '           const char *tag = "a, b") {\n'
+        "}\n",
+    )
+    assert _declarations([ino]) == [("blink", "void blink(int pin, int times, const char *tag);", ())]
+
+
+def test_templates(write):
+    ino = write(
+        "Sketch/Sketch.ino",
+        "template <typename T, int N = 4>\n" "T pick(T a,\n" "       T b) {\n" "  return a < b ? a : b;\n" "}\n",
+    )
+    assert _declarations([ino]) == [("pick", "template <typename T, int N> T pick(T a, T b);", ())]
+
+
+def test_extern_c_block(write):
+    ino = write(
+        "Sketch/Sketch.ino",
+        'extern "C" {\n' "void c_hook(int code) { (void)code; }\n" "}\n" "void after() {}\n",
+    )
+    assert _declarations([ino]) == [
+        ("c_hook", 'extern "C" void c_hook(int code);', ()),
+        ("after", "void after();", ()),
+    ]
+
+
+def test_conditional_definitions(write):
+    ino = write(
+        "Sketch/Sketch.ino",
+        "#if defined(USE_LED)\n"
+        "void blink(int times) {}\n"
+        "#elif BOARD_REV > 2  // newer boards\n"
+        "void blink(long times) {}\n"
+        "#else\n"
+        "void blink() {}\n"
+        "#endif\n",
+    )
+    assert _declarations([ino]) == [
+        ("blink", "void blink(int times);", ("#if defined(USE_LED)",)),
+        ("blink", "void blink(long times);", ("#if defined(USE_LED)\n#elif BOARD_REV > 2",)),
+        ("blink", "void blink();", ("#if defined(USE_LED)\n#elif BOARD_REV > 2\n#else",)),
+    ]
+    cpp = generate_sketch_cpp([ino])
+    assert (
+        "#if defined(USE_LED)\n" "#elif BOARD_REV > 2\n" f'#line 4 "{ino}"\n' "void blink(long times);\n" "#endif\n"
+    ) in cpp
+
+
+def test_duplicates_across_tabs(write):
+    main = write("Sketch/Sketch.ino", "int twice(int v) { return v * 2; }\n")
+    tab = write("Sketch/b.ino", "int twice(int v);\nfloat half(float v) { return v / 2; }\n")
+    assert _declarations([main, tab]) == [
+        ("twice", "int twice(int v);", ()),
+        ("half", "float half(float v);", ()),
+    ]
+
+
+def test_prototypes_after_conditional_include(write):
+    ino = write(
+        "Sketch/Sketch.ino",
+        "#ifdef USE_WIRE\n" "#include <Wire.h>\n" "#endif\n" "\n" "int twice(int v) { return v * 2; }\n",
+    )
+    cpp = generate_sketch_cpp([ino])
+    assert f"#endif\n{PROTOTYPE_BLOCK_HEADER}" in cpp
+    assert cpp.index("#include <Wire.h>") < cpp.index("int twice(int v);")
+
+
+def test_arduino_h_prepended_once(write):
+    bare = write("Bare/Bare.ino", "void f() {}\n")
+    assert generate_sketch_cpp([bare]).startswith('#include "Arduino.h"\n')
+    own = write("Own/Own.ino", "#include <Arduino.h>\nvoid f() {}\n")
+    assert not generate_sketch_cpp([own]).startswith('#include "Arduino.h"\n')
+
+
+SKETCH_FOR_COMPILER = """\
+#include <Arduino.h>
+
+void setup() { report(pick<int, 4>(1, 2), "s"); c_hook(0); }
+void loop() { blink_all(); }
+
+template <typename T, int N = 4>
+T pick(T a,
+       T b) { return a < b ? a : b; }
+
+void report(int value,
+            const char *unit = "ms") { (void)value; (void)unit; }
+
+extern "C" {
+void c_hook(int code) { (void)code; }
+}
+
+#if defined(USE_LED)
+void blink(int times = 3) { (void)times; }
+#elif BOARD_REV > 2
+void blink(long times = 2) { (void)times; }
+#else
+void blink() {}
+#endif
+
+// Default arguments only count after the definition (prototypes may not repeat them).
+void blink_all() { blink(); }
+"""
+
+
+@pytest.mark.skipif(not shutil.which("g++"), reason="needs host g++")
+@pytest.mark.parametrize("defines", [[], ["-DUSE_LED"], ["-DBOARD_REV=3"]], ids=["else", "if", "elif"])
+def test_generated_sketch_compiles(tmp_path, write, defines):
+    ino = write("Sketch/Sketch.ino", SKETCH_FOR_COMPILER)
+    write("include/Arduino.h", "#pragma once\n")
+    cpp = write("Sketch.ino.cpp", generate_sketch_cpp([ino]))
+    subprocess.run(
+        ["g++", "-fsyntax-only", "-I", str(tmp_path / "include"), *defines, str(cpp)],
+        check=True,
+    )
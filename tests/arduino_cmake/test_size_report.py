@@ -0,0 +1,97 @@
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+from acmake.elf import ElfFile
+from acmake.size_report import sysv_size_output
+
+ET_REL, ET_EXEC = 1, 2
+SHT_PROGBITS, SHT_SYMTAB, SHT_STRTAB, SHT_RELA, SHT_NOBITS, SHT_GROUP = 1, 2, 3, 4, 8, 17
+SHF_WRITE, SHF_ALLOC, SHF_EXECINSTR = 1, 2, 4
+
+# (name, type, flags, addr, size)
+SECTIONS = [
+    (".text", SHT_PROGBITS, SHF_ALLOC | SHF_EXECINSTR, 0x1000, 100),
+    (".group", SHT_GROUP, 0, 0, 8),
+    (".data", SHT_PROGBITS, SHF_WRITE | SHF_ALLOC, 0x2000, 20),
+    (".bss", SHT_NOBITS, SHF_WRITE | SHF_ALLOC, 0x2014, 300),
+    (".rela.text", SHT_RELA, 0, 0, 24),
+    (".dynstr", SHT_STRTAB, SHF_ALLOC, 0x400, 7),
+    (".comment", SHT_PROGBITS, 0x30, 0, 10),
+    (".symtab", SHT_SYMTAB, 0, 0, 48),
+    (".strtab", SHT_STRTAB, 0, 0, 5),
+]
+
+
+def _write_elf(path, e_type: int) -> None:
+    """Little-endian ELF64 with *SECTIONS* (headers only) plus ``.shstrtab``."""
+    names = [name for name, *_ in SECTIONS] + [".shstrtab"]
+    shstrtab = b"\0" + b"".join(n.encode() + b"\0" for n in names)
+    offsets = [1 + sum(len(n) + 1 for n in names[:i]) for i in range(len(names))]
+    shstrtab_offset = 64
+    shoff = shstrtab_offset + len(shstrtab)
+    headers = [struct.pack("<IIQQQQIIQQ", 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)]
+    for (name, sh_type, flags, addr, size), name_offset in zip(SECTIONS, offsets):
+        headers.append(struct.pack("<IIQQQQIIQQ", name_offset, sh_type, flags, addr, 0, size, 0, 0, 1, 0))
+    headers.append(
+        struct.pack("<IIQQQQIIQQ", offsets[-1], SHT_STRTAB, 0, 0, shstrtab_offset, len(shstrtab), 0, 0, 1, 0)
+    )
+    ident = b"\x7fELF" + bytes([2, 1, 1]) + bytes(9)
+    header = ident + struct.pack(
+        "<HHIQQQIHHHHHH", e_type, 62, 1, 0, 0, shoff, 0, 64, 0, 0, 64, len(headers), len(headers) - 1
+    )
+    path.write_bytes(header + shstrtab + b"".join(headers))
+
+
+def test_sysv_size_output_object(tmp_path):
+    elf = tmp_path / "sketch.o"
+    _write_elf(elf, ET_REL)
+    assert sysv_size_output(ElfFile(elf)) == (
+        f"{elf}  :\n"
+        "section    size   addr\n"
+        ".text       100   4096\n"
+        ".group        8      0\n"
+        ".data        20   8192\n"
+        ".bss        300   8212\n"
+        ".dynstr       7   1024\n"
+        ".comment     10      0\n"
+        "Total       445\n"
+        "\n\n"
+    )
+
+
+def test_sysv_size_output_linked(tmp_path):
+    elf = tmp_path / "sketch.elf"
+    _write_elf(elf, ET_EXEC)
+    assert sysv_size_output(ElfFile(elf)) == (
+        f"{elf}  :\n"
+        "section    size   addr\n"
+        ".text       100   4096\n"
+        ".data        20   8192\n"
+        ".bss        300   8212\n"
+        ".dynstr       7   1024\n"
+        ".comment     10      0\n"
+        "Total       437\n"
+        "\n\n"
+    )
+
+
+HOST_SOURCE = """\
+template <typename T> T twice(T v) { return v + v; }
+int counter;
+int values[64] = {1};
+int main() { return twice(counter) + twice(values[0] * 1.0); }
+"""
+
+
+@pytest.mark.skipif(not (shutil.which("g++") and shutil.which("size")), reason="needs host g++ and size")
+@pytest.mark.parametrize("link", [False, True], ids=["object", "linked"])
+def test_sysv_size_output_matches_host_size(tmp_path, link):
+    src = tmp_path / "main.cpp"
+    src.write_text(HOST_SOURCE, encoding="utf-8")
+    out = tmp_path / ("main" if link else "main.o")
+    subprocess.run(["g++", *([] if link else ["-c"]), "-o", str(out), str(src)], check=True)
+    expected = subprocess.run(["size", "-A", "-d", str(out)], check=True, capture_output=True, text=True)
+    assert sysv_size_output(ElfFile(out)) == expected.stdout
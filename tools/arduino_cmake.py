@@ -8,1054 +8,2970 @@ Copy ``arduino_cmake.py`` anywhere and run:
   python3 arduino_cmake.py compile --fqbn ... --sketch ...
   chmod +x arduino_cmake.py && ./arduino_cmake.py board
 
-The embedded bundle is extracted once under ``~/.cache/arduino_cmake_portable/<id>/``.
+The embedded bundle is imported with zipimport from
+``~/.cache/arduino_cmake_portable/<id>-<python tag>.zip`` (or, when home is not writable,
+a private per-user temp folder), written on the first run: the
+modules uncompressed, each with a precompiled ``.pyc``. Nothing is extracted, and later
+runs neither decode the bundle nor compile it. ``_BUNDLE_DIGEST`` (sha256 of the bundle)
+is computed when this file is generated and names the zip.
 Regenerate this file from the ArduinoCmake repository with:
   python3 tools/gen_arduino_cmake_portable.py
 """
 from __future__ import annotations
 
-import base64
-import hashlib
-import io
-import shutil
+import os
 import sys
-import zipfile
-from pathlib import Path
+
+_BUNDLE_DIGEST = "03ec4b9e1226690a3f228e7d6346a13db1f8393d40c8f375b0cd806003240f8a"
 
 # codespell:ignore-begin
-_BUNDLE_CHUNKS = (
-    "UEsDBBQAAAAIAOVqrVxqqcXBWAAAAFcAAAASAAAAYWNtYWtlL19faW5pdF9fLnB5U1JScixKKc3M",
-    "y1dw9k3MTlVIKs3MSUktUnjUMEXBLdDJTzelKLMsNU+hODu1JDlDITk/tyAzJ7EkMz9PT0lJiYsr",
-    "Pr4stagYyI2PV7BVUDLQM9QzUOICAFBLAwQUAAAACADlaq1cG+Kq6FEAAABVAAAAEgAAAGFjbWFr",
-    "ZS9fX21haW5fXy5weUsrys9VSEzOTcxO1UvOyVTIzC3ILypRyE3MzOPiykxTiI/PS8xNjY9XsLVV",
-    "UIqPB4nHxytZcSkAQVFiZnGqQnBlcUlqrmtFZokGSFZDU5MLAFBLAwQUAAAACADlaq1clPvzEMAD",
-    "AABODQAAFAAAAGFjbWFrZS9ib2FyZF9saXN0LnB57VbJjuQ2DL37KwifbKDLdXemG8hgEiCXyXZs",
-    "FGyVTbcFuyRHkqe6MRkgX5MPy5eElJeya+lMFuQ0vrgsUY/ko8h6YRh+o/oDGuEQpLJOtC2WsNfC",
-    "lBaib398+35j3UuLYJ2R6snGSRiGQVAZfYAsq3rXG8wykIdOGwdCKe2Ek1rZ0abQBFj4lUTsi8nw",
-    "Z/ylR1XgYNQJV7dyP23+QJ/jcVEcRINJoVUln6b9r03ZS6XZzK7MOmEsZu7ZTZatFmXWGd2hcRJt",
-    "VskWgyAosYLM55jJklYJImvwxUZGHFMoZeEeKd07znkXw+YBLPqVXRoAPcTAWz4M372zIAxCZ7CS",
-    "z2hBV8A44GrhgLxIhSAgT5Q4YA5jIC+eQgYi5+mMDff8M4r9TqUNNFQQ4Ij8ircn+ARVaY/S1VHo",
-    "YcOYWC8hTA6o+iQEKgCfa06nRk+JKMuoeUxh06KaD+8GfwapkIrNVvSM3HSiaMQT2mj6kZXSpL5O",
-    "np5W2iU/unfpaY3yetwFY/gc3RIkkf4Vxadwx1AIZGbiA+WsDRtyapYqi2W0hnFoPE68YovdnQ5f",
-    "ccYPXS4nVY/zYn2kmBc+txDWRMaRSh2eo9fHz0XlRIQp6rM0GOBK8AsX06Ebjq46OzF3TtsJ7YbX",
-    "FXWv8faq8wVKNAVBPHatcBTXIaEmDWMG5pb828jjfLqHBfSw5oFvRTKa/FOv1Ivk8tpMiQbk+OII",
-    "12AvywX/t+bOtTLwQ32QiK6j2xhV4cfFZeb+/ZR+nOs5fpO3T+GqqbmTrjT1dKUzo7Wja+jft5ua",
-    "ZtbIeq9KNJDnSZJsJ5DtmyGyh+0bDuiBv42lqf+wzXOIbIOuqPdaN0CEDF/xPAb/Yl6Mof2LUTEj",
-    "/JdT4kY/L4G+9PWXvv4/+pp7J5vV29jlkbdlaUUiYymZ7vzG0ITsgbYnOfbIBjv4Fd5rUi73/nUX",
-    "3BgHPw1hsEac1OHAy1BEpsb7gGlI3EFvaXKcPl2NapYDSeCBvzc0XVJAQQfzfLMZMGiI/PHb79uz",
-    "o4uxkueMPRvk+QU6g7/ru1YWpHVJ21ridRl87KUcp0kCWBMZX0FF5DjQRdEbw/TAkUhOpvyH2cXh",
-    "Ynl1fllEdUXf+T0uGwmy7CDUS2T00S4QPN9MfboaNmTlFSEbn88T3huVn/d6ceV41StAsry8zmMW",
-    "04X0NtMIXl6UVTy2OdX4bHu4YJwx6dXnjgQqVyeKE4NWtx8wWocwE/HKHxTBLXVYPAb4OUd9DyQc",
-    "wYWci+NXUBaylwGWgjNed+JAX/AnUEsDBBQAAAAIAIFJwVyNhAeIvxcAADlSAAAPAAAAYWNtYWtl",
-    "L2J1aWxkLnB5tTzbctzGcu/8ijlQuYRdL0FJSU5ObQlOKJo6VmxLiiTHlaJYWOxidhciCEAYgBfL",
-    "rMrX5MPyJenuuQPYJeU4+yABmJmemb53Tw+DIDgWgl8uC85S1nBRFVc8Y8suL7I5q5uq5k2bczFj",
-    "ouqaFT7k5aroMnxq+CqvuYiCIDg4WDfVJUuSddd2DU8Sll/WVdOytCyrNm3zqhQHB+rbNhXbIl/q",
-    "16LabPJyo18roZ8arp/EtmvzQr+1/LJe5wWXc66qouArmkFPmvHPnWrN0jZdFSns0bbqTzO2znmR",
-    "yY512uKidKe38Ko2la4u0wseEU6SqqaZkk+iKnXf6yZveTJs94av0tWWJ3l5lRY5rIDrweEBg58d",
-    "nawBF7ypm7xsZ9S2qgChV7wRADhZV01CoGTbZXq75EnD10C6bVItPwEmdPvEn78q1/lGz3rcZF1e",
-    "VrhL4XXLcrGqYLJbZohAPJGkRZE0Xdnmlzxpq6og+sumukhbWNdl0lRV60Fbf14aLL389xevZ4Tm",
-    "ZFXBp5KXsFnonBTpkhfeOCBEkza5pZnE0k/0+XbmvryTi3hdtQolCRCjSdomLUXe5leIc2LYhJfA",
-    "FR0wruxmVr3laQYjBLCVaktL4PQWMC3XcQsLLts0L6FXljeqEy8FcroknFkwgOmWTi8HOCwk4zdE",
-    "wSIvL7gzSvYdrGiVloRT1a7xbSdDWOKCt6ttn9xWdH0UorSkteBJ1tVFvgJGTIgkAgRiCxDzMnGk",
-    "noZkfJ12RZtc8rIz/I0zL6u0yRQyYK01AP3cAR2yBIYAtkah8Zs6LbNdn1G0AQuKlHlJ/CxRjMtU",
-    "nYsqzeTs7geNPiUZvNlw2WkwmWwz6MaJnb1Qa5Zc54AWNXVvfAmjQIx/48TJoIma5DptShDcpOBX",
-    "vOgTY1tVF4YOb9+dJu9/PP1w8kPyw5s3PyZvfzh+f/oepKkrE+yY1KAfuS+VQHkQGKAaqj0DyeNA",
-    "0wUZ0B8tOcTnAzlItiSrugYEZEqwily0ugV0hGbOhgMaQC6E4Tj8rPoZPBHByvRyoH+U/RhyI2ks",
-    "VHHawngtWgJHG9Xk/AakfbzHFchJCnrGNE4ODg7+1ViAA/qXvafWN6Q953Jb9GUuzQB+UKoVmdD5",
-    "mvG6/+kCpHzORNsw9ohUN/udqVXAE1qY3xXSqPsj9p63DNiQLRY4lMUxC6BXsFjAIhip8owpNhPw",
-    "XrJOoK3+8MthUa3SAsYdvoLOSDUWCs7hgzbRwAsNMqUxGqRyNNMuFpNIEXw51+oUVvcaVDOL6b8x",
-    "ZL1AUr8t0lJiClX8nJS7r8NQbzloUaQCxeh8lFzjf5OKgAMOs3zVnsEOZojNc4csYk67PXPJdg4r",
-    "JmseanW1Tlegwm9j7DqRar1ZbdEgWIr1dkvzF+v9Hbagw/dD8JhipMMS1eK+DkbBq40q2jxkj1pe",
-    "yFZ0qKsTcMD6kByj+RCgj4CnnqNq/u5ISjN6GsRQR89dnyO54LffHQEzXm95qURGsjDLBQOHifgT",
-    "NUmq9ZZiwUds2gc0BakoMlAYJcxu3KNoC+CXt7AjFI8sX695A44EWxfpRpBoCISODlbbcHBOXemV",
-    "sA2/jWAexBHdAFatleUGmMCNDUnykZZjJWbjLgSI1RwXkkks0MrRvZXgwY4cKhppyZVCKkgJiC1g",
-    "JjuUODNSDzttqwtQ9+DvoSZvoVEpdeUTNNG4B4ELmjPQw7/BaE7itJvgphsqSWhkA/OnMNimm1DU",
-    "fKW5iqBKZE7Y4Xek/eSr1BEQILxvU4wxxJYc+HSjVN7hIU1xqKa4NYrMYx4gaJsjLwOeJhRukHew",
-    "BkMMsQEthL5IJwkCkNJSFG017FjAvDwLRYTYrsOJxDYyF41HYAL8vgzXHoqJ7jZxZ0JQuyfawiwq",
-    "somAjM/+6a9h8PFJEH2q8jLEoZOIl6sq42HQtevDvwWTSQS6JMs34GuGkwMH5vZs/uwfzzURPOZF",
-    "tUr6HPVu2NPAw3iBLJH+7LsqYu7QScnAzFHLmiRI7Z1dp7MxRd7vSUyBDZYdiM8VeXFPRA/cA/tW",
-    "Wk21AXjtSz864yjy4bdMeqNgBPWe2BEFrcJyybJK1vXI+jVhzdJRRSGVLdua4TBkPEALzWiPfrjV",
-    "UEep0Ya3+AydgJ9ggUFPhwbwDWkY9TVgaFbhkjR2X2ZOlx5548EX23lI4Xj4qd+9t/eYUCM7GYWh",
-    "zc8StGZBqja0fCuZY+b5G0PWeOtoSNEtUYsrHbxY/M9//fcRtKGJCdHJBO6QGgUFD5V2XooWIlUK",
-    "My0P9ETzaYhCji+4qkipUCCOFlBfMs/mT59J9wMCVYC0M4QlkLgsjxns/pH26NohvYMvMOQu+bK9",
-    "CwB3ya+vXicvjr9P3rz4t9OTD8nr459PYaYGw3YiYtg8Pnv+3Tw4+vjx93+Zfrx58uTw483T9flj",
-    "g3mRlqAif+OJ46naVRK2SAq0gp67axybPwLkh0ESzBiOBSyBcVmB8vr4ET4FR6C+egpqCWELdiX1",
-    "RPF3QYmfpIOVSV4WzUoxge8re8qE+Nv6R/KjduT73/t+5TAqcb+PeLpKOxmMAM8sFlEFHIbCS0wG",
-    "vJdjVozCGbK95HgSI7AQdve542jYPSeB+FQZaeRhy40CzVGzsnynKFE4XjAoJhMNINTAaqS2ubUv",
-    "aiRCBHiI7ytMz4QGhw53m0H8ZsXrlv1HWnT8tGmqZgwe6TDhsDMv3EWpXX7tulwy/n8tDUXMDoMW",
-    "SuuJnmIncGkODqOdLMSxKHafuxzNE9okAvsYvj8OJl+31xEF86fuUzJX4Hoko6PwhztJyxXoSnR5",
-    "Qis1dnEzT2qcRftLG2x91/bldJNB32XD0wvv6z3IwB/a/LzsdIgm+L27Rp8RJe3sPs1YS1+wRsQA",
-    "rEgOBETX5A4guoIomE2kCQCzDECDJFGOHfWeUHcah2uDZqkhPD8VRiqvEpSqg1QN0R2i1DJYCWi9",
-    "i6pg1BcE7QQ+dRZCsOE1zMFrqQpSa/gwd1cx6Nv3Z1+msAOpcmFZlQCbeJU3VYluTBgcn/x8/OOp",
-    "NhMnxyc/nKI1eBoYjzkqqmve+P7slcXkE+y+xjnwoazw32q9Dnohh85ghHtzAuRKmPwuZUpVRILs",
-    "cN7T7EQgN2IB5jh3LA6864nkZqUgYGOEPINLhX02iohHgQkO5HiLSpopSuual5lSxRNtxXbOo1Tj",
-    "PVNJCBioyKe/xPtnp15yNHI5qcJyBG3jo5WfNPGoGTDF++vHh6+CL/Vd8NhKkJQHxx0cy8TTlOHe",
-    "VIfKeGO04xrtHYnysTBXGXbLDsa+v5LLIOgy7J7qiaYAuxNM5ucxvQdgFwv4H7AhYnAKEPOLxSO1",
-    "E/igAvP0sio3bGq2M7XmHlP/bYXQ0Q190HlAaE8GxjcrCbK8TaRfZ8XCSRV9uRshu0K2de0liDPt",
-    "umrxRQB4RjfWj4zaWGc39epL63BZn+fymM5NbtEHUB0qt7pmaZaFg2jBt+MXcm5vPa7xv8CN2zX1",
-    "zCwytBNCqV5nF/3tf9YSgdIg14dr02wjZ7zegscIG7MAuwbgfI7qqi74ug19ewxcRfkHmZmAvpHi",
-    "sxnahBjwJvfTM8ArmAUcAE0RUiEwUO/dN7ionKj/aHCrf7gV6uYvEDltxhJc5L2Harj+3kJxf7HL",
-    "/rRUfN+5VkLJfSuFTooEVde6+t4qdMG5TrGiOtCt8BwOdKHGvyY+KOICNzSRZCjSy2WWsp+ABz0e",
-    "czaLwBolX9EOtYq/cdcJkdT0ggH9U57Rm/c73CI5uI/FxnguFg+DoaYpIkauh44aYFdzvW5WFgBa",
-    "lIZ/2EnDPVb8AYbg/2YD/ODOSboS6TAnpBMOH36RWdtOYCvFejJT5eYjI8l9H0wW9vA6z9xzFwsf",
-    "tyLYdMrxSH061YZFTTejzO515cSsXMCsaQuOG8SWmM7+NX+Zs2XXqlw3UhWaeGMRxq6rDiScvl5j",
-    "QANiJjWoyY7rVBBLm82VSr0i4GhV18qovc7LT6kC1fDDpitp++oAqukK5XtfcWyous1WLk2f6yEM",
-    "L0kOaGMdxABpuQGhAmyBYCus5LhJCW9VVHiIibmbKdlfLD6wJnePxSU0KbGBb3L/Mo8wlWgmfGsk",
-    "hQJDedwHrFUAxH2n6URAfinT7ZR01uxj3BKMLfb7N44Nh8e9hlynYXrOr5aYmZxRu1XeAcp4Dng8",
-    "LdJL0ypBwnP1uVcR4qVjdNEHsLiXVcag5emTvz7550D2w8jCHhKDtqLgA3p9aDqVLYbhy0pw00Kx",
-    "hh09jGG80X8wgW1VinNM4aeme0eaFnloM0ZCZR+ZaIv1864+0eUF5kKRbGUrYtoUKEQ8aa8u6FWZ",
-    "NO/8lFKAIzU2NjFMxIOQYXWRboCDYQ6btaWcMohrVvU/4kGo/WR3GNtH2wyUobKXWM6lX3Xi11t0",
-    "e4Nr9qoxQm/lCi1UupE06bXuLb+M9aWqE3VSJchH3FeNEtL+ZNVHDnJjZ3Jm1sPQGZ1OvQlmoDxk",
-    "Ll52uXNG0cECjBmvLNk988yfVW8Li0wMtGEtSugideYuYQzAjnKVUDbOBhKhuA0lydrsPackQ9kz",
-    "/OHDgHH3VceEA2DW97iW2ZB1oPtEeigd8EZf/NnuAtfVp8FgH+WmfZdHfjvbATdA71Ah6wzBnDOw",
-    "kYHNahz4euWTVQzDyhcnuzZx9Qn1dJUFngeoJN6g34MVhrYRlH43qYUhD0z83mDtofOwwMqqFg+w",
-    "VQfaHBj2xGEYrPSEl32LhwSDIyfd2R6c7ejoINSeTX0aaC0D0EF6H+KIBYtHvvlKUnm0MYk1xC/y",
-    "FaICvxeq0rinVJVNl5lG4SjxQQ3lXkXuEWvmW4bYr7m0s0IYlvC0KW5HWQHUnQ90OtXLvLOBEUV8",
-    "Dfpt4d+cMKck5T4E6snZl0EYMZ2aNc1GGh+AG/c3hicL/14kub+Jv5w78+blD2jXsZ3DVyt+MttF",
-    "PoxTArq7Ss9KwYz1lUavHDB0NumM2lVMqDytWP2vdAVsZ+Cl9QUKIgI84+xX+/nUcPwET2sNJh7B",
-    "qe5fZbdWi8Ks4DqlWAB604Z0DIvCpyslJCK9tD9WJlKSxi9WHCjf4ZSjpY8hDh6MkMjw9LfR2Rg7",
-    "eebHRxGVptjN5YJqN3vxPSZZHoQAzPM6u7BonY/RBYHJonSC5gwEpTLArQ6wqWoZcygG5PSeQmgX",
-    "2VaYHD/RxlaeS+k7ufJUXPYLxtzSsR7nvSRA1iQ6KttdRm0pRMdFRqTOBqn+c2c/4329dL3b3dvc",
-    "qJfsxn8YRY42hMjZ4XCDJhf/FfV9Kitmg2Frksai33CEBgO62Hph/JEFNAbRftdsNYIeL1iOhxt1",
-    "7Hdvr3H/g4vl+8ryXZ1rmk3t5PAQyaJvfyLdDI5A5FSm2E8GKkmTSWHDT1Ixq4jfFhqZHAB0nFng",
-    "vhe3y8bTmECDCOYG/t1w/AMK900eYjD6q24T9MA88hNml52g00mZdMNcjQbeyytJpyqlFBKyRku5",
-    "Iw17GnlrPLNYOB9Brk2wOBgmANXyUz+2RzUkUxQicPs8xFXH7lgsPgIyUuVgeNgUuB0fHAI8uLq1",
-    "X4o1Hus97JDZsTy6II3FO+4qOXgeifBJKwCXYM2ZpdFo0ekwjDVrsFVW8f0lk67amplFz3qx7Mws",
-    "y/G5YvM04tv0KYEYMWsYWetDWQd/u696+Xuy0H3/dmQHfgdTMxSTxbMitM844s8t6hkfu9NY4s8o",
-    "07h3H0riVobGewv/vWN85GtVD7JvCwf9le8a1Fu7dziZiGYV2qI2p6CNTf06R1/URs4xUZmsS4d5",
-    "H1BOp3+wAh+luI5dxDVPe4jovvjd7kkWOl0Ie7EXHfTJjgSfjYjRSJUTusqOjI+Wc6kMiFLLNpFR",
-    "7Kmmc8b5hZrUj1R+MOj8NWJ7X9nczgXorn/6Gvz6OIXvnTVy+PvDdXLO5vaXBpOwTP6UrYqHcUWF",
-    "kR21HSnZM02P2ElaViX4M5jF1EdgUaVcD7yWJbOI8jiNDonwVGnVVEJg4C5YyKNNxNBnYVeCHdVN",
-    "fgXOEb6roySFdp+l9bk3nXkRQv8yVueHv9GzZNoTKbFKRKrEMi1q+lD3TtvvO1omWFU9cjD9iP3I",
-    "ec2ijMnbiLI427mTIgNlNH/hyc/g2hzJs8XvT9++fPXTqfT0RJtirlbkGXcALxayvuzFq9fH7/4z",
-    "+f7VO7ykBuQgCnz4xSC+QC+V3MXF4vDnl+A/6tJDPAps8azRJfYjfWWHXK0NL6MESZcI3qLfhftI",
-    "LtcwFx3IbuU5IcPgmdGpJd1dUfTV57SWjllN5xK18ujWwRfJUHdRZplZWTB9ou7h27Vnw7SXHBl7",
-    "JcPDTJpT3BhX9bBdX1WMs5FG5LV4aDTwp9Q062sQWeloz9z0z/KJMpXmos3YZU9bqOz4k8awzpQa",
-    "nowD6l3u9IqLd4DTSnWsIq4f0Q3m691FNQW+vSSMOx9iaqZxqG4h6mY38WNqcLW079jy2I1XNwvj",
-    "1T0LC9jJH3kT7lj5+Iqo7zYVREFg+bS8DUUV+aZVrrmSlTW0PlO7OPCO+ypPw+6FFtJiSB3uA9B2",
-    "eqz/11iNgTZ1r4ru1Knu4tRKojQYVnmP6tjeDLuA9fSvb956MLywUgFQoTZp7MUi4gVoOWiGx2Ve",
-    "0uMSOBjPYEGHa5cTbFmRb0q8wpgD5MXii3SF3UOZu8VCwcaqTxXV6T8JwsL2tkb7WeAtx/fEQK+x",
-    "eCov6WYFsMjp+7f/8Aym15U3/Ca9rMGcKPsIU2Xdyh44+LWy7kKCiZNGfcBpXN+/92CdU+6bplb4",
-    "Xo9hF1S86nWHKFW3jNTF4D19oYvsq+8I74PLVXpZXxfe0xe6BOpEd8ffIrFmZW8ceI97Tw5Q7Pwl",
-    "BlJSEETTEdjMYXyJ49gE/r3pbQgf9z/8gSttSjWpKhpTzRHuW+Kek6IHo2MvKvfgQCnG2PuTBX2B",
-    "jt0XB6ziyFg/2CbNgLF+cEZp668fnE0o9or1g5e93R2Z77ppviM7i7++/o77H0bI4+bE49Gv/hVE",
-    "lRCVikgmtQnL990kUAMu+K0K4J2wHpapH3XqkDoNqwtf5nj5kDeH6FIyujG3rQq6Rw5qMlWzoBy1",
-    "vClNjXgLqq+v6uyC6DKANqJoMLH74OKGArVqb9Abhd318q3QcBZIXNBRFOk6OjlvVk4PRRKvB3xz",
-    "engZVf3iCmDvb7mEuNwZjjX3AqShv+JNuuGyAiPcRZneNRbAGJpuWaWJ98c1GKwUBNc6VZgub23R",
-    "I3lLh/IvBOgLrgb1FLvKupHQVoesIuliyeoQ8kN1C7hPbpvvcgV2QQGC9CiqSTlWhE51bi4S5T0c",
-    "iS/t/W0AtpQpPBgq51bV7brqcFLVaIGjzarUVxqFvcfo/4WGEiKnxeK5UWXfHeF8RzBaqte/n5xI",
-    "jhYORFoNKzFSguEcIDHn+mTE2K9bXjqFtAdWD9i/DJGuMHKTiViwbDrTb50DlXaH9ysuBQmZS2bi",
-    "chAU/PMFWJWM4SRNJkNQvHdpinVhni0v5DXNGg/BqCbX2Yq0piqdQbWvXUPVsxIY4odAjeDoOfrA",
-    "+i9fwB6m+D7FrUHICZtaLGbwpPYFLwoObA9bqBxXF54Cyv7eVF2NdbLLWxlz1Q2W3cL+S30ukgsq",
-    "YEMpUFjQpb7qbir98QumjmsV3cmZM8cr2tlTuQosOJa6iP7yRCM98tSQQGxz9CBfvT3OMtDwQpYO",
-    "TxR63xHTyjMZ+gMOFRbzizYvKWepMichEK29lbKrxUQHAeqcQfJHA58GbEu+e68SVynEMYWCEhIZ",
-    "FThQl2fn6uC72lARIv0NOhTTn+CRN6G6pa8UL0meTOgTXM/VxsbAVFjorhGtV7gxlvwzdlFzidQJ",
-    "dUd9LohcmQ2PHm0gWClXu9R/TMnPHhMx8S9dRE4ugO4suBoK0aV7R1hijVwRBlHV10velUuJAyDK",
-    "AD7VHZKjraGezQ+fnWMNFpEvmPRnx6+2HuKeSZH/FeINDY6YijoHvb4m5kP2BKhmgiO5MA9fg7hQ",
-    "URBodfssxP4zgjPpbQIpqTM9frsfEuIxJnzx5wBe1NWJYfAyBSxlqFtxTvaNQEX/Dbgf36BZsivA",
-    "ba5smY9ipgMXZl6uqxAtArSwbzJG5FGyBfAJYMHLUI6dzJhlUASh/5wBtR78L1BLAwQUAAAACADl",
-    "aq1cUyUL6YIEAAAJDAAAHAAAAGFjbWFrZS9idWlsZF9vcHRpb25zX2pzb24ucHmNVs1u4zYQvvsp",
-    "WJ6kVKHbngqjXqCLboAC6WK7C7SHNJAYi7K5lkmVpJLNpgF66gP0Ifpg+ySdIUX92ZtsDrEtznzz",
-    "830zFKX0dyOdIEVx08q6ZLpxUivL3lutioJIRdxOELsXbrMj3oSU0pCkKLgpW6n0+aaWYLgkP//0",
-    "ijQcwO5TRildLCqjDyTPq9a1RuQ5kYdGG0e4UtpxH2Wx6J5htPhd2+DZcLer5U10ewM/O0y+OfC9",
-    "YButKrmN5z+GdNDMTsyqP29UNLr49eXryWFjdCOMk8JGE6XNgdfyo8g3+tDIWpj8jhsl1Tavxa2o",
-    "F4tFKSqS76B+OBB5petSGJvX0roEk7arSTJZ170c+rbyZaTk/AVB8yvrzPVqQeAPOlYUDd/s+VZY",
-    "6CcYR8cbrffATwxYFBn0sOwOz2u94fXkmNzthCKNEVYo56nAALp1qyEoWRP8DPmyGBdTZOCn61uR",
-    "pOm1d2x3YNwZthbagfwvCY0BaTq4eAdZgQ+THi1JQ3ldBow3jVBlgqHbXRrsrQ8wNOk5cPsF4DaC",
-    "GwHqU3gcieNlKVF9vM4roNfmRtQgR4jg5T3Q9BniAJ78RV5rJXrm3nYIXrPE6+usBzsjTvshKgrx",
-    "gR+aOvKLTTVAEdHVeMiCnlK28Oi/cHgG6pzN24oItmXw9NPf/y1hSgwMnrDLS3mzjEGW7zze0icC",
-    "ET/98y/YM7ZkDH4lENEHmGTVxc5gCpzPKUDfw+SrshbEaO1YrDqQtwfyhj7N2IrQnla0Y6HkSOX4",
-    "nCl+EOSrNaHxKSXa+EwmZsfcdxwjJf6ZM/dHhxpV7naQX42fyRgyIz1ZI/V3BWxE48hvvG7FK2O0",
-    "OR01SOsON2kesLo9muNmS7zPWeY/5iLrujgVWnh6apn4A1xpK7/Msi7LBjaCKFcgq40f8Axlej2O",
-    "OGy68RoIQg52830HhoPWs4UXPybRyz7eHD/0Nb1YnrpFGHnre2W9pHDofGn9aurdQSInmJh16Cm9",
-    "QVw7bwLYP/SkUWwdXfkOMqdzMIBKkzQbLAL4JaxVrIH6Joy209g0bqmLcAWALc0oe6+lSp66H8aL",
-    "JR3jaeiPuYzTPKAOm9ov4H7eZ4oNSI/+P6+g7i/ZdZNk4lzyarRZoadXdEC6QCCKbeVVpxuMlUQR",
-    "sq1wCY1i8lI4yI++mXlV862lKc41hdWO3W+GxQ5A87BPwWAK4BJyaK3Thxy2i7Ozay7cYij/fC/u",
-    "UdSiP4SvQ/ijOelzqSDfBt+FPm/iY1iERK6mpcU/iIHbrJm5hR4qJ1UrJgfjouLl1tgjTLqmmNsp",
-    "2L5qBvyBL7NNLYGdNc3It+nVN9cxzxEH8yXQg9a3UN5zr0fJEcCQ7x1kAhDVwGp09YSyh/r2kQ7W",
-    "t0+oauJ4WlBdQQCDb0s+NnYfO9Vr4dl2V/QBPR/XD3eQ29ClsdzmkvVnL1Epb3qheLH2y2HsHjBL",
-    "Yd14++E70PEqpb0tC3eNEx9cgiesbA+NTTCDDEos4Y5df5eSrwn9QwHXQm10Cf1a09ZV59/TybsR",
-    "4i3+B1BLAwQUAAAACADlaq1c88DsJOADAABxCAAAFwAAAGFjbWFrZS9jYWNoZV9jb21waWxlLnB5",
-    "nVXBjts2EL3rKwbqIVK7lu2gJ3dtpDCCppfdBZJLYRgSVx7bzEqkSlLZNZBDPqLf0A/Ll/SRkm3Z",
-    "bYCgAgxLQ87wzZuZxziOl7puZMX0bETTsKGtNmT3wvCG9ONHLh2VotzzjEyryO2Zys7BkFbVgeSW",
-    "rG5NySQtKX6G3e1FtzPTWRzHUbQ1uqY837auNZznJOtGG0dCKe2Ek1rZKOpttn1sjC7Z2pPlYLsA",
-    "jXD7Sj4evR/wGUXRhreUW2dkkwNyqzZCuVy3jk2+0e1jxfmfrXZsEzsjbEtptPD/s4jwAN29YqrE",
-    "waezpeBHRRF//fJ3XBT0vOcuE6mwIMHMXiBL7bdgObHMeBVlLZ44Ay+1UJuiSLMoRF/qRoLFPRsG",
-    "R4gDhraeajBpCYGKojm4vVY09rmNnR4HqvOe4aw54JCQOzCEkD5zgaS6mtCzhHvrThiwHdGK4uGP",
-    "D+/u7x5+/fAuoBS1PxNewoYo15Cz7yEQkb5++YuemBvQgbKoEon2LIZ/tELFKrEpLeb0GuXdkF1N",
-    "1jSf06v4Vf89mh4NXQmCo1KgfY7V6QzrZ/s2OKJL/Ilh19nJP4bRUf1KNDDYY2PUTtacK5t4gmeh",
-    "Z0IHoJ5dJOtwrl/MLFoxSYMR1ZnTjmFwJrHuhmLrTqHiG7rTitNjytjsOx8YvfmM74TNJcqm0ZXJ",
-    "uuwYk36kaT6ZTI6/tAdfC6kSYXafZlRJ61ao0Zo+h1MAL2C4SAVlODXUqKZjiYcdRbfdSGd6Qbfd",
-    "2C5oNKLb40wvaIUTbZZla7R4X1dvwYkeRIJpzDwmVGrts/fvPv+AiivLwZIO+8G7p3RLPxPmJx6N",
-    "4mNB/cKZr8Z4Xi7KG7dW7KA8/yOp+DLQN3KMby62+eGc+wyt27Ax58X0uqqvu+bBKMxDGplUG35J",
-    "fHbdXkDCku+3kD/GoLNbU17Yp729B5cHPruYKx/+J5rSbH3qNRA33HnNXvxf/MyoltZKtTsrdzhF",
-    "bL3YAfHNdeLfSPcHupPqowCmoijrTcYvTOMldKGE3lcsPjHtjG4baJ7TT3zUuPiNny+vl2P/Nfod",
-    "zOPrlz7mb8ullzforGHhrH+vvWMlAU9UAZuCgllKiuINohi2Da4MHgUttQwFc7LEYZDZSlvXq9IV",
-    "o6vvuiREGu4/4dtzGOBUAdQ1kzb3RydpJ2mmPFvOBXHmcKlVcihHcMJIzAcWBE4vHQb8T04L/FJy",
-    "4+j+/Vtj9JUaNsJ2+h609HSRZrhukmEy/xIjk3Ufpd5AUwB0aBiqWzfhUwiUzyb3ZcF1DjmP89zL",
-    "VZ7HHSQjJDa+P1jH9dsX6ZIgZmka/QNQSwMEFAAAAAgA5WqtXJJfMFkpDAAAsyYAABoAAABhY21h",
-    "a2UvY2FjaGVfaW52YWxpZGF0ZS5wed1a247cuBF9769g9CS1ezS7DhIEszsG1rENG9hdO74EC9iG",
-    "xJbYI2XUokJS3T3rDLBP+YAg35AP85ekqkhdqL7MOBsgQOZhuiWRxWJdTp2iOgiCF/WGV2XOjWC6",
-    "4ErkTC7/IjLDMp4Vgm0LUbOm4mYl1ZpJxapyqbi6YWXdtEazrOD1lWBhI5SbodulUUJEcRAEs9lK",
-    "yTVLklVrWiWShJXrRirDeF1Lw00paz2buXsF1wVI7y510ZqysgIabvBRN/sVXDrRPFvzaxGv/rqs",
-    "u6c4OMkkXNSiNgkOSyq+FJU3w+6jFLqbFs4Y/H1vt7egi+T7F4+TNy/fvf7j0+TpT2/fuLulTsQu",
-    "q9pc5AmISXTG6wRXXcwib42GKy0SszPdGpXkedIoCdYysHSyKisxmyXPn3735Onr5M27Z89e/MQu",
-    "Gcj4WdRamPBTEBfBgsF/99E09nO3o8/nwW00m81ysWKZBANvhNJg1AS8lZA7QrFreA2aXrC8zMx7",
-    "bdSCwb+Pi96riZLSXJBRI3b2CJ9e0EbBgY8lVzlYNLvm4OVzWoS5RXBgWV8xkOFcD/s1JToVbpP7",
-    "UQo+voZwYWHgJqLmqq1NuQYTOSXi0bO9e5HVB/82YJ5+T/EVmOg6wrAMgihGfZow6seWK7YZZuKf",
-    "EhCGNdvQTcW3IOyQS0LPNLDtQSVwZmBXIE1ABinRb+2gMr4ivhL2YhBU87VwUtr6upbbehDm3XVu",
-    "B4UhAVUDrjBJIXgOioQYjPoCclWb9+jXj3uOfWP4shKUc4xCVkN8QvJbCZRDmj1ga3QSfOryZ9F7",
-    "tICdu2SNATMe/u73bp/o6gZdbdfvd2zUje8HbUBEA9viZuQvkh23DYJRCMqGTayEltVGhFEUizqT",
-    "uQiD1qzO/hBER6Ytgw9fBSdEagOrJrStpNaDVK6zsvyVUtFIXyCxHkkEPBGNYS/fPFVKKt9YmYRU",
-    "qVsxjpciLsQuL6+ERgO6SOij1jqRIEmHhAv41ab4gm0A9jgEy3CPomMIFru8FqK+gP/uJjgMAcmq",
-    "LFszji549v5jHwGUM5jv/cr+mqNshsSAOkAzYkDVvFRhdGLzXozRJHVVyWUYzIPJNCe4QamU0ZQ7",
-    "EHHtalXu6BmI8IHXl3BwcfJAQ7HbR+Z0XXjuxJMF94Ti3ZjneaiaaO8hGDbmTSPqPGx6U8eYm+G1",
-    "uLms+HqZc7a7wFwOd+P0qORWgPWicZTA3C42XNm2RSGh4u3iA55cdGXvYCAgWshWZQKq9gQg2hq/",
-    "G4D+gRZAUlcVCzXgGBgQcBErBwemABUZPOGIQ9SjCfpR+4H2CZHF+rfb4G0fXqVC2+KIsqYinFgJ",
-    "A77iJVm4VCML/XeC2sJkSGss2AGfDJ74n4T5PYMYJh6nMRB69xQD6WSBnNKq2/l0JRzVZdyEUf1f",
-    "59y4Mh/IvwOpN67Qz7E0d+mEUbBgaerExANhSdMF5eV8jpYDwqvncyZXfUJqSl197qhBPCP5r5TY",
-    "lLLV1Q1lLyyyblirBwJAFRIiXEvQIRc7JHpGykojjnJWiy1oc1VCm1ABzU5TkmpkmxU40s5m27IB",
-    "ibTlHIbHMk0ZhqlmYgNtBfUWyxuDIwXwyra23UQes74rAU5FooHyQE5UYHHttuR2NGwc9t1UrWZr",
-    "YTjM5BgOhy3GQkfXLKFP01yg+/UlGjNNHa7Yy8+//CsiA6OdnO/z3i+YLix89qfHPzoKzCsFaoHZ",
-    "M1hOW6vA7eUJHh3FnctPsyuPcewj5BGGdIjDoC2Q+joZSHD3zRR01BVvHQKYPVbXL0Uz0A4JeTeM",
-    "7kd0Gq71ns4dS0KEImUHvSd40EPm6WJ3agdKVFgSfOoJ34BYlRvo5GTYqRHhbSBcGdj7wwfsWs6D",
-    "aA8A3W7/zKtWHNiwXa6JkfPvze2NAKOOk99jFPWEc36NZ4555xQtXbZllSeyMW5New1FcEQ+6UkP",
-    "fa85oks/Ly4gZS1OUKsy7yXMWbgutaYulLiFho0Ljo1MVV4LJtaNuYkc5r2sAe08mFxzYwBBMHBG",
-    "WK2/6fAL054ynEO2llc1JG1OkGi20tKJa2EgxBDpYJQW0ADjQYrT/RzUBhjAM4ZlC9Uph2XLjFdu",
-    "L9DuWfBFpmSN5iMB5mi/VUzSkUX67Dxa/51Llk6YFxDumR8Ks1NRMJJ2pNsYWfDePce43j0b5mP9",
-    "IoR80E10ZQmqDzoxdCdVPFNS68EL6EioRgzxeCCYBdrxYJt8V8c06Vv8UPchumj2Gr/TuTA216GM",
-    "8Jr159+dwSJghJ0LFLTQNEO80LbMfJQpLgneabBTmo79DlOtVWtpAz+K2duthJVWKyjLYHxrYBuL",
-    "cFuJzEg6OsOwJ7Eo6mwI8KlqUBDyFhqIPtxHu/dj/rB1j2PIYTMj8UjsOSaxbTkx7o8QJRfjDKIB",
-    "B7i5VccvL24sIMdkMNbKY0y8idu6KuvrDq8SeX35VrXCV9me4bmYA/RJgGMQN7d7gdCkijY5sBt2",
-    "g9gp1tB0TUjXOXxB2TFHBobndXDRR7clkEDJgC52tHEJAVQNRz57Fh0UQWBCcQF+ka4eZBxy7sgY",
-    "q0jgxh21yz2Wdfp7K6O1DNEbfyzc7zHTjTngb7SN3bprMu24fV87Sc5Mh5u6gztw0kcaj/9Gj2N7",
-    "iJwUOWBrA+TijgDqSI+VYBu5abgs2F7Lgbf74PmBY56nqTu/piyLp5JhF0ih+UaWeXewnd1klYiO",
-    "nRB+fRdl9bP4/cXXD23nXfElEqRjB/okEsmTh8z7fofPVfAJptwmn4rb4IjF7DxqhbzObMHuwmfi",
-    "d3AH+YHtOqzIc9+HaXoxfX1CDcsILccwDijesQJa6C32ETjwDAbSWTvynTS9q6ggwIeWciDOA7o/",
-    "3cEeqzF+D8Bc8SsgUWJH3ESJFZZhKrdUWW2jSN2bKWR7VTABVusKBLiclbArubVHwN+QbKopZ1Ri",
-    "soJa5HqvQOQStEEgdu+TUB+3efakr0OoHNiH9jKfWwZmSmjDyuEllgO+zs5e14nqoWnx1YFXdTDR",
-    "V3s04VjPbqNtKd2Uu8x/oq5hVNLStx+++kQCb4P78Ig1v1lCiIsVpFLRoYt93+NgdZL3dHduPybR",
-    "bG9OGRvd3Gdti85c9t2ZOy9zifJxMduvR0+w18Rm+WRNut9rRpcI8/mrbqRjcpAqoU8YI+LsI4fA",
-    "wo4TDcaZW+Lz+Zd/dklwA5FIcWhPBDBUt0U5RDgk3FJgu4FGNL0+k3DGzMWAns9BFFwYVV6BHowz",
-    "PMcDfoRFgWF6XYARGoV9g7BxhC1DIaV2Zweesi01OmmK9DYeOz25FjdhHMcdUk1i8RLPMPAsQ49I",
-    "nTv5mFJIl1v9OUYFfa8z3MAH0/RbA63Vo3MHb6AL6XH+7W8fIkl9dO4OhNy7YO2Ogy0Iff77PyzW",
-    "gNYLZg9bcGMemx/3UMTKkZQWpbXKqq0zPBmy7gM6KuuMEryLoDN3NpSrcmVsGyfUmX8k5vDFgmBZ",
-    "uwjgplN6CLZhKhiGEBA2BFE8AXdnJgJEOnc6B7tj50q1IMID8GVZE7aNssiFeMfrqZG8J6Yf9Z49",
-    "xESsR5cDIa+wdaLNKdFqC+VeaCHv0cgAR+Td1vkN1jbYr4ivYqgLYLDoMPAeRFx7xEd9g60sNohi",
-    "9gN12H5V8Kzizi0ZtXTH68VIgeUNFh9RrXxsH7YZr6+RgWGyQZNE7GkBDS8gmM86nYunDLLzt30c",
-    "jIbeVzBGCp0nXHZrjF4td0TPKt0qvMbycq8+e9Kp2gAAe1kZ3bq23cfiHlKRAUmX3ZFS/44ZWG0/",
-    "fnh7JioIGwR2mxW1EDlRW5D+jMOzjlp3i5bWPTiD8q/b0G8uuyEDVx4LQ2PN+s6sezCM/eI+KZp5",
-    "po+3Cti8tUGn0wOGB1ngsalNZn3jRz8+qUeFr1fIEfbLuwg4UW/vtwlon5P9w96rEFTYMrD95Sbs",
-    "dURah0XpLY+bf7TRmKrYTzrW2g4DJra1Sx237sm9YpR0ug4r3COAx/oPWri4owtf/S/o0P7jnbpf",
-    "6FSCqwTPSJTwSRtW08TCh+VZ7G82dS7pY79Rc13+sUIMGMxeE+PURKUJdBTNyRFRqRRsZQuwvBTd",
-    "g757cz0dSrY/UKI45xrVQS3G6pI0NxB/wILfKZQjNOBErb4BR2EHgt7+5CtWa6y/IQ7yyDPemP0b",
-    "UEsDBBQAAAAIAB1BtVxtL3NArQ0AAC0wAAANAAAAYWNtYWtlL2NsaS5wee1aX2/cxhF/16dYEDDM",
-    "U+4oxwFa4JQzIEty7cSRXMtJUAgGxSP3dIx43AuXPFlNE+Spz33oS79AP5g/SX8zuySXd7yz0qaA",
-    "i0YPOnJ3Znb+7czsLD3PO1aLRZQnoyzNpUjzUhazKJZipgoRxYvoRgae5+3tzQq1EGE4q8qqkGEo",
-    "0sVSFaWI8lyVUZmqXO/t1WPF9TIqtKzf9bwq06x5q6bLQsVS62bkrnks5WI5SzNplltG5TxLp/Va",
-    "r/BqGbGcTVVUJGGW6rKGoecwzXUZZZlMQgbQXZwqzZIaPFYAi8vwOlarEJJIPRTLQoJ9GTJgBxV8",
-    "L2VRplLX+CyngQzt7F0HJY7iuQRDqyhLk6iUzcKZjIpQ5mWKldT0O2KCYbvY9P9a5jXWbZGWMuTR",
-    "DtxcqZuGp1evT8OzF2dfHIXPz8+/DF89P7o4vYBYCprJ0/y7KCTwcDmPNIlbVLk70F1f5bP0uiZ8",
-    "VCRVmisyQxds9v20YfHZH5+edSYzdX2d5tch+UANpGVZLUM704HW6Z9lCAMQVK3jAl4JI0+LqLiz",
-    "c0M76oB3yFTLTEWNlUlEM7K3t5fImQjjLF2zmq+XMh4LXRYDMXpCv+M9gT84/ze17a6uvjz90+Sb",
-    "o5dfn15d8Q65uhqNmM6opnN1dSgKiFfkYp9I7osqj+dRfi0T3khEs89reP0BT1t0GrD8FlKrbCVD",
-    "fSPLeG4xk7TwGd6Mjnl/DHlk3/zYFTDMgom/MAh+zhT2+oR/DKSqymVVEsldkKwZmmhUc8FLm4UE",
-    "sOHGqrgTfmRcZQQ9uzoCKhSnJQJOmcZ6EOwxoVfAk4nMYzkGdMs1YJ9goGXODnxuJH5ywKBXV0HN",
-    "Dv+mM1dwHnK0Suz77fwgkO+WCH+VloU/CKyi/UFNyVFML6V2ficli+IbxsWB8JgFz4UzptZzVYE3",
-    "cll25dDsQQRdvzG7MTVbY6pU1ljjTVFJofLszkRveOA+nK/GT/b3RVlIKfxZWiBiIq7IgkN3bYcT",
-    "BQxEQQDGakFBEMo+/gpcvERY1UH5roQFVro2UsDhBEOLMl1IPRblXN4JQqvyQmZpNEUkJ8J+qSqI",
-    "rYpEFkNBAR4xH7FeXBdRXmURwtrdIBBHM2QfIiIMh1dXrAIxuhDvf/6nGD2ln6uroYCOjduSrA3U",
-    "yLrDWJwRX+9//odmTyhHaY4YkElxm2YZbAHlChZL3M5lzpR65PShQwVmilpTeE9zWFsPEGbKChnm",
-    "Tpit/f7nv9+mJSxXwmEKJggLxAhuIhKzCos2VhByJbFDSL9QwxAcpNDMbaTBF/NPSKSC27kCxyY1",
-    "CE4NXTefkvtiazoOzV7Y63gwqvANBnyPRT1mkhAVTpjqkIziD2CiNVjH0C5gHUgbP133zqGAnFOl",
-    "saXJR9lZKYo0zvoaRkjztEwjVztsUYVIcGh0f5tqCSF4cNPSYJBN3UTWaQKNIIC13LT6MAoxFCa2",
-    "KAlY/b7Ho16z60kFPORs+og4eQbhz1T5TFV5cloUqrCojDGjUeLz1dGb55ZY10rJYK9eYtc+58DU",
-    "Lh0vSKpLBhsKb3ThDSEoPT1tnv6AJ4914b1tELFMbYRmjPMP5U7fE17wnUpzH/StcjibNPVZAOZo",
-    "cggvl/HNhMKLFQCjjzs8GYswO2/3tq29ue5ju/Dmoo/XVmV3w3hodw5SzDUiTl1rBmcRItASlSt7",
-    "GtYxy6LGIGO79QZjBpa5gU3IKGkA51Y4AdUTqNBWfsM/G5GxUQ5Em0GfhO5MC5nBado02yVCSDuI",
-    "1NPrRAzLXHNNuNwKWAOGJg0PnKqgdj2eNEM7ExWFsMkH6o2WeitVm1En1xIHAmxBWnJoAwjPwDtI",
-    "ikGL1WbPdax2povVbFEWiKroHIkuIUoQi6K37+wcu8mLBeU9ytWD2imCNJ8p3zNiTB5o1if9Mrt4",
-    "wLJWRp4KShUirpD7DIaiobTMIrJC58jQKokQh1tVBiLtC3tg+4pNQCk1TBMZwlM1kvSEJXYGWmhY",
-    "MiQWzA5SxYSiEYPnqjPRolj3n7h7QTyZiMddqu7JpEPVnWhR7N4swtuoQMq41utm3QDY9IlOWYyj",
-    "1hZ/auZ3+Ycj2KfsJmSvoD1KwMsrKoDM0a/1m9ZBXqb5jUyEQaGDn/8gGYyxZiZzfyc1J6RSNUbJ",
-    "7r7L0988KeBYfmeMaT0U/rKaZmks5jJCPUV0y3mK45859Y7FD3lgIEIDgZUy8q8fBw83yFGy64fe",
-    "AOUwZPNs/TfovDVq28B9KMQn4kEh3v/1b+AzzqpEilLd4GT7oMCmQ/0kHuiHww28Vls54nvfvKUW",
-    "MrVNAKixD2uVRsMeQaANNpHr3RyCoV7yfj4NkR9teFef77i121hwSOmlbtZ2zvbsWLZ+657OW80y",
-    "JRPIZTLsDjfx2sk6vU2B+4YDw4tT7FHs2lSCrbA2eiqOPPXOBOc4mYfTNOdt1ac+AzJqQEgXFDOQ",
-    "neJ0aZsegY5Wci7fBfver6uw/nZJ17O7JMWaTJM+QRv8wS9U/ka/w1FqX4fEmd7cliaI4pSVp3ou",
-    "E+OcXZVAp5y06URgdJTm3QGZzXjA5dIeNx459ZppvPxWrv0fl2u/VUkfZZXUtkU5WNiAbtqrCQWS",
-    "yqrTvmzd4iaTcUv7nvs8hDsQpKGoVFk7fn0BEEAeeiYvHgyoEWE6u6RSXs7UIVzySzoeExFqTzCC",
-    "yUPbWuxtd8+ir59QZ95ruVAr0O2m8B9okR9toqFtvol4pjo4Tk80Krv4PXpsrzPuqcb/wUBo9rck",
-    "ri+ZpN4W4LhsprJWuOGQ0s/l24FpMhCEvbfqv/nxTcSwqxJXetJwAGTeE+tWJIq9NqpjY2EEhiUa",
-    "Ax0V19UCvvaKJ8e2EFosVG48vQ/Kj5IERXe2nDyLsjq3GaSApiIL7eTt0YhMNOI424wyCc/6gCAA",
-    "cjvhg+WoysqxOHp98vWLs/Pw5MXr0+M3569fnF6EJ0dvjkgD5xfCwg08104f4oOs1cdHt0KyFwRT",
-    "VFDYw4RjWIN79nL19cXp66FxnJ8OaomgQxzDqncIa13iPx2cqJhZ0y7wIorPLw6+TfNE3epBi9ME",
-    "P7N3dhjGcQh1PbGhx5E0kTou0iWd3VrFa+cuBHL6psP8Cef8gVteIQeC48mlUfHbTqbsKtwbrTzu",
-    "rtncg5coNqvGCskP79Z4k0dWLF1NKdUyHeqqsUAavqBLIC2oRVfI7yuEpaTT0KOyq5oymnXwOg0B",
-    "w3jYH0wbXNreOZ2DTB1pJLdxLd7uM5TpHUV0+NjtRsgHgbCXSuNoVYwrMjVCjEbi1jqdjfH02WPz",
-    "X382Pl+Wk2iI/48n03Wv8b+vcChxeuyrKKukOUZLgXo4y4RWvAEiLRBP7miOT35WqD6f6hEdElvN",
-    "rOm8VijfsZWN58wUOc6H1dhepnVdEgZ2q7dmaoHSYBUVEw87bSNsPGULmvrNvcHTyDhIqlAPlOBe",
-    "57nrH4omxnTv5NZiyXZZzMJrgcTI4taU95PlKEvBLCUFl0m+5OmO2OM8zhm7+AR7KCRHtpB09pr3",
-    "6aPfPfp9sy9sGUpVZ2CBmQmAI5PofoOCOHcvnS2toXkZlnCQhvSJzCR8tblfFVMJynbgw54Ck7mF",
-    "raOwvjXXtHlxky4by7tkhB+rPEY9E5iAm90dIubeiVmUZpSOb+5t/bUj/i/iby1CmLvDCEEsJi5n",
-    "VWaUxB849LcMKHSYR6ovu+T6EZQuawzf8C5q3g8F7xj4QLS5Y9bkvGf8WLOkqStHpvr9DzR1kmq6",
-    "mEWkQyJKEOcKeYAtlUZ5eWB7CN0atsoTey1rb22pMGdvXI+sTTRQ+aFAAV0U0Iegq1HBGf/4q6Mv",
-    "T8Pzp18g4YfHR8fPT5G3frky2mPRWsjoOThtRo6Xp9+cvnQm4rlK4TKTSy9HkKd8a8WgxwW0Q78o",
-    "Kr23u/X6VbTUFM1rJgLLRDjLIpSvn/O6T2wbuMQ2XtDtq420/X5Ti/Fv6Kj7Vcq2ROGcDzcV1Xzs",
-    "0uNt0XIp88SZKO+WctLzXc1unZ3XPhI1Sjngyl3U+MJH5JGoaeGydo9tS0gWYxCs++Xpu2ixzHCA",
-    "WwcVD7cYC+aejL7FfzH6VtI978OtFkASCa3DaH9W5fHEuaW01VXVU12Zk3cT6ek63AwFpVKZjVg2",
-    "xFcbucOUUuulXD9sfxHSC/1fLjOc+mJL4dCauNZgJ5fsYPejqiQ2jUAJYFsdeCEL+goikSsEIhx/",
-    "qNg9wNtBXOE0PV2oRC72t7rCzhplG9JGZdCXR7YhJ8XdCFl1d+nyis7S1qVNMc0fR2R3/WR/rWTn",
-    "XXT9ZywSxSbC4dMW+Jz2OhmO7WoaD/XnN/Z7hvv53keSkDZl/0AuMl/ZOtnovgJ/pNllUwFNEULn",
-    "t3ukmPVw0x/djVfXR+ees3OrK3YwLvU3Wza2uid3M23KXufcXn75lKCovaDXKu6tWalt1Frmp1lP",
-    "amL1NBv5JX9eXTfWhNEdr1p/45Rtd5Q693zYxDvj8YV7Qj4UUYYDOn/2bdp8VkdNKoEWk1v6DnGr",
-    "ZcFzv4raHqzVkO0BLm0PcBGlOfUjV2Nm4FKXxdvud7LdFi2Bmk7TynZIV53bZO51wbABzVx+OjaN",
-    "TWMJ4HVbjjVF6p6aMXOZRLrXzFWnb0nNTHPNBOn4aUBfUoGNkO/Tw1BMJsILQxIqDD3DsfnS7YJ9",
-    "7fRdWvosMjD/BVBLAwQUAAAACAAzTbNcOXIKeYobAAD6YAAAEgAAAGFjbWFrZS9jbWFrZWdlbi5w",
-    "ec0823LbRpbv+ooeZGoFyCRkO5nZiRJ5V7HlRBtb0kryXErWgiDZFGGCAIwGdSlFVXnaqn3d2pf9",
-    "gJ0Py5fsOacv6MaFkpNMzbDKFonuPn369Ln3aXie9y3PeBlXnL18Gy/4m0RUIqxuKlbN44qVq0yw",
-    "vXK6SrKclXySFJxN8uUyzqaCXSUxO0yyD3Hoed7GxqzMlyyKZqtqVfIoYsmyyMuKxVmWV3GV5JnY",
-    "2FDPcqG/lVx/E7dCgijiap4mYz3+GH6agfFkCUiGk3gy5xEgUiQpZ7FgkfMkWuZThY8aMF4l6VRD",
-    "9DcYfL7BR8dpnA3oJ78pYFGRXGM0y8tI5KtywmVrkk3S1ZSLSFRlkl1SO005jQBVPe9gI3BmVZTS",
-    "84oiTSo1g9NvnucL4WI3ydOUT6ooL6e8hFmwSyTmPE0jTX+JWT7+MMmL26jIhYYtOxfzWPBmJ9iY",
-    "rj4u2iUXBewWUAHW1MArLi+voorfVESCKS+wD/ytAFnY4oGDfFxFqrmIcFcVNgA/T694RJsSTZPS",
-    "dEToTWzEgleTuaEh/VJDizL/gPNk8ZJvbHzGTlYZMsNoVNxW8zxj2zjpdpVvO9wRFrejERM5cDhn",
-    "kjGmOawT2JRlnE9hvJwaegGQ47+cfXd0eLx39l24Eb3ce/ndfvTy6O3xwZv96PTlycHxGdtlwBU+",
-    "8qnf5sMwkkuLglCt2w+CjY2NKZ+x6KNf7BCDsx8QRsCGL/DvDpFJKMAFjizSeMJ97/17b8C8bS9Q",
-    "hARRy9imt8meMGF6we8B24SumwE8h196OlpVNC7jCVARib1a8qzyxU57cpDob2Q/pvsxnzQE++m/",
-    "/u/zgP304/8w1AnxNdDLA1JN5jEMqHgpmF/yj6sE2JYBk0Az0Ovt3uEr6PQEfv1x/+SbvbODt5K8",
-    "EuYX4U1AWgTnrtTCRe/CEWwGQgnTZ5fc//0XgcSaBBkEbpd5Fx5M5nu7HttiGdIBnpg+yYy64Y4D",
-    "kKoejJ8xv0QA5y0A557TT1Efuz8BnJ8gSLktcSI4+2Ocrvh+Weal701ICTJF+eHHVQ76VqoSWosk",
-    "giKTZ9hDCluu9k3JvY9Pd1gKivocQFy09s2m97ZLbxwKIzMOW55n3EVoyqp8wTNW8FJ25CnHfTf7",
-    "QgOBNEAZg+uF2Y8YSUm4GSrRgDAuCqCMP/Pw0V0vE8KGx0Fw77K29z7zwg95kvkEy1AGaVdEShlI",
-    "RU0aJkLNYcRPqjofWCjbsfQ9myyn3Sx/wpf5FQeaDQ+QO2ekIpQCAj0FuiYvb5nUTkybH2UW5XaG",
-    "GwRr//T48+eoiNK4AuIs0aKi0uEVqic1sgwnoJBBiU24EHkZztL4UkCv6wQUAuJwR9oplOsLcX33",
-    "o1FIE5yhdcYnLBGA2mwGVgJEFDeCX3FAkt/EywJMEiq6pGLXoBf5csynU9hn2ChpvGANJd++issk",
-    "zqptsGQEm2w6mH5U/mi+AOgE+sI6CW+y5ex6DqwSs62tjF9vbWkijUaE8jauAma8VL7FFJHKpHDP",
-    "89XlXBIWNAap2zBH3oSZXv/7N4fsGpbCVhnoE5DtachOJeizdwJonKSpVNIIoORxqjbrK8WhwFfl",
-    "7TYui0myAXVyJehkwmngSvByE3ciBL8G5q5KzqVSgb0CmNrjSePbfAX+kOaPDaU8EB4wUUhs6FvK",
-    "R7EttNEjMnqWrKLwSImpytt6FHXTckIqH9hUGT60j5bl6NCIgfJfJryo2NEpqRwbthCPmDEXxF8h",
-    "khS/NFH4JTOPRQELlxClmwXbeskr32vxtxcw2AXPCzRp+ywAbAKA7VkQtISlBFCj+VAv1PAauuAc",
-    "NAZIq941+OrLplWWfOzcUWSfAkVLbrptawpi7kLbG4LumBJ8EsbTKdh65zlOptFVTcCPMCcy3xrb",
-    "SHgQpgacEnLU33fFgDlLv2/1ksj0kceSgiIE3ARqLOrlLsuF1oRAiF4hprqfOxrbP2KzP9scHnh3",
-    "xdU9OjYzb3iwiT82m9PV5IH/DXk+Am1Yw6owZVSwH3nllk/WigDa9kPkruUAdxh5JNecLFazWXIT",
-    "pjmoMt/wK/UCxyKceDXeC36LzoacNJyEOYoBOFGZ1DU8VQORDDBygjsNZqOQf29ubBo0YBXFA9AE",
-    "ATntB3HaBiB4S9lptZhNYGiHkOvYCWerpdevhRKHQISCnrx0n0HfoFlD/joEN8X0RCkCKi8SdPEA",
-    "TVD3XrORIsfGWGuBEsvHhXO+w13OygbtJml7Eh1y6Y9EqaO/dg2iOY8hxgNU+NIaKwkFcg7o9sWm",
-    "DRoa5HAbBzU/0ldFYFROA1z/Rj0JaqiH9sCh/W+A9tI0ePS80xRK1D/dUyP3zBFXtKZKOMELXOCg",
-    "MXiDEIYukYjc1wvfAU9oQnp5wDpd4xNpR9ExXWi/DYNZ5muLD56BAFM2FAW0zpIJrm8bHYMVOE/o",
-    "rQBphQxVCGjtjXaGUdYqhCYR0luQKDEHyiwBdetv4QQ9kFAjLlB4qY+rag2tfUf6FiR0rlWB+a/a",
-    "mlOhedUh3nIzctEzh1eusipZ8jBXMh7IEZ85hJytwHVT2oT5PLwMmdF6ake1sgmX8SQXN4Y7YWrL",
-    "kCEWklYzrxfCHYy5d81VY82t9XYCBiX6C0BvNOD24ot065+y1ppXLba60rQ+1Bw6K+NLDKmAi3rJ",
-    "82zAwucDCOL/yvy8QIc+TtNb3C+ISMB2cSWBxJia933Z1sOcRVxW3b6uZt2kjthhfidoJwA97DUD",
-    "008T34d3yb3XzdDki7SZegz+7MKdBdFs+FQ2t2vXgPqRrNI3V16bPEmSYcj0aWwpOnlHbLTh9nOP",
-    "4Q/RVjuaP/ayW6BSNsTEn9Z9aO4pz5tSBjJNFlwGtgh9m7SkmoKAzBOzw9UKgsta0zb8YNA65NhB",
-    "VAvBX72dCdo4PyADtZvGy/E0ZourHfh3/vQicHxm3NArRiFZRdmgq6BtY/AzyUH5ZKvaS1ikgMzC",
-    "8b4UTI8SrR5p0PQBKAqFRQqzIgNIF1ftQNPz7BrtKTJ62u0HvDC20XtWP34AFlJdMyzqc5cYgdl7",
-    "2h13FNLft2gNsnuDlG4yCXaG5+fPLjYcPxnYfSN6c3D4fXR08mr/BGMHbfh32NOB9MB2GEizp3x4",
-    "+PX8Xllrx1hb/odoetSkTIitMBd6Ycw1OB5DCuXlYBlZMZUSJ0bDYJ7YFNNDzFdZCIKmvDH8oXAL",
-    "VHJG2frhJE2kva/miQKLGzIa9cnZaERJgzu1FkqPm4yMTg9AIyXJRE4YYvolk/6VTkignFqeFK5Q",
-    "5dFwbGvTRL7DrE0gnajGD9iXXwaOr3TuunoWCgj7QvtRyqNU62tHODkQtsQ90/JOG+Mq/Qq8L9RP",
-    "3T6Z45EaHkWex3F9QYQintHC0UcfYi1chFyDQUvFutY5QVHmBS+rpD6xUIvUKMnNn1Q3MAH6iV0o",
-    "Quu5Z2+vh5oNJ3Q85biczJMr6chaHi8O1k2U9KeUxoXO4zdHBv0jaVBrQEgHHRbVGiv0kbQDhBY0",
-    "NlodALU3Gvisw56rrW0HcxRYWFHcQ/v5MzZo7dI69g2XGh19828vj47/Eh2/2Ts4BMxLOnyrg7jS",
-    "+w8p1O9DRYr3of8vx19j0PUifBK81yL+W/AvYPDBt4dHJ/sv9073N4Ia+tHpLwEtH4MD8EK6tz+A",
-    "4KxufrgGOc6vRQAzq/Vbs+NhmNpJfYaHcCPUERFsho+/6g2UVjnJKmmVjSI9Bv8JlBtlpYeiuk0x",
-    "x41+TULnsiGI7mjExnyGynY0op8DCu1Gozm/sds4L+Cnv/fHk/rApigTNA2GBzwXNNmKunGc51Wa",
-    "Y8yrGn9nNcJsaELs/jAjPrJ7yXFfqF73xldCajiGXzETeK6J1JsD9uzp06fggYgWYTGoisaSwOtD",
-    "SveRofLbuNAnrYQJ++k//5sprr8lX8s3tkX1CxWbaP/w6zqUekEnAZmoySwjsP7Yq5U7tSmhFtZc",
-    "D+7b/a/tt32Su7ZEG1JLGMR+YML9heO4LYkXl+Flma8KWDMuVq8OM0GOM26t9twMwV9egMtd/OOs",
-    "lrRV54IR7vIBUMRiu6yxRCe0wB7KzdT730km/K+mjT7YlI1KTHQhgpYWlYxCoVkvLCYgNHKyh2c4",
-    "4NqBage5aInEVu1uUaIDtD6frgrw+MZSrga0Hjq4J6yMgCiMkcRrhVol+XGbKW9L2686yV3v1rau",
-    "p2WIdyG9LGIlhKm9LBpLaa420fxuw9sjDDA1ynY34zTwavCDFB8TvUqVl2Qz6UcRVvmqKlaVxBQP",
-    "cJsnzAM2nsoyBUJW1StgVrCuFeCiGvLZjIp7CBwz7ucqW2T5ddbeaFf3wW6jeyPq3cT84XhaH34Z",
-    "wU0G8rSZQ2hM54uEsSuZsUxyD3NMGAyHEikgB9XjsCfsGfuapTxrjsQPJiKomgPbzqnzhZtwMGaF",
-    "PMIwEVE8BiRXgEkgae0D9tusCIIO9Am1Eo9pBZ92oE5oBezFLntO6MZOCDpUi4ghWtPC7T199vzz",
-    "L373+3/+w5feA1qjXly9JHlo8jNWgx9Qw8rBBTBBV9gNj6xTopCnM2mqGs8n4urBuNo5xFSoA054",
-    "Jg0+cpUDovXU6mCyLsRwh3Yslo7p1PFNb4YUpnww+KeDJecUSJ25EDuG8WMSCLi3NZwH+jdwUz/p",
-    "BETKfKfIm5Ne93hL+5QD1lVrcmyCHgzRqVZgNDp6d3b87gxk2Ig9Hhpob0inTWzJJi/elIA1GAs1",
-    "Qfdpkjwytiu/JDP1FoY1DknqI216rkxB2uU8ogVN6aCJvNImrQkctMhAG1CQUjLz7nDae2zymoDI",
-    "l+0ExFWNXAcgHNQERB5wJyBo6QOEg5qAmq56E6YLodGbOl+uuABFhpbrEXYFjYnBQQ+1DppaCKg+",
-    "G7043eHG3Rvbdl2C/ybLG8E3zmA3DZNJIzYg7lIMrosp1zL5KdZdMv/46PTgz8RsY7S8zP+TCt2Y",
-    "mIDvV31FPE/5VV35ibVUmJoagIgIXrEhV0VZeBCLKikFM5CORqFVXJKLULI/7A4m1AxBYFa0iHo1",
-    "RINQBte0XhHpfY6r+ly0rtr6Vz6Z5yyfzVAHATZpPolTz83RT6g4SBPF0TlONdck6G/znMWBpeU3",
-    "ScW2x+yZ5Z5W8tDce182SrywTIAeNnWhD8tCfY35EaWr8UnJ4ylVpPo8m+TTJLvc9VbVbPgHWCVh",
-    "IXY9VQvgUbCAfRvqF+FIviFA+B8MboBrZU1hlNQe88dti5ir+ka9dL3wc++z32yDPG1DD7k1wCjw",
-    "bUtvxIWkSuYUIPli3iCHmP9iagCIRxJimU9RRcMA8E4qHwMgrHflDorU6Z/Y0/zZs2fuLJM5tMn2",
-    "H1S7LeJibjJYy6QyKkWWQVfxspBqXdUy1q4qPd0aKDOjBF65+zDKfjDlyK0iksWPLSBSpu0BdRkm",
-    "zyqpPzZIWTiu8GgUT6fRZCUqeb6NG4glZqacnhSEhI7564ytiin4sIJtEYpbzJdGlWIbIHvgFmDW",
-    "9ZSfsTsHJX2w5ApjGxu/qx+WZ0ojzu6ijz6hYqox12klCQUYBaH0lKyee5PllIqUsICFantp/cFF",
-    "IOtvCIivC8qcKpPHwa/F5yHozqpr3VfXtLLf3t29fLv3PdV544P7ezbcZ1W+Ap2/tn5VEg2oZrkW",
-    "wGWofZG5fJfj6naNDdJdYt61kYy92j/eP3x1yrAy2aTIEUBXf1zRn45Ovj84/DZ6dXCy//Ls6OQv",
-    "tLdggLtZhTFdK9zZHHQ+bZQrg/Iy1wKWs/rSQEu+9KUAW8KU4C5nkeXT79gRJ5AS/yjBa+cWXmOt",
-    "KtaEvn2NaUqqTpFHE1P5FKccjQI8FPn25UtGyk7QOZLCGuJVPAiqLwdgcag6OXqNjiZVrQ6pSkbX",
-    "AAvmNytpA1Df7jq20M2xCopVrSzajNFI5d2h1ZTbQ2+sryVfToMBLpSaxFQjY+2tvMpQl+3q0nJ9",
-    "rUFKFVb/AkRwSYYKAx35SKfdv54n8PA6X2FiBU9arrGOXdbhynpbhJ1MAbmkutXnb1JZompQNcWq",
-    "nlcWCGcESFcjy+O22CpYrguGA/cYDdkD8MOzGsUojRAB8xoOfXu8yDxHY+t27QhjW5HlFCPluixW",
-    "VsUqrAYEtrc4lci9Pvgk6KgzFMQuzdfdRwbrpE8odSCJAY+e0jfYRNwkld3AkLwGWIHhoeLI86T2",
-    "+oCO9Bz0OoiH14qR7WSJC05/CCBlSXC3ChcAe7LLnj8Y6wIGbpIDMJE+DU4LrQF7wT5vhf6wDqbw",
-    "hvm7pn72wNR1HyuCVvpsiYn1SCySwr3W01sQOs7z1Giis3Ila8odhXH2DtwVfXMgz9JbKSfyaJg4",
-    "mF+T9okzErkwBz+Po0ZzUEBxMccCVvD36BI+zEYYKsgjaOt8RR/mW4/wpH+g7FrXJQyly8AYyQJF",
-    "WjRWU8ppOkgGQiQKGmHZhj69/qrMC3X+L/Xzlps/2JJHjTodoSwlqCEKaqRiUrcDVDWBUDr9paO1",
-    "5JW3FFVtbQfoWoKqQZDbSAm40lxhiCdlLoRS7FzdFzhR1+gUzBpcl/5XFXH6WV5U4RzP4EYjsqTw",
-    "W8CeS7cW72HwXj0uZA2DoUDI9swtDaWGf/rxfwUwYZFIy5dR+Y8y7QuOLAgwIHQXaG6IpHSNRF4s",
-    "weN+i5hn75DHSj4E35ZueRBDE7DRaBnfjrG4cwb6dh7ZzEmXYYgq6p6HvXQ8b7yt1O0TPZEsk9W7",
-    "9kY91TUVS/BwidOlj4U3yyRxhvk12n5JGWKGvETTCS6MAFLe5hneJcmFsmPVaiy+0hdLbIS2FQLK",
-    "Hgrafvg6TeXBhOSLJLuK02RKV2Rat0Z6JZSkkwo16qoQqqxpRpxaYB6ZRQNd1ntVgdjECGCdI9Pp",
-    "YbHGNJbYq+gworLxoYSsXxvFgb42ErR0u7mdEvSr8LbOpmhReXJ+w8XszGa2dTbslFQjYk6uEPgs",
-    "6Hm/Pnizr3yeRBgV7tMhDLDD5WTCwA4xMGKXvKq18wcg1QOXZm07PkNr9vaVqQ77QDIAz6xHLbZ4",
-    "HaeCW+NfP6qv4164DtZDN06ndMHkgyK6TBhQXNR11w7DJaS5sPbC9ebbGbc/IcjmjfQkq5xLu9oF",
-    "tpNnzem0eNl16Y0eTSECUffcmb2NroGYDMXrkcsFDPLlD7GLLDTAjJeoonxBP1U59MPyimY4quvH",
-    "egq5+mrJdhu1ZKZWitzFdaV4CsHiNuI33L7OLG4x8uaTVRWPU+7cYJbWws2+INqWU0H0WiZZslwt",
-    "I30l2IcQ8/Tg6JB9Hj5/Gtgehkra+yp1pmzb4dHhvtMNr2LJ8Hz/z8dHJ2fmNraK1k/Z0aE9YEYj",
-    "9uSQb94dvHmF4bAJhB3Y6ruqguwmeeuGQ/eFIXIKmynMzosSLa2GH7qAu+u8MsA39yIsiO6F215Q",
-    "A7JskUpGrL+AD2SRqrKeTHrC0sTtPuAYuwtX6+jPDTSwzEOtjQaNmG0X5AdjPgsVOpt0bghZOVpl",
-    "2oid9dKf9L+awHdXbA1/rJ9btPzaNrhIFhvUVQdYMBGi60qFFGagU3tS7PS/B8Ct92hqgp0WicME",
-    "PNKywgJ8b/hq7+TVu4PDIxCdEyUbVgSLpAH6d0TBzi6BEK2Lg90tayPk6Az9kZpo0Hre+f6FdjfK",
-    "xTnqM+jtJEW2o90bDr320y35igr7UR1Kt/Kz2ku4Uztzv0Nf1TVBOhWwSPXYvG3HVG7u1l16e4r1",
-    "yVQShI7EKX5w22F0GTeKdMlaTANZqju1XUvF8Q4IlKqZp1BVG3DvnPeYeRpZExJimhrjfd2pnyo6",
-    "Y3qHIxsXL1xf0eFpIgF5XlSI1ce/XdORm4hLU+LTQf5PSdC2+aKVpG13CXpbPGXq7arirkpjp5PM",
-    "ONU+ljNYZliV31KTJy417DW3KOWJvnkbAlVL1+XF+vNk7aC4DNXZQlxaA61rxp9egqwWIJ2hZiGy",
-    "WtnAxaouupR/N73NlhE8lzDxqtdEqJMKpx78AtZ6TpU0Vs27IW6PniE1U3K9KwxAMoDfzwM/X7E4",
-    "yP6aaqX7TAY/9qlHgyv6Lgkoy2ro9nhb2sU+/zAiK1146XJ2XN8YtC5HKA9Rj+t6WYUp4awdEofI",
-    "i/rKqcPtCNvcsOq+INVByjkEcC2F4B3mznXcWb4CjeIDrvKVI50Xcc7Dr3Px4mLQ4AnP3NINn22H",
-    "z3/68a8D1n+rUha4y/MJ1WtLddnS91TVbd8u/7L5kh8HE7BuuNp79j2VPmrwBA9zU5RD0DfAmS8o",
-    "LRfsNNYDUKw9Ot/54unFb8r7u01Y2KYuFLQ6YI78i6fSK97cvG9iTYzQFVdoDml0G8iv6D0/LmYw",
-    "Iy1AJb37owa0zgNvjOfpzLFP+re0TQLd2LpP88o/wbLPXjuk4zF2zMDR8ti+wKO7YJxAkTu+1iuo",
-    "38NRo0KvArEwvWiPN0q0y6fSFO2YV94aq1WFYx+w569YG6CJ3jhFXq/+68196Ey+76DbWe/f+8Qb",
-    "n+Lb9OjIvzexZbqBdCFrPOKtfr3vdFj/Dr+uy2yG0TUGVprXQZ3qrDHtpcuWVFPJ1aSeO1DWrux2",
-    "1toBpp41cGAmr1Xn+pIeS/Ka79IYT3fHjVdv0MBddzluD7foYvfcZuCLBjBa2G69RrfZKbbZ1aaO",
-    "Srx0TTvz1UWp5p0GO82k2GeWZHHayJ45yMk0nlNM2X3B3uoT2a+cokubsptJaNX2gi5UrrnV4XJU",
-    "K+3VcbNwYEH/x8h9qesga29idOFc58x+TrpMGr0H7V1jkERDBlvrq7UH6hpMH4CoJKz1z46DGolE",
-    "WYkW02EI4tC00xL1Za9U4grvtRggTqlBQ/F0lmw4CFq1Ue5Yy1vvfF2XgWCFgnh6ky/aLyrEjzn5",
-    "wmoDl6tieqXkz7wfgZ/WCZoG23tUhp8HSkgIRpPhFZkVbIULXZGzuKMN5zNt3xNBqkO+JJAEUR5M",
-    "X/Is4qL4/DmSFHZHwLR0yhl8pV6w1wFTm3FweJMKDzjVuRoe/Dbvn+IRUPNGavhp6zXFsO31UR73",
-    "o4/dglYjvY+n991sBoR+R5toQ8BPi2NFUGcTWplBbS9k8TrzLUf//m8Rutfb/7cL3PscN60sjED2",
-    "Afg7hde6oWFqLc1jUa+ze+S8WNDqrRxFfDfzYzxF7Pdruord74Re7ytqHCxn0UW/z1uEXm13kYY+",
-    "6C9aQwc1BoELRkVzrpfYDLZam3LRVBWtHq7ORXXe4YbVNMLP38CDdWm81oU11Oj2XmuSf7L7Glo7",
-    "wfx4VtWpkXWerGabhww7ebw6QnYHKDLTGwqbLm9rfKNDPfIx3oWDhOtRaBxET3eLJ9phoRlha2lZ",
-    "DdI40t5786ZbUdJcdNUjsEvIu6NPNIU8cy+SWDdo1F2RcZqPSZtQ55CucnDfucjRUTXRZUpbPkzX",
-    "OLp+QrVb0uvA6XsvUjZHm359b5TFj3mrbGtuqVzk5DivU7HSmuv/AVBLAwQUAAAACADlaq1cUtFn",
-    "MQQEAADnBwAAEQAAAGFjbWFrZS9jb21tYW5kLnB5jVRhb9s2EP2uX3FQB0RKYyUZ9mUeXMyzkzYY",
-    "kmZNiw3zXJoWzxERitRIKok37L/vSMmxkmDA/EUWefd09967S9P0plHSw9SKVmoDFkvZIJSmrrkW",
-    "oKRGB1J7A9ze3tO7865I0zRJNtbUwNim9a1FxkDWjbEeuNbGcy+NdknSn1nc/XOVwsckeQOrVfxb",
-    "uPD11Qqct7Jx8GdrPH2wdSjAaLWFjbFwa03bSH17BM7E1NF8+mn+5eLqIzv/5aerSXqPWhg75ras",
-    "xmvDrUgJcY3UBGG9Cn8VvVoVBPt+NgONKBz4CqlRj5Yryg5YZcUtL+kkcEH33Hd0oMIatY9V8tiD",
-    "voWal9YUCZuzm8+fLq7es/nZ+cXVGUyIh4JqaqTCzB6M5tliOvqdj/46GX3Plm/zSZotvqbLwzw9",
-    "yBN2/eFFQvqVsenscvrzGSFnf4i3OWPfpHmSJAI3wCKBzKJoteDaM9NSuUyYdq2QdbRmbhxqzGH0",
-    "LjzHCdCPtLwJqUQ3kjyo1BPfoPgWLUShD0O/J4fwUKGOBJEn0Erqu+IOyDiRqCKJmF+CfIGT2SW/",
-    "Q/gOMgqINQjARyxbz6mqSOFJDsFnIXi1KnlZIes7JtrDxyIgXdWioNToFEk1Nty5KG76o3UNfXrk",
-    "/JYwvblD7Yrgr+As1vmZ0toQfv3x5uK3HjH6L+AZKt/WpHXv/Yb7ylFxVKCyyMUWWt0V/wN1Lh3F",
-    "1VxqFxTnG/Rbso0vdmTGp9yAQp25HN5N4NvYoVucLGEygYP0oH8fne4OOiViotbE+IRuT8d0vz/f",
-    "xEQarWDAGLVPCj+LNIb9TTI4cL0/hmxkRObeCWGkF/Sy3PshbgSuSauGSiXRuryCmCHR9c7o+7WQ",
-    "RWLBtgpd3ptgHq036mUPU3g1vTyjYeWqxTBUG8tvw/R0XN9hQ9904Aj5SUd4kL4KdouI/XJoLDq0",
-    "9wSaBT5K2jRtTW8hOfr3wVgBApWswxCHgobaNIqXWBkl6Gq8755IXyy7yiNflUQlsnocZvCS+7KK",
-    "Uc9n5yVcwZuGlktWF3GEspM8T14ItEkHU/x3MMkQgODh9B/G0q6QrghqbQIvt0nh2nXW3R8B6dl9",
-    "6A1M1QPf9kbv9Bjvdvtx2HCdknHDdkH93HTcFvCrpOX44Hq0Z1s6K4riCBrj5OPknCuHeZiecBOX",
-    "7EU6Gx9fbkn3so2yHlN80DnYpMeTmtSXYig9jYKwhlZ/aSwe33MraXsdK7m23G4poVSt6Gey07Hh",
-    "lvImMKxsR9SuvM+2xY4RWoOvRA7nYeE0YZYi3F7OOnB9/aGog+RZkw8nsH4+cgS9E3yo4YL6fXLA",
-    "aZ4v9xhIpP03Rr5bHaHmZBARN8f/2/BddD7cAHSU/AtQSwMEFAAAAAgA5WqtXEy80kKMAgAAXgcA",
-    "ABAAAABhY21ha2UvY29uZmlnLnB5tVRda9swFH33rxB6sqF12cNeOjJqmj4EQlOSlj06qq00orJk",
-    "9NE0Y+y370q2lMRzoGXMD4ktnXvu57kY40LVlgl5qc2eU1QzRSsj1R4pqiW3hkmBUsLZi6A12jGz",
-    "Rb0Bup3PEBVv6I0oneUY4yTZKNmgstxYYxUtS8SaViqDiBDSEEelk6Q/kzq8tZyYjVRNZ10TQypO",
-    "tKY6mMejDtESs+XsOdw+wGeSJDXdoBJ+iOWmdBYlpJJm6PK7R1wnCB6914Y2aBJ95t1JmvlrtomI",
-    "CcJTonZM4M7SPYpCWsLT5VvZUGC/QnjOnhVRe+ze+9J8+YpH+H4wUcudPiLksiIcopE6h0IyJUX+",
-    "Qk2K54vbYl48PEyLxwJnEQ503uJAMIgq9dfZSCTnwy/adgrV8uHPnflYIuOmOTmgBg2wmqqxBsCU",
-    "rF6pqbbPUr6iHn2N5kzYd2Rdz9fr31e99/X6G2pItVhd9aVzCA+Yyso2VBh9gPoB/F89jv6Oi/Ox",
-    "Hn+a8EybAiRJbqIeUtDDTyomj8rSLPFHQZ3OXMeaL52W30DAQbuOAmRZu4oqlOrYkyxuAEZ1J2rH",
-    "EQR13cnNHYUW90f+7KZVsqXK7DsjmIiWVK/khWo/DJryzWAgjjJ2t3lw5HIOtvgcuQ+Be/2xj7sI",
-    "gTsX0Tj48EVsqNnKOrpxW6cEgaaRruL6In6c1gb9QvdSUJg/93dAnZZrDOXD/rt93kUNyODneB/A",
-    "BdOeY7AUyG5krxTL6dPsflFOZ8u728fFcna3Kgc7Jnrz+wRospy+tzApLn4YRfDpuCkHJY6s20O6",
-    "jiPkfByx/eeIn1Z3y0HE9rMRH/bTcESgtWnIZ1LXJ1y56nSUZhcxt4k9h8mSP1BLAwQUAAAACADl",
-    "aq1c+I5df6YGAADiFAAAEwAAAGFjbWFrZS9kaXNjb3ZlcnkucHm1WN1u2zYUvvdTcLqSU1tu14th",
-    "QWygBVqsQJt0bXazNJBpiYoFy6JAUkmzNMAeYk+4J9k5hxJFKbbbrKhvZEnnfPzOLw8VBMFbmXAj",
-    "WF5qw4tCpKwquMmk2rKKJxt+JTTjZcqMlEWy5iAWBUEwGmVKblkcZ7WplYhjlm8rqQyIltJwk8tS",
-    "j0bNMyWsdMXNushXreh7uG1weLLlGxFVXGkRm8+mFdFiey1UvBG3o9EoFRnL8jKNgZ/QJm55xiCi",
-    "YcE4zVW4vokBRZTmmPDHbLqgP+wLO5WlOB4x+IEB7/Nkw8xasFLcABg76uxPpBJHrC5Todhy6QCX",
-    "ywkD2xhXq9worm6ZzldFXl7paESoL1Ra56Vka67SG1BhRglwnsyMKNGpiQA4sB90c6FniLdcolvt",
-    "f2GSCNiA8UYSnjWeNdaxTBbASLNQRFcRaD6Pnka/LJfjiH0EVwEPBvQZ+EAkRgK7km9h9RtZFynB",
-    "5SUYhi+LW1ah9R6Z5ZLJazK3QY3YWQlyLRqIgLO4Ad+UBnKAAJfLNgIRhAwg0GYQ0DnwBD9e8yL3",
-    "sklJacBVjf8tpYw86lwc5ZqCOLZhwp8SkF8lxa5V6WLMZizwOQRjRMjyQuyA6FZRQsviGmRIJIHs",
-    "zlNMqWNW5NpcYLpcsjm7uKT3AM4q8J5P0wg14Am8KkefCiasvo1en0PEq0qUaViNfQ95HPd6xsPQ",
-    "kBAhFM284NtVyll17FVSWEWYGuMJIGBuifm5qoVdrsHsoC6eXnrusjXY3Hf1h5ENSb/tGOgGW4AT",
-    "en4NJkl4oo2yD7hK1t7tkb3oDRTBulNuihZigRcrU2swY6+Eq3dX6B8s2y4PbR2xsK0rwBpTkF//",
-    "/vK0ZYr8mrL+KPCGSUVaTZFPtbktBCugdxZUOgqSXkNUSeUZ1ueJtWYxa/vB7MSCL2YniLjAe6Kw",
-    "gNr59+9/GLY8vgLYGauEmlp9akeaYH/2YFdSbh4BjV6bdi2u1SPY5wTbhm7RYXXou0FfShBg73gJ",
-    "esrFvlfhBlpH2tQVRLspK3qFqWTUbbziWgzb9oQVfCUKypDdLbxZpGsFuaZ23vU/v19psNBaNUNT",
-    "gH8b/WSdFykARC3jb+xLuyrQGdwWcRbckR33x3cO6z4YO2FsufNH7GnjYfEjAJCliybOVA2i0MLS",
-    "aptIV1m+YGeO3gCRTigSnyvoAZg14XjQL6nOQdrFDnSh0bXJEsCNdTX8QWdPWGCBXT55HsC2uZuR",
-    "Z2XlzGiLf7dKnQKtVuRRJoDmV0xAnO81oEIn+y3yEMcev2rjU+oRbfi1sIHbN/bQ6lPa6itYJ3Rv",
-    "swAGGK9VKnZnl4UUxpXuWZisRbKBHjIIKnDwUHrumjijYVg5tx3hjgrlJ3VvtZrth+eQuK9hgzyV",
-    "5rWEEeyVUlKFwLLdfLCTxDg0xU03s7Pm4e2H5HHTe7jl9DaxA3tKNxm4neWNa6eI33YUmCJaGrOj",
-    "mR3vTvBi++eCZgNZIWvYOpyru0nQdaIMHbB7JsHw+nn0sD9h6JqEgdGlL/xwemkwMVus0p6Ohz9s",
-    "qXlZi94Lg0U591KUrMH8dL7ftZjZTf7gUtYyMsscMKdZBSQPLODc3HZsFHd12JWSnyS7y8pOAvOB",
-    "6GFHADKp7SHoGdqI/WBL7fvvHR4JZTAqku14/PvhdbrrrHdqj3h+w6CzKHnYrenqDuUA9GCnGVox",
-    "6XAmfa7z3p3f7Ky7EBymbIwgLezt3aP4wx+n52/evYrPz87efow/vAJaSkSJ3FZ4iFCBqqFAtuJT",
-    "RFn2KQovXkz/5NO/nk5/jaPp5ZPxpwgNDbrRPYOjWZmING5UyUIdGjh3dtOWFnZasx6kg+Sxe4iD",
-    "gjBhmzKKbTFDH1CNcKzBjCVsLyMJLuJpGm6jKyXrKnw27nmEBAYJBO4fMD6YSFuhrsDGSskKmKd5",
-    "QtQnaODl/0qrPoTLrJc1TI+sIWaDEJ0g/wX5HY/ANRyd6RuH5cSQk1DmFoHo40Gbdl9z8zW62Tcs",
-    "sujh0Lfsy3x/oK87wM0Q8DE4G4sjazP0LxC/u3eLIBKuY63rTV97msPu8vq2yuqqq2mKB2YzoH6R",
-    "Bf3Y3eEy97ZmKAJGwUmcPWHBLPBTFHT9D1LcHgrBiwIcmQgNPTTc246aD26N0tRXYtCZ3r84/42h",
-    "5+ynICeXFHnXoprPY+va5IWd5G7WORwW582ziG7DYNci3YhIQg9GQ+Qc0qvhTAoU9q4A7zpguOlg",
-    "8WsCqBEsvBhH3cebnfT8+KHuvo8m3seKAU//YPYfUEsDBBQAAAAIAOVqrVx0nz8H9AUAACcPAAAO",
-    "AAAAYWNtYWtlL2ZxYm4ucHmVV9tu20YQfddXTPkSUpGYxG6LQKiCJECCAAXcBAnaB8elluRS2oji",
-    "srtL2Yrq135AP7Ff0rPLqyTbTQkk4mWu58zMjj3Pe8+U5vS2yvMdfahYLjLBU3otmUrpgm24Jv/t",
-    "h9cXAbEipdi9lqURstCh53mjUabkhqIoq0yleBSR2JRSGUgX0jAnNxo171ZMr3IRt4+K18opMyzJ",
-    "mdbw1XzqXk0I4eTpaBS9f/XpXfTpl5/fXNAcqmEiN6XIua+8y98/X4efp4+vHnvBaDRKeUYlM6vI",
-    "SsiCFyaybqKcxTz39Yy0URMaT2jDbqKcFzMShYHN758HNH1hv85GhAvZfWSFMOIrJ0ZOm3weLkNC",
-    "DoqpHRWAJ6BMKqoAIdMQ06JY5hxB51zvtOEbFwppvtwgEIeYtW39DTIKdRX7XuRNSIfwL0o/CJob",
-    "vA2ciuIAuCDfEPx5N15wOWsSuELSLzvEfCT7lRfzT6riwci9IktgndSWF6lUDgP3zFSy6p8cvZFI",
-    "+zcN1TNKRWIuHXL47wrhO158gM2qHAizxEi1m1sxkGBVX5ZKllyZnXuyrGR/xEVkPfqa59kh2g3i",
-    "r/BVGJ7YYrIfAacFNwVHLexhY1fY0nR8sC3C4ro8Pws6hAeQWWehdTvqIjEyqo3fE0nMQChy9PZO",
-    "uUbtdrbvTLX3LWK3vVeREUq/9trC130chGV9dO8hqOHQm3jhFykKH57Xt/P99tZz9bWe0NZCoNEc",
-    "PPWHtkPAtdEomOA4b9iwPhCqtY4Iu/TjSuRp5Jqkqcz7GflYV7Qr466jXFAN97U1FIgCH4WkR7NH",
-    "9GiCf/NHNmTbJPqQl5Ipl+3lANxJT1Nz20J71el9KxKHcDtvIStL+PHvbLr1sNmC/6m8vVu54QAv",
-    "a0KdoaCnQMZfUOVRwpIVj9Z853eaNqVJ9zTubxOJAbvlSiNZ16G2YLzhdzcRVXTNVAHW6lFHf9IF",
-    "OIOs/emlmxpoejQybPkN4kA6ymCaqxLdY+7VuLOS3oobnk4xsJYoJZQLVUXKFS0WLNmwNY8AiYPj",
-    "yWJRnzn02OUMEpI1W3JINtkvFkE46kz/tuIFjU+yH5PQANOQv1hMp+1bqE5IGPstk3nqJouRZFac",
-    "wALKqofTxpLCaSgRkJvoDgVD18IlkGVc2V5oTFPOtzzXlErX/xtxM4hxfAq3iw8nxsoeeNqwGF2W",
-    "iiXXmPAZ2ZidzrTVQRAS+SuRct0XixwEklTa4DzNcrbswtArBgRtehqN2CZVV58+DfCIYBejVf74",
-    "7tX07IcfacVvDoLstMIV4ot3BiDVtEKrj3LNTbJqxS2/oJ+7E4PQwryrgbDuB1FssYjgSOOW6Zpg",
-    "MHlIXD9w7TSg8bgDYjw+jmzQI4WBhHYn9nisOfoSbqDhKu0JbZkSDFg+6U55FxKh343i9shxONaZ",
-    "/vPX332O9jVKCEEWSV6ltiJYoiSO356h+4EQdkgOu6UPeYvW8ofN7zYAr507/cy5rgWP+uBIOszl",
-    "NVcDLbuL+KfleZ+TWPbyR9Vyn8rhvO/PXnRisu3HOw7O6wdGd+a1Gc3317deMNQzD+rZtKBkjpRi",
-    "+aBWl+J8H8uhapzL2I7ez08PZ3v7vRn9zbYbogPROb7VCnmRyJT7XmWy6XMcFyH6qW4nH/vc+dlV",
-    "szppuzonG25WMu2OjNJu6s0C6wZsv9a5AkRM+gT7dhs5WkGYQP3/yvKKv1FKKt/jm9LsnEXvlDiY",
-    "LXNhfG+GA+/8wDjGeZM//UTn/+Hl4Ku9Ms/N+Q0GF8W83U7dUuqO/8uZxR/DYBKG4dWElkhlr79T",
-    "g3XLXn1E7TJR7xHtCoEUXIyXT2GjvnvW3Z31FXj/tru/HQpFTQnUBs6vjoB4QeeEk4CTd7AVtoqH",
-    "INmlJllVxdrOsVakxXviHS0z9qql5/XvCeFHxDuhUxvODmahKCp+l6o395w6YnrAwgnBmdeM7oO/",
-    "FGnvbIA2a++oxtrLLXZdUnX6c5Tbs1PRhqbLLnnL0PYEiaYPrT+/rov5sDzmhzUyb28mrf158xuM",
-    "/gVQSwMEFAAAAAgA5WqtXOTjTvRhCgAATSAAAA8AAABhY21ha2UvaG9va3MucHm1Wetu28gV/q+n",
-    "mOV2AVKVaG+C/hHiAEbW27ib2kYcdFPYBkWRI4tr3sAZ2RZSA32IPmGfpN+ZCynebBfbCohDcs79",
-    "fkjHcY6reJvkBSvTUK6LKmPLZcWjpOT+pijuhD/1y1BKXuXLJRMbnqZMPWdujSBKwK+TKJRJkXu+",
-    "4ziTyboqMhYE663cVjwIWJKVRSVZmOeFVHBiMjHP0uL2Nslv7W0h7FXF7ZXYbGWS1nfbVVkVERdC",
-    "s4F8mzRZWR4XuDUChFEW3nEf0CWvZMKFheGPZZjHgeQZacEnExKCV+zISuPfcvlJPXODIA8z6OBN",
-    "Jt93jfOu3ISCv/ffnb3fM9O///kvVlZ8nTyybCsky0IZbcAzjGS6Y67gnPWsTkb0fHD4vM1ZuAYl",
-    "8AKRMoT9VtskjUGYNNWyC5hwxlYcuJyJO04MCFrbBQqwAwabVGG1Y3EiouKeVzt/cvH5JLj85eTL",
-    "h4/Bx/PzX4KLj8eXJ5cLJrdlyq+ErGbM9/0b2MF1QE7xdWZK80auD3+FUT8lQsKcgj1UCfSGMEmW",
-    "8TiBNaGjEWy5VA5g87nRQEtwdnr2l+MXBZgw/Bytm98Iox9r3eDR3kkExgPg+R15Fc/pEo87OoWI",
-    "qohMt96mQ2L3PF+sfouKcudP4Ra4iE2niOzpFEYXksdswysOrTZ8p055RkaKWZLLQtvv4CzJfwvZ",
-    "agfSi/U2jxZLE63q7y3PfbIsD9QtUq/Q8WD4gmu1zYWRnnRCbsXG7vvS7sk5UyCgUgg5SCZM00FE",
-    "VmxluZUC3ju//NJ3X/Dx5PinZ3xYWx+MjflbvsXjMed2j7R39556fdeI8J5v+KOSnFIRGrIiR1Q+",
-    "bHhO6YMKQBmySnLFRWekcQLRDnLyTUDUApXgYumN6n55/LeTjydfnwthIw+8Zy5rA9gTMG2OvDFW",
-    "X45PP43kamMRBHaDEyDdfj79ShkWJ5HUWPhDWN+0DHWqLJjTMqM98K20DZMeqD3xu64dI9457+GN",
-    "suoC+M9UhC5uH2QIe5T1AIw/XHW6mK1TfySWh5EG9GyXsr6UrfM+nk3CUUQDUGPaStBUnx5uH6SP",
-    "3VSdcfQGxuJ/z47zHStQSauxEvyOBgLdhynl0ZOQaEV6j3ob79C7MZmkyP4kNwRNpuv0Vm06QNXU",
-    "mY5SP5azvUjsgfjP5fUoegND+E+TySTmazYonav+LiiDPTZ/T/+zf7CzIucLzdhxLvSss2N3aD1m",
-    "CAE+myrU6YwVZEdCIVOt2Ta/y4uHXE1tRKJEZRioHzQPae6eAgNmSZZG09vjT7+KY+TLWVmDEZIv",
-    "ZFhJ8ZDIjVtHhOOphpTy3FBm79XNHkBDFj6GZAruqgPEFjdd7uvh+PoGKk++VtRAkvDG5EUVo2vH",
-    "gYHer/+uHhh53K2jyg2dilz74oSGrldGrdyEkuGWmTFSzBhZq9eu01DI2lkroMMqw8oakBQABOen",
-    "xQOmWe0+8BYII640oWaAS3NEwXI3Y/fIF2a19jGIZMLdcwccS64HtnvvwbtVUu4f0y8qcrTZLa8f",
-    "3pEody059kjdpftBsko9ilRzwPPYxI6dsp2XmKH6ETcVKysVXHtRUhIfHAPIF2WaSBB2WhKpoCQo",
-    "j71jb0kUdXc1//HGKsC+g+WtOC9IY3TUNEAiEXFyC7YvaUF+8sM41rJcHdbM6yxUXiBvdlMAFlaP",
-    "KLKDvMgDNdmgKriiKSA6cjGV6mhuiJRVQiOC06r5h089JoBTpQHh+qdDD1QMV8uQQgvjFo9dV6jQ",
-    "EhRXJDAJL7QN9zoDSEDEo5bAWlfMoCB2tXaaZH5yGpIW4cYapkXWMm0UBDk/LEtEljvYorz9IqHM",
-    "5ALFM6VieErU895YqdC9YTqzQDBLYEfQBVsVBQXsz2EqOEbA58rKBZjPezuKXcv5Y5RuY5pvhwsP",
-    "7QE8W/E4VvsIU3sIxltF/VeakKcd4aZU6GW15bOxSbtpgZDjQFEag2y6nVmckpzkhSyu3YmXy/lc",
-    "izC3ItC7B7lLuedbI6j/A1jMmtsGyUKtYLau0bX7zNZS51HXIa1A4Y+SAuX5DaAO0xfAaYp/Prps",
-    "A4JZA23F39+LxoKB2TYEFxdqVZpO9RaJZXZwGXS7LUlHHI+9ui+1FCtVkpYUa6/psJ6eLagwDOdl",
-    "x0aUif87I7U10ymldke7SE6naleGcUa3ZSF5KWpbUCkaUuTV9uhX9kF6s4GYssaKijTlkQwsP8VH",
-    "vcwLoiLLwOel2qUnL9HbPnWlqjOutuTPKTXGnF6lGN6Kp+UGKzVDKRUYY4vaar1EvrqppxOFRChG",
-    "pqFUjbJYwQYYZega0IOC1GY2GnotK4IgLKiz9/Tsp5OvambAZpaVCcxbOde+ex3/0bu2Y8m1mP7B",
-    "mRHM6Z/Pzj+ffEDGWycYq1OVoS683sL6uHihGWdguSeAL3hYRZsaW4ubAwh4bubfVsW2dH/0VBZl",
-    "jKObsMN9ldx8xixyM0y0w2TYQiMx0civ3LUXHwTURMRnzX+5dM3r2B2JMKtDrh2PXitCsLbAgbY/",
-    "tCPF7DhHz21MrWlJg/SyygRYSV1Yg7Qm1U0ixWJYxXZ0vnp2vrcD7v9tiC5/7xBNmXPUfVnutuVt",
-    "PFg/6koFMi8wIuvacczVKes1dvcpaVyaC9MwW8UhQ23oZJPEbNzOXUK0mYfC3QpqKg8qbsHpAVf0",
-    "yUCFcGuV/qzeG/JaPxVh9K6VM+rtp18RzGJDEw8usGNsaLSCvX9N8rh4EOo1cmyOS/KXivDlsh62",
-    "9uHYQbRcIsWK+k1yGQo6u3JwipriHET4mxb5bUAi3JiXmxCh/hyCR1sURDN/Uay+AS5Bk2QPm4S+",
-    "QogoLNHs6xFwuXRoEqOXxxUP0e5OLi/evsHjD+cXf2eOqCKHObGQgFKEiRy9Mt1lpSwyygkemnHz",
-    "+preFefqM4VQyRHu1OMpKa3etssNx/EuLcK4/spBmivSZuFVZjr6goFzad57aztiB1JjCkjorlt/",
-    "UinyCMNpmmAeplOUQl7hJLnn+pNVe2pEVBbCp486asrIpdN6zWCM6SNo3CvnABPhgdiQA+bkAIhy",
-    "o6LmCP9wseHRnZLV6xQUvWcjfYDRSgy7fAqzelLMzdibukbtrZ7vj9jbvZ3skEpTZxHczzUAJDQe",
-    "mIAhxvyRm9cs9e5p19ejIxVT7czs6K+R3kDjxikvaN+xgBacGlR56FccFSTiqEAkF0R0OvLnSqom",
-    "WZxh0ZWWc5PMxjXes4pcWbvNamr26s3NSw7tqESpTv5THyV9lVauQw+d2od0Nx5UdPrKeKIGPkoI",
-    "uK9wjK6BdQl8/apal0Z9OzIBttbae16tCpoJBtbZXm3lIeoR9vY5Govc6epqfKo6KaXyLXLYDnqz",
-    "/pgIESnDHmLfvPLde4k1OiaqLk2jx381GLbDCz62urae009/S/aTfF24jtLqB5jtB+HMarbt2JLV",
-    "rk9lsGkpF7eRsX3xUjL3/PKkqgpyYBMkH7Cj8PhC36lj1ALU/j63KkxgLHhFJhlXkO7aqT9OKyXW",
-    "IWZerOnfoMSTt2DfIM931RPKi/rWzif/AVBLAwQUAAAACAB8TLNcr+NCFVYUAADfQgAAEwAAAGFj",
-    "bWFrZS9saWJyYXJpZXMucHndXOty2ziW/u+nwDI/QrkVuWtmqmvKE3knid3V3nEn2TjZ6ap0hqJI",
-    "SOKIItkEaVubcdU8xD7hPsmeCwACJGU7W/trVRVLxOUAODjnOxeACYLgg1RlfiPFqzpts6IUebas",
-    "4zqTSlSy1k/7WVWX8NhgcVykQm1lk2xEViR5m0o1C4Lg6GhVlzsRRau2aWsZRSLbVWXdQPuibOIm",
-    "Kwt1dKTLasmtkzLPZUJ1pnkqf2t1bRo3cZLHSsmu1hRxiypuNjBFU/seHvU84mQXb+Wsimslo+au",
-    "MU3yMk6jbjXRKsul18MsTTfPVBNxUQTcgRUc/dnOIYR+/ymL+ce6lZMjKhJXzLDTIwGfuiybU54V",
-    "PhbxTp4K1dT0FNfJJmtg9cAtRcVCPAOO7HYxDSvKWhwLaprKShYpNGraKpefoelUzGazL1RpNiEq",
-    "b2RdZykPIf4h3paFpBZQroDFbrmYczXV/1nzY68HWxmaES5AhUrmq4l4cUbT+ozL+cLro+FXAutn",
-    "w2nYJvipYERqhyTFyYE+M5hhVoUTryuMUM0yFaVZHU58qsRkCRwsxOdqVrMoh5MvtpGqk97AARQF",
-    "3uzr5AB1QxlbWNrTjtrYgLbPWKMnCo9Wybdlo5kI6vXXzV7gvmmFFLexgt/FVqYibMqtLMR34nYj",
-    "aymaTdxoiZFFwi3TTCXIY5lOWFeRqiYV+WJpSll2TakRCBqqK77J4u6hapd5lkQbGaeyjmqZo3aO",
-    "Ct1RdHX5Orp+9+nDm4vo4peP11DD7FCyCYnY12C2CaYC/uqvqqLvxHwn/HV3x9/0FzSUvhX9vQ7u",
-    "jyYwGAp0xECAOheyspFAw3CoTVqc9d59vTNiOMvLWwliIVagi3fABKFmqsqzJgymwQSFxza91wPB",
-    "EhD9lm2Wp5HF0kg17RJFTIVcAz8ZGKYd4J6yfmkh+EITRH5ZGXhTy7iRYrF4SUTOTmzXk5erMgeu",
-    "n50sFjRZGQOGafkwGM67/nMMWAaA2mw6zL88vxBEUuTxvmybmfgItRfX73//O1HlcQMUd88VdV8s",
-    "aplklZxtynKrZuXy70lZgX0oVWN+H8McqFascbplQTCN4rqVmsZXGm2G5ffOKmDE6PoDdEcbs1gA",
-    "xDmVl4XK1ptGQblhiAVZkB/LV9Rx26trMtttUcVBDmTRKFK7qZB3iO/lVmshIYYkAdeCQeDRaEBC",
-    "xpK1KZxNs5rPOwAdoI41HxXLRRrdAsUIB/GwJimLJivarj02mcVpGnKvDhJDDWS6/Cnr0jqA0h/t",
-    "eP9DmCUVkDJMxeq3ZdE9k+wtyzI/NZhAdbw4+ukhNawNbHzXjPmku8xFcByc9gESJ8ZmMEclS4G0",
-    "q6Om+8RVTKCDzDM9YBQ7a6upXb1etYG+ThlDA3Goj6eOUaNVp1nSsIU1imj17+e4EklclEWWxLlF",
-    "YtxlEToOEhbMiZamMDOiuirbIj0dGQJW//XeytgyVrITMj1PV5CQ2djogN0ayBISBWcD9BtlD/wa",
-    "mYbcv5E1EZiKrdzP83i3TGNRnYLBxVUYrvbo6xkQxQcM82Aa+EE+wWp5NlZTXQczGBsLq3EodNee",
-    "PFYd36LEjnh8tF2+l0HbOMc+szVofIDPYEZ4kfgwGXVOtFrYbp5Xh2boOLAdUWLh2esPhlpFPFFL",
-    "Q7t72DsYH1W3gE7kEYbWDHWWyhA+ZLB6PlaRuDMwjlngt7ohfAttM+1YBrwyf6HW+zQfRM65kfhw",
-    "6MYBqs2Z252vNWhFuoV/hlUe5+f4NGyj+TbX38MGA490DiV2WRl5xkLmoJ+4vmF/zZE5fPuVPiMJ",
-    "CD67KvaFsXWkVSeBY201NFJTQLxn4t9bcBsJHONincsXwO4E4he7MvBQ0qxYo4iAJd2AsQ1XbZ6T",
-    "jYZCBWsGNuXZDrFBTWZH0eXbN1efzi+iDxcoInIGIUqFOsTjP//br+r4GfzTA8CvIPzX9y9/O/v8",
-    "t+DLd7/ONpPgH8M2L7FNDG3OuM3Zc+bXKo/Xag6j/Pzp6uPl1eXbiyk6cc/EFa49QWRcLI5p3ohg",
-    "yBYlVFuBkMOql3vyazbgjYg3FqFPRAOmLNnEsOb//ud/iUKiIDfoTYlYAe1h7BvK2XoGIz3TMxYv",
-    "UQaK9WxzBiPvWqCPsCQLCFZb8LnJA18suNFigWy7/vjq7fmrD+fR+buP0U/R61fXF29f/XxxHV29",
-    "++vFh6HHuwq+4mruwe+1loBACWbdqUuA1i2Jg6lTAgFy3bgluEO5vPOKmn0l3QIQb/SWu4KVLG68",
-    "ZwBOj2pWNEhEeWWq/OEPP7glJDleG5xv7o29o0X4Jc3Gfa6aDWxP6hYpcFv8ArmLq01ZS7+w+fuu",
-    "8kqydRHnXkmTxjmU9svqdb+kKXdZ0itEt6hXBH5GrwR41S8pewUgbL2SomRt9otRooYlHoebdZ9/",
-    "zD6/UbbzONWCQtReQQGekMfh236TW1eMJl10BZbZqhjEOuCHl02EGRNSntBEjzYg7PmX5PDMKR7y",
-    "2oIlgPAjkWHw669oDU+CycRDQhcCjdf0iOI5U961eZNFSq534DpH7sCPzhg8OvRgMeQuCHIMThCM",
-    "biDkjsHNg1CpKQGAUB/BXBSNCK/P/wJ4lMBOA9V9Dl7FkY6JOqhZ1RIUulQnTay2PcRZSlhv2iYA",
-    "dk1pcQcb6rCJ/fuUfes17Ad0jHXCDua/Naj4J5GBUVBCG9sUY3laCc3NhczF4sUlEAe8lH7kBfK6",
-    "g217ZMc8B8Z48ifkySMBzAb8dPHq/OJDdP3pxx8vf4l+fPcBbM75xS8eRh5KCGzu7oJ7shDX26wS",
-    "Chz0Au0bLAXkQbVLnLfijcqKFVp1rK1jMHVNdiPFM2sZOQ3YxcvR9V8u33Oq4tPr88sPY2kKB1Dv",
-    "YkRdT+fkHQzklaRl0qK4UUK0V+Fpq1RN/9kjNFtnzaZd9ou8Pj4Q5nIdJ3td0qVG4iIB2qUJkPYR",
-    "+tKw7xAyUcJCZz9txmI0Ewgi0YvXKRGBESqowhK8KZItnVxl64qC9mIJfksuMdoHqElvIYo96ZEx",
-    "GnKh+QtjAzXoBjZ8sXBSIOBanp2YXTh5eU1jgfL8CYYulXSsO1JgCYYNQj1aLKg3zJnp0lzR9joD",
-    "QKXV6CnIU4ZZYkVKGee38V6JsiCi2BkYGwO6uHqnJMUKpCWeGumosGMpiNnnL71khKnoshFJi854",
-    "tzud22zdhwiVDCR9LcMf/uBETZwswDCsrWf84IaXXDLjiGjuZlMIYXT1eOBX4aR0C39C7gA1sW00",
-    "EWKWTbmPqp4MKolds7hCD95rYGeOk4aV+XSXYBC3toSZ5yy950cbEyHvCBsolRchtrB5YLNgtaGz",
-    "C5pMXOzDio1RH0JwX6iKBAFm0ChrRsECgz/pZCqW+wji8rGMQaeFgzTFdRMvcxTBF2lbSfSJ0QiA",
-    "y8WpsnCxYLJoVuIKvGd0h+McMwCKjEon/Jo2KqGR1rJt9Hw4fTmewtBpMh5odhPnLazGERWg8tnm",
-    "yboM+TCw0dkKTEoaKl6u4upUXPm5Cs1Mk7c0+WjaPD7PYPUB9Im6fZyKG2B5DH6AW2aJOCc5h/Dv",
-    "o7YzCDU8JiBfTflPNqsUNdXsIRwfLyUQlsfHwiCg3XWNd68YVKxJriCOi9dSoyqnaPWcHVcDEEnb",
-    "M4gBi3yvDV+j83gwQ4OcL83izk40GYXZYwyQQJNASChFq6ugIsOuAD9TEy69IAfmiLXeZr/KVSNR",
-    "r5s+Ccr2oh/BEgaMAiE1czCAelu2OfsusIqyxlXBGjhUQzHd99i116wW5HEFyKhAFw2zxGocZBOE",
-    "AisOPdQCViT1CNYRPYNCiUYhBj9XZnrUDKMj7fECfmESzBSDs9RrjwRdwezVN+akkRtDLQwOxg28",
-    "8dAbi5sDmsmqEf+BinRR12U9SMvSsszCb7qFE/DDbP4FOFUf4MJN7fl4TMocv/S1sZE7FQ42hXTL",
-    "uljO0Qxso00ApIJ6g6RZPWOZ1p6riledZtAQIlSbOC1vlZUaYmOLPliHbET1gdQ/oWemFzbIx9Ju",
-    "f0M+VudbuF+9zstliLnC0Uwr7fy3Zj/JHEI/1a5W2Z1NkGvDe8jnfiJx4hWbaBoDHjsAdoSgc5ep",
-    "h7V0jhiArBrXk5H5sNFzAFlvli8rjM18SD7WuyvD1n5iP+/ES0MKDkHWEuBG3mSJ1Gdri8Xrq4tz",
-    "KsE8FI1Z3lLQ4VhMjeLshTrhHSEgRG0GKcnLisEg8KhgEDI2GEZUTSrKH5SZDLwnbzX2ujxXYNhr",
-    "GJinRDlTzPMRDbTldIpHOOIcUcLS9E2HxYKot4qOCQH3Y5gpO8VsaHjS5ggKWFdu24ozisa1MMsn",
-    "TaUj6TjHlMSez6YcP9tsKatvCAzWujth87nLGkxoqtJAvzZlxplPS5LpALYrzgPBGUHP4uq16gBP",
-    "h7M02goCnMY3FI5IPnxSYxryvp32hGvUHTrk4PXtyridokHBM47qQyGBRSp9ejTz7nH0LjfgMUw/",
-    "aHCwA+odHz2qx730qCYQqKuhn+7ZBrdB7h2SDicAg+f1Q4N7lPO6t/ZxlNaEH0Fq/Izi3ZMR2xnn",
-    "MdQ+OJim8X+C3o8N8kiQ87+dtuuRPyEp942jEDLPxcD0jE2H2mK45VuOb14W0TFC6WDEKCGnwWf8",
-    "PXa6Yz6eD3eIEIOMpQUIMzxBcz++r+j5hUPNG/LNfCYj+bzRxg94lk9ckhUbL/rr+DjtddSehOtI",
-    "ZGBT7siO8c0XB2d9m9G7aTMdBouHvYsH7gdcZVsvzaUZrD0JiLWnYMIaDsviXQnG+dhO6djaR567",
-    "9UoPe0OjJmbkYgpToHD7oRNHp5m9vTLW1tuTCO9tHHDmmOAB5k4ObLNxEE0yUpVtncgIQCnN0rjh",
-    "GI2ucJwaRowG5A/YUTYpfL1t1Iw+xYQeNJ8jphOH8r1nUzxqPEcN50NGc8RgekMO7CWHvYalB9j0",
-    "/y/k6V06fDrRbzeSo5Q6jtv0pQfTk96+zDD5FfoXcxD5qzFYHg2/Olo2pwmefNSdfthTL32S3SGl",
-    "Va+pOJ4CeN2BgjZxHi33JDEZ5Y9/H33//ff4z8mKOXeU/ShrsQi9a6RTTBvdyAIPICYYW6F3TvFG",
-    "F8ew+kMAT9Jo8JSm2gXuGaP16OidPNP04fF7s8JI3xw8oFWkSCh+6kGc4DTv43A1Oe1BhNFVHuJh",
-    "7ekaDhBj4D7gZXeAJrwOHadRI++aUBZJiZc+5kHbrF78ESRGoo1W80DLkWPVtSV/dz1ixgfzYp5+",
-    "BzyURQgDPzAtcEG040JT8/wR2onJg87GIw4GU68r/84lbhAhjr3WgzKmN4nm28Mezmqwbg50etzj",
-    "GrllREM/7y7wieCrMb73gcBtFF9hwven9uwRWmzw4sfzITHfNnh2hrl/Nh9op9elO/jQoECr1Hgw",
-    "zhiQme7Qm9TKy8S9thdvwtus2ZRto68STTAn56U6wJmRaspxtiiTpK1rEEaI6msM/8NUAhztMrx4",
-    "kCXmoO/y+p14Q4fkO3CSxPt315e/2Es/9rDWpEXcizlTfk6zkh69BALPHrwzOo6XBm1kd9A9JUNB",
-    "5YMLQWZqZnRO85NB08el/om/nd3wLH90VkgNi+1pvJ2eTmrivQH3jgFPdrnvTZWvo/YyGodvNNNh",
-    "jt1g3/ZT1ORc/pqtwL9G80Hy4aYs6PZiuJut67KtwuA3vg9on+PB/cCBIwEU8LjykWsk0OwxNyN7",
-    "9GbHE4jo8PK9bj56CwXbuKN64eHgUNMeaGIzX6PxZEsjTlepNRXqtJ4+lK5jXOof00/d0qSqIqvV",
-    "+qKdd+F76gRIw4vRXHvMX9ad9z1j14f0XveY6hWZhHsEXOqHYM4bL4PeD5x0vs+SbaejrDM69rK3",
-    "OhATzLVPRAg8yAAtbWuF1wiM1tjmWtF/0gcLdB5sj8zGl46pVdJSID3l87YY7yMmeAxrzxV5Y1HH",
-    "6TQLVDwG9wasoFo5NxfNCKfCUenMvuqDeknJVD0B7diQM4ULMz100gPCYQEK4KZJzb1WjTkE43rN",
-    "H7s7MebS/J7u06ix10lc54x9Y8422wsYwGwiu1jQ3RV8FrA1s8kpICVfXMI3QqBeQ9i/qbLAS0yg",
-    "DHGtb+wohOqSstx2XE0VXwVaLE70JVaLws5FqsAhDMZVH24y/2BNdxWANSxI3uAJ6UrsYTmO0uhr",
-    "oogg/H5iMwPFUsokzx1h5lNNkCowa7SNbO8sF1lv0FgceDdHhK3S27tYvLgBeif0A3/l5XoNrJ34",
-    "oM7BNSjJI+83THyd5ZOz+aEDuS5HC/oWjos7XYMer+Kb0dqGTIbZAj+D8y2pAydnQM7/Kb8nOubu",
-    "U0XotIWQDUOjERNIbfitLWoZdq+3Te27bb33sEjj8OI9Nj1k0Jq+d4pwbou22H2Qs4SuW2NBvHl7",
-    "pNwasijbybDeGJSwoWVM9Eofdod7psIxkoY74HQ8Nze4KjCKdQnaT+exVIgKOfF82u/Jp53hDsZN",
-    "uNGx6TNxjcdH7ALGytwTiJwJLMt0r5Wgo404y7etqk28lA29hYNZBK0a9mZN/6Vd5wqbs6qHufGN",
-    "4VPPpXA4trIs+8rRyf1kxO/XO6RkTph0ON1HzW43GEOwIjixGJkBvMY512JQlaAdK/d0iDGDZXdM",
-    "AOX+sVz5wFvC+I04x7T1lR98PwRPttxm+vUx2xjzVt4z36Yj609I4sDCkCD3xk6+co5OUuvl4BW4",
-    "mffWiPMa3GM+Yr7VmYPBdWQzty27gnpDH4vvudnnfNtPy2arge/kMqp3+65djr1w6zbRvmqfrexk",
-    "jBxnAEmK213kHm4GfvrTPBhID52+8dDa2DE6wDa8Hg+3TVN6iwiTDCOnHOM9vZTUnJVotCEo1hz+",
-    "jVeOvvs8h9KnB/SER1OxiVCDMfR6NFXnZ5Xw4+AO0fGpgxtsstrmfxTweqdkPatDL+GnQ+Ew443y",
-    "JD2UGRm+82dfzMIEgpstORVf0/vRrIgbJ5G3YnTI3hOcHP0PUEsDBBQAAAAIAOVqrVyLGnuWGQEA",
-    "AA4CAAAWAAAAYWNtYWtlL2xvZ2dpbmdfdXRpbC5weV2Ry2rDMBBF9/qKQRCQFzFtl4EEWtqkgZBC",
-    "Q+nSKPb4QfUIo3Egf18F2YlbLfSYe2buSJJSHjp7MghnpKMPHV/mpXdM3hiswPim6VyTSymFqMlb",
-    "KIq6556wKCDmeWLQznnW3HkXhBhiQ954DJcoiQprCMj9qRhklTxxAZ1jWMJDBvPVzXMXV6SFgDgM",
-    "ntFEYtRe316+NtDVQ9cIqyU8AZq4UyOz3a8//iGPCRmJ7+fP/Xa/yZKFbyYGDXLyV1KXVv+gvFF5",
-    "vMPu2o/6081db7WrDFLIS4OaVBLaSfEDE2r7njAVHycPXCHRQE4MrvMkuvZkNXNMGkvdI3KWcKct",
-    "ZmEBM2UxBN3Eg8zuzemqGo3bFKX4JeSuovgFUEsDBBQAAAAIAOVqrVwfiF9j0gIAAI0GAAATAAAA",
-    "YWNtYWtlL3BhcnNlX3R4dC5weY1UwW7bMAy9+ysI9SKhiYfehhQZsGHHDSvQY1IYSkynQmxJkOS0",
-    "wbp/HyU5tZMW63ywYZF85HukyBi7k84jfHV1r7QB28rQGNeV4TnAJ9gY6WqffvZ4XB5k2yM0qkVf",
-    "MsaKonGmg6pq+tA7rCpQnTUugNTaBBmU0b4ohjOH2dvK8Niqzcn1jn6LoqixgdbIurLOWHRBoa9i",
-    "Hh7dF8lLwPwL1GobVj64GdDrYVEAPVTJDwoFCeUYTfZjm2sFPmU1m5CaAVXipDtOAkVZJNQ53Aen",
-    "rIdvv36eDnoba/YUpRG2Rgel+0QTnlR4hOCkItMONnK79630j6fAfQTamq5DTeH8CoyDW0E61YCd",
-    "DceE6E9s0lc1QCImuUo1iCEy4fg4JMk1/P6TTpx8gmX2dUgqBnwOHPXW1FTOkvWhmX+ee7VjM0Dn",
-    "jPNL5pBU2SITCSDlX9DHJ3kfCG31kCybvqGfoSgSMZNXOuYsvW1VSLHT2qh0ihr/Rxh6rxbzmwe4",
-    "zjBwRUQ6c8BRuzXkMXF4UKb3ryDYenwPMuJcZC6dj63jokRd+9gaztZrJs7Dh/6NwYlHKa2lKE4w",
-    "ojjPNDbmjN3bsGQyfVhcjCthDP2a6pilf4XzA6dy4DDlFgfCx9nxZJU0iZnbFRNvD28/5EuAbMkS",
-    "KJXhP/Dez+BApfncc06RM7gZq6P1QNb9m6ppZdD54T02FHKekyRb0WHUicLyYOcxJ8uwJDp0O6xa",
-    "s5Ut30gaiQuN6UpHW/UfeyNB1ZQsGhOYmJyXva1lQP7uVhpzCDGtM4cOpXrsDugqYsTpalHeVEno",
-    "bYuvi+s+7sCoXZwI8vZxmTSmrdGBlh3tMb5BH+bYNNEzQ4rytCRs7DcxcFg2Steybblj6/r6Zf39",
-    "mvrjc3G67053W+kAL3B+w2NqG0cgoZ1dY0urp1Y76vfFMEXI08wTJrdC/OOmTr3tmWBJDR7tovgL",
-    "UEsDBBQAAAAIALhMs1zQKaAFuBQAANc/AAAUAAAAYWNtYWtlL3Byb3BlcnRpZXMucHm9W+ty28aS",
-    "/q+nmMA/DMgkJDup7IYnclaW6azqyJIiWTlnV1JAiBhKCEGAwQC6RGbV/toH2IfYBztPsl/3zODC",
-    "m+Sk9qjKJjiYS3dPX77uGTqO81Hm11JcZWEeqa1pEhajLJ+IaZ5NZV7EUokwjYS8n9LHY5GNZToT",
-    "6DaUN1kSyVz5juNsbIzybCKCYFQWZS6DQMSTaZYXGJtmRVjEWao2NkxbLnXvaVjcJPGV7XqMr2ae",
-    "cDgJx9KfhrmSQXFf2C5JFkZBTVkwihPZERNiIEiyYZhsbLwQH8NieCO67w93P/Z3nNswKaUjwJO4",
-    "Hg63htOpUEUep9diEg7zTAmXe4hJqQoBWsUwS4swTkUe3gnH8zeC9z8F7/sf9g/7Ygek+8NsMsWy",
-    "bv6y+9493+3+Z9j9fbv7XXD5yttx3PNfnMtNz3npESW7eVTGaYYpc4gxGxUyFXISF2Iw6L7fPXl/",
-    "tn94FHz46d3hzuNVGSeRP/rtKp0NBsLFoN/KrJDK88WPe3uiuJEpJixyGRaKvglNdaiwURISGUql",
-    "wCJvj+owI6HYM6z+Rdzl4ZQ6h5b5JC5kHibEXv/D7tnBp+D008n+4Y/Bx929kyPD8GlPFOU0kecY",
-    "1BG+719CBO6GwJ/TJN/ptNveHeFpvvHn3ZP93cNP883/fnT6KTg6RbO3EZwd/nR29Kn/3hKzd3y8",
-    "VPZ6CsjfEa+E89nxf83i1EUHqYbhVLqpxxueCuzjWgY9jM9fejvuD19dOJ57cfrKewlCNjYiOTLa",
-    "ZgzCtQ9BnmVFj7XVE923IoqHhRYQ/rvsMWlTkNvqL7aEYxt8KLSju0GTFbouU2t36rX6NJTc5bbO",
-    "mhW4G6+jJ8klrDLVc4G54GP/8Cw42H3XP4DoMTmM7nfojSzcRyeJ0/Le6QjnLk6j7E7RI0wlU/fO",
-    "zEoG/8IyKYKJTMsgm7J5B1g5YC/i8v9BHPUEy0W7lgAG1ZuT1koBwqV8iHNYJK0g9AoC4hHXeVZO",
-    "O7SvelZiUmQ5/JBwJ2T4MDRrdvvv+5ZS2DHP+1f5oGCOZVrIiOzBzJyEVzJRPdjl9zztW5/W9b//",
-    "kVZ7639/xN32o7c7MM4s56me7Ot/z6L8bOT4WQuRp7iDOcNGaQfjlGcr7rKukteYqtDUwOPGCrY+",
-    "YjG40r/2BWwRmiLUVIL6HHPiEYYsrh7E0SlYNJIzeiNH8T3trfNo92OmSdUdeOL5DUH/x5l+DfsZ",
-    "13Lm3eMX9BeP2MOMfVWEeaHu4uLG1Qt6dSf6I2cKIciqEY6wwCLj80SmdojoXVbvpzQfG7sqfObO",
-    "dXyjxWZlHkndPLGzI960FzT6gX0lE6Re59uXHfP0ul5HJgszfc2BTvd8cwkbupO567ELadnLH11Q",
-    "ySdkwzviwwqN0rr13C0z5n7GErVb0BtcexDtIJ9thh1jB2r+xcY6A/1EtDSscEy2FadFphu7uYQ7",
-    "im+lhRIPIg0nME9Xx7rNjtFnekJs8fwF1bUMkJM3Wsseh/3das3Oyqf0uiNu26rtIxxOlOv9M1Qc",
-    "M2vtrid2NPVPzQzGzmkosXNbccMigfDtLgaABsSd2dNF1l6ID2WSCOtu2G2KEOgkt/5QgwvtdF5/",
-    "+7EGR7ovmt4Zd1PtSbVp82Ha/jm/ULCuY/Ti7j1aTmb+Y83KrGn+9dNz95EJ5PhZEekzF+7Ya3XC",
-    "tkzaw6zIx+cTX6aRS7tYi94YIzo04YIm5YvAwtUysFDb1TOgwtWXQwUz/xNAofYw1QTwkSbK6zVt",
-    "Ow9ZdCy1Z/oC58JLRuCEXrrtJbxGD7+cRmEh3cYiLTZ0L8MH8A1lJnc3UJEEoVVGAZrjFEIskWUg",
-    "MQg0Ng4MNlZuIe8Ldp5MKT7bvm8Bxd9CS7K8F+bDmx7ThFDPDnGh54UDj3fhDAYGlxylyQNMcCSH",
-    "BYF0KCn4RyRA0lDBmbm0heYx8mXHClsI8zhMCw2wbzKYLKECsZsga4geupxQREwLp0YVDSJWCIWj",
-    "QpTp8CZMSbAVlOAHEh+yjMSd9MiAOcE6r/BbJRf605TEaQpnAk30OYS5r71O9fzGa3hKHc+QST3S",
-    "wNmO88hDZ87LjeZGrkkMfFVeuURcR9B2WYSqnUxzV+M0sDu+amNzcNzngYYD6kdbUMmMREYSI+8D",
-    "34TQhKSSX6OxnVops7W77FgHA506K0rvdDLd0W4Wso/HclFFnGZOSGuSEzZCmVCCilwOyyWynQFq",
-    "InriKhyOVRKqG5PAR1l5hb46qwR7Ko4kJZI8o0kmc2nkFjGDlGbuzXElOL/456iHpWVHD/BpjXAo",
-    "XefigpKSC/whQbetL52XHfESTS/XK5iZdUHFqjR/iUa9EHtbe69ekTHLa5BuhaHKEQU9N8lgNbA3",
-    "3mKNz8DSMFSyC0lj12MGQrdxCEMLI5LnYOD+EHuUTqRUCMF8CNUbwf7hp/6PJ7sHwcH+pz59np59",
-    "+LD/d4qrjvtDD3H7c5KU+Pe5xBMePpfeD45R+iBWAZMI2lj12VcEvLsuy7BW+qssS2p3lmP7EQA3",
-    "udMmOQSqHsyz60ZyGE/wkJFCb9+D+ht571nggReDQTkYbA0Gif4/IatgGUlVwTvGP/4IrOg4nI8c",
-    "EkX3B/C3/fn8dfe7y4to03tcJYuZYzSoEeXNJhIf69fYvj/f7n4XdkeXr/7UAub7B9i5NNIvUzau",
-    "egeqALMmkJzIuxzSFcY5pyViVlx5FOMgsHfDxEfjm2+29d/BYNDhLXi9fYZnD5pn14+0if6/W2f8",
-    "HH2bA2LWHp3KHq2/nxe0XXDbe76VEqcpeIdf/l27/sg6fx00KQZQ5zX78ROJ0Po8swujJLwGhtKO",
-    "w767yiLgrw5X5kQE6GFdK3lOKxSzgZXqEzr7gzjEqydYG9pU3XGNQrZxkmoHzUjrUUUWpm+klkux",
-    "3Lo88dBuyRyS6ariIZEtIROYl7cyf6hzRpOKKClFbwSA0hs8a4sHdTppmHwc956pHbdeK7tghm1i",
-    "MTOiGmZJEk6xXxGS2HgIFBpQOTswIXcdwtgzQ8G5VNOv32xtFfDFCjL4x3//T9Vo22KKJxTkMXsF",
-    "KYwcc7jjaVVZphoo4Yy8RNo4kX5VDaShsy0qKxd5GCekvUymJyj5NMUsveAW8A25FvAclUNtA1sY",
-    "qqvQg8G/YRZkoFPklYYkbQBXgJhjCmUqm2gHCfBaQmziVP5WynRIKMQAoR5RwqnlYHBTFNMeLUDe",
-    "jPjkLx5DEYakIUKrbFe2hiV5JxIwf4UhQTzkmBuO7L7QmSg7CarKb/Uuva3HNx3y7blz8XoLn5io",
-    "5c541A41L/VaqVmwpoFanqUOf9aEdqdT5AdG/59Ya0CxYJkRLTOIp9T4KVOwpy3sxSeUcligO2No",
-    "A6rpLAON+LqFzxmrtAWfGjAhRzkjKIuWWGFKeHUJSiIM1khZCbghimxW8ZvHTwyfMYoXhgr7BjcX",
-    "lIbNulDWrkxGXeB0bQggYJjlMJ0iefgLYM51LmX0QMOhJrPLVx71uMvKJMKkqoBjDwumVVdiNQuE",
-    "qLXOV1xw9GQEd9g/Cd6d7O7NHxg5F4/nvzxiiYuZw+dDVVrxSGbjU+WDbMPC+ppJOtCxMtCy1DL0",
-    "2GW0ETrm1ZbGslPAZb441EN1BmLzjaXiaoqJjFCN4+mUEsLgffDz7sFZPzhF/nXQX87g4onYBUmV",
-    "ePY002wtOixd5eAvaHCpgYNqhrPnQKdaikaAoWokbNxI6ZNrUSyvq8RYTgtW7kpO9pDg2J6B6pik",
-    "vWupluRoc8d25E6zsjBIwDepH2u1tjsmuNPc2Xp18RDLJCLgrc0Wq1FuuSSzNOb8J5MwyOWPZeiP",
-    "LNLZYgK1REFWZeds1jb8Nq1ZV5WULllrxsIiXKgr8ZtN/TEJ7wPQDTfRI+AFpl6/+dfOxoK+9PUR",
-    "NhTf6Akc2qbapNMT63EafgyEqyIuSq6Huqqc0gG0dkSguUYXOhJ8iUYb7EWqFwg+aEby6NZcADNX",
-    "8v+CXaW/9p5ue+eve93GGURjt0iq/rUsXC4c1yO8jbkg2vRnjd1sxU7d80tkkFpA+0ToZR+7JOo2",
-    "OEFjW6sQnQj6UJVHP5jzDyqnszOZr1EuKtC336zUHhvd2jGoWY4xxlpySDOLiiTLxoSH5mLwGkOw",
-    "1Hd0FdRM5DXJ3WkojZGBvjLBbskijgdXTeWw9qGNI/0WyDimoYjZ5OdCHWi7wyQW3S5P17XTcWS4",
-    "LvnsYDD4a/8/dtjuycXaEElnnEqClpCvMFimAT0lpEvk+MTy1PVstk6HC/waVuHsOPwdQqWmRhIe",
-    "xqDwZ9Knfp5nefuAYeTEqa7JzVMsHmnJr/JZjwSOyE+ZdpZ2IWG8rDiok1BNFqOeHabBHkXuADa+",
-    "Nm/pjGcZG+M1BD+PRiYLhtkuyhM5zZp8FFC8ae91dfaneyzqul0uoNWg75SBskMRn8Uh9n7tid+J",
-    "JiSEVk8fqC66qZfZ5MgnZAgk2NYIvs2z2V50U4SAszH2wAXKLDA2beiIEeIcnQvlAV3ZpxYKuOak",
-    "QLfW7pXGWti6bDKzwSttpnZRfAy04uwn2Dv6eLx/ACf5t92TQ6pOH/R/7h/M36uAwkkqW5rDXb5W",
-    "keXcFCZJfbeikaNqXJUHd2GeckEAsD5x+f/lkOhnUq1QY6KuGaUM8raz+XY2Rjf+Jl7zjPZ0tmH6",
-    "DcslOemV2UIdz2q+PSe3m4eexnZXyaWWP/jGYCrwkhT0JR6FMCsjd9Vgz3uOcVleheHVcPjIH7Ax",
-    "5J/WD5C/y0Y98WiImXltq0uszZHSPqzaE+3Hlxnc3G6tsKxTWazcImtGK7fwe17jLTngpt9u68A8",
-    "uFVCx+J1y06TkqC0T6qrU3TfaK/5RgpsHkMq9mpMuj96Dq2xEpNYUZDkIpq4CtVaYnQhCKOAxKN2",
-    "RYC183l2Y3w346SRs4LIx+R2Vnkj6hvbSI0drvSPTcI2WyzlzZkH927f/Vgct4IOZ+lkDX9nJ6le",
-    "nK+aacF1GeDRCBsYPgfP52PK8iNezeF9kS+gdBNSsDR9rALr337TeSLoqCy5lYJRO8gfyVzXk5DC",
-    "l7mKsakPvjhLx2l2l4rH+9nCWaapcNkssSpPaDOgLFdnZpTmmcNac0Bq+vIhaVQSRrOH3kvyN5VV",
-    "p+H6KPYqAZXm4ixy0vmjNLVQ1nrerZVWEaZWK4xvhqh4ZDal6tCcg18tvyzRmOfJPMWO0QkAFZTW",
-    "ANpbzhpa+BWJWrvAhA51eamiSG8kVgjTB0odtLF54ivOGOy36sZaK7lo5wxGMnzPV8+6Kt9oZRfB",
-    "ydnhp/2P/eDoNDg+OTo2B0UrLsguuTmJJ32v0mtFE1OqDTJVAY8gu5V5Hkd/pExoTWUw2PQNDSb4",
-    "b/qakOorU2OvJ1Tul3yd2yiyVfdVvdZhNlU0yOnr+rN/g9xG+dNc6mrI1745z9SHm3/ThJDb1jeX",
-    "ESZMh5rIxim0LQ0PJ5HYGop//Nf/UkEYGLGQYUSgk+Y4Pjrd/zs6geob0TW9NFIXJ/K3Ms6lMmZv",
-    "y+GZqaYzGgUIdQeDtoxaEjLy8Wi6CbZE2XPMyAYQRQZfWz8ZOQnCZHqCDiyqlHAYIoTGwzAxRcKm",
-    "3dNlDiiNtmqOBjXFCxFgHm3RYAu3VuroPHjWt2rq2zLgjCCYz/ezMmXbEDZTSn8kQFk5Wgg+jQma",
-    "FkwJhdtyUe1LdTQdjPVttQIJbmz5ontW+kocXtvGOQfFmkr363pdM0e7woFFqMvyu1z0pn19blxR",
-    "jfdUg22TPE44z2vK3SxCzmic1BRrASrtiNTaLZnjKCJUzRnGYnZBziJOfwVYtRkKnbq4JuquQJ3N",
-    "8pj1MfU1KkzQqK/Vsy425hkvTErbeKnGshjezA+x68B1BXBhZBT8llTr9fa32//itPtlusi3DCRQ",
-    "PTWwF1nW9eGbVst6rPOS+yxNch7srogNjWH1d5WV+VA2mpeep9ErSKG6viU2N42j22TX0vI6W/o2",
-    "VkxguvI5HhV26Bgiq09q6Nc2Gf1AJLTqOaSyvT2140sVhHXi++rw1F4TapA9c7boKI0AvLlYwgmE",
-    "8YdNt44ufHxnQAofDDRTCDCCzOSY+fU6TSdcHRCaWRH7TlkttqrFuSbAPzgJHzTp4kpiZX3yM0wy",
-    "LpBx1bAVXbS20ztW9Y4993pGyCRMl0TW828uxhlEF2yatyTswZn3T4+/fsNOXJlyfzMGIZbxvDae",
-    "PTsiKfPLBOKolVy3woD5hVOFIOmXPQ/2mxYPWCZLpEOXSggUH+p+vnoAUZPFOFENhTFGYQ55OI00",
-    "PA84BlmwYnKWuWEW1CwZZ18tSXaqPhr+aEbo91B0kaGVA2k1HtqSiBaUycXNzcbFxEkPMq+X50sk",
-    "GwwkJXaX+kK6Qsa4yQwgEvgFh2UavSUc/gmXgyd6mB8BSRkSGlmebliYyLTzXOZ5frq5dLE9Ec2z",
-    "0XTDZizBY7DtMp8ND42QyhKDQlN8rVbyGn5+2RR1WFg/w82dvY5PQ4k6+tmeTKuPRn8e8IL9V32U",
-    "W3s+srlwztsRgmy4Sb4EQe7WWGGHfaR1Qy/MGH3+GeLbBZI57SlZfPSrQqXt3DRra2fYD4cO5FlN",
-    "dC6+Et2RWO5f6ecdsb5eP1S34pJ9G3JvqYwvpNxUbrU60s0KM7sbRr8iM0oLe+9LBzsF/MAcAHY2",
-    "3TBD54Yr5jN1VQ5v5oRlXAphE212S83WKEd4RXY5p0R+rk3H2aK7ldUQrQx6RFtlVgwgPQhUQym8",
-    "FR2hPtTNaNGKTmyRdrbKPFdNaQ3GDmga0KoxDYPhsFJLBkwvMcrnydChnxfi44vkuDBonSwXOq+S",
-    "50LHJ2W6MOKZcl0Yt1q2y5jfqOtJVFKoZnGWwjCnZ8TTWex4AxO6gw+yHUk0S7oBN/gGr6LTEhS7",
-    "ZAwys562scbLGk7iZbXTix0aoLrq2GxcGNFwPRhQq17d8UV9Z4HPPFwV3sobec/IEw7OwzCK4yNd",
-    "s+ILEkvRLvxK+45Y/Ssfp7GPNRnVri5QTTpladbKttDFaJDtVSmY7jizzqyZDlRTsIacO/UFDK5x",
-    "NrrO97R7t7KvXYmTivbo5o/yzJLUC0ClGuGX0yknq08Wae2vVnjmZvfn1IS4SktD1tdx/w9QSwME",
-    "FAAAAAgA5WqtXIlwKdS7CAAAwxkAABgAAABhY21ha2UvcmVzcG9uc2VfZmlsZXMucHm9WNly28gV",
-    "fedXdEEPA3AoMKPkIeUZTdklc2aUimWXna1KVsAm0CTbAgFMd0NLlR/yNfmwfEnOvQ2AABfLdhZV",
-    "SSJ7uX3Xc5cgCGYPlSwy8fPFhZjPnxtlq7Kw6nSpczWfC2lW9UYVzgpduJK+3glX3qrCilDelTqz",
-    "4koXH+T04pW8VUQBl36ttbm1URwEwWi0NOVGJMmydrVRSSL0piqNE7IoSiedxmOjUbNW2vaTUe0n",
-    "u87VgydSSbfO9aKl8AZfR6Pkl9mLl7O3yR8vr2biHBfjtNxUYD4cCfyY4O/v7fgEv2GmlrpQH3WR",
-    "5nWmPlZGrjbyo14W2Pioikzjb25xYBm9XwQTInX589Xrt7OLF+9mo2g0GuEgVmWWrNI0aTWVkKYS",
-    "r5PQ2OoZMxaJ0x9Frq27ts7cPGNeoI63uC0kK7u9L+i+IBMYBRUVXsdL4o71HkIe/wmUdFWpLIpH",
-    "TO9yKcZ4cCzysry1eA0GkOJievHtt2KNh5QR4Xx+4uWGWaYwz0kjPn/91z/+GU2aZ5nifH663SeW",
-    "3BokF7bMa6dY/8KWvNgo2QirlOUVKzf4ozaycDq1TE7axiGWpcEZ6UQqIfC9duuydvCoXBe6WBFb",
-    "OIQvIIU7i3JV263nxa3y+L8zj16bbF15Tza3VcxmcerBhapIywxUz4PaLU9/D0MqY0pjzwOjqlym",
-    "Koj4vnpIVeXE63cz2u7R9Fa4vvFK9lydi+u8iNkAYcTi5AX4JwZiW+Xa8TFs6aXYHrxhCliCq3tC",
-    "R5/Bob4nxxvp0nXId65/cxPt3wtaS0FAPBd6JcBSdyqMooYqtPxs64UkhWeJBQDtQyJsnyKxabEV",
-    "p9toJLICZCx2pXGWjBoGJ0HvPv2kJdyhqFW3eOKd31aNZms4xJvX7y7/dmrdIwLh17rEhdX3cIqq",
-    "tPrh/CeJoIR7hH/VRVbeW7EurYsEs2x7ZOmiysiFL4OLZ1MpFtM0wD3GrYWh+OxFFTl3ZsrKijtp",
-    "NHxWNOpkL298rlFhDLcCPoQMRV5XoZ0Iz96fTK0ir5rGNLjRYQXbI1nUOs+STJtEOg8XFOMeoLo9",
-    "jxsTDv+e0UaMJK6ucnXdLU62+31suTfaMQaTDBD9fg2Zx/RlLDRUXRAkjLsXx4DwdEOwDZar2rW4",
-    "MttU7hFOVS+APipexSDJXJeVs/N5BBYVKw9YFItfGGlOGX3oFOJXAR3UDqCIH4zKiZUfwdgQRLwr",
-    "ZiWukluRR3jYkCupC+vEShXKSFiXabKBdrIPAJlNutHWwns4e0FkWyukIfEaj5kh4DbaYIJ9jZBo",
-    "jEtwJWn7+a5RjufM8wC1WQ3RdgnkagkxinQtixVU5C++Ze8gRAwLdc8eAGh6cEYmmaoSphg1WOnJ",
-    "I3YsIDATnP32rDfExUWGaO02t1DwSRzonrd72x1OSAIJdsrd+JeD0H8eRIQHuSpCGYkfxNkQCCiO",
-    "JDwGcSSjT0MESZ+AEzAir797dtPiT/P/m+CbLYEKhyhuwvbSdmuQKTg+6XC1oxqvhsOp4Av5PvAg",
-    "HstR5NxRgRAusr0n/yLzWn3dq7vWqGJtGVzCYxDce7w1e/sIZ5Aq6imPKorzJ6qdai8l0LXh6ycN",
-    "nMzn3jmBITFhkybkzXUmwhcmq3VReucVy1yubPQ94EfnOTlgqgZlSTygjmeruEDlEeflvTJIwOfn",
-    "Iui9FAy5YauoHJKVNiaXiRtUgvQTxFAUN0VCGLx/j8waTINoj0AvJQzSMEjdPOEiVB4gQEhNzOqZ",
-    "r7LwFVmeee/oDRnHauvpfPq7m+iAI7Pldr3wuMwg+llCP+GsOzph4fYO7KmivdV44Fbw6NgRsP2E",
-    "eve42MnLPcC1TY5OyzxXqesyc4fF4U4iPlLRv2GoNmqpDCpPgPWCfP35XvsUEpZyssL2y9mb2dXL",
-    "d8ilcYvfB0GYNv6LGPy/QlqOwiPos4sy/Sp1UDb1bEKScjGfQHiySGMZB0OhYTxoGXzobPKHslGX",
-    "qHLqJERZqNNc3SEIKqVufUlYlMVp0yX5nL5TH7DBgDyvXr1seqfTVz/1LVaR3slO8kD8DM32f7Bk",
-    "a51jdtyD6qfzRbuwn9e47fqapot+PpVt997+z9uvRuSmuwTafl6fdSReYKAOjvD41vAFGV4Eh7B0",
-    "4OY4E3+Af4ZMq50qKB7C9NsDDxu+R9jx94mvWv2/jXxITIniEOgBv4aqzn43+ZKmgbkVSqbrXufQ",
-    "MsC9ejvw4TKU23hi8ivK2mZStPGTog4Eh4XsUSBMa8MNqXUMAFEXU4l3BdTa4VYbPVMWD4erXybq",
-    "a3Qscp/ZrXexild3MvFXhGvDxZGS7qCreXf7fHjm88chusf50cD/Si6fRvhOqWi/v6SobJima4c5",
-    "bXI9HRjeOhGvN9oJRaXntC7oRblAS/i8wXbe6CYRvtaUWUa5ops+3Qmbl9QUDzTQ+Qs1/ruY2uwO",
-    "mV3g9dutw7EXg/k+KGBx0k+ASVpWj14repmQ1gkM0NgtUWaE1qTtsCCzrjdvvEKe6yL7AiTEGGfH",
-    "iF8xxskx8mD+6KcCTaNMTrt4dFCJpy3CCkZR5k41NzZOb5QoqYG+11a1I4I/A++LTFM2ljlimfg9",
-    "Q5SXhUCaNY/kKUu9qrmb5jpf0iO+/iFBm8HC7N2b357tTArm86lPyCC20zVEE+4IiPG0NGqa64WR",
-    "eK1cfEBpAG3yaYb5BkuWStI4yU8o12jOs/ZwCsRTQ+jpRs41HMILOsh9sDKUsg0fP0XCCns069F3",
-    "IND6YG0nfW4HrsdyYSWtn215XmLWLxmeTd5ljcLSTN2rqAsmHtyEe3Mle6uQ6rYrBzwGLPP8aNip",
-    "TYfjHz9nZsNhw6hUVype0wQ6rhoDxGOAejeY6GYSm1v8pbxHzsyDM8oUwOWkvPVzND+sqFx/lIH3",
-    "Bw2dV4sXxh/dSnbwLKy2PX4I+56Itu7uhFhrhsd5E/FHSNIyT+MaD1gEQZuvdmXrVNtxS3SX5SGy",
-    "WN2j+m9QSwMEFAAAAAgA5WqtXOuWckhsCAAAgRsAABUAAABhY21ha2Uvc2l6ZV9yZXBvcnQucHnV",
-    "WVtv3LgVfp9fwQpYQHLHSvatmO30hmSLLZJNsNn2JQg0HIljc60bSMked+r/3u+QlETdHKO7L9WD",
-    "LfFyeM537pwgCP6qslaWFTsclEhlLWIt/y0OB/ZqGOHZPS9TkSVuqhBFpR6ZEnWlGsZPjVDs2Mo8",
-    "i4Mg2GxOqipYkpzaplUiSZgs7LqyrBreyKrUm40b+0VXZfeeVzc3srzpPivdvSnRven2WKsqFVq7",
-    "U3ha8DsRm8O7c/5GHx9zXo6WpFVR8LJfpOtcNomVb7QO9GuhGil0t1Sca2xMGlHUOW/EZkOMQuJ9",
-    "x3F8I5p3ZixMkpIXkDnabDaZOLHkJJVukrIqsbt5TCwtkYXdy45lMm0+60ZtGf582bKrO/God/QR",
-    "ses/0f/dhuE5VYrdMVkyM2+G6FH8AZx05IiV8G7LgiDqV8gTA/BEKMTiKMaLrMNoIEFPWpWNLFsx",
-    "0BXQXjkVPpxS2fZH90MbbzuZgwFCCV3l98JYUOJ0sQqCEbxp61wMY5Zd2NdPlvLh0G/v6G3ZnSyz",
-    "CAb6cCuUAJL4vGJSY3HQ2XCAaSCJkSPXMsWnMVrDc6UBZTjCMlAtgClEXOkgoo1AthM0zqsH6NwK",
-    "DPrYvKrvHtduZNuPnIIlN4tr3sCvyvgCtp6CYfmzq906yxIUj0W7qUoxBgPp8TDTBotfy/+L2H6O",
-    "WzJTw8mM5yAAy8RV4FuXWYsJq8nO5Rr1mNRKlk3SQ0RhBqabVW0zeNaxqnJ7EKndzo5suHMcDHLV",
-    "6AfZ3IbBJYhm3H3Pc209B2cPs9XxFxCms2EpPNOhtnTFORW1jX3xPz59+PGNSKtMvFWqUs+QBneg",
-    "BprWLvFZt03Qcyq1LMEnxA0xtbVSUsDzpBqoG3xoYazcXDQ9+WflosGIE4exbgsEzxtxTgrepLdC",
-    "h06lBt4ta8TZQxpnsf+wH6G+nQ9sZyoz7tyJtGGOqjoDBmUCei1z0R08ghbTYgynjdnxA1clInYY",
-    "yPKe5zJjvlUagXbsGwVjG1Fd5Am5LAcnr11wbgH13lMXhetcloIiNqERm4xDI9oXtSBhzrEWXKW3",
-    "IU2PAncxjtLdMb1uumeEUD9oWPz9nvAPi/hGVW0dfutp2kMs/AFOfTY2uGX/4nlr7TGaUx1lCoeK",
-    "PQn8WgYFQLBIOXMxDkpGU3A4pwVhPQNOHTWX2swPOcDVLNc/vHl7rZvHXDAcdk10lWYmm4+qGavZ",
-    "K4r890jcKa+pMsnAdpW701iIEohyadYWdTSkhHNSL+SEKelZaug2Zy/YHGe84asUxEsoCIGypVim",
-    "gZkbiuxzlyXhOrQj0p6RdlAe7SbeVndn093ZZDf4Wt0sppvFZHPBF8FHWYBgGmNWFqBLKCwLTvsX",
-    "8J/sJwG/QmRBBRMiFv8VMhZHuEGdNmGryeLhkFtWnBeqvEVnLs6SOS8+j72XQgQm/4g4NPfUoQZb",
-    "GD0FLLwQSUUuG377+jW7YsQdCn+QjKKnb6Jho4sSQ2DYLdGkao8+jYPvBr8F85+/dJHf2CNqMsoA",
-    "pGuTpIyuvWhNBGJe16L0Sg96TsGnOwEbIlY1uxCxJ3Z8bIS+ELz0vbXUoidW2dMULwBwpfiNQN3P",
-    "UxGz91ZxxMfFrHZE4kFkl1DyBZZXGD0FH8en7UYMstBEppn3Itr0Wdy42xI42TPmoQRlEawKX2+t",
-    "ldAG2JUhF71ciUQm+HPwIjX8Pa+OiPn3XEl+zCEdFMIudKCvD/q2+sisPrJHNEgoNW0LuWW54PdI",
-    "yOyC0zucTOqsUp/6XGPZsxqb4riqsTcjfnYjCdYUZgK2rzUKc0tKWzt2AuXbtx9/+vAeZ4OODx4+",
-    "LXYiepoDINYAcM5oTnQJ2JbDpveyTXuIbg61Wt8qmyA0AEVtVlsyavmgDNgzdjocjHCGHuuysMvA",
-    "piBlYVd0MyptKRba3sIgx1wJgHSdPw5ZVuQnWB6xFOM1Qe1169eJNA067jWWGl0KCr9ZORu8t/cS",
-    "rTa+F759973ZZIqS7zohbPt/J6GKLAqmBd5m49G7vr5mPk2GAbcjLVy7aYrRhd7WStP1xr442Po1",
-    "zqkWmbdLiMzP9X7Gb5pb2EentzXxuLqhZtW/AwnB1YhLWvM1Nn2z6ERFUcVM78gcEmtMHLNO5+b2",
-    "Jsmkih2SLveOAh3YqnRMtytsjyhVNsE4elGlMFwPxWjbx25Gz+cAUlIn+SrFX7x/2c7WpA/Zni45",
-    "jlm0MGkrx8Ta+p7K8PkiqvZXpkSJTg/hbh+0zen6D8HCCorLeo8aD9CkYrLCi+Uolf4XAF4dZflK",
-    "3xII1//XILhk9uGTyWSMaybWuz3fUE8cwcOYKSBCt6eBgtd0WUs/TU09rdo8M46BXX48pLD9tGbj",
-    "tmcP69g1Ga4yVH6FCWH7NfS+tAbGb2PN3ru4MZF49bZjcubIkXDMxHaM0BgeNZ91bGWh2wn2u1mJ",
-    "OQW5D/zjsCAbDNHdCTN0DN4+5WXkfInt9c4kl1JfsdRWjuIunTSCwRfPVqkLOIxLbFONlNTGL2wY",
-    "NuXls85p1sy2TqwMYb9LkFbGsM/ApRCZnpciSAnBnOpyxcJM80XFVnMrrJJMA2z9eGvMadLXXBnp",
-    "a6FSUTZgUUdxsBKQrFnZ6uB5u/lNjO03sjG6Z5hfig2Fne8oE76f5/nX8uvXbbk8KjLwl5ZuH011",
-    "5nJpxux2+kGDlHM43AulZVXuDwd7VSI42qnDwZ3i/QDiXY1jkjyOOjrrYT3R7pJhcBxXQNCWWQHx",
-    "T+0zZCqdUixEz/Utbq29XjuSW2qAIrKQztvSjyP7nBfHjLN3IP/OVAzdRb25YMKYqqomiryYeG9+",
-    "zkFL/Bd2AZ3YQfQU2DjRD9gbCq+h7rIFQ7NldtJxTxcsfwrmOcV+mXXEAi35L1BLAwQUAAAACAAd",
-    "QbVcwRq1pakXAAA7UgAAEAAAAGFjbWFrZS9za2V0Y2gucHndPO1y20hy//UUc9hLBFAkJDtJVcJd",
-    "+kqrlX262LJL9marTuSCIDAkYYEAFgNa0spK3UPkGfJg9yTp7vnAAAQpenerNgnLpoDBTE9PT3/3",
-    "gI7jvL/hVbRkRcmLMo+4EEm2GDI/yXKWlzEv4bbPojyLwopnYZXkWZ/lBf4NUxaW8Rp6DurReek7",
-    "jnNwMC/zFQuC+bpalzwIWLIq8rJiYZblFUERBweqreT6SqxnCowcX4TVMk1mevA7uFWQw2gV3nA/",
-    "TkSUf+Llve4yT7I4UFgFNlYHB8H7f794F7y7evvhbXB5+ub8PRsxgPUzzwSv3AcHvteF02dOmueF",
-    "8+jBiFdnZ8Hphw9XF99+/+E8uDqHESX3o3xVJCl3Dxh8Smc8C4Kwqspktq5gpWPRG7tj1/3T8PpH",
-    "15v0Po9deTH2PPg/9pwD7yB49/r07PzN+eUHgh+8OT27ert9AgR2OvhrMMHvk8G/BZMejfsMq3n1",
-    "5vyNN54h1K/YZbjiglXLsGKrtahYxoE4bMGB8Gyel7dAGRbzKA1L2gNGtKyWiQBSC+EfAAp/OT/7",
-    "ELy8NCTaJNtni2yE4gN948dJ5k6/voMp7dvbJazKbhC3CfCe3QJc1mzgqWgMiXP7roQ9KzO7pSrv",
-    "m/CawzN+24DGU17pDo9AQqDhqzSfhekgEUs2X2cR0SnmwFgJXdI/zorlvUgiEIE0yfiQ/f1v/80y",
-    "ID5z6dJj1yAyopqwB7wHqN/m8T1bhfcoSlWSrTkCqpacCRyFQJg7nT4wuSJ29zV7nE49n70qOYeR",
-    "06nrH3nTKRM5AJtO15lIFhmPWZpnC5oZnt0nPI1FjTUhNJ3Kp30Gkgd3OGA69QHKax7GIN3QJlAk",
-    "I4BwDDdJhtjQDS4lLDmLwgLFOIbZG2wk2A3nBWJ/Ey64jyJ2/uHsz8Hby/Pg9QV8vbzs5OgfQUhQ",
-    "QuS8Y3H0WU6KV0Q3fleUePMpKat1mMKl1wPBkaOREtDijm/xL0gbCBjIF4gWgqXxcOH9SfcfP/i9",
-    "P6J8HBzAPrJAgKwWQRQAUiueVSIIQWdgY7YQASwvEFGYuaKMhgxaPTZ4gX+HBA102xUv0jACoqjh",
-    "oNNiJocfR8uwBHJUvAyBOMDdSwZMX3FR4AiXqAUsiGsVHilKBJqvqyGMEtU1gJkAxa4n1J7A5Qld",
-    "ZXCVckLKowYSJejwDcuGhp2TOYMOPlC1rFC0lq5zfAwaLfHqPvj5CNCwIypL1xln1KXRAzDyw6Lg",
-    "6nnzIUzzESY+aQLFz6zk4U2zL0z1kR2xZ41WLQM7Me89iXmPFgfQn++LoL0u5rAeczM2gFm8PZbS",
-    "ogkMRkyifJ1Vmoh9WuvzFjhNg+e7aQBGmBZ3nUxsukBzkjFn7Bw6zfX8tM4rDkOiZXvx6smIHTqH",
-    "xJ0ggYKHZbR00ZrwO+DPDETkj4AzTjhMJt4mrZDWycbW4YeDgBSgDUbsJbA533iOSwPJCFAaRCdn",
-    "2x/Jyh+brNxakZqx+/k+KHWiprcTafBxsskDBDiVvAkdkKLOeOzsg8WHct2NRAsebdV2gApdAOg4",
-    "/sc8ydzGArpRxg8yjhoL3OM6Z+jYnB0dOR0bbX8sJidWZEMpvluoI1ckdqygBVRJ3UeUOoTbIXlm",
-    "CZ2qw/5syuh+OH0xEwAaoy452DrL/npm+zo2FAR+kk1MdrF+p5kwsJ6Qq6dkyrBy8oRoPCEWLTg7",
-    "RKJj9frTTcOOAc2taW7IBsmtztGy7muBVf6aFk8YYPyMFS8XPBAF+APBrAQHICC779K3pRbJwzB3",
-    "xs/4C8ADd8wbjzP2AO5YklU5uPEYn8GepvnCuJ/okzF0WjJ4ZrwKmj5+wrGoGQTdC+mX1LQX6HZg",
-    "G2yNX5Lf5FpUmAP9HNQv0gdyHhzyMU0DSfgW0PjJ7qp6AtIyftqeRE0EXRvewUOXIpMrNgINEFH4",
-    "jnDwpuDRHj5/WuqaQDU1dvGCHAFcEJxefff9xeXb4M/BxeXZ6++/2xZDHqJD/BX8T7IoXcfgB/eu",
-    "v3EmpzKOHfvL6xfOBA32oYxU5mm4ECMA8+b71x8u0NOGoAxuL15dvr06Pzt9f96Xscx0+hUQLwiW",
-    "oQgUbNdZOhhIyPgQtmvGWQXCU4GAhoJGyI4YJEDcdw6h39n5+/dvr55YhKMXAY69AvFZRuUYnrYQ",
-    "b2GqHHMSlQKC01WAXBtUeRGkEMKm5KuHwqVnovbLN6XmPcIAMaGeENuV1AeDLQmClgx7iMtNIIiK",
-    "MUJykSDT6fWE/jxA5GWkSM4I65UXvs2fyJcATSFlOEKxgZK1Apm2UwqJn40kxryoluYOJRrcyQiF",
-    "iWdrYCnYILV8r+HxUxfHvX5oKV8Jr6H+SNHK/t7ksdUfHskhL7ocZ/lo0AENNX/fIXlXSxi1ARAJ",
-    "tATJNVzT4sHx1ARtCqgmTe1/bofRAqGpXxANC1wtjcUFFpNmDFiVYQISvQigLVynVYD5kADCe8mE",
-    "cp5tUeAq/8RrfQysOiBWBQYaMQUP2IkyLJQwMAzp2iE0PEvv61DQcFqD0Zq80REW7ggKI4wq2jHF",
-    "/wKeGe3mGeinzUcmI2xlItTgDndmT4VuoAPSBvIAIeMijwa943/4x88//ue2GTbdjy+c4ZsXf/iV",
-    "sBWLCwzcOszyhkESTa7XzB6Wi7VMgBDb13p3Q83ajP9dmReav5kBgZmhosyrvLovuGBxTpoxXoM2",
-    "xsQxZbrqJNqh0BCErWgr5P69rUBbB1ebKrhDZ2t/DcIh6bHtqwq8lj5ppZMoJ4SkoFywcCuIsndq",
-    "jldnZ8wMOhZcpuxMIllIzbEtbRsucJh/QEBP9SC2CqMyh81YR0tpzC+uTt9QqhhUEb8rkBnBi5xO",
-    "Gylr11XTu77vex4YQ6lOMH0VsnWW/LTGdNc6Q+1VwP+1CBe8j3te8gJcB8wiwg6jomOzvFrWrKBk",
-    "XG+83Okyj9cRrLAH3D0HBqHxBp8eg/WiJyt8xt4jcQsDX+WruTVBIqTiDOccXJkoXAte09WmJ1K3",
-    "k5rLELYjyxmfz4EM7O9/+y+cgqBiZpPWS1n1FgvXsH29t/QXtx4ZuV098MV65jrAedjBa3TdUg7o",
-    "GKH4FzM68Kx0xuIIeZnpTobZFXcCrwoIQqjIE8yzQBEgQAK4MnetmbQCaeXoo/QZOSqf2SXwv+Hb",
-    "iznr4YAekBwoCY8GFHxI2F258r7GFjwsTEL3ieze18iLEFBCM05gOVtleKsCgqZa+4qdHR2xqAIB",
-    "PGYx/qEZwjT5WTl4oKym0w/AD8TCbAhO+GrGS3mH0RPuKiqK0OBbcm6Q9rUuaWTKMJ88BMICWt6G",
-    "bkHUZZwliyTtxLe/wlKGi2NtRbXaDkgUHI31yl+U+bpwn3ltZ9OR+XIZckFnn1SluwM3uE/Esi8r",
-    "AaNtukrP+NzM6PUNGv9Uo49AYOp2kWj79GrNEos9ummaOT9ioSsc/BxMxreUpsS5d6wz5WFMMQlO",
-    "pMmiYdND1EN4cX1CVtg1oH7XktWOJRUUt4z2N9p6w/5ZOcJRXuKez50HSZZH9oBUfHQfCPSjqqcA",
-    "gfTIf/GITPWtZgfLm0Sg4F84jOosymlNFnIiZEqYBjs9OnowJfeRtUnm8ZmtyKRewLHJ4vFrR6ut",
-    "BRXhVNqEfMRgxmFveMBDUGSoInbkUZKsqiPCbxEGhXxoRqS/2etJaL0eQ3iq/nYCq5ATg5rRagJd",
-    "ahHlBfeUtT3brPvUJR+sliWLLFfFMsJf6ECTTJhyjcicNu0GoaYXhEuoQ8XN4JAwBkaWRDD7I2Ho",
-    "OInuas9QpDU/PVX+QrheEyzuu0h1xePBAXpb949OIzMkR2wUYZoLUTwgkVZbD0YMiFYZk6U0dMNw",
-    "Kcst3Fke3+/KBlxp+/MpT2LiNbIIaIGIcDJz1jRgAlCIACOsi+KRAFUWxVMBlqkiKhY8ljm9/emK",
-    "GHtSQ8lsoBXhEZh9OL85uYQgOM+AFNxkGbA8r4FHaXcKglza5b0IUjDW0XKd3ZCC35K5DJIs5nc8",
-    "bs8/3Nh4ca2gyrDnDxvh3UZcs8hJ2e10VwjBBpehJMHIJ2DXvgcKeF41ICijRuTbDQa7+GEcky9j",
-    "ywZQt5Y4cHCavA1Pn8gIG7pu12jSNwOlIH2zmsNfJzecDZF3h9Nt8KcMvFSp6IAx8bAMhgbus8Es",
-    "FKinKNmCPZUPabF5XZpuY/D/Ppts5f5dggcLb6SUf3lOuQO0SSzvCuRh3BYtuakcA9zqBBSM3KMs",
-    "14yFp6gm/YM2b5Hf38FgwCjhTAR4FIu0mOSTZFWkdBk8IyZSrj0mvFCl1JkAVyWxB2evL4DpBtZR",
-    "MTzNUt2nvOsgRCdOVup0u7IzUTot2RBTq+nCL8ELDJDPXZ5FOZ6AGTnraj74V3AzeVnmpRiBk0Y+",
-    "stOhqWl6rf+QINqkXTf2fV8zm8m8QpoZY27ATCwV84usg8HOUlaJKBAObV2clBj3f+K0u25Rd/uF",
-    "dqFLLPc2CZ2SQtT+ArelZSLws49lEemmjugyLVtx3GpiNLStZmb7srvNDX5s/YE72q83i8TQ61Ya",
-    "oBIEnsbU5yOBDgno4ZYXZeeq3mF+B3RvXRViY0dJtL8cg3Kg/DWukM6ySU8qzrmss4QpChs8VmMT",
-    "nbF6gzETdLKUw1B7xrBkiNLr1OHtkmc2At+Y+V8o16yFklR4wswOGkfwtrONZbGu8pwO/8lP24jO",
-    "sNWm7aHBqkbBGWeHoNOxqzZA8gyV2gQSvUS0RNBIbb0RszxPzU5g5ZzEEihhzufBNVM37iosBIh3",
-    "CMEHRDqRYLJanK9LiH4wiqnVrFlMnrp20K3qd3QSb+b0jZrrd9XtvDrFxHkqOamtVihEBepXLn4F",
-    "exa+KcOM7EQwrQWD/PRqQD3mKjUds9k9rBXLkWus6+F+Ax/NKV2Jpsg6a0eFtfiubwKourpWg256",
-    "tNt2jPJUOmHSFGqTpdMQr4cw6QTYwmqCFnJphpODzjENhmnravga0oHoDZk9nYk8xWQw9mmxDMoK",
-    "BEAkuO4sjG5EGgoURHSw6OCF0Kc1NtgFwYHxBOCwds8PwSfIRXIHl2obXDwB0sdzIPC3bj10Dvvs",
-    "EJoOmyJAu0Sam5aMXAQmRM1oGix26W94MQftvGUj8K+XbbPCUIb0QHjl/hIj5PMGx1kIwPAyv0X5",
-    "kiqLTsbLVKulS6Snmm+WICh9+0zlomDDW64ytEiP1pqx5TJbT5BlJn6H5yyoKtauziF/tYtKXUcv",
-    "t6qktinfC2B9EgdrYDDkxWjHCjWZOrkcKXp9MvEMBeX+dNCk1Iq2NMdVpUai7nTZoNsWL7EMb4Pf",
-    "1FOUvh2lkFvKRs/Ul/HX6Nmm3wR9WgvDbabFbPoQOwlZAAnB1fzt0NK5PY1P8KtQ2p8JpAKpX0cB",
-    "toXHblsxNJXiLvm0q4/bUySbnPLTHl5048zC/JC0Eeh75+GnR3QStnT8Qr5r6AECdD0A/xoVuimM",
-    "YosPsFW4i5y044RGfeK7dbitWfe0HWgVE1Ac0J3FAM1cV5Kwm1LKqHXBBlWNg0fStZGHh6TdV34M",
-    "vZHEXNVRplvlOy4lp2e23UKwAc2izz61j9ds+gDbchY7lC7DFGL70H2Lvr9G63aO3XIuS/lybRCd",
-    "lKjP1qht3uyltxqPj2V51nihSoeiyKcQg1a3EK5I693ef6VKhjKSBw6jq4MtPi6sbjqVR3uoM+YU",
-    "YH5g6HsZSA5O5L7RW06JDDQoCAmRaaC3ISWwkYoW4WqWhtmNCj9+wJCCxsAIqlfWTDenK4hjfIby",
-    "EJZMBtiWf6AzxX070QEYq9AgWSyrndzt/jVZzDgfUPZjqOHbqNDa5nma5re4ch1Aec0Y5ok0xK9M",
-    "QViVh1+deiB5Q/BlmC04+FJ37oliCyw1gm6Bne5bqT2vM6mc7JVKbuQZO+QWGUb8HlLbnO+rJ6dT",
-    "cmkOTat7eRpba2GyvmpvTLGkrsEHNKXCeqd6btf7T2z/mIY2vWRVKXOnU9qd0ehkOvW6jgEoofse",
-    "gUFQmmSC47ue+r1TI0E9kpleQ1bGY5X9bQsqDoEGFe3P0hxiGSk2oKQgJOySV+Zyf+EzKX0KAa5e",
-    "0zIQyRjgq3cEuKsGJGt3eL6mLhktwfS0zkChQrB0x4oSGQQU7u7JdNUoWi8YSs2hTdz/ZYn/DTKI",
-    "v7ygJM+S0MydxYY9Tnp0a5cvyEaawx+W5tl+VESkeyoEixS2XqCjA1ItSBnbUR0QTUOvqgQmEShP",
-    "J2wpGtjJhgspzB3HqkSLkZmLYqwjcRRRLJxLFhMgXUr8hC6zv6slCUVFJXoSIHecgKcGttsq4m9o",
-    "pa7TSHKJa/1WtGXWn3JA8fCQyLfrIHZMsNXcn8IyCWepfhG76UWgG2OQK/kqBKn4lIhkRmeIm2fb",
-    "WsKvCjrAfl9Q/cE9bBxAUg+2pzZp+o1cXTMgkklnWQRSSWfpR7dgW7DacdCDGv0I8RCCw5DoAQE9",
-    "mtBIjibdDtNbR3aOj9UPAAy7Oa+rqg9BjQFwVIc0NYKe/Vj39mqPFlCgnK4V5+P7vBhWjdBEy65o",
-    "M1FB7I6OlI7MTqjrLzPhZldrwiBA5RGbc0T4QcnDZy8IvUbz/r69SgsghD5Ck/PbuhozLZkMsJqv",
-    "xuETM3Od4Kz9NJMCNWkdKtl8UWJZh6yYVZT8Ka/TzITq3SlH61qmGOtNlyNwXZprNUxk23ouiudr",
-    "TwSzRxbvHlmwuuJqnSEGV+yI6SH6oZ02U9qdTkUr2af0h7oG+lg54VpvW+WcZBWW9zKHOcIAA8Np",
-    "WbuqKCaC71I+xiwp1lCKZQgcgO+apfcmtFbnCet5fWxRQivnsJ+Ctpw78vQZwpYwACBhjz1BzeKx",
-    "khocMqDr9Ki3ZzhdwwZVo0fbeoxyffaLH2YKHItOgwIwaSu/a/1AZejtXdJAFPEVkrN1ksYgNPlH",
-    "YMmAThZ17oJtLP8jTE0Rh8b79ngMDPUCp1NcObSg1Mj9Idd1Ov0heZmcpQnWs6iH111RYxffnZON",
-    "0r/QEqWJKs6nCTheMAe/C0EDo5IH7ZLMwZ6QpVVu78Mmgo/+LMkQyzYWst2TvzCBFmyGFtvirlbp",
-    "TW76Di42G96ZslMJwZrl9GsOLW6U+yU3Sj2LiiJAJf5EwhC7oPPYlWb07B67KqqNjl/ukOFAWx3Z",
-    "ZlrFfrdlApiRkk7mwey+Akc6TuZzXlr1IXmmR3p1rIcpFZlSpBZ8sVxmFokAjfjvB4TOeji6J5Ml",
-    "VIldJfQTQYy8AJwL0ysu1VjLT5ytqmQleRwM2RKj/dhEWnVqLg6rEOZG2D4hxE2qsxZ2rDdBoI2K",
-    "yJUnU1UJKozlYmX+GWG1eUTldKG3pJHsjj1N+lIlUAOM/hTtgIgd5Mv4bUBzMOq1Saj3YCF6OKKH",
-    "HlxP93+KaHb5aN+1Glz2Wq/urddcrrPO30aSDgTKhrVuasvXVbGuNpp78g940bNcYAYrz1P9mrgK",
-    "EhoUulpnnT8VhUsPP4VJiu7y1/qAcIEKHqZFakoEDKkgRqRyzpYfearPfGNH8IRqLPCzS2AagZe1",
-    "7L6hy460vFeLlW4y8LyurapWeArHmsYnNiQzYreSnQVfwJfurl5sAONVih6u/DX+eM6Nq5gsyG8s",
-    "fzSsKr4qTG3D+POTRuIAm1ygmUdFf1cvWd3CHN6kv0dnZ5A7XzhEd8bBA0cNkfaZ8tG8BGt6Tgdy",
-    "MWKSOSrA3fi3qGqiVUzmXq/Vjrk1kzY2GOwsnlnW74DBeKuO8hRJqU9534RY/3SZD2KGEDHtwSM5",
-    "sK9/QimQu6sakZlagNXZYwvcGTggPH4n786x/IOpJ96R4QdaYXD4ZB6SzDQs0iicp87PKj2CGntV",
-    "NJRSLVs79WlDoGq19CUUb0rPzu74zofmnd9b+KXmrZWUcgHklG2PUaco0GNpNe6hcrFzy3rLCXxY",
-    "hfz5CAOauZT1tNKViY0lneGkU1O1zTZj/dUNfGM1EDNfipX5HbpzzW3Y38/rKM+GCRiDl8Cel3n1",
-    "Ml9nMbG+O3fAubUCFBD7hxqgfgkBy9i46NEO96/uSQdlRhZxjpmjh2CxG4YZS13zCr2ypEbXomQe",
-    "AwnN0x3Mg1GJwrYdT5vhNee6qusmy3naXrcXUrOAOs2zzQnQ0/URSl9z2kj93ThS+D9QSwMEFAAA",
-    "AAgA5WqtXLPyGHUYAgAAqQUAABEAAABhY21ha2Uvc291cmNlcy5wea1UTWvcMBC9+1cMOtnBsemh",
-    "l6UJhLI9lbZk01IIQWi1ciKqlYQkhyyl/70jWfa6291uDvXBtj5m9N6bNyKELHW/FY4FAdw4UcMz",
-    "c5LpUIOSa8fcrgamN+B/iMCfwJvecQGdVMI3hJCi6JzZAqVdH3onKAW5tcYFjNEmsCCN9nmPZeEJ",
-    "U44bvuCwKOjq89fb90u6/H4HV/CTNJzUgO/8sTZ9V+ntya+iKDaiAyqDcHTA4mmvN8KVzpiwSFlr",
-    "uKjBCd47L5/FAtbGqAour5GQD/dxx8OiAHxkBwgSYmQjPd1IV1bDSnycQEYa7h/SjOkx+z4Bgs0L",
-    "mGR/1hTcGQcWpB6Su0dl1iW5ILP0OdbGk6OcZZV0to3vu06+xNiZOH/GZUANs1boTWmrtCqUP4kg",
-    "CnbA7/8DiDMea1sOwywgzuaycaOU4IFGn43VK9MgemMo3tFCodFulIKGt9ESbbOCVPNkWN++i59r",
-    "KKcyVMmZMwjH/DKdO/PK1Z3rRXWANvfDBHgcn8f8yejLKXduHR91zSmwRirSKMPOSs4U3Hy7BcV2",
-    "qNirKMyRzFl8YOiEQxq5mycaOKb7njlF4eMQBW+at+AdbyE4IQCtpcQj4zvoFAsZ8oQY92F7jPmh",
-    "BYIzZGwW/D/dbMdYYsDfJToTMx5+VpXhWqPiJTg2SZMnEeK/xVkNd+LMlihGvigT9TJeL43U5lXl",
-    "3B97BPZvUEsDBBQAAAAIADdjxVzgJURIbAUAAIIPAAAQAAAAYWNtYWtlL3VwbG9hZC5weY1X3W7r",
-    "Ngy+z1NwHobZW+repycFNqwDDjDsFNvBdlEUjmLLjU5ky5Dkpj1Bb/cAe8Q9yUjJ8k+StgnQ2rKo",
-    "jxT5kaKiKLp5alhdAP3ptoZGMlsqXUHbSMXwG89Fw00aRdFsVmpVQZaVrW01zzIQVaO0xbW1sswK",
-    "VZvZrPsm1cODqB/C0LTrRqucG+NBGmY3UqwDwi0OO3iWV2zL03UrZBGmf6bBrWT1RCRXVUVmBxWN",
-    "FDbz9k7kUHHDtRXcBNFcSckaw7MCdylyZnlGBmVGMrPhZg7cOSWzvCJ/8NkMtwPLsKn0gdvf8JXr",
-    "OPI6omQ2mxW8hEyZjPTFHoEXCyhEbu+M1XPAf/dz2PLnBb0mcHFNz8UM8If+/YOjW2uwGw6f/rww",
-    "De6kFDk8Mi1YbUGVsFrh4tVqDiWTEg2BNcu3YJVbs2aGE3g6c4Cfavhb1IXa4XbcOvgRonTnP0Wr",
-    "FQgDVgteQCm0sVeAUQeEBYVguueBcWAx+Xm34d661SrgIAwhIxRbG17bZLCks5XmtNsYL1KH9XmD",
-    "nyqhtdKmg7NKSZN+oMd1mlcFLrs88XmkVSq1bRuHZzfMwk+6aEWt4OMvN47KzI8vcikAg+8Y7ezX",
-    "nBXkubC/1D7ZNETAPUUJffQo0nGEeWFFxVNlogTQS1GUpFLtMPwJLJcQBaf6SNJvh2SZYJTRHt3x",
-    "0vt/7kAw+qKJk34Zqt4NIPTzroPdbDSYACPqFKvjITkt8zmc4V5zvlGy4DpjUmB0zBv8pJUDQaez",
-    "PVc7f18Y+yw5mA1llVVbXhtoDXJK1EYUR6H19qSYa5brGmnkqfqx/sJz68lAghcmx4wtPOwGzTTH",
-    "Qb6chJhy0EGxRyYkW6NNnQVdGetUmuDdPeX7y9jT8N8//8LEWhIJ4si+qfSxOIpgoowzN0S7T2Ec",
-    "mxDt/dQZGdMP5uUY9YTUAUBJRQuLDi/F0+sAY6mplcfGhUxQrT2kB/J6/+ImG3w9qnZYmSKvfU+P",
-    "F+dDJKf27IwuoyTkWDMQHfXcRU6S8H1W52fBo88HxPwAkSYJMPfMQM9lVKyWhyAnXNxXgn6VGPLu",
-    "QM2p5fej/L8LGPduXXme406Ebdhpeei8U9JkQ9mMCweKhvIQKkNndHdEPpOZZ5eG8dl1izrx1Bjz",
-    "6s3cTz8oc411vD9T+r4DzRM1HdU2DTzUCrdyfk12a9wZ9E6o+yiTgtN1fOsw9oQ2FO9xvZ5YtdtO",
-    "avHpUr490IoHefs00iknOv3sqxrlGRrlocaK5cqMVVYTld30qzqrM3RW2zHxCLdjXtdZTfn3BuUM",
-    "x+okM2rb3uyaAgJMQ+y6GteTKDwvvjdhmujQ84sGhwd2NBI8cVqjT7Dn9QnR7/8kDqbWg2ZVD8Qe",
-    "8dwq+AGeL0xnpaVPQ7/MYn96qDF0BBM7Ue44XpoJTJK/mGz5DbVj8SSSZVQJY6hXmlwFgBqZb/TL",
-    "FZ2wlhrGXGlOKZhvOHajztFjNw9E8ibl9glNpjj3W+onMEEL7Lfjs9uXzhk9wF3kCZMSYVwJHBHI",
-    "CX0LtwOeASm2uKVQTfqu0LUHl652XKZpCjmr4VlwvJJcYudRYnS80w1eeq46XMMqjt7WFRr51V2H",
-    "gJn37hqZ6MNMFxRc428+4d41TqN3oOKDW0tMUZ+TV5LQFuI+O6/GKFIvhpvVcabN4Yc5FPo5w0UL",
-    "DKvj9q9MGu5y8HdVc08lanyWryQ2aUmHYI10JOFUfqQgje5uMeJNyEsyb5A2mrZ4QyXAexF6wj5D",
-    "d1HsUgIvcamoSxUWLuA714/j7eiLEnVM6pLegOCAQb+LhRsOl9oURdzCuc+C5WfdcnzfFUv0pPeC",
-    "i2tWCJ1qbpR85HGCav4HUEsBAhQDFAAAAAgA5WqtXGqpxcFYAAAAVwAAABIAAAAAAAAAAAAAAKSB",
-    "AAAAAGFjbWFrZS9fX2luaXRfXy5weVBLAQIUAxQAAAAIAOVqrVwb4qroUQAAAFUAAAASAAAAAAAA",
-    "AAAAAACkgYgAAABhY21ha2UvX19tYWluX18ucHlQSwECFAMUAAAACADlaq1clPvzEMADAABODQAA",
-    "FAAAAAAAAAAAAAAApIEJAQAAYWNtYWtlL2JvYXJkX2xpc3QucHlQSwECFAMUAAAACACBScFcjYQH",
-    "iL8XAAA5UgAADwAAAAAAAAAAAAAApIH7BAAAYWNtYWtlL2J1aWxkLnB5UEsBAhQDFAAAAAgA5Wqt",
-    "XFMlC+mCBAAACQwAABwAAAAAAAAAAAAAAKSB5xwAAGFjbWFrZS9idWlsZF9vcHRpb25zX2pzb24u",
-    "cHlQSwECFAMUAAAACADlaq1c88DsJOADAABxCAAAFwAAAAAAAAAAAAAApIGjIQAAYWNtYWtlL2Nh",
-    "Y2hlX2NvbXBpbGUucHlQSwECFAMUAAAACADlaq1ckl8wWSkMAACzJgAAGgAAAAAAAAAAAAAApIG4",
-    "JQAAYWNtYWtlL2NhY2hlX2ludmFsaWRhdGUucHlQSwECFAMUAAAACAAdQbVcbS9zQK0NAAAtMAAA",
-    "DQAAAAAAAAAAAAAApIEZMgAAYWNtYWtlL2NsaS5weVBLAQIUAxQAAAAIADNNs1w5cgp5ihsAAPpg",
-    "AAASAAAAAAAAAAAAAACkgfE/AABhY21ha2UvY21ha2VnZW4ucHlQSwECFAMUAAAACADlaq1cUtFn",
-    "MQQEAADnBwAAEQAAAAAAAAAAAAAApIGrWwAAYWNtYWtlL2NvbW1hbmQucHlQSwECFAMUAAAACADl",
-    "aq1cTLzSQowCAABeBwAAEAAAAAAAAAAAAAAApIHeXwAAYWNtYWtlL2NvbmZpZy5weVBLAQIUAxQA",
-    "AAAIAOVqrVz4jl1/pgYAAOIUAAATAAAAAAAAAAAAAACkgZhiAABhY21ha2UvZGlzY292ZXJ5LnB5",
-    "UEsBAhQDFAAAAAgA5WqtXHSfPwf0BQAAJw8AAA4AAAAAAAAAAAAAAKSBb2kAAGFjbWFrZS9mcWJu",
-    "LnB5UEsBAhQDFAAAAAgA5WqtXOTjTvRhCgAATSAAAA8AAAAAAAAAAAAAAKSBj28AAGFjbWFrZS9o",
-    "b29rcy5weVBLAQIUAxQAAAAIAHxMs1yv40IVVhQAAN9CAAATAAAAAAAAAAAAAACkgR16AABhY21h",
-    "a2UvbGlicmFyaWVzLnB5UEsBAhQDFAAAAAgA5WqtXIsae5YZAQAADgIAABYAAAAAAAAAAAAAAKSB",
-    "pI4AAGFjbWFrZS9sb2dnaW5nX3V0aWwucHlQSwECFAMUAAAACADlaq1cH4hfY9ICAACNBgAAEwAA",
-    "AAAAAAAAAAAApIHxjwAAYWNtYWtlL3BhcnNlX3R4dC5weVBLAQIUAxQAAAAIALhMs1zQKaAFuBQA",
-    "ANc/AAAUAAAAAAAAAAAAAACkgfSSAABhY21ha2UvcHJvcGVydGllcy5weVBLAQIUAxQAAAAIAOVq",
-    "rVyJcCnUuwgAAMMZAAAYAAAAAAAAAAAAAACkgd6nAABhY21ha2UvcmVzcG9uc2VfZmlsZXMucHlQ",
-    "SwECFAMUAAAACADlaq1c65ZySGwIAACBGwAAFQAAAAAAAAAAAAAApIHPsAAAYWNtYWtlL3NpemVf",
-    "cmVwb3J0LnB5UEsBAhQDFAAAAAgAHUG1XMEataWpFwAAO1IAABAAAAAAAAAAAAAAAKSBbrkAAGFj",
-    "bWFrZS9za2V0Y2gucHlQSwECFAMUAAAACADlaq1cs/IYdRgCAACpBQAAEQAAAAAAAAAAAAAApIFF",
-    "0QAAYWNtYWtlL3NvdXJjZXMucHlQSwECFAMUAAAACAA3Y8Vc4CVESGwFAACCDwAAEAAAAAAAAAAA",
-    "AAAApIGM0wAAYWNtYWtlL3VwbG9hZC5weVBLBQYAAAAAFwAXANQFAAAm2QAAAAA=",
+# Adjacent literals: one constant (a tuple of chunks is slower to compile).
+_BUNDLE_B64 = (
+    "UEsDBBQAAAAIAOVqrVxqqcXBWAAAAFcAAAASAAAAYWNtYWtlL19faW5pdF9fLnB5U1JScixKKc3M"
+    "y1dw9k3MTlVIKs3MSUktUnjUMEXBLdDJTzelKLMsNU+hODu1JDlDITk/tyAzJ7EkMz9PT0lJiYsr"
+    "Pr4stagYyI2PV7BVUDLQM9QzUOICAFBLAwQUAAAACADlaq1cG+Kq6FEAAABVAAAAEgAAAGFjbWFr"
+    "ZS9fX21haW5fXy5weUsrys9VSEzOTcxO1UvOyVTIzC3ILypRyE3MzOPiykxTiI/PS8xNjY9XsLVV"
+    "UIqPB4nHxytZcSkAQVFiZnGqQnBlcUlqrmtFZokGSFZDU5MLAFBLAwQUAAAACACInlJdBaIZfoYQ"
+    "AACBLwAADwAAAGFjbWFrZS9iYXRjaC5weZ1abZPctpH+Pr8Cocolco/LXSVVF9/Io4rskuPc2bLO"
+    "cj6kNlsczhAzQw2HZPii1Waz99vv6W6ABDlc2bGqtEMCjQbQb3i6Qc/z1utke0qOWm3LU5Xl+vKU"
+    "FPfr9VLRr2qOut0edKN2Za3KQqtv//frt6o91GW3P3DD26z4kKh9nVSHaLH4+aBVlSctyE/KX6/t"
+    "c9R+atdrdaXW602Z1GkjDaGq6rLSdXuv9KcqKZqsLEJVd0WbnbRqyzJvwkXP76CTVNdNoLJG1bop"
+    "8486xRq2WmWFStRymydNs1z/n2wo2nRZnkbvzOhvyqLVmPOl0sn2sJCNqabN8lztdduoDP/Lu0It"
+    "d12xnXKpal0ltY75ba18eq/LrW6asg5Vnm3qpL5f8KK6FpsIVFKkiqlVmtV625b1PTb/1SbBtK+u"
+    "vjLzF8lJv4q/OiQNGtfrSEGAWS3ibBRmXJx0vcc2s6ItnfGyqoJkT7q6y9oDtKJVc8AYCGXzAVOq"
+    "LXaqQ2i21hD9x6TOkqJVVwuzXkPW8FrXayKLwE4dko9auGF1quzaqmtVlWAKIoSdnOgXMtcfdW1t"
+    "JFw0JQ26V0lV6aQWxRAhVsSSaKWJLCmB0K1pRQvP8xaLXV2eVBzvuraDnGOVnaqybsGgKNuERNos"
+    "FqZtn5cb+0ySw3bs64emLOxzXu73WbG3r80Bmsn7t25jFGhbyORkFWnSJmxLsHvT2TeFapfpPBVC"
+    "kgkmt0Tv8Go24hqP7fYXCv++piYYZRHy68Q8pXFb5jkUE++35ccY+9eNtI+scNxknSRcBKMV8N+9"
+    "LuwiePo/k3mFRgPCLd5L212dtTo2sSA2um7GLMtil+0tw9d12mVFSXsfk6VZg+WTgRhK47L9UuO6"
+    "LNvRkN0/Nv1CKdCMOg9leez18e6nN/Hbv7z979fxdz/++D/xu+9ev3/zHtGkbNqYvSIm8riCeUB4"
+    "FFHchhFfIYexWN6npD4aJhh3TutIU6TFPikjRtTiXjF7oR2hC2x9q2O3DxpIEYJGYyGsCjav4x30"
+    "0G+7yoq472nabhOfyGzHG2qyf2pQ8QBr7dTUdFAmopRL29bJtl+b7LlBHF4sSB4r60IRVvc9HnXt"
+    "ezLQCxaL93/94YfXP/0tfvv6hzeg9Qz/iHwQDr34U+80C/6r3rO9/aSbLm+XbL1igUvxHGoQW0TE"
+    "dNqeqfKo/qV2CSSRKl98qml1FaBV1zXiib8tOzTCVaxDcPxi0kBmQhDpmiV+a1orD/O4hx+l41/q"
+    "LR1pK/4R94KjLgefnaEg0S4R4xFuZ4Yb72w0nCbF9Lu8TFpQXEfXTHCHULuk4D4zWKJ0pjEsz5r2"
+    "hua4BQEHID/VuwRyjHcJny0rIoFSaCC6cHbGpAe/0fkuUJeveIUidLsvsKLeiJ77Don2DfoeHvvG"
+    "bCcDcO6SiGmFAyv6RzH9qO/hgHQs+L4Hvl7IgyI8xhQog1D53iYrbDseh/aD/mTb8SjtwXgOuxB3"
+    "FXy+VFHWsJv4MyOcPd1ghSQ/aNqvgp6y1jhxCvUwGuqJZXpsFyzESFqCcEzXG6xL2jdOqcUKiZQ5"
+    "8tuERCzTUPDLhMDsBiTmaToHDLKfAc+T7t6qLE3fMCGc2C7IAfqKVHY46QzVH6ZbJcu2U9Dz0P2I"
+    "2EAmKmGzl5Uv773vh6PowDZMD6JiQIZ3ur40KGqCswDxPiWniuJmuWsRrRkVMdZqCJR+k2e6YPS5"
+    "Xr/XNc6o9TqICIUQ6zTb64Z81ECLCKNf+KxbsYBIF9sy1b7XtbvLL70gIJOVUX5ws/zyduGYVb8p"
+    "ALCd9yAsIlrKY/wggx49IxCLiGKK0DEO3mxHPO2DIwiOB/R224tDgis8MSeMzBQMG9WFHX8RMmAH"
+    "3EZvoSMJFt/jkZEmoxlIrGZ8RW+trgsWWG8iVxdXVrRXFxAaTlaN0zwjvMjoj1naCZ83Zjkv1Qae"
+    "feRpLdp8BqBJ8AKakOmbYwbgmEbqzzT9KZG8g3qOumqZcVnk9+ruAI0K0ESfVXpGQNKIQk4SHPRQ"
+    "ol1LZNCHH0RkuIVh2LVLR5igvxHtUUCrkzuSn8MhSWMCaT4bAM7FlTWBqKnyrOXtuUGIGsATjITA"
+    "954hyr0Ibq5v4fx1VvmBG2MpqtGQcRSDg7VZ0ekhdotmwJgW7dMI2CSlT2nX4Ig+42kGUJhMNpyh"
+    "nIXKgSfL7co2uKzILCI4BSxzn23ZIwzVNFRb5SHWAlfo1Oeh9Gc0iqxn29UNzGf1c93pIBhxgXKw"
+    "Lfhv6vNGcd6TWipRisyAZZk+2h1FEYeJzpuJLIklpSdgaRfhOiu6jSvGhC/iJtsXCeUjvsANeF7b"
+    "wfiX7iBu8eVvUu8/yirpiRZKAyMLo7Fjfm/LDimozARghFkMhqRA2fiS/QmouIHAQge13w7+P9vt"
+    "BASyOHUhzC6gCdiCydbpsKTwptq7ErPsdpo8wmZ2Q7IvB4wJFO85tbwUNGszxwI4HsncveSMWQo2"
+    "2TbJB1aTLPEl8nR5Yp7tAWgIiUKyrzXFZh3tI1DY/NSkIUgh90lWICgnzmobjYRyRw5z1OkYMAVq"
+    "X4KdhCRVwIgYaIUmDd3c0xwJ1G/kAZg/Dh6sBxMZWLMibDmWuOE2nFfP7SSIUKQPJZ8nWYg2ImQN"
+    "p1GkgA0w5mLzELEvnzBC4kpPPbuI3poBrbH27gqcAqE66dOGjgPQyp5G7gDvgfJ8ISaQ72PqkBYT"
+    "qNWKfoWZaWR7xkLt8mfglmHVVcD+WDCIgzMas6YbEg1JizdxRrVBuD1+xpV5O9aZfdKFTBeqB2K8"
+    "FLaPwcjBb6w8aFvxU0K6tUGgq2LgaN4K50YM8UKTJ5ETWaTSwt11y93sn5uyzGW5FQXBvtYQwdL8"
+    "fhs3zChU3iWBZYqMA+eAmgkrC+vbAT5t79LVmNacaA4C2yYVl1HEkji4Dp10hE2aGGc2Kw+oLkdC"
+    "6EnPSHRVJA8Efcg4rvkc9xBT7sr6SL6Wlh6JsII9pk4kpdybxPqrRGidDkTwMASOTQnFszxZsHB6"
+    "7uujHLseByuaQwph6/XlUV2v1y/N2hsOA2YCiTmMB3E0dhWvHBpWCaBifce1SRsGtqeUvPmX1HRE"
+    "s3ftidPDp+yyhxO7Robne8qLPpRZ4YOtMUte7pB2n+s0BGjkRlj10Mfw0XPcb8bKMEn4GVsJ7GLP"
+    "9DpwNZqHzP2RKTy07D8tadtK1UCNM5dxVQ0lBxb82woTVZnFI6j4s+SyT+jUBvowzAAtNNBunCiI"
+    "oxF6XY7KUdJxIT+mqBzjjIqhIKo099WAF9f/ef1Hbyio2cruTFVAiICzRhUcsVCQDG5lNljD9muI"
+    "YN88yUwyIFMIH9J9MvM5cltG+1BumpnSwbDAinIns65vEwRQ01Vk7f3TA6k3dkoPTzCI9adt3qX6"
+    "FxYLWAoEGCPXf5Jd7+S0IthfuBggjlsxGnz+nSSfocn7KA5RojsCGgQNLqwJXbyEEUtJ6FSmHcBP"
+    "Wm4JgBd7A25e22F3B6zFMN5y8VlttK3jpMo/ZcBrxd5ClHBkLxJHA+RQ4t3Mi09nrl7JvUXFkJh8"
+    "h24c7KWFu1MELlpqiT84leSKQgr+I5AicWFlCtvR3SHbHnyJFl7v3rQBCbyDWycZlvUtjPNt2X5L"
+    "Of0bWrYZyiN21Iqoqt69/vk7w2zIZFfD85BWjWmi05HAuASbRk4bGAN0GpdHAfsL4yZc97ZoV86C"
+    "SVH8dqhG1Swg6yIj8xhw12fx88Brcx/bc3ugnLI0tAy6xEKgOCKPKEk/6vvGbwYhCB3jJGN6TpDe"
+    "pL3kZooettzhFqYIEroLMhWIlblxGaqlq006GkcystgIr0MfeRiFwQixZhdvoeZ2lDG29f0YZj3r"
+    "XeMyLwnZr9fIA1IENX2FDJ4K/DVCKtV5zFUSm21/CRiNuFHFnxLiuZsAf0TZh3QcWNtjstec3YVn"
+    "NHRqRB+xz2mdrO9M6u3hvMvcfZDs7P3VlISSaSaQddjXMeEY3sLheIvkQzCC3rjPeNueGyInO5ve"
+    "45xLw27ofKG9rOa7fsVWZUmTA2t11jI/cHp+raYN58PGUjPF6NHt1vn+5/f+1I426XnbEzKaQQar"
+    "mbYZfk7oX41uhM9IzSG3Mr/q1Ur9ftbiRrBiNW04H/KbtPYbNOaijpX7MiMWY8KrsZHPbxcgZWV+"
+    "ZwgIaaz47xOdA1JZTd6fGmBwy2r09jmfntwdzoQpvuXg+ptO7eWGjczhU1eVcxbxmVU8dfPnj6cb"
+    "D5Kyw2rmopeHjYnnb36lGOXU1D5tddWqN/wDr1BJo4DdcE4U5T+Q3X39/Zvr6xfqklOyTV0etT0L"
+    "1alrJDI2bVnJ/VxiC0G9sJHTy5Xeisrl7X2lfR1EcUwpTxw/LtUDMp/RkLzcyxDf+wKH/heNZ4/S"
+    "cGA33upZSXUHfJrnk6OPBk/uOeZPT+y2XYxGmYDmXqxRe2+chFVGcz14tEGPcM0mkpqRZ+KOabRR"
+    "SHnkTea2iTroNXgccSMUwt8lFGKN/bw91W3/9Ey9O5TFvUnkXhq91NqU7rmAhRSfrlc3AqEZxhEG"
+    "nly7DEe98GIVGuzwsElN1toTCUq7MfWNszpQj84citrsgFSeFbty8EWvR+hfpAT98bf/dMnHS/8N"
+    "kYlJfhME3uD1uS5M1TUYNxosNWm1gS2wdZKhaIhVPlnRFSN8pn6Ea9BHBv2nMKbcyJcaclc1fOkz"
+    "fJ+wXouEx98nDAgy6JFqFko1hIqvRXfSNaXjPIkDR4e83AX06opuaYevizzCNJkUfKgIB5VK70P2"
+    "GLm5Bktg+jmEL2VXp17S04ItiVJWpV6pF8szr2YV80Ui9Hn1RbqcqLWBCrG2/1AvQofX8By4M7P5"
+    "DdObrwlW0/rUuF5BWYZl5QTqFw4fKoSIuZvy4VkQIfFOjfks0PAuVyo765BLYqpSyJJZIcOMZh+s"
+    "Gq88jkPjDOU5FHVDrujWkHomQ5NPVOjsW3L9zV6VDXUhvi3TnPfYBG0oTUkstGHR1b/9poCrBsLC"
+    "bvd3K97NL9yEnX8nNTnXztKZf/Mwn+8eDvfz/tkPkPwJRJhURVaT9+C34MezI/ongbCc28sp/YRt"
+    "hWMTMMqXSqf+hYOTuVDtZTX6xmiiBqPr0QdRHGye/KDEMbooSVN/dritZfY2yHeXlHc5JjuI5ekv"
+    "r3wiHZU4jRmbYqXENbu3z9QgQreKyfnGU18v/IDps0Jf0qVyssk1f3/pfoBrlrBkIIVd1vd8c2+w"
+    "VJV3dL/VJrlTrSY8IrdIcNTu5L8Qx3TckhPUPqRAZ07FwieHCx39m09RDLZIyy2xHk5c2ilgCOfY"
+    "bRlLOc13bNfj9RF8mT1ILy5kwc4AG9sx5qaO7CdMwdk2TC4hCyMpG0v4NVWnfogolcEATROl3alq"
+    "fGwTZ0pBF5mr3wc4W7y/0y3M2Y2/aywVf/fJlsKVfnMCtqTXz1kLW8Vg+9AjIQP+aGBQ9VJZL0V6"
+    "BhxxwglNH9bhTGnNxxT8qa77+UdvEnLxACD9XJg8X371x0f18Nywer589V/0Svzw/OWjzac9J67P"
+    "RnXj87U4P8icr8WIuYkHfKfomdkcoMAbcEmowemXdY8xrfdgLVc2wdNQZOFf55swPgufX8rmvCkT"
+    "nhrD5Hd2GMmBJmNROIh1FNBqEzFJAfVnjy2rBPv+YIY+YsP/D1BLAwQUAAAACADhnVJdVJDb8uIQ"
+    "AAANNwAADwAAAGFjbWFrZS9iZW5jaC5weeVaW3PbxhV+16/YIg8GFAqW3KZp6SpTJ3WatI3txp5p"
+    "OxoNCBJLEhEIILjYYjn87/3O2V1gFwAtOe1b+SABezl79uy5fWfhed7XMl9td3F1V4tiLeLVLr6T"
+    "Is0bWeVxVos4T8SyTTP8jVd3Mk9q4S8WetiS5oowDBeLIPQ87+xsXRU7EUXrtmkrGUUi3ZVF1YBK"
+    "XjRxkxZ5fXam21YFFrlvsnRpWrZxvbVei9o81du2SbPubd91NHJXrtNMdu/pTioeVkWWyRWvaJj4"
+    "pmhpW6q/jBtay/S9wavmXu0tXBZxlURpnsh7Mygr4iRS7WVVlLJqUlnPVHOZxc26qHZWj0uOZagJ"
+    "8Qtor7I2IQplJcsY8uJ2ZxqEtE43Zt6LKmnTvCBmXepJWq+K97Lam5GVrIvsvYziLIsqbBtyiZqi"
+    "yLCY6eo4roqicajJ+xLHHm2quNx2AlLb2v+ZGp3R65+XuRn17d+/fuV09tIwQ/wzgV8i13GbNdFO"
+    "5m1UlHxOEbhR4p3xGM1GTyJap/dlAd1U/f1x1KphJ6uNHB+Q1dftmQhbS31Im62SfkSKgTnB2dln"
+    "4iVxUIM3UTfxRrKFLBbOaS0Wz0WzleIZ7EQLOmRBQ8NqbLrm3qwoyic1KHqwg22ab8RqG+cbmXh4"
+    "kKu78OzlP9+8ePWn6O27F39++VZcC99bxrX0ZsJTmsNs0auzyKhBxJs4zanZaJeHnZxB3CJiEYwV"
+    "WB2Iow1ztoeZ0DaQzLH/aib0Oc1Fkq6aG27Cn9uzQFx8NWibM1F1OFEVf8COJq3Hd9btVwz6+aQe"
+    "NeYfzs8/rjW+mTyzFg5m4vxcDz0y0UrCN+UnFUKJo9OvCbt2eQ5m3YRp/Ztka2btTVPozqnXw+ju"
+    "Q1xtBguawyG7m7PFnZR/variBh76mqf4xluGG9nQc5JWfhCIp8JT1hqxP/dsKR26zRk9syQCmh6r"
+    "xkAi4nPhPfV6uXj9jvR4w9hT3eednFMVP8GNR3m8k5jrMYchfKA9tL6TIHaCvuqcWIDkF2EwrBGz"
+    "6A0mpBv8YDgwrlZbM4yeVf/RnJn2VcpNdH7K711PMrSamdAnPO6ommkTa9oykzdZWjc3bjfmcOsa"
+    "Ktvc6sNfZcXqDkfPzgG6uI5WOgBSb9FikSlSmHFzy0NoYj23KVt9eOQF/MCQC+OyRH7gn3bbvpJE"
+    "EPTkzSRNS1yIJvgvFhj6cR/Tbi6ubskJaHEHj1oeyiyQveSiIjftPwvmnT4MOXs8d/BgFj9Vcwx6"
+    "Cr9YGh2FRy7cB4b5IA/phXVzGxwD7ZQeZk67CsyeqZHTRsHpxP+PRajs6dpNnIwFDA+RB+u8Syb+"
+    "L7IQs6CiVUnKH5LHWcT/gp1PtJhpbscWMmVi0+z9V1Z0mo1H28snyuuU1XCE06ajUzM6t7mT/NvR"
+    "H5KipL6UMfQX1o5NfnE5E5T5q3wDfCM1RPO3AHRSGQ7GqfMBanuH1cV83ear+eK0E1mo1LJuxHyV"
+    "IbWdLxzNXghkyUUuVV4TnjHxr5HsCplv0hy5M/IHzoVHCbRKrkUtf26xd0mEaFwl44wG69QibO4b"
+    "jH3KhBcLtTXVqDLwpQRvSNDPlSzOaUFOwPEO4CGRQ8tKrRWKf8AsxHkvo3MNORhDcRORIrJmfaIE"
+    "+RUqYQc1UvjlvpEXaSKRGa3ALaAV0tM6ZFo/8gHX4kqkwNX5XvfCj63XstKDCDTzGdsJFI5qEqT1"
+    "vp5VIiyByNm1IpFTGhG+h64V5oXzFNHWsqIR12qSebXcu/YDWPah3FMRDiwnTpNOAYuJqWGfDPOr"
+    "zswVxTT/CeQ+Ese6/Y+82sNJh+3wrL1XtrRHaNmfEjTYnLkHdu3mv0r5WR8BWyh1nQsVL3x4k7UX"
+    "3Ipzkcncd0BfwBpFo8mL+p7ZAIE5dk9eYAAMa5kdEafCFsWmw3HKN+/ie//K+IzActSGgRkbK3Hh"
+    "sHEiy4Vofc3haAw320tov6t9Hsm+zfURdfGf4n3gzNBbviHmaF+g4PSTrLvOm12a+zEQlpIoPdFe"
+    "/p2Wfj9OMxDcqsMqK1KVtWcOci4OzpkevcAZx2o8p5bDEDkchX+gw9V6dxR2rcg4qYMS/jEY0D08"
+    "YcE9mf/h2bOjODwxMn4y/+rqkhpYoN1bXUqZtCXef2c4pC1n8VJmM2fnjqopPm76s701LeoYb60D"
+    "6zhjopqvGAp8JX+NZcNfr4+7WhyWo5YY6Gs5/+rL8Gp9vNfMNWvIfYMzqtudP+QBetQ3G0YG0mmK"
+    "Js6MdJr1aFEQHzWtwUizsThR7iutd4QRu4SOjKZP5+Czc3jiqIayaGX2jRY6cusax6LrlzBZgOMC"
+    "A7OQFaq7uWYQmUjN4ct3NP5wF9ZllsKjhLC6q+Dm8paP/o4O3KqMDaG53hdmN3HV1ORIfY/qKaFx"
+    "L71vNOq0TBOi2rHkWvPuE0LAkhz/4ega95SonQH0O4Wwd67XgBhmD81VQOShiQOfNX2eS3OKtpaa"
+    "BIG9QCc0OAKTjin30BFDj3mhWoQiKJGqDY3Q6zKNuWek1pPhKcL74fu3P7x49813c28QcXv3oM/T"
+    "soDRHoRJU8AthhvnopNWTmmGK18a2GefYzwNqaAJ0x2cnFK6qlj6TLyuEmRtWAgwrRYIynMwsUpL"
+    "qa4mtkVxh6dKmoI/5L7cixSj44bqrJTC0RqhzT8Mzr8X19diz0SIEf8+oAZ+3KvAcT9Dv3afHE6o"
+    "QvfH/toi1I+7OMdeK7X5n9tUNth9ghDlB12O/RbaItYJJOd/8wNdnTwVr5BHxBQcNnAhXFrG+VOl"
+    "typWaIBeYLvMf95mmUjk+3QlQ5Mw1vs6VKuE66yttxrS1PF7zsmKOkRc8K+02632/RGTyQsYaO7T"
+    "IPmeqCPF+LD0AhHXvNggXDOtZz71hFQ/zAs/IJ/TjdqnMkuUeqU5hGutdoJPmy7z7NBDD/BSLVVX"
+    "VxiFw0rX8apBGgbdasi55KwwUB21IiFKfYsU1tv42Re/9Xu1LzmjoUmhzNacOHIeBxNJc/t1K+/5"
+    "1XIB0PeSEACZ3CuCOaQ3ZZiSJ8qkP3AW27Atk7iRfglISa4YMKE2sFDr4JaW0RsJHOy3kTlpb1HV"
+    "j8R/qsTZBTIacTuFCk9AP1IxpZS0KWUwsLGGUBal2GFOmgrspW8A1S2IvgJcFbsSElgsNOR7QxiL"
+    "+VFXh2oKJc2MDk1hVl1qqHUKQK5mGzck3w+wbBhKWtWayQ9V2tmxmkQChwCogcfpZm1X6sKshUP4"
+    "XFnYcwFFqGRysYohI4X7l1RTVm4DtgcGSP+IoOYcjOh9JdpB5HDoAT/H0IGLojQDmKBPXNKKzMps"
+    "BEWDULwD9Zd/+5ZyIpgIdgyLKNuG7X5JMLm7Xt21tCdF2MWXz7XuaEwJhvfaTbtg0rlAzFJz80bQ"
+    "JuLW8Sj6C70zQ3k/J8Yql2uuBX98Gb36/tVfXkTfvX791+jNdy/eUnpJK9G4qIQ1ynpEgzXKWo/G"
+    "c9tML80vo2k4rBJoUbLRdTyUsN6up27aZbTTBRUWoZHrtX2ZwfS8uT45tdOZJSG7/s+89GM1nx3L"
+    "gbkKoL8fLzH+svsYauh9gjeFQ6ZACKvp/DGIg5WekurfEKbQAsP7l/TKmwbA+L2CI53BEQZhiMLr"
+    "8ABN+YHMmlyxsbO89119xFB91/oh1ODcChxLinD9FY8eR7CuG6Ic6+iqsofEhhMFd9XR8qEGnOpq"
+    "pQnRuquH7l19jhBWu6aS0l+Sd9vkcCKRrCqc0PW7qpVuikthBWs7hS8GA8Z5w2do/FsPkK9rSTp8"
+    "6UqjCV9cCOHaxKQ9Dng5YS6+S8udxEnDZHJj/6YKvR0FkrAK2eN5kXKg3Wwqk34SdaoiDGXB5c6p"
+    "xZQWP7BYlBfw8tfCrtuMRj22sPLYbTwkqE/cqrMRqoqol5kYVaPNT9tNV0uZzrlcfaqc0lwnGu9g"
+    "GaZ2LuqR/Io5co3WGZsDrXtTdMyJ6bFXl3rwQe/NpeGS6HlFxCTcVcvG17sM38dZy4lZIH51La4G"
+    "uHaE9qz96GzbcQTaI532BkMUZ3KAR4A54dH9NdL08CfAXhs8fgowU/fk6yIDpqp9guROzsjpYf/a"
+    "ZYkvuSqupok2p7/nPPlc5W1b9BAcQ1ZIV/PIFDmqmXRE86arGIcyJB+YN71jZzPiwjdZEhHu83V6"
+    "DatNVix975wv/ulq0gCCBE4wSuQqiyv1dZm/lJgq9Qcr8RqRl58VTJAqFnUb+1M/k3I8COycp5wT"
+    "iBA7EELkbCTdR2B354r2ufApVQTw40/kCJNmT2qCbU3R7AFMg3AqEev7Td7y9q/fv4ne/Pj63et3"
+    "/3oDt/3iB0qdrN1Ed3KvkhjeKMxRf8LmZ3lIkb7Ussu4WMusq6oQb8YADp4c1u2yqWDI03PV1iYm"
+    "862oERyFXdlYkAp5uFqalxgFS1Jr8ZW45MS5DimiqoLTc08l06T0tVOK+swbuE3IAMsOpOIPoqS2"
+    "nzjfU+3ikCP98YgvesHwo6diPTVNSX3CU/PdYJL4mD28r3PAGoV0BdiLamxRUyjsNAgjhw6w06uS"
+    "6NK+7vKtLuMPOQEiIDAFCC9sFjocpmxW51KTprspJH2cVhXtZmuu//R60riKVVkuhK9TSKbb3a7R"
+    "5230RRzWoXpKl8jxwSKN38r8JI8EsGg3mCf1F3gF3fwZbkb2xTd86lrQsiMDnTRiUgjOZIG2VxB+"
+    "Fu/51gGobQffo4pHiGUrSa8ibmARy7ahqlIN/wzANry+Uw5fyXPyCu+j32Ou0zyJtDAcnXmEnxjo"
+    "/kxMnJLJI6N++oiySbrt7zDp5/ATcbW2oKpbD4HMWbgj0xzBqx9EWm84wi7rvod1dnL33Zdv9O8B"
+    "7KT1i4CEn8xGy/lJoBwa1zYnY11wa4XhHgV4ff2EK7OdJtNNDt1IUGOqiEeI7jZswRgKSqooEVjp"
+    "y9pT1nZ4MhNPVNCmD9MqHey6SBccPS0Dy4+NQZH2PpeqnBcZTzGRnj42JZ1KQ3kuF2uKehqc0W9C"
+    "/XyaYX2GYTGo0k79PpF59iMP9J3pUIsVZXWwY8aO0weqac4FpYhmAZ0l/l5liTO766lwzl0PVRdI"
+    "T7XZ2Efrj0A1yBlNKYM+e9EL9Inm0fJfnq388p7gz0k34Xf6QQPhPqkIObofMHY6F1N+l1VrDZNK"
+    "nttelFqpmEVFMgviOBp3qnCxu0vo2ccy6/T+2qlbuM7CCzr13JENn3I6Pm1MV62jLgZci8vw8lHF"
+    "hZiKdpNdThH8hD65iq6+W/6I8xuovZ6jS8mIN/zk1CrMt6oYFsJukNGP+rh9kmaoClB05+DzN8QQ"
+    "c5EgGbj22mZ98bsBQDUMhG1OBUwCDTUGR8XdRIXiFCrlT1+uP+LCfSjkbGLbM3XUg1X6I/38NP6G"
+    "lpsvblw175jiU+5gGfxqEozRL13PpHkrR/vhGEIPt04XWGPEOwYVLOxOnFzS50MYyh8nojCfBwFR"
+    "cuEN2Co+KEc3yGbL0GoZu4+b5PY4FBAxC8wKgo+5pzwlIutjgSLP9vqTD+MWqQl7IqYvaEH+0KM7"
+    "QN1LjFzQmFP1DjY1bI/tTGFAmnpiNP36S8hDwmj7SJGZ2KQHotV97DC6bvo0RE6n4br+C35XCmaj"
+    "dsv79172YOnzRHjp+p4KHYbzR8SWK6rwYD7s6hgMkoM+ZAFVjW9tTWdaD5bv5s35GwgYUI0+K2Pg"
+    "pEk7zxFZMR1OjK89JO7XMdZm+jAD+NOVPWjBQ65F7dyDU0gFeDPH0cvlc0F8qA9r9OEcNQOdg4ZO"
+    "cSXFNHMFxXM+9vpoleQ/UEsDBBQAAAAIAHycUl2HYez0wwcAACIWAAAVAAAAYWNtYWtlL2JvYXJk"
+    "X2luZGV4LnB5rVhtj9s2Ev6uX8ETEJTaqLq0BfrBVxfYNNte0KRZJMHhAMOQZYm2dZZFlaSy8aXp"
+    "b+/MkJQo27sb4M4fbIsvw2fenhkqjuNbJb7uCqVFxVartSxUpTPz0axW7O8w0DWF2Uh1cEN1W4mP"
+    "bKtk38H69ZHRBvbyRRZFJ7vlhhWsKdRWMC+E8Zt3t999O2N/fv9sz5q6FTphtWaAwMi9aOv/glDZ"
+    "MvFBqCMr5aGrGxEVjdnJfrsDceu+bnBFc2StEJVmZifYXhw1niZbYeFk7D0MW6jaSCXsuoMALNUp"
+    "zKej1o0si8YNV3VpmO6a2rBOqEHNFE+zIFGklr0qBdsATP0VSOZdYXYp06BIyg6mPoi81clqlbGf"
+    "YQlY4yh7M5tFEYNP/vr6l5c/sT9Y/923bCeKCs5pRLs1Oxhzz0qUEg7+wwFYN3J9+pBlYHtU2G3Z"
+    "ycYZxqHTpjDWSEU7+DivK/b1j4zLzUYLk7qDAeo/wMx3BfiqkXLfd5ECqVack49C+vYAEbMrGm2d"
+    "QaeJRpQGowLlf6XhJA6npuxD0fQCJIPDtcmiOI6jaKPkgeX5pje9EnnO6kMnlQHZrQS0tWx1FLmx"
+    "Rm63dbv1j9qovjRWAFq7qdd+9y08OtFFeSj2Iqtqvc/LosRwsGs4mZ6GcnIWPVdg5krk1tpuaNia"
+    "i7ZYN8KNi/ZsKbo/RyvnqC8NNbKoJmsoDicjd6o2Il8fjdB5YeShLtMomaDvlITYMzXE72ALEGuj"
+    "NbUPPrUmG40qykHjUvatiSIwI5t7Y2ZbYV7BX6F4bPfESRS5gJyzdXz90+tfn7/89zdxlP/z5vrF"
+    "zdv81c1vMGOtn72jHx7/8BL25e+vf3GrYEXskslGS2xnn7+5fvsimKQfN3f76vr9z2/evsbpgW1Q"
+    "dQ1xElViw6zGuQ1nzf2iXElpZuT1BGPZ9F0jFreUgfi9nJGdlYAYa9lkF1BbPLJAnN47O1DCgGVY"
+    "+X+GExLtJUDD/BmkE0Q5sdEXwQLqcKggKZFCRr6/cjwYUIb2Y3QA5TxxrCD2vZoceMWQN0g0P9Ra"
+    "Q8whP0Mgt2XTV6KasRJWGDfOyl3Rbp3QMeyTDMkisBq/esT+ScquHgqXJPF+dNOYssTaenbuMTIY"
+    "stbEdYtJvvMuYSCedaAaEZJeTsOWiiUy4Qyzh0TC70QiTGZUa3icge+/SRbPBiGOJixno7k5fVuP"
+    "pszDmBHOlKnibkbFawGH4LSyWvwGVrZnEh4dLsKdC6v8sGm5hHz89NnyG6i3Bx5HDUF+BoAOmidW"
+    "3Cgyg0ICkIu+MXyqO3hlsUyyoutEW3GOssARuBNrmLbYF0SFeOxiaSmzK9oJTguxbkFN+AoR2ioG"
+    "z88GwOu6gmWIFGE7hGfIqYbOp6TOR8pyEpJhPWFagGw8PCyeHCUlyUSw9hrT3DDlwD6dj/toztXX"
+    "i2gsvabsU+ziNp4Nrk89W+EY4vts5VWFKYjM4+w/sm75wvJ7ygJKz7qi3HPEYU9PwFX2HyQS6bBM"
+    "7qlWNg5TOmbIKsx653ssSF8Ssb4dGdNjGr7Q4ozBC3zwnJof6meo5l2R9KsUaOrTZ2xRN8QitkeC"
+    "5rJYa4Ehs1qhmHGB7Q9hAQBqxMA0Rh3H8LiroRmjhRlwUstjtY4TVsDJ4xrvOjD1JkP9yZzW1gm0"
+    "l6G1sTFMJjsBjLd+wv5mQ+L+vQwCGzokOi8D3MpohOh3TEEFBIOaT+b4Dg5KE8AcHtG3FA4ofREC"
+    "mS2TM3UpUid9E3fqo2gIoyBuz1RGHWooCqBCWwruIw4dn6COdgC7FD4EPJlnCJ4v1hQzApBaiQuf"
+    "KUuS7UPvDB9tgtAYA+/CUY57/AfS2rfR2CiBhMn0BuhRjKmG3kVDwQ9sPAFArHWPdV2j7uxLLGV3"
+    "i4+l6KDBffPuRikJ1vxVHN2/98dOuL//wmac/gfRcmq7cw8RJFspHtjnntGN3BGn5YWxb83H6n6p"
+    "RXmcDgYeWK1+8Gt/zK4gr5W8o07k5ILHL9/wEiwi1MpAwGGw2UvZze99DRcWYAxmJE4bobBJmW36"
+    "tpytzjrzLGjJV3ghHrmnU2JTA0FqSZKdhD/PRbiimR9E2+eyo+tPDoaxYqkHe0QCXW3PDLxi2/oD"
+    "EF0F2tSgOPhHwzl4Z4MYy7whvcuh90CTDNdDxzXnF6GwgFolscz4bU9R0GmIfNrPoH8IG4nAbict"
+    "mq/SiGkfspw9K7FpR33xfNonQ4Zo2XwQPHF3LksWyHJhu3fSILq+kKxANWEe3A+5ZwyKPu56TN1v"
+    "AMk8zurqY+yqd41wHiqAaVCxp8wDiuJ2IBw0+JR06PrmUFhpGayNR8aAKx1E0LrfeqhOC1g1Y080"
+    "4098tQTrP9FJnDIHh7ioRn3OidD5Daaje1BgW+9gQFNId8vRo2Qn+5bjngY2tAbsT6KHdFEC3/yQ"
+    "Ph6+3fBQ+N0bekEPi6Y/6VXZPJCG15/LMRgQ2xCDD3Pbw2R28qLNvqyyDUgwGb6i4hSlFZDyXoy0"
+    "40w2Xp0cmT+cxs5WE3VO0vJ/zrqzm9sjiefXP5p6UCB9+Lla6SJs8n5hSLWgrMFy33Wgp+HxtOeY"
+    "X+o5XDYMCl1Ky7AWgtxFbF9puE7qsoQgpWi112rwyOiI8H3SRXXvvStYHLb75vTgkyH5nISJQ3PR"
+    "X1BLAwQUAAAACADlaq1clPvzEMADAABODQAAFAAAAGFjbWFrZS9ib2FyZF9saXN0LnB57VbJjuQ2"
+    "DL37KwifbKDLdXemG8hgEiCXyXZsFGyVTbcFuyRHkqe6MRkgX5MPy5eElJeya+lMFuQ0vrgsUY/k"
+    "o8h6YRh+o/oDGuEQpLJOtC2WsNfClBaib398+35j3UuLYJ2R6snGSRiGQVAZfYAsq3rXG8wykIdO"
+    "GwdCKe2Ek1rZ0abQBFj4lUTsi8nwZ/ylR1XgYNQJV7dyP23+QJ/jcVEcRINJoVUln6b9r03ZS6XZ"
+    "zK7MOmEsZu7ZTZatFmXWGd2hcRJtVskWgyAosYLM55jJklYJImvwxUZGHFMoZeEeKd07znkXw+YB"
+    "LPqVXRoAPcTAWz4M372zIAxCZ7CSz2hBV8A44GrhgLxIhSAgT5Q4YA5jIC+eQgYi5+mMDff8M4r9"
+    "TqUNNFQQ4Ij8ircn+ARVaY/S1VHoYcOYWC8hTA6o+iQEKgCfa06nRk+JKMuoeUxh06KaD+8Gfwap"
+    "kIrNVvSM3HSiaMQT2mj6kZXSpL5Onp5W2iU/unfpaY3yetwFY/gc3RIkkf4Vxadwx1AIZGbiA+Ws"
+    "DRtyapYqi2W0hnFoPE68YovdnQ5fccYPXS4nVY/zYn2kmBc+txDWRMaRSh2eo9fHz0XlRIQp6rM0"
+    "GOBK8AsX06Ebjq46OzF3TtsJ7YbXFXWv8faq8wVKNAVBPHatcBTXIaEmDWMG5pb828jjfLqHBfSw"
+    "5oFvRTKa/FOv1Ivk8tpMiQbk+OII12AvywX/t+bOtTLwQ32QiK6j2xhV4cfFZeb+/ZR+nOs5fpO3"
+    "T+GqqbmTrjT1dKUzo7Wja+jft5uaZtbIeq9KNJDnSZJsJ5DtmyGyh+0bDuiBv42lqf+wzXOIbIOu"
+    "qPdaN0CEDF/xPAb/Yl6Mof2LUTEj/JdT4kY/L4G+9PWXvv4/+pp7J5vV29jlkbdlaUUiYymZ7vzG"
+    "0ITsgbYnOfbIBjv4Fd5rUi73/nUX3BgHPw1hsEac1OHAy1BEpsb7gGlI3EFvaXKcPl2NapYDSeCB"
+    "vzc0XVJAQQfzfLMZMGiI/PHb79uzo4uxkueMPRvk+QU6g7/ru1YWpHVJ21ridRl87KUcp0kCWBMZ"
+    "X0FF5DjQRdEbw/TAkUhOpvyH2cXhYnl1fllEdUXf+T0uGwmy7CDUS2T00S4QPN9MfboaNmTlFSEb"
+    "n88T3huVn/d6ceV41StAsry8zmMW04X0NtMIXl6UVTy2OdX4bHu4YJwx6dXnjgQqVyeKE4NWtx8w"
+    "WocwE/HKHxTBLXVYPAb4OUd9DyQcwYWci+NXUBaylwGWgjNed+JAX/AnUEsDBBQAAAAIAKeeUl1k"
+    "D8UM6iUAAAKIAAAPAAAAYWNtYWtlL2J1aWxkLnB53T3tdttWcv/1FFj65BhkKChJ2+0eJkjrKPLG"
+    "jWO7ttN0j6IDguSlCAsEaACUrHXU06fpg/VJOjN37icuKHm7+6PVDxvE/Z4733fuYDQaPWlbsV2U"
+    "IsqjRrR1eS1W0WJflKtZtGvqnWi6QrTTqK33zRIfimpZ7lf41IhlsRNtMhqNjo7WTb2Nsmy97/aN"
+    "yLKo2O7qpovyqqq7vCvqqj064nebvN2UxUL9LOvLy6K6VD/rVj01Qj21m31XlOpXJ7a7dVEKOeay"
+    "LkuxpBHUoCvxfs+lq7zLl2UOazSl6tU0WheiXMmKu7zDSalKr+AnLypfbvMrkSzqvFllRbUSH1Sl"
+    "+CiCv7LOV5kstQBminZl3q3rZtsr1QUSthmuCYrG7rC4FVm9owVm79q6UqPfNEUnsn6503yZLzcC"
+    "Zn2dlwUsXLhTN61h8OpSNLumqDo5OzPvjchXounXWNaw09eiaWHoDGpmNJgs2+a3C5E1Yg04tcnq"
+    "xTvYIlXuLnBZV+viUs3rSbPaF1WN4G+daquivZId6H0smmzbFVuRVbSVpchaQLXsStz6LZc1TPM2"
+    "0nhFaG4W2NR1B+i8r6i3rq7LrMq3wp2A+LDLq1V22eS7jcYSuaO3f8SXTu31+4XeqKf/+t2LKSFY"
+    "tqzhVSUqgDdUzsp8IUqnHaBgkzeFwVa5Uc/p9e3U/vFaLuNF3THMM8CHJuuavGqLrrjGbSdSzUQF"
+    "9LBXaNfb2BYIisvyCmi8g62U87iFCVddXlRQC8DNlUTVIo1L3NEThm72C6uW1bmkGkKRsqiuhNXK"
+    "owTVaJlXtCtcrnbMDIZ9tVeiW258fDJU5oIQ+US+a0W22u/KYgm0kNGWtMAKNtBjUfUIdCXW+b7s"
+    "sq2o9prEcGSidgYGzHUHnb7fwz6sMmgC0Ar2xgiE3AuWq+hENJdigHvIMg0bbGwNTKWr7KaANcit"
+    "8NtX0ArI/s+C0A7oo8lu8qYCMs5KcS1KWcvuAKnOh+emrq80KF+9Psve/Hj29vSH7IeXL3/MXv3w"
+    "5M3ZG6KdDCtmO2DuHuHYxG9IEJjHyuEL2b4V7kYuDZ3BeN8/ez2lhx/Onnx/Bs9QDpidg+haTZkZ"
+    "4qsboEUAgzuHfVV0ty4+AFyrjN5nixzwSEHNepW1ADz7rfggCQoABaRWOS0MbqpJSfDSxGQVyed9"
+    "AANyA09omf+rSTpEpqsgjbkrk0TgLa0RgAtAya2mEXwtnw2yEOyR0fkzIg7oSDrzxq3Y5Eu9p8sa"
+    "GOg0oncrd45Sd+jTI20+ShGlXTgligcFC3kx4gOMF65xDbuRA6fVheOjo6N/1tL/iP6N3lDpS0LE"
+    "mQQTvZlJFQBfMJYidVhvV2Lnv7oCCM2itmui6BFJx+i3iGcBT6hd/MabQNUfRW9EFwFtR/M5No3S"
+    "NBpBrdF8DpOIiCpWEdNuC7+rCGgE9LS3Px+X9TIvod3xM6hcFi1AtRUCXij1DFClQUrXcpmYruIE"
+    "8/k4kRpKsZgpgQKzewHCKUrpPzVF3rtcojmMrTXAKIbxj+k19Pd19KKo3qESSQgGuw0qykZUEXZZ"
+    "r6NuI0BZ2+SgRLQJc7DtAgh1FnXAkcU5gnEaJUlyATOIg5v1Hfb8CghX7hQK2RmJV1eKoOSwtoVR"
+    "BUST9VJSgftOcmgBe7gqlt05QHCKu3lhoQXMFqF9bqMNzpc0yVgJjHW+BCF6m2LVsRSszXKDItlg"
+    "TADaolwfrrABKXq4BwcpAxUWKJgOVdBsjBfKuPGQNSp6JWm9R2mZgfLv92SpLQ/p9BHg9DcoM789"
+    "kdwEhQYh9Mk3jvgAte/bEyAGiXNUErHMaQEHJX0gZ8wVW2USeBRN/I4mQJWEwhWMrnXkZAPdL25h"
+    "RUieq2K9Fg2octG6zC9bIs0We0ctu2uEwnKnb41vYVpDRQxpRapB0CdgY0Oc5ETxESbzsBIHZDjD"
+    "iawkFGjmaFrJ7kEqHvMeKc4hmURLTKjdAGRWxxJmmuvASrv6CqQRqPQoaICMmaCUVtYkYR0OJzSL"
+    "QA78GVoLIqfhDdfVrF2XIENi/vYEJDtMl1jlN7Qs9QrVF1zNsfxJ4Jlt69VsbtQIxex2NhcI7sDb"
+    "Zi8k7CaaECaARlsRkUDD1QPjBVXqcauq3IJ+uK0ngCyw5HyF+6dN6QY1o8QlLKoOigWwmQWIVZjA"
+    "07wE3efoCIAS9XQ5xpwuv4zbnVgqaiJoyiWMo+NvSerIn5I3glH+pkM9BPaVJHh+yaLm+JiGOOYh"
+    "brUAcYgGELkrkIYBP8Zk4mOvxRq0SrDHaSL0RqrnYPRXBo6oeMKyWhhXrOI2QSzbxWOJZUhU1B47"
+    "A7kCcg/K43asqo3tkbCr4YE2MAp7ExJA36/+4ffx6NcvRsm7uqhibDpORLWsVyIe7bv18R9G43EC"
+    "PHRVgAzq4vGR1efmfPbV31+oTXCIFjGQ5CjKm9iTPH1TmDQA9drVu9uZtU+MeVNLHKktwd0erDqx"
+    "WwygMyg7iBRYYNCB6Ju3F9dE+4FriD6X2govAH76XA/NQGR18eeRtINA+VBrik7IUdQaLFnU2XoX"
+    "mL/aWD11ZM24ywZtdXNoEvZOxLq1s3+41Fh5hpJL0eEzVAJ8ggmOPNkxgne4h4nP+WM9C3tLU/vH"
+    "1KribW/ae2Mq93c47b/yq3trTwk0stJY4ariQguQFiWJmNjgrUSOqaPn9VHjlSUZ2v0CpRfLnvn8"
+    "v//zv06gDEVrjMYCYIfkKEh4yOyQ7wFLJAeHwQGPNL+MkcjxB84qYfYIm6MI1KXM89mXX0m1q8wX"
+    "0NOg84S6xGk5yGDWj3uPKjXu9+gjNLnLPm7uRgC77JdnL7LvnnyfvfzuX85O32Yvnvx0BiM16JGi"
+    "TYybx+fffDsbnfz662//NPn1wxdfHP/64cv1xWMN+TYH3Rfta8tCMLMkaBEVKAY9s+cYGj8B4Mej"
+    "bDSNsC1ACYTqEpjXr7/Cq9EJsC+PQS3A2saqxJ7I81OSs5UMTonLbbNkJHBtFIeZEH4bvVC+VAaU"
+    "/97Xp/vWpf0+YGEwd9IQAZyZz5MaMAyJl5AMcK9AT7SWulL9JkSIYljdexDUO085Ijxl5QRx2GBj"
+    "i+KoWRq8450oLe0fGJO2wrDXkeFIXXNrfnBL7BH6Q3hfo9Mw1jC0sFs3Eh+WYtdF/5aXe3HWNHUT"
+    "6o94WGuhsyjtSfEqP3Ve9jb+raaGJGaaQQm50luPsVN3eQGKshksxrZIdu/3BYonlEnU7WN4/3g0"
+    "/rS1BhjMX3WdErlGtkYSbIV/uJK8WgKvRJUnNlRjJjd1qMaatDu13tKHli+HG/fqLhqRXzlv7wEG"
+    "/qHML6q9Mk1bce+qUWdESju/jzPupC64Q8BAX4lsCIDekTqA4Bolo+lYigAQy9DpKMtYsaPaY6pO"
+    "7XBuUCw5hKOnQkvWKoGpWkBVPdpNmC2DlIDSu6QeBXVB9u3FYGQ5BVKXJ7aGDzN7Fr26vj4r9X98"
+    "cQ3TqluQiddFU1eoxsSjJ6c/PfnxTImJ0yenP5yhNPhypDXmpKxvROPqs9cGkl9g9TWOgQ9Vjf/W"
+    "6/UIhcmj6FRKO3WaB9ZP3aKF+VG5ee6ALwMpl2ItNcbZel8tZ3N2Z8tm0h9P0JyDvYh8vEyOTl/+"
+    "9OrZ87Ps9dnps1dn2Y9nf3qDrp2RbJMskzphTypOSb3d7YLv31hvx0doLMPwx7BAadU4013t0ay1"
+    "bNXjm2IlpH+HNFzQkPBgMqqXyz2Rp7Jek+5DB9Zi9uzF6fOfvz97k/305PWPiCso/9UQ+KzQQ+pp"
+    "qiQ+6EciNUyfytD5BltzSEoXfan4dmO79GBhSleckQE/SpIEnYUIAZQ+U+1tRKtq0htsouUhEY5t"
+    "SQLRXliaAPxWi5BIKBkUFuImbHBfAP8aJq6TkTbaZHuD4jRSgi75asUicqy0i8FxeBn3DCV7wKXK"
+    "p9+lh0enWrI1QoxEVBXYknBr1l/HDpWNIuZJ68ewHR93d6PHhrNJPmWp6aGzORoyPuh64zMwtEJt"
+    "ZWrg6CzkdmGFy6CaxrBnchrUu3QDTdRAE+h7D3RPJ3bo7m4R6+B/gEabAtoh5OfzR7yS+Vw5ivJt"
+    "DcRnOVCMGoaHgV2NvaN58KATwticFYYXKzdkcZtJfduQnOW6/HgX2HYGtjG5ZBfnyqRQbBU7wHiF"
+    "UD1SNkKVmZjoKMLlBP1pvZ/JkAXb2Uov0AuOFRCB8tUq7llxrn51Jcd25mMrZVe4cDMnT/1BhLZM"
+    "W651fuUv/72iCKQGOT+cm0IbOeLNBmXKezMG8tkU2u7qHUqS2NWTAKvILyQ9RlA3YTyboqxOAW5y"
+    "PZ5itIRRQDFTO0IsBBqqtbuKEDInqh90Oqg/XApVcyeImDaNMpzkvcfsOH9vori+1EZ/mir+Hpwr"
+    "geS+mUIl3oJ639myxDD0Vgjl8kd2oErhOe7xQgV/tfnAiEtc0FhuQ5lvF6s8eg446OCYtVjsrGH6"
+    "SgbYKv6FVVoEUuMZaeqPNdaXbwbUVdnYh2KjNUoDh15TXZQQIu/6CjRAV2G9KmYJACXM4R928naP"
+    "hvAAQfC/kwGu0W0dAtDWoa9OOYLe/iw94ftW61LSg2j7iROJfW89TctRWrh/XEobTSYCY3EmEyVY"
+    "eLgpnTTc1JYvAZTRbpN3oFCDzY/HK78UTwtQuDo+e8FdhSLRGIBFN/UeKJze3qChCWQmOag+rVEu"
+    "uihvLq9ZecSOUfFkoSYPMmVXjThu9hU7/ulAttmXbBNdCyyo95cbOTV1zo19OIc2ALYIlGY6/Fwl"
+    "AC0gbIZKgYuU/S3LGs/80ac2IfmLUUtG5B6QuAQmJhtUv2n90r8zkWAmeCsgxS26WHAdMNcWejwU"
+    "X0MbKLby+IcOAxT6aLUEbb7D+o0lw+HxoCBnuvL0akUwUzng+H6a00MowhuiuQeQBXnHT7R2/fbn"
+    "9uGkcYptWUml1gpL6qq8VQsIqO8YcgEYAzjOp4HUW5zLALnjZVmYQzo6W6eTMPEhX3bQL7wB7Ad6"
+    "4pO+cRI9F/k1Thc4Fk1ZIobLcIDNg54nsd2mk6k8p6ltOpBrbRkpyTTI5/OpRmdCMoQeEbw6NKTT"
+    "MQpjsg/MkO8AoyKPnuI/MIFFUZE700O5ezDk/EKhRziKLe45MMmtCBzTjj6chuIJhtTo+VyDkOyx"
+    "ko5vW4HH/uzUyhkC02hTXMLuwGKbom4wpqLM2y7xVneuZdDknqA8azljc35AK0qAazYWVUMVq4a9"
+    "PPaTy3ojU8n0HapxEQrSeMX9nuKZ0YfOnD9J+YCaPvIz5MVoIeH2s0vBOZ2fa4GER1RMTHM+1VXY"
+    "ebzNKzzANCEnNQCLUHLHQb8YvOSg4OOWu3KHmyfICK0YUMVwEeUVrJgWIwxQJK6Ojg6BqAw6KHWL"
+    "tdewK11/AMmm961QBEbwMbh91NsVyzstw/2CkSl41mQ4n33uJi2jvBUybHXmBawSutkr9rsPHN8Z"
+    "zr1q+i6Mgw0OxQW47QCrZBgZ6IBIxwqQqq/wIWyIiKUQDJ9bhA5X/8ITW6Or9VejzmIHyOK1Ets2"
+    "miHe0Y4jFlmuKUCiEzycRf7Z8gsy2hEWlnvHIe00HPEce7xily+v8kufS9ApKSg6q9p/ibwtxChS"
+    "82iKiRFhocWXdIWxO2lYFpqcA7HzsbMIFS7ysiKhB9oUweZxC3rCDWg6sI1bxHH4jaKGBKU+UwK0"
+    "Oga8wngZCdGI3BCs4chXWZPfqNn4YbruVKYSLHxPgO1HCh3mYJeWzPpDIcWx08PUmsLYTEk1Q//B"
+    "ZOIMMAV9Tx5ryyp3Vis6o4c24Yjj4ZGn7qhjixvp3voxyrG9m1N7CqEOBsKYY1k47dEa27zDjM8L"
+    "OOhTtUZMtw9od1/UdNzrzJiLN/JgYT1SdRLVlGLEko/uaHcj2ztDjUGQMKd3bFD57nyg3xFFTHId"
+    "7OYCI6VG5oDgyNYsPEZksQEbm1MXt4/cmaS8MwNgTN2fVlSDlkWpI4p48mMT2oAHEzQ/1EnB7l+I"
+    "7gbMdDooFGhILm6NNgDc5BrNoRhBCLyWRau6tQSIkW9346+PMKwM8QKqotgrleJxRXGTxmCQA8+T"
+    "o+zV8ydvn758/VN2+vLF27N/f/uGRSSFrE5V5KoL0SlJgou+UENRFh4q9rx5wMh/woUpxcirPwcw"
+    "oEGsmrO7DXga6GnaCnWMTiUaLst6kZdRf2GKVvol/YPcQB1yZrKr21xsQrj3hHVY2x6QzkE13Liz"
+    "Nbh+Qd3K0yNVyzkx/xnxfNDzWGyS5aQUvPkcDLgVoK0w+jt1zV3+h3+ZKAnK1DkICrouUYGlFlXi"
+    "RsdUceQzSSArSgZly3lf/vJtIxST8dg4xFTUkpTHqJGrWeuAJpTKF9y3clm5Mne4735veiDdtz59"
+    "sSyDoJvSDB86+f6k0eRWpeELcyF9QNlQk9i5FuacO1PjMUjMmI52gPc4N8rghaxMyv3mZqxiA31a"
+    "/P+kiw7Rz1Tym1WUrzvR3Ms1qbsnkm/za8QR9pGUxZUgh4FtwT2mwyWPnSurjs54la+CnPONqMhh"
+    "eINUn8uKZItR7UpQ5K3I2Yco1FR2t64n4YHsjtEpbIWoP8SAqfNmZ3Zd/d2jJQd3/VBQYWjzU/+F"
+    "qS6pQyopZvZEbV3NPrTYciIgYUjmgUa+52EwhYqzeIVBv8SBxZAwjf3ZoyoTj8e2pbAp0EDo7xwd"
+    "qsDqNI/CihZzIm7vSyfaN94ra3/QTdOdf3GRuOwFo4Cw4MsL62gLLz7FI58SEozztgKYVKAxdft/"
+    "10yjyIvtDm0msUbfJspW2Eiix7yKxAqAvgVTH1TFvJKKibl/HHB90Dbgfj50YwIMf9l9QPkwSKAu"
+    "cXqEeQ9M/vIo32FilLPuY/A5Ke9AnLCgKauttkSD14POERopLI3CEZteBPnDBJfyFxUrN+AdY2S+"
+    "/OL3X/wjuwbNHcS6GZRb0MGiboV7EYIvVQYDrKAOXtH4G8pHCWxJh+/qBVQt6PZer5JCspkvTUOV"
+    "7Zsi0oII1cI175abIDjwlt3gXLwbqIMdqAus9+kH3j07EJdnqPN2eP4D0lWsBJ5PRJeiEvK6E9C0"
+    "lsGC40gM0k1YJZgomE1mShmYkc94NvdgOMe7ha6GME68CzcSjrxhUjtZNnXb0gWd1u0AJNsHuqPI"
+    "fh4+cqBbeR3gGB670fkJneXkW/su3K3255Nb2fUEs1bDByqyurn/Jk87JCAks5vwHk8wu4bgCYLm"
+    "w/RGly0Qeqeff07HTEP3maAj3NDJjCmhEdrui3GaOpqfX9LiJh6eTMZ04KIudk7xIFwaPfaA8oLn"
+    "18Z0RobfRqK6xnnL4MSfXzx7+yd0oU9suodF3mxqPOcBspPmlHV9DKp1dXe7o+wiQtu6zr3mxO4u"
+    "g1mJuavBWVZIGoUMDZfTYayIeh6qk2yv8A4F8tSqa1PiN5H4AAST1Vf0k/0phTEG+jqjLkkHLIaw"
+    "aAqIpweIqE8WU58gqoy48tUV7Zh2CgKeObuuW3Lksud3ZhP7t9RtfdLee8l4rI1F25IDtXv1Hry5"
+    "j6IzmCCK4EvgbaKsbyLxfg/8FJCeQ18NpPBq4lq5lK+Leo/u5nZfdjKEDv0AINjbr7lnPHBHTxie"
+    "CZEzjA+DG3Esu5Z2TUeRuNgQmO1ecRCZgMSCqPGpUbk6B6W7IVCPShL1lpFddSILeTYGL/2cEC7G"
+    "OiO4OKW0A+O3h+YpWQquGv05XmcJ4qNqYK55HahsoYdB33dB2tEdW2gU6jmg4KSBd9MeEbP9lA6b"
+    "U7omyp00oJ2PLeVQQ7mo3g1to8WBEucgL+ySCe/6x8nEHgvPEMKd3hlbZrlvMpE35e3QzNz7Ao+i"
+    "5zk6DvhMlpFdhauAqkLpduT5KBALlKruIhmBBrUpfGcpEt2pTFCRWrkp4oCFdMirbdaDEWBogPVS"
+    "AMU2aCxbrsvwylsqJ+GAiSkGexx/OuRlxxakkaFMHXi7TYLQJ0QDLYLiFRt0PMZ/8CISkScFF6yH"
+    "AqlcAMBTnAFohQQjl7AQaL+l2JVLQR1I6kYcgg40cYPsqg9dNggka0oEIez9rtcez25ULyGAMMFQ"
+    "zdRAtB8O2L8tQ31OA3uhB7ReT/GtDxDY1GS/Qws45gVYWxwm4ZTbSXl0IB+MYZW2nTxW5pqdmMfe"
+    "XavVUFofts9S/p9FI4+x3O3Y5nZyzRhZYdvstgyeOsZhav/oDWkxRNVFvbo1agLeFkF9NCPFiu6S"
+    "Ig9W172PlB5PkTIykPlwCI32OAQ4hc1u+3EQSgdEh1WgmhX9MKwthrpN+yEUOj2WK5jpQpbe4fPe"
+    "pY0LTxaF6zuXL/wmA6eCAWQOrzwdSD8WH4CAp32GIBNo5TVyJ3F4lsYJ8NAsJhxrjXZpxu7VEPYD"
+    "6nKUgFYD+AwxVjg6Phgc2U8iYeE0vuq5O/WU9J0HWVEhdCAthd5LagsVgBrokeDgDXiuBrjQzUw0"
+    "YUowi3U/tjPUhS4w7A7Pisw4IT3C7vlQzKpLFkMWk70rPR3N2iGnTO3TAFk4Ya9pHys9XdODQuq/"
+    "cKujPyq1nVMhAizWgwgx81cS2EVEXdo0DdexPM+O/bnxlYX7sgHa0sn0qflyP4RMU9Ph2zq6sUKd"
+    "3o0D5v7y5olmc45yPaBtTKORiisdzSL3MuDduKfrms4ekg1Qq5S91p+UotDr5pEbc7/dtxRqqB1a"
+    "unMvNJ2kHUaBY8UGw1Ix/Fz1PZHqts74lQ5H3er9cJd1biB5QRqh/KE3+ApEPu6wvgZYkDiwtFU8"
+    "pHOvY0L1axeX+9dY8XDSvxba1hGeCeLNBozfvBRdVIAYqW8qO5Na4vKCgvT8kelopK9She630mVk"
+    "Z5XqT0OEblRd6+wO7uIok2mpLvUs3vleK3RucOT1yK7zEMcGVse0dYEuE06Qgtf8RnbFBztMHpzn"
+    "yk9OEg7Zeti167F9CidTtETpQGJaC1cHrEAkLszCEqUH0zD1o9H0HEzekfT+JEIaxeigS0166jnP"
+    "pnpalsqe6qeABPB3AiGi5xCY60NRB/+G8/q6azK9h/w2zgp8NyZn0UhJOzVs5D5l1k5zEW57ULHV"
+    "Eib1ctO6sB1IXPqwxX/smZoj3HsQMYd9RlTTRmpoodGlX1O5e6HWUByeruvj8mhm0G2odr3roFp8"
+    "b3omDkKkXD74bM6r1N+d+/P8cC4jkjHjoFpwYe+VtBYPpmt0LrsjD+JsFofQjVrYWDbUyMMz5wpv"
+    "1jbL2KTksdLxRBM3S5PLFgO3fZHxryuL0TwgGZD6gxm4oMd5DBGifjpAcPaPTz66sJ0DqeMp8EkU"
+    "iXNA6fVztCDGWfw4mIyGXeQsQnWRm/PFywVktXPTTFE9Es+jXuVPYbH3Jf0ZnICq+lefg5vdh+E9"
+    "mOEH//7iLD/W4h7EDP4aS20fhhU1uruo7IRpTxeB+plXdQUqOwaOqwtySc3aNSbzZfWULp1uZb5p"
+    "dV5N1xNikVwmEarl0XUbnQAvvQb9H3+PExvNXZR2TH0C6O9CWYrwL3jjmtZETKxuE04QlZc7erHz"
+    "7qTfdwGb+qp3gevbj6IfURtPVHiATC1nHQXLIzxUVeJTjHs+kTdwvz979RT0a2nMtF2OToy2WAmr"
+    "4/lcHkB/9+zFk9d/wiThFClwKncAFX0GfImGGFlEoOr/9JSOsWXiJIxkoJsj9mY/UolWSS2+FFWS"
+    "4dZlrehQR6aw0u0axlKXIvE2baQjHWXmTd5fdZvZ7ONqR1dBdqx9r0cfJULdJSuDzCzBVBStA29b"
+    "nsW9nZAtUyfhWV+aW6mZ0nrXL1cJrtNVoBBxLe0LDfxjNh35HESaRn0lwOAJi8q1ShMaShFu0qxZ"
+    "ur8WrFNmw+NwR15KcCc12kB3iqmG8sb4LoneeIqDqfFUxhDvLMYeDyE1VTDk3NGq2HZ56wxiitoH"
+    "lhzKk24fgTp2dmsFaP/O87Hz+4GZh2dka2LI0e10+ys9Gx/jDXowiVjxidhBSv96L43rKfV++xU5"
+    "Bip1fplK3gGEc0NNR5pk/CivbpnAOxpFRvhMHVY9yLiJKCwXmVG2HAXryKKPTd4SScA88uo2buvE"
+    "1VUkEtQyoQdBVB9f9ExDX4aovj27WopgKRTdDpTiE6r/KWK4J57sjOmDQsqeHM8kyUf9pH9BoeWN"
+    "MNSZJ9BcfcHrw/GpcAfsnvtROqQSUa75FmeyKCp6XABS4AVDEIpKhwfloCwuK8zkLRNcf5S2hR3x"
+    "cDefc99WAjPtAIu72x0qJCXek5J3r19gzpaiqjnG7OzNq7/7CoZXsWLiQ77d4aUIzpbd1Kv9sovC"
+    "KbrsiYzI1Ht44I5vMDl9XdChIg3N8F6HoAsyk2vdIUj5Og3nxz9QF6rIuipV/qF+xY4TGnPW/AN1"
+    "oQrf4B76LpPhEAedIPfYS6RRpl6IGLoPUjeQTME41V4vb/gHBX49OKjMvWKo40fjQ1N80H3De8Bx"
+    "EJQHYMCMMe2JHJugU/uH1S1jZKoeTJFCwFQ9WK2UOqUerEUweqXqwRQddEsp9eITjpF8/p36LwLb"
+    "Yx9DpsG3ViPeq52/Uf1zxrT/ylz/lPcIw0LWCZOWCWGUO8XPYxzIYWwyo/v58ufzb+yPDRDjxfMB"
+    "NzpXfV+I6LzDe0iUQohjY+NXpz9E9XqNLyt5yOo2LziXEEaA+Gn1rS8axbxIS9/yk98bbYQdAPyV"
+    "JKkHGo9c6MzddtgNaBxOGv7+55VitcO2xmJ1a02cP/CH0uM5PIom5nTsIFuZi7g2zIi+5jCDkaPP"
+    "SJn9rP1af8yC9gVz2BTdyP0glJ5IwEHkA09d6ZKLUAh3QD894E+csoNv59+lmAzE7h8I2n9QsP7B"
+    "yxMmRY0zSY3lE17JhC/zyejvBWd3UieB/eQlKuvACUV+5+0V6hAm5b/+XhbMxP+EVkwvHIQyhT0E"
+    "5/nZ2+R8P+uQweB/tsvamBBPHfhyV+y9H9siJWA86O+Bxc5rq9mAUeGg3aehmwXASH+RcRgHg2jW"
+    "R7C/EmYR6yQTxb6MMGb3Dx98rvAKv7p7QFcyJmZRE1mXL468rIT5/FQHnKNV6VKWlC4NubRMuiO/"
+    "KfU1FavrKSuVBqAEWY78hNky9fjNC/pqUIWem066ci6ber973KpkXgBQQR+pAZUaSp2vpKiPJdSN"
+    "TnulfVmyEdjDdMYsWxH3z7te1+6lBmCYlHJkkG1SLZpma+cjkIl7LNF2MQ3sl5cP1TEUXW9Az7DE"
+    "q5gmBkemBEscJ4/nH5BzTFrRcYqSWJmreF0wUf4QHg09K9pJNKZEXvoOea3uwUnc4WVLIW8vT63c"
+    "XWQsh5TnvVP15TFcOM+wF3WwUASJHcHc1FfhAFwGatzPnbH9dzK4zPuyoIyo0V3CDCxGpcjQCt0l"
+    "VE5V9+q6KKEGfvQi0hsCcKPKieWNlyAMec/Jhh5PTZMxpfG0lUPWKGQNy0OYSCPec6XIyioCQVYh"
+    "u4iKP5pFWplOEHoFA4ACP6r9lsg03u8ShpeHRW2zhGH6X1KMzSzU5z1EeZd9LO7k0Hh9t92v18WH"
+    "uxGP6Lq09RFaYMZZ9hEdqGRoJ94Zg8LCczUMottDfbL3eGJ5D9QZwyG/bNiB/MnOWo0O/WLGwJSv"
+    "ZhMEh7y3+KfdjxIwX84uAmdDCnjthR3zgX+seWF4734bl6KK+byXPK4Wfti6ZbISi72vQUpp8Rmw"
+    "x88oweBnK+2HRH0SjwbidoyeVsSZqRoZfsOgvOqx/BUa1jl5VOKyD4lpdLO5tRLrQldM7DrOadwH"
+    "EK6pqNZ1PNK642d0pnDbmi/MxZ/R9OXnF2gcR7/SfPKQdmVyBg+cj98rH5hFcord/qA8is/F8Y+O"
+    "GA0uqL4uhgMW7SS8/XYDWXnp5pQbqIL8eWZ8FP3UO89f/yzvXkutBOtPHreeyLdvWUoei1+hRlyV"
+    "WStIzrdXxS6QadCy+7Dz5JBb1t7BB8SeBPtzSbZ/BBMMvAj31IvBoGoDgRi0A0MfirjvWwnc4Erc"
+    "coCEFTYB01KPKtaOKvVzHD/F+D388iHqk1Jj3PB13ng+/2hlkrnD5KXwipdsv7KCCMe45pwnF7Hi"
+    "rze02+5K32Fq1kFfMrCpFKv3KJS7kikNEChepCcUnI+seZPHlC62NUurhrUMXQPeWTWGAzN5Jt4X"
+    "q2Oc7hTbastFHhcAA8wvhcxFdjjNrvk2Cn7dQn9sET9KqLrBrJtA5LlUz/Lq1mSipUOsY/m5TfUl"
+    "DA16CimQce6xyZO2TOTJl8yTRseDqmS3c8rck7CRmdDICU/lFCO0laEM+pSfwAai/XFHdSh3CX1L"
+    "z1yQGQUSzJ7WO/TjJ5fLqtbJq3QiQ/dzp1VX689kIs1+e4LjgZXD1tQfT08lIbRWjzK2X5lBFCZr"
+    "fZMriaJfNqKyUh1LAeJ9ZjVf4oH61M+XbI4YVM5gtMQkISFySdtVm1nAvPGU38oqgAxXZxqHcTai"
+    "lN/+2qEdIpO7mqVInzxHmZCzbd+QZio7Q/iwBdiD0TeoJanPyMIaJvh7gkuTGY4lP+B1wQ/uB5aH"
+    "JeQIVFmzAWR/RNsCnSpg6JKVhBfI8CiM7jsSNhQtOVWQChgKKk85i1b6kmzE15V4351MBfrIiENI"
+    "MFu65EXsZiRJlZuMABsSSc9ePVmtGtG2Mu/5mMH7mpC25XwGMhocuELHiZg5oCWGTQP1imhXkYmS"
+    "WexDkfiBTtAe2tIJ4LiXiQkbhxgKCRjNAnvsElSVTzGakfKk2UL9Ogd2WDjSd/tV1YTm6xiH7Wbf"
+    "FWXSbHF3YlVR3TdArFz1rzR4GhUN31OrUI2nzcTPpzoGmGOpMbhU7QTzwyNWxCMwVfyPZNjf8ZIw"
+    "gE3p9U93vum4TvV6Pjv+6gKvSNP2jcb+6Pg2KVoSMX5gQG9QxH8GvN6DE+U+6NX6lJNjRE/oVQ9w"
+    "IifmwKt3usw7iCnBvoqx/pT6GXuLwJ1UOqdb7h4so9sU3ngXbECPV/7t0dO8KGXWFBwTFXpg9GSf"
+    "oFgyMyB3gEkwwcjk2DvSNjilEjRlaHuYtrpadoiGi2w7nkYGQbELlUqISo/+B1BLAwQUAAAACADl"
+    "aq1cUyUL6YIEAAAJDAAAHAAAAGFjbWFrZS9idWlsZF9vcHRpb25zX2pzb24ucHmNVs1u4zYQvvsp"
+    "WJ6kVKHbngqjXqCLboAC6WK7C7SHNJAYi7K5lkmVpJLNpgF66gP0Ifpg+ySdIUX92ZtsDrEtznzz"
+    "830zFKX0dyOdIEVx08q6ZLpxUivL3lutioJIRdxOELsXbrMj3oSU0pCkKLgpW6n0+aaWYLgkP//0"
+    "ijQcwO5TRildLCqjDyTPq9a1RuQ5kYdGG0e4UtpxH2Wx6J5htPhd2+DZcLer5U10ewM/O0y+OfC9"
+    "YButKrmN5z+GdNDMTsyqP29UNLr49eXryWFjdCOMk8JGE6XNgdfyo8g3+tDIWpj8jhsl1Tavxa2o"
+    "F4tFKSqS76B+OBB5petSGJvX0roEk7arSTJZ170c+rbyZaTk/AVB8yvrzPVqQeAPOlYUDd/s+VZY"
+    "6CcYR8cbrffATwxYFBn0sOwOz2u94fXkmNzthCKNEVYo56nAALp1qyEoWRP8DPmyGBdTZOCn61uR"
+    "pOm1d2x3YNwZthbagfwvCY0BaTq4eAdZgQ+THi1JQ3ldBow3jVBlgqHbXRrsrQ8wNOk5cPsF4DaC"
+    "GwHqU3gcieNlKVF9vM4roNfmRtQgR4jg5T3Q9BniAJ78RV5rJXrm3nYIXrPE6+usBzsjTvshKgrx"
+    "gR+aOvKLTTVAEdHVeMiCnlK28Oi/cHgG6pzN24oItmXw9NPf/y1hSgwMnrDLS3mzjEGW7zze0icC"
+    "ET/98y/YM7ZkDH4lENEHmGTVxc5gCpzPKUDfw+SrshbEaO1YrDqQtwfyhj7N2IrQnla0Y6HkSOX4"
+    "nCl+EOSrNaHxKSXa+EwmZsfcdxwjJf6ZM/dHhxpV7naQX42fyRgyIz1ZI/V3BWxE48hvvG7FK2O0"
+    "OR01SOsON2kesLo9muNmS7zPWeY/5iLrujgVWnh6apn4A1xpK7/Msi7LBjaCKFcgq40f8Axlej2O"
+    "OGy68RoIQg52830HhoPWs4UXPybRyz7eHD/0Nb1YnrpFGHnre2W9pHDofGn9aurdQSInmJh16Cm9"
+    "QVw7bwLYP/SkUWwdXfkOMqdzMIBKkzQbLAL4JaxVrIH6Joy209g0bqmLcAWALc0oe6+lSp66H8aL"
+    "JR3jaeiPuYzTPKAOm9ov4H7eZ4oNSI/+P6+g7i/ZdZNk4lzyarRZoadXdEC6QCCKbeVVpxuMlUQR"
+    "sq1wCY1i8lI4yI++mXlV862lKc41hdWO3W+GxQ5A87BPwWAK4BJyaK3Thxy2i7Ozay7cYij/fC/u"
+    "UdSiP4SvQ/ijOelzqSDfBt+FPm/iY1iERK6mpcU/iIHbrJm5hR4qJ1UrJgfjouLl1tgjTLqmmNsp"
+    "2L5qBvyBL7NNLYGdNc3It+nVN9cxzxEH8yXQg9a3UN5zr0fJEcCQ7x1kAhDVwGp09YSyh/r2kQ7W"
+    "t0+oauJ4WlBdQQCDb0s+NnYfO9Vr4dl2V/QBPR/XD3eQ29ClsdzmkvVnL1Epb3qheLH2y2HsHjBL"
+    "Yd14++E70PEqpb0tC3eNEx9cgiesbA+NTTCDDEos4Y5df5eSrwn9QwHXQm10Cf1a09ZV59/TybsR"
+    "4i3+B1BLAwQUAAAACABJnFJdrYK+0VUPAACQLQAAFQAAAGFjbWFrZS9idWlsZF90aW1lcy5wea0a"
+    "7ZLbtvG/ngJDt2PyTNF3btKkdORp4rhTJ6mdqS/tD1kVKQk60UeRHILynXqnTh+iT9gn6X4AJEBR"
+    "F7fp/dCRwGKx37tY0PO8JEmX2/RailpWZd2IxS7LV+Mm20qVJLG42chaimYjxZus+JAKnBDlWqQM"
+    "KG5k0USj0Z9lulIiSb6i0RdPowKh53l5lSTCX+zFSq7TXd6Issj3hC5PVaNx1rtCaCJUk9aNXIVi"
+    "XZfbEcGVV7DfWskGKFyW9UquxEKuS6Aqa57jtBI3WbMpd4hcihQmVJVnwMleyGJFFKsQGMmWG9x5"
+    "pBlV6V4FIgWItGnqbLFrpBLyo6z3AnBVgK4pYQsl4iXQquLkH0xjRCxG78pdvZRvFx/ksknEv//5"
+    "L3GdAS5/iZQ9FR/TOkuLBp7ybAG/6lo2y00wwv1gpE5hG1zUbOpyd0WEiSpPC5AAIFgh8a2UWhUt"
+    "y22V5TJJRn68LVexHo9w4VwVaaU2ZZMEkfirJRA/SfS68TYt9qCPRQqkiHWZr2StwlGSfP3yT19/"
+    "/2r+7et3389ffv3yj68m50kSiJKYUyTSVkYrUg0Sl9UaYrxMl0h+2myem0UjlFLTagZ5YaiUzalg"
+    "S0gShk+SSFwiTJ012TLNCRmSmJc3ilbL1ZVUI7C8JGEFkIUlCWhWZlebxpJZeXUFb6tdnTZZWSgw"
+    "T7YztpU0z9mKK1kT1lCoUnj4ROMemjcK7go0U4mMt6cVaA0fyoUSdVqEoiib0csff6Kp58Qp0Db+"
+    "cAESphU3pWEWbG0ro5HneaMRSW8+X++aXS3nc5FtyRrTAtAxvaORHvugysI819I8qb1iJKu0Sck0"
+    "wW71XDvEEChEND89+yO8agJsUzbT3+DLj2BKDkjryAbMHwn4Q8Oc8xy4b0hjRVlv0zz7u5yzA/Fo"
+    "DaFBQ5IOj0YBN4+R23ZIATJwSHHMXLSCAUTOzGj0SFyChlRO8hzvCggG6JxK+OTfzSYrroTMlUTt"
+    "pvVyk32U5KnFNfwDi1yW1R6eNmV5rXAEdFgH0ejyp/n3r998+05MhO+ho3uh8LSn4yPIGv+xr+MT"
+    "G7cXjEbsV9/O337z3auXl4CglpF2S7/2pk/fv59R6LjX6AIaKul3+jf8ffIrwGPQ/PD6m4dQASGM"
+    "MnoSzKfn49+l4/Xs7uLZYRjraPT7znLoV7wCVV2CYcekGdZnDMGpZk1hmJ5vVSyyoqERiLTO+yNB"
+    "gfC+DYT3FAjvdSCEB5YNPBgF3LMC7lsF3GsF3LMCCC/qsaPjkfhBx9ICPAziRQ0uCPtgWCD9ovPh"
+    "kojAyaMtLiiE0zvs8QZ9fkL/RjT9+6ouIUY0e3qDBNaGFODUVzJfB2L8AjlmIbFZg1sXYpve+ucQ"
+    "VwAmYsmIMb8ZyQWjFmtTztHTO4yrbHmM8q4dwD+PNeLFjNX2txaE2TMg/NYDQdEYAHzuTZO8zDy9"
+    "9LfQ3LSb6PcemCU3A2kNdcCHIUuksISmqFgmFLPmq6yOOaCR9WFgicF+VDM1ljujGZNQ5hgLByEe"
+    "dVUIxNHCpJCQSgMof9D0RIz5L05onwTMModggokEUgXMbwUYnlPZsL0hys4lAH7OI4uyzPXelybJ"
+    "YxG0JCPW6fWo6rnBrOnWSVQCkXPcZBjNIOGmSmPmIqjFhhF8qCLayhp4Yu59ZPlaykrhBrlOuiJd"
+    "N7J2ZSUx4KRLJEEjDzR9wA1AEztglciazt9pnWcSxSRZOPIW1rMswO0u691Jt1vs1P5nXU7ttr60"
+    "zYqigUSNshsiK8GpLbAqOL0FJO53FdRmrG3kTed7bRZGs5z4gRKElFDu6MD5WLWhI8IiwODN1lhE"
+    "WPTFjt9ozs5teIJtLWkInCC0yIbikjQRaUg+EKa2WQEwxpP/KylWaQ2kSXCybSfJdV6mA+qyqMTy"
+    "GF+1Elo2zTtF8vPo/NS2jo//YkNxsNlhuisp5lhSWNu4UcWxm5ecmNmTICNAPSvB29dZDUHCtgVD"
+    "XYl+7TuK9eWQFlBMkqI2jpvSJAjBgfeTPN0uVqmA5DZ2eG3xWoxRYO9zgznI5eSVKZCpcDZnmKeU"
+    "XkPwegwjQ4yly2VMKW3a7KpcTiHbhphyZyHvBDqazSAC3B3aJQPcuqYOOCOIjfpQ6YM+OTtpgYAQ"
+    "prMgSqsKTN1VdtAJHE8WEzF1EN+1OQ8SgEmP1yEfDzB55bLwEb/XQLme64QGFkVj4F48gn62Cg4O"
+    "amTKB6zXAEkqQyayRoK9dkTNTtgDEutoFrKfP66nHRkgTnhl6mfBLy0v2iTrUXnka3fVg0Evv2Ms"
+    "MomdC3dn2oQrA2Lee2CUEAwMvfQAdDwwIPo17FNOMcUA6dcekBWoABBkBmZC4NZEKH7T57MfaMwm"
+    "/fGHlsGaqYyMUoKHgs9sqBxTTj0GttOXojbUE5uwOXV+9XC4CGZucYb2NDetAADx8eAVdydHXUYH"
+    "bF4edpd0LwXszudIoT2V69EADstUopwhpjNdtXclEJ8RUBhtTLkuyptCRxSKJW5YCa1y3o4rEC2p"
+    "vwInPsy5OB07AUeVKCCE0bVyL+ZwO2ACcBEEv4gOHJipSo7Bkwmf/6hsZBh7L2ZMAzt4iZ8pOVkZ"
+    "McOcepB4X6/oxMZwWnqBwwFMm3TQSyDElT5nEXIIVvrV6xkQw4J9GDg8lA0DbeStAdJHthPIZPVJ"
+    "cIuseAAucNWB+hxW5rFgK5YlC5J/yUy7IElHjWy9962TLgXLB4yr23EDhfaE94uuZKORdMoBWhHk"
+    "JLU6BgNMO7wFhMeHfUh6qLahDbaDKHVLYsvRwr8ImPPBbf7HLWzcJ/eB1XhYM1jJe7jGVFhI+17E"
+    "B5s5jG2ruRcMc0P9AGysmAdyLTiWwIEkq2REw5E2nugMtAVnmRaT2q3X2S1w7JDCoxEWZrXv8Gvg"
+    "wbOj0humSHd4Quupz7iNJj2BxjhjaD8+hAgc9AQq8tew/X8CCcYIDz0OQdGT6T946inRG48M7UcH"
+    "eQuJ51GC0w9dS0WDGG8zGcXJev5VnVYbO8BTmYgVI9Q4bVfXBsASsitdEbJNQG9JywqOnfqgWlCZ"
+    "utykGZ3nzmi3M6eJfNZuAgmJCloypF5tC5XgVbPpk9ElnKqWH+1ZK3J0QBi26xK7mYVgvm1dmRm9"
+    "laOXZVk0WbHrxP9IvIaDN9D9ESr0UjVj7BrU1NxegV7hB6thWSz3zL0SS2o6U2iiY61c7moFbIMY"
+    "t5luYZDfNOnyWvdOrHiIJ3fKsFMfCQ3FH1LIcUFXwkIJoZdCrU5qwfQJ8bHzspsNHo4YymGvKFcS"
+    "qoFbOHZj72PCMFFVVtZqLSYDdZwCDAXRKlPLtF75iDY4AluASYT0OwdpT8R5z7LNH2ora1VFoZ7p"
+    "9IPgeHNNHSuPgLNQnAfiBe00DD9EDSOYZmD92dEiPYlkoHRxlXhi3X10NJ4f840m6iyFDY+AjgxN"
+    "84XrOuPEDpgZafX+abhaJaWrIQXpOT7LaV6wWxQMgcnbhsAyY40P6gzZyCgnt3wEpljE0b7f6fA1"
+    "ZRNHNL3mMZ77eJFTVxdxq6cZb2B1I7VfaKTsECzJoXLBEnwXCh1BULGsxeVKkxZOSOutHAI7LuPS"
+    "aRyPL2Y6MvOJj/qFfq/vGgoIjm5LE3BroUMo7rdtdQdBmSZa7/4X+DlrdzjTFzVd+wybioqvE8WZ"
+    "2fUsaIPxAkNEuz6qpSrzj1KHClnAgUUquimxb518WPUUsl474AVt2xYjTu86ytd4gq59aRqXWjPH"
+    "fbnlplSSnBhU7d/JyNSXVktHoz1EH9N8B4LWho0Hhg7RNq2vKQ66F2/AQqdfQ5KGtezHqeKOZnuJ"
+    "xZDMgB12hx4HEnmegtVQzkLh0WFHW7RJ9lhp2kfH44s7ZEbzPtTP75ykFR1T0FGFV82To3tIwIud"
+    "oX5FO3AchcX2ScASLRJkvMpQhCCIuL31EKa3Gg4h17wt9posrAKGDQI34/qAgpZruDSrTde6Cfe6"
+    "wIKSHiipQnFXwj5Hrc8y5G1bwkxX6uAEh86hu8Nl63GThXV3RBROrMteMgOboMm03WxazpgKOn27"
+    "XQ+0pQl23PDBOgoaP5scd5LIByZW9ygwRSZY2E3hQ8Q26oMcu+JYRgEL4jAbEh7ypT5hY1ozOqLJ"
+    "pt4fd5ThiElHiiqAyJNTCTZvSsucb5eyasRf0L9f1XVZH6GoNJVVDUXk3Am7TWyJnqJuU1Z0qwR0"
+    "XnyOFWouJ3SeRTY6h4bYeAn5UH/YEwtqFVo9aKuhLaihHfY+v0j1XRE1fMmU23jLjoY7o4TUXoET"
+    "rEotI4gCi2bgkkLBqQFdzNPRHAPfnq5KrGDv6eDHSPiSaAiDnT3MGjtAGdA1w8Iud4APCTp0C32w"
+    "quOvhTxdv4OI/bVHwuc7s5hwtEZ/EP4dbXMA10IzRYLpguTAPhB4WjttLNGFxTFnvJvbysOM3YDB"
+    "FqW+9hubaz/KmKq7GkQHajYwAknsOYdg+vSkBMrTKsXPuvZeD3l7E0g3l3RO4FTcbNLG3N3p+z2s"
+    "btqPrnBnujVccT7O4NDr4DYsW72bPvNuS5+ZZ37p24ybVFFsaY4E2PmMpaSuCwY46AMf1JO5Pnoq"
+    "Ls7Pz+Po2fogMEa39xisTHMF5QB5FkqrJ0xLrHeCv7XYd1lnkpsdVhOw8PgGqZULwPTFsfbeF+9O"
+    "uSpYHt7TQSQI6UoC1gdgdWjl5vUQxIPSM9iFuHusHscvvjjgE+arx/FXXx7gmVwdXp6dH3TqGkTU"
+    "5ivYbRoDKbNeIXps0kZHd24W0sJ/8QWJH2fpMw+iRl/tTONn5zMmyRtAeWfCeyhsDw0OPdMcNk/H"
+    "RGG9+9HAQz6KSnrpBE3/ro9gwLxMtHDvGg/cr0K9fZI/OUo4Tfb/TxenhdzSOCBT7d3vC/cGkT/G"
+    "ObKsAY+2LPKzQ89WKZKAFf8WXyjDCXylObWBIGjm4Ggm2Nx/xl0xIrC/mtgAIr5o684rLWxz/fIz"
+    "5gHUX001/TMw4s9mmgsYJT5mzAi8MiszotfrocF5c9X3eNYq6UtS0h28iDPRB0Hy4xefRxfrw68H"
+    "EfJ1pYWOdP4Jxse1yg2Ym7RrFb5t6hcsfNTF+sjcDh2VKd+9e/vGfH/clOIMl0Cdg5UFVRX6wy5c"
+    "kyRtDdJgcTOhryTBgrcV1krdnRe241ZQYUyeBeKJAOvzjIOTm0IOc48+XQ0TEWM+oh/OOXjAhiSA"
+    "Xz5vr8EBfH5REzwLYtMKji3z8ppeu6qc0c4RLeEGwGJZriDdTbxdsx5/CRX8fwBQSwMEFAAAAAgA"
+    "EJ5SXQWYF6Y5GAAAv0kAABcAAABhY21ha2UvY2FjaGVfY29tcGlsZS5wea1c/VLcSJL/n6eokydi"
+    "JKYR4Lnb2OihWWPcHrNrwAfMV2CHEFI1LdMt9agkY87niH2Ie4Z7sH2S+2VWlb4b45nr2B13l1RZ"
+    "WfmdWVk4jnOYLVfJQoq7PFytZC5mWS6KuRRqHuYyFtn1exkVIgqjufQ3Ni7uMrHMYqlG4jor5iIv"
+    "UxEqcXW1ui/mWSq2V2Ex3y6ybZ4QRBq4v7q/uhKzPFsy6BuZyjwsAP0kSd+HALKQasNVRbxIrkWW"
+    "Lu7HgBhGy/BWYl4q8WaaFeJa4iGevPnt4tXpyZuDi1dXV954Y2NTbG4ui2QpNzeFe3W1p3H2s32x"
+    "p7Iyj+S+2NoSewaZfF/4vk8zGXtCyD7htUUyo8ENIfRkkSigcCeJLKF+/+rKz/B/XjjK0kKmhV56"
+    "aysCNfbiBIs8Ho2IibWlivsFLetgOtGc6Oz44kAswzSZSVWIW3lPLOkgncRYPynuhZtLlS0+4BXi"
+    "wkio5L/kSDBlvBEA06w0y5fhAg9iEeY3H4RrGLwtYrmakSDQXCVyuVqEkYxH2OwzGgcjzFaVmIdq"
+    "To9CAMWmkzRalDHe+DYm0txEc7x8fc/rAaVywZiLBDPfHL4SqpArjEdZHsvYE2Eaa4HT1L6+LyAM"
+    "QiwShffpwVyGsczBhHAJrAF3lcsPSVYqi7ISdwlkEe8muUVS46h+EHdzCRFdLEQ20yRYAoEEv5dh"
+    "EYFIvHSRNWSdELLEgA7QFvRzLA2lgJCmt6AbLbW693xAPQWQ/C5Rss0YiJdiaLRzQwgIk4FWprHU"
+    "qgbpIgIRpFe8VyFjmkKLQ6lAFxn74pSx06NGOa9lcSexvesyWcRErLCoZFqBWgAIZJaEQlaPahKP"
+    "Da45RORDmCdhqncOFczD/N4QQ4FsQn6QGFC3EgTTZIQevPzP5yfaLAhVXhe5lBDVa8hfWZCCbB1B"
+    "BgieYauWKsJ9FeYFQaXlsWuIacYQMyKiALzoNiurNyCFBUzSUoDeGAor/OIMfCerwLRgxsI+HRru"
+    "k+6IRXhPkDShYRdILYEVmYhCLlf729rEBNgqbwRGS2nJjeUsBLe8MayLwMdqoNreewp5/Li/vQfU"
+    "9/33CnQVtUBqURVKgnBb+w3hZyiGpB0YmTAf/dgorJgAfah8CaFyX5/95D0AIbYQrNRadbASTcSv"
+    "NJr2Fwr+Ps8WQJchJyDSR1/9vkgK+b3ofRgsqZRYymUmvhPzhGzGMlEKMlSC6Lna2DhI741IyDwH"
+    "w2bQOyWuw+hWFBlJZpqkNy0d+UH/4jkpyRnmJJgTapn2NxzH2dhgzxEEs7KAKgSBSJarLCdxBf/D"
+    "IslSrG3GCEeIiP1JDLLfM2W/qXkJE1D9Kq9XeRZJVT+/r74SL/T6RETyT+bBG/zc2HginpfLFe0u"
+    "ST/ArsZwa0ZfKqu9beXAJStohBLUMXYF0oJXiyQCJeFgbmAT/Y3g8OA8+Hl6dn50egJRcLSkknfZ"
+    "2nWw6quGoOUSPLmWZBDIgVfrunEym2EY6nB19SSZkWjnYQpSK+C0dSTIAOeKVjs+ODl6OT2/wJdf"
+    "g+nJxdnR9BzL/hUrvWQDC31KZokkS53QihGgwlWyhWJnAH4VrI4kH+xeXC3HN1iyXMDAwEHlkDle"
+    "79XB+avgeHp8GhwfnQQHP04DWu6pv7MRvJi+eXn0ehqcPv978Ob1weH01enrF9MzIsKzZweHxwf/"
+    "4GfTw4tnz4gSJ/JjQfQPreXfYt23fmjcNL7a3AA7tkwaP1dJKcazMo3GV6toHlhvekV4wl0F/5j+"
+    "Fpz/9PLl0a+Egw8YkMgNWAgRqCJPVgEIDxMDFgZgrMyDOCuvFzL4vcxgZl0YWrzmkTnAv2NWNgj1"
+    "acr2SbJV43lA2fnXP//XAZvYZ5FiJKRYCWQFRAZ16RUyYISyDZB8Y+GvCGGGfpitiFOwpuRUNcdY"
+    "f7U/+spojUGSxIfYlNFUsi8kxI0grReYAUvyNRTbYU2G0kXZfwwBAelf//wfsA5BQ5JCNdOIfS5T"
+    "UZuumVjI1FWe2IcMaadzufNOTCbiW+db83tr1w5oFmibhzgUTFWXu2M8r8dnPJGkGSvyW/Uk+uQS"
+    "hsg82WgMKCsYLFpBqlwi8JhtBUsA+KkhQT0nbFF8BQvmausO7kwQHGOgyBENj4SjigqUMxInWSo9"
+    "u2W8nGgHSMM1fhVuhZsqb6MzpArfwhSbYjfY2dmx//cs8hAT14hCQDHimGOxS/DqXXsTTLvKePrd"
+    "eb3Fc1//iKCgHu2hOdDcjZALuL3dBkJBmVLYJWOKVzVBR+JRSDp1ihPOSM1gLrMP5Ic2AWqT7ANM"
+    "5j0lF2Ed3mF6ZhyVDijYVI+gmUk0Z7itSO8uKxeIseowEChH5AogP+xpfSusRX5f8woI+HpjRgLk"
+    "x0iuCnF6PiX/Wb+4CpVqUrPHI8u8pgUzwjdkfX6hSDEUFz/ZLcQ6ZqiDebGnYxkKmGDylMl77KgJ"
+    "8jdpiU0ovzE9J6QysLcmwgzrdADcBR05nDx+zjqpvSRQ0MTj4AK8CG9CEA10BsMSipe1arQTsDoS"
+    "QYSR3SlfXNS80g6gyjTu4Hqk6iYjHMYKm81pHFPjSrCsazxCwLMDIitmXXlGAjgXUS0ZGOl8Cjtj"
+    "wCYSrFImwLyD6aWopmDb+oPZYwsDnZmQsedgveWpDP912qTZBaAc89OGYEdS5ACUvicwHaxBxIqO"
+    "u4uztvFsySNbpUxpm0SsfVgqjTA6FAVCoQYAMpbZCtaZQ9DvRMejAk9SfkyeOGUx2/qr45GDmnXM"
+    "beW3TXAcsKWcwXqEsev5aoWo1WiQsY5s6zDBI6OvjV5FCHpmwTSe26FBU5/bGN7QwjXEGImfw0Up"
+    "+bu3Xl9nDpF0/KnG5LP9YZf9XEUVLZFzIRjW3hESrM/iv7UvILWurT9YesbiQcnpqHLSmzRtcyTi"
+    "PFt5fTWAks4wMEc0VyW620ZON7H4ZmW6sAWEuvBQ0dwn4AEpAeHn05c+c72+PJDN51KA6nitCr61"
+    "h0amgux2cpGX0htgSltsCY+GL6WPoWRYZMskchn8CKz4RCh8Fk1miC4z3qaOz6IpXe/LplmIJzBk"
+    "rLSpJmva1euwMOw1OVpAChFAWx/r0OgNw/eGGacY78fDw6aRs0kgWYLNJkRdoTp+eXVlzAP9enF1"
+    "tU3/0hewEF8ziiQtz+9CMl4T8TLEBB5hAwNjR65NpuWSK3ltX9Tid0ga5mBZRysfFtkVexyxrZnU"
+    "0BvadOu1S57/rqXrIfE9LxTJpMsr6aISLREiKBTfr4cdXn4/7kCjjRGYF4i4HCKM08HN0oTksorG"
+    "skKP96wjMaxpCsjns/aocjZLPrqOHzuV9w5zJQPDQLeAO6rddyUNFfff5OD+72WimPWmXjJLclXo"
+    "qJt1+5jSRgTNRfixkgyIwdu3YLWQKgpXmIvom8xJHaSQI5zwP74pG7jO27dvc6gFiCIcrzVsB7V8"
+    "MAJmsrbMDr+x6yEo51eibAEFmehX/VmSxq4ztvNBTP18T+y0BIlIrGfknDbA8Et4PM31cZdJhtqX"
+    "dVRvVyWxaMMBfRFs0jugkGooHt42AKIyHxwnk2l3cqlXIPke66cJHu1oPdLxjBF8mtXAF/HEhCFd"
+    "Jq0khMahO2/f9lWHIfConsdaQZLriCdOmxJA3afSPqjceLdtUDGG1Kk9DZFLkhoJrxDyYZZXxPcO"
+    "uelh2cmSLEHt6o7jv88SqH2Ze17vTYzWZKWPXNQk+Map9tpS9m++gWAl3toNY+LARncbayi5dnI0"
+    "bxiGel53qw9v0cghvQQljxbkLUyR8pBy6UaSooPXMI6xTVWXo3WRiHN+BLak2HEWkeSmN1pjjeQi"
+    "cgiSNCmCAO8uZggXsqxo5J5th2srXbrgt1H7Ukz1aSaJJP6pzRl++MvbOMkRy1FRSbFjhiv5CLXo"
+    "+2kGFMTXlCPqRZD2I2GOKAnNXV5iWzituqOD+Jo8MMKWyV92/J0+NF9+lFEJh+O8OTv48fhAvM9A"
+    "3nARUMw/+eXgtfOIOVRDmOdUWFeTk9Oz44dntcTDOTybHlxMxcXB89dTcfRSnJxeiOmvR+cX5+bE"
+    "QTjtCTryvZj+eiHenB0dH5z9JhAimTLU0cnF9MfpWSOsrUbi5IZsC030apD/H3hSMKKEy0FbH68P"
+    "FM9aNB5YmbKvMbCM2CSOGmEpmcdPnzuvI4ELNIGMHS3K1ULqqQjIzX/IuBrryvOf0IkZTaN8fevP"
+    "fmpN4QhMU9goSy9XbsVaRkfVPHz6H38hx2oSX3hSeony2xm8KOUjVCaDGFdl0Ot7eFq3nbx4CAyt"
+    "r2VlnOkSPdW3auIO+bP68SXNqK1lK8xmsg/ncvRZF8q2masXAJAqgung0hrPszvS9IeF8nz6enp4"
+    "0cnkKlF/eXZ6bJXol1fTs6kmykT8DUaetzCq9+D5MzqOAgrtxI/waFaS2G1kd6Ye2MkE6cHuuy+l"
+    "gAa9Cb/+tOmgus6jxwT6tHNgREr59WCW21vOHGX4Wupcm+56/lx+NLLbdm4P8bUFucdREM487NKu"
+    "WTDcY+Ps039cipmGyvj9Vbv6b32lIUfNklGHC1YwvCHTU0mnfqcbdZvRSuHtoQin1C1wI9FIwFQe"
+    "2a/w2ONm0rU2O8ODu5hNB8Ndaz/mfZY2T3k66abmJx0D6sMqn+tO7VxoB5khH0O3xh5pEgD8cRZh"
+    "SNvnfrmioy535rzdsRWwtzufAJyL2pDUBX3hVT7jQSPXrn7VlY+BvYMpgWIuBJRrUciAIY9dhItR"
+    "rh/HdCbQLRu3EKWT2a7AUwbLWV6LcLvjd+19YxQzw66ecD7L2PVFPaQTIur72G8HARzK6q109ctl"
+    "ePoZ41Vly9/pUW/dMni671QYaQhMAJqun/aRaOfKz7qZ8u4DRoN1r+k4LbN1xHtH/SBExYHYnhCe"
+    "OZ9C4r2e/HkAN+aVTr5NEZoz8GQZRnmmugkefZ6IA5pV1bB79WnbW2JbSJJUJTHXlenk0tSYBsBW"
+    "rUomZaYmBd3wxIfdZL2bbQz2PKsHyTiwAUoNEek7ohKpR5fS7L6JeL3yPqTkW9rrt16HokbwIcSt"
+    "4Upxr7EQHr7dIUELrQKaIiydPJWwBDd4U9cInKYRzqPga6SCNBZzPK/lqBtQBquBXzQ7urGEyFVB"
+    "GrQkBtC85TbrnEkXQ9kvaHewtFXWkRUbY+wri/+ufZ7CmPWNO8EZQIesj/Z8dvdptc4wq1gmaEpT"
+    "fb6KY+tJwAG2zjD/dHjdDLCDyuGyG9CUtYSt6pm9YlmdfSI1rJpuHPzC3Mvx03f4BkNC9VvuvWkk"
+    "v4aP3GdkE+DWgjrh0M6d/tsw97EVZLu06bOhhXOzci/C0KhwLdnPwIDWQNxMyxdZGFcEGaIFSxal"
+    "Ug2cet4bskB2lLbtE0S9S79DacD1OFAMqADn9o5Xej7/CycZjR1f9mlAKNFpC8wonT9F0qWhEW/I"
+    "097IpnJEiUWW3Zarvp7ZAOqh3OusdWhRlzqrdhdYxfxe3M0zVdt76vtrdPu1ki5SRD2nSrvajCIE"
+    "O5SwcCd6pn8jC9cxgw4HYw0i0Ydc7mLhPsJKrjw+i4q1gSBxqg3DgOvjY5QWGloBnL5jyQJjbwLj"
+    "jrSoN/WFoPUnAnk9109UwCVpHS7EncHhPOaJeH32kzk0oj3Z7g/TQ7LKS0qc+z6TUVZ+yWnGkIgz"
+    "X/rYMlU6p3WNMXYkTWtBRq9rKFrJQDcDGKiifTVp+zF5yL1+dCrAhTRlaGwFhJ4zle1SFAU/LpPX"
+    "kOuTG8NS7pnEs/bbhICu631NkY+3xIeC1bEGHwrOHP8TjdCPzz6lBRDRVYLs9bOP9ztCOpg2Yw4f"
+    "BNp9Y9rXZbsmb6Im3afroZiltLTpt9ov4KE96yjo/LBFf2o/qxoTdENDkq7KggWem9t/ELqbiRuv"
+    "yGrVSmHMmOnlTVK481obapya6/Vznk4BQh/cGAVd7wZGukFTTfpRQ9vnyNUflIr22Ws/q5CrUW+w"
+    "dd60rhFwVOWCno2BBk3B+sCo97rXRqURHTaNxHLQSAxVDB7r0Pis3hy/22R0bE/ndWP7alFSM2zH"
+    "yekmD9turPy6fH/Gxq7X7dKqU4Z1cwo13pibFSQsY/rBtVbdCOD5TYTrcAm5ppU0CMifEzOK3sNr"
+    "1ciS6IoCG/pHpRLrYvT2YZKSMh1Tu6w9v8NXtxOUc7NW6wTWbrR/2KV7Ean3nvrSv4y48e5ms31j"
+    "1Ttts0j7YRy7HZv1NcnXquMpW5W+vgGhz1Dm1aC0rd9drmwK0zhMNGGJdtuN1GrJLTw2nPnj/tPE"
+    "I19vkx6wR3rxUdfwBS1zVBeg1hkm7xEpWb1IIyTQ/lNvrONC9eCXvWjPg1be8/p9x+k9GDK0XGZv"
+    "as8VdtwlGadEkipf6vYT+WBoTbIo27Gr+LcJi9C7LkwfCYbMC3dnJD5VAffYChQV1TWEMU//XOO0"
+    "bEnWUCTZefVPy9bSyDQnanG5XCnXbOJyPNho/64rOf3MnQPayivNkjRRNqnOygKuQxrPZK7iNLvE"
+    "TPlzIHqlHhJQD3viK0h1U2We3emLS9d8uYE7meZwOPAf2/hKdTNuzDY3Pxr+5xc67Ng0WGwKV8/t"
+    "3rPhayuYDwrbKEhn3Lo/bSXzLQOiAmyWohKf2fH+2IJJFCNKV9qUuJOLxWgo4eBjz2bC0XRpup8T"
+    "gusa6COv1Yph6dpSF55UHWcg9zdzqbdPv//ZGTWYySdB9ohs6NitPjiDnN734xrn6OR8enYhTs/E"
+    "2ZRNDx3UntpDs58PXv80PRfu30bC/M+DFeqev3RinT+OBS+tD5MbK+96oh9hOacn4vD05OXro8ML"
+    "Pnj2xItT8dObF3RGfT69MKfOE/Pvd2LX6YeHTO5uqNZGvXHKFC1kmLvdF7C3aJEpOjRsdVsa3a3b"
+    "9Udc3BjrTuaO7jzhPmfowa2ie2R0yaRqnayuJKo5R1cwb6JchuqWpJoLzhnCs0Vy27x1WhbIGbRg"
+    "am8w4Ase4QnWtN6yrXbuhk8dZz4TgOs26y19rxf4eajklL9iP42i1SMaOPMwQUJqqK/VPtD3T4zS"
+    "uFGoENDklhFVtD0YTUOLYROMJeCLM9zXDxJ/kFTwJ4thAO5v+762Pdt0P6WRfJHF4QuNBoW6Fe4a"
+    "G23EptXBlgFpvMUA/XO5aM1btCLDCo6OKWiVFn3rWtyY5E3fjYxz7Il6S39J0hgmerDEQb/JLXJL"
+    "2cJ04NGhHzKuRg+eLQnTm7Bv/K+58EJvR2WO3Y00/vTVNpstyEXz2/Vhm+GlPU4zPe9B1cmkTcg6"
+    "rrZyqDVnrBvtOx2IbDVtoQX4brScMuPJYH9tG65+23AaMx4UwkbCv+I+PSpr6NZNPqqjw5eBxnft"
+    "ciatVi8LshFx6GhZX65vHVEz0qALZ5Vt9Dm7fOTxJ15amn7r4YJB3sTAlGd1rE6LdDOH/EFY1b59"
+    "W13Tjfu8FzqyHSowgqjD5cNOGzwDGS5T6jVNUORQnOJUgVD/bSP4O01tqywZGUiMsc7ZrjVTHa/K"
+    "5Mja83JV2Mi0WmCV08WCmWPvuDWv1I1bf0dBlGn4IUwWfKPO/YQFP5OjJrGdqHs6n0dQ2xCTITIN"
+    "kae+H0afJ8YQ0uUmXQNfc8VJH//wkSdVscJ8kcDYgI5+18D0bmINKVYekU496k0tfJXE9q4KRKRi"
+    "O/r2Skf07C39R4q2lsdlLY+sW7q9nNJkEs+OzLfFSse8zpBGmVN3uvGFGcTUrvytE7NHyk5dp9Gs"
+    "MrL0BcnpSs3DCmUTjchY82WYpG7HCg8kFM1rdtW10i0I0sBGxGXjz2O8e8Tfx7jE+sr3/XdXV9Yd"
+    "0wj1cCd0kIYN29YNrmvR/StT1dA8qUWt5Xza+7DE4iYIgG9cI6WfpnPMYdydpoVniACiLxLQq822"
+    "aoMpjz+1/eDNVfbEv1PxCIAd63npQVcoWjLtlCq8gUT8aUJ3mlTX0L0ThHfEbKiYYcRIt5IrdsgM"
+    "jNt8Xdpr9YcMWpTbMZRTbD36FG0aD0tVAt9sttdHG60IokPLNfplQtU6INc3+fi2KDB+wDK3tvvE"
+    "/DkbukUTLWNKosT2IaXJMKvIRj7QZfispDy1yG6lvYvtPKNQxTG5tbN1BMrj1w8GJt3u4XtFMCeh"
+    "/osoS5pIzikPF4ybzl7dq6tngALnu0KOIbf4rkf9xwWo4wWpT2GKuh2KXj7qMnvoDXdPVRywWvHQ"
+    "1eQHAsVm0GVsdN9t0LEkgrD2mSTeHTqQ7BXGkubtbColi71JY4SCvbUV0Z1HFdGG7uo+6Ao3Nggp"
+    "zvSCgG1NEJD5DQJjbjhjEuf3lG1OPyKcZ+PseRv/B1BLAwQUAAAACABHnlJdWAcK4bQPAAAKLwAA"
+    "GgAAAGFjbWFrZS9jYWNoZV9pbnZhbGlkYXRlLnB5nVrdcty2Fb7fp0DZi5KbFeW4005nHWWq1FLs"
+    "mdhxbafTGVtDYkmslhWXZAlSK8XVTK76AJ0+Qx8sT9LzA5AEubtWogtJBIGDg/P7nQN6nveyuJV5"
+    "lspGCb2RtUpFufqHShqRyGSjxG6jClHlslmX9VaUtcizVS3re5EVVdtokWxkca2EX6narNDtqqmV"
+    "CkLP82azdV1uRRSt26atVRSJbFuVdSNkUZSNbLKy0LOZGdtIvQHq9rHU9j+9aZsst09NtlVMtpIN"
+    "LrA038Cj2VAmW3mjwjTTNxFzZeb4MwE/NBTh8gU9p1mto7bgs6R2zK6NVCFXuR3PS5lGtUrK2gzo"
+    "poST2ZHAYWD9z1Vht8btoqSEh0IVTYTTolyuVO6sYPFmSttl37G8FyJrVB2hZKN1liu9sJqgMYdG"
+    "JWutouausTSI56ouQUkNkCYC7opk00nxLy+i5y/fLgSMRbtaVrDImdvUMunkmZRt0SwEjaWzWfTi"
+    "4vz5xdvo3Q+Xly//Ls4ELPxRFVo1/icv3HgLAb/Nn6riv3d39PeF9xDMZrNUrYEoCPRW1RrMIwK7"
+    "YzX46q6SRarSJegmaT7opl6A8OurRWefUV2WzZIMIRAnX+PbJekITPGbUtYpKCG5kWCvp7SJMJvg"
+    "xKy4FkDDGDGIsMnQPGGYDBmp4OsbMHzhe2Yhcl6DBMAkQ8tEOHg3GQuYH/y5BfF0ZwqvQUQ3ATqY"
+    "5wUh8lP5QTc3W4vbfiX+1AocqhC3NFjLHRDbp2XfEQ0cu2cJ7MPjHYgToEFMdEfby4zLiMsEP/SE"
+    "CrlVhkpb3BTlruiJOaOg9t+KSzRqsS3TbJ1BEGo2mQaSCbhKfi8gLlF4gBerthEQO+DdVm1XCgOW"
+    "n5Ro8WKLehDXtSzaHHyouQ9CsMjzdy+iV+evX15evHsfvXr5Ojr/9iJ6B0d+Gj6ZRe/Pv40uX353"
+    "QfMucNhbg85VXYFFNCHKMKKdtceT33x3/v7y+7evjKlPVnQC3yiZgig9Y9Tg+kWDjp9m10o32tcJ"
+    "aGopyIwxNugleLQmu74i67VP4l/iNcSMq86UIU4//cMfRbkWCoxVII9olXOiMhd+HOP8OEZttUUN"
+    "fGD8CtBbZAPTa92EMyJ2LsBYTubEylxsZZGtgTekHMdIDdnwdfajWrBwowLiDm8fAH0KCw26S61u"
+    "s7LVoJ0sT9lStLhRVYOM4QwOHsa7IN4+E2UBiqVQBkmmBPXhPmgXrEYTjEn1eAQhr2VWmJBbiqZs"
+    "kw36rOTz1+qE1QRxkmwkV/KWnrRgiQsfPE0oMO97FMS2CkQX8kMrWmYdPPIO9NqnCd8bGgKIAAUW"
+    "oHynaQKMW+VwHNQBkSvz1HonZwmfNliIsfERQd4cpIdGjjRG1GAKvsl0VsApikT5QH9BIXEQXHjP"
+    "Tw80UKjdMGY2bZWrDxnGbfqFBnfVzy7bZjmxPXj94YqDYK30JpJryEYwSJEPf8GpT8QhZ+uiZ4Xm"
+    "wMbesdrU925oA1WdQfYP0Vr9qg+C6i5Bg/r+3UVdl7W7BpgOMVUVqY/8Bs5L9LysaFU3iOaKe+Qc"
+    "dysn0NLLofzRbHDwwxMQwxmwB5xFZKzdmy8Hb6yjuAwaGzzj+U+v+lOBdt2pE4E46w1KCtkLfcx1"
+    "cIAQXSRa3TdK+0EQbtQdL/BdSRwT4WfFuFeUILDBscVXQ/tw6YMVfqjQkPxegouRzBbmnP3GA46G"
+    "r/Y6CqoDdhG/IdX2uw8R2iHfW+DKYJjIYGcbunUii2gU2CkuaIMnkT4+M/ZYiFtIPxJifT82o5DO"
+    "rteF+QX7GY+Sb4JDXl2ZSK+VKiA/KJ4LgkMYFXSAdbl/8cBTweEo6yNi6Vh0mRuEjM4/R0DTRxoL"
+    "2jJwNYrOEup2vc7uOCYVwgWAUwOb2I89aCjTFAyj9iswZV3mtxBRAkcfGvAmRFecvIDUcn8Gs8O8"
+    "3Kk6YO6Mtvbr6REqcpJun23fMjspI8Yv7ELB5DmaLQx3zyjX7WR+g4ZJaQEQi4JEBfkLmYTCqsT8"
+    "U8hKb8qmg5Ymqu/LJhO4dcwcD6kZYtfB1DZBLJQSelIDhfCbIeU92kqOZLsxeuq9uc9nsMzkM/Jo"
+    "tzjDtx88HPOupqJB7fEMEgdMoRlGR7gKePs18ptUekdPtRCfDANLuzezvCQeHhy7pgk20tiajvVD"
+    "NbbhDN4sbTH4OUvVZVsnHA+HVoq4Du3TlvC+lgi0SoBEWBNJsFgoTxlNYnEfdOY5FC9qJkTkBz5I"
+    "bHVFKD4AwqfNdWCruWiAjvedb8/RhnXbC8h3gmwjzwWHojg2ZMK+2onjBZ13Pjc4W8/neF57VsPV"
+    "qbFxg3/fGNwKSBQFQ7BQtFp1cqPERO7NroOIsynLXCNQlZRt4vgaIGeSE+Qmqh025dVil1UYPjga"
+    "xHFYInQm4AtotOAWC6VuAcFMDVCp6JozUJAxlCt3EKhzCHvaHMmcqD84nLvKAYpvVQPAv5EYlvdL"
+    "TPim1mNUHcepwkSrz1CYcZwVSd6mih9//ul/7I4op9oamtUL1Qr+5V+/eW0QvswRkNwzUNYsFRhe"
+    "HSnCg5BqQGH1J+AXnAusEmsUAvmm8EHjI5LLNchqGY9Lq5j01YnRyBoLCS4cbTHhov7NFFyxn8IA"
+    "V89n+G+I//ZRj5eGbYUdNEpgdnoQqiIpU+V7bbM++ZMXjOauvI9PTAGOShlQxzJ9qq8uUeBQmJn6"
+    "PjgCpLutaIWDEB8Fqiup9YTnwhvEVIymR0NW0EN/i+3QHn/MKt8ExmldPJShKY2DY8esVY7gCJb1"
+    "YBiCe3aroqbsSeEwBH1IMN7Hj9icOfUCxg/+RBx/k3mr9kiEt7LbYINjQqGTFczdbwGHrMAZN2jX"
+    "9mAsIamTLDtEyKrGROuNUwaYYEwFelRWjTEFfoasNMBA9KbPKhJjXLcu3EDg4GhF5f+8ozAX/jbT"
+    "mhpplEQ06EoBbylYNtT+altRS4YIf4/VvxOst7JBf0dbGWQM/cxGUSq2MM6gI2fXBYSOlBy92ZWc"
+    "nm9Uk2wo3sIsrSpZY1fb8H4KbEMwws4qtgeyFLbNEpmbs0AdyCkAUyILzQ0P6KDdUdFDBxJxMNxe"
+    "3zQqWRlijg1bHOB46OyYcw6oGbWO0cxAgo+GvsOse9mvxyy6H/o66vPN7YFM6lLrXhmoTyzOMDn0"
+    "gMJGj1+DwjClYGu5A64fn3zaA1YfYHg/Un34TMD/ZeEK2dkTpqg3xAQ0laduJJkUQp0jr71PFfLO"
+    "qx/Aq/eHkcd5+dAQ9vn6UOnvXpyfYH4FgpZ36gS6vu9ovS3IEPoYYNz7Bw2qj+OhRcNSavn5Rcku"
+    "DQn//a6EndZrgD1gVmwz7GVdsZQZhyaySOqkd90xa5Dn0haAb+fIw8as481WeK76D0fHUU/FiBmB"
+    "XcTXZTjJL0fC7dVuYgNNwPiAsyfhwW2TmbkQE0eTqezeE2PIr8K2yLPixkbiqLw5e1+3ymWZL1iM"
+    "b0BcjQDDYR43ZwEHpFw+uk3pT0O1xhbqhhGoPYV/kHYoEeHiZQo8dD68MM1XC8lXYDy56kDlm7+8"
+    "0F18mIi25whjL9L18J/SpLxEdkXtZA5z5Jl5BwX0iG3NQZydUWwNwTd3Lox3acHM2aN4FJKRQ1b0"
+    "86ZKN5R47h5C9mdyAkN9wPHwZ/A65BZ9tEkhfVSAOY4Jiq7CsKtBt2EkakBUJeixHt5xTbgZXCq6"
+    "su2uHZFqgFeY4OTBuCxmbrlvMbZRuhB160gc7iz2lcTgEsfmGpNcOxxTBh6xLpK3ZZZ2d5z3Sa76"
+    "1DVKG19awDoqDDrM5oaOD8svTfM3lytMgIduhYkkIkwn2k9tDP5CxoAlD9GnzYN3QGK8jupbp9xe"
+    "iM8lBYLC3PpIuZRkkqeuvcTxcvxpAFWhgxA9zB2QOizIoo3eY3GIE09gIt2+YtqM489lMswqPiM4"
+    "TC6QUi7u4Iz5MGn02SCX14BJ1R1BvVqtEdUQbCGEwtU/leTNpmyvN3y9ZrISqJwuk8odt2yeEW1K"
+    "ZCeU15INdY2LSVZKS8VNavOtRLPpEKZ43iU/ZA7kQ2eZz02/KYPaOus/0DDR1srZaSUgeyjadHyb"
+    "hUFljfHpUY0YtrZVaZZ8TvxHkilaJW2NYIYIPniTOmaUVf/MHxLA/2jEW3m/wn4bXymYKMLfAphg"
+    "PooANDrnPyO7Xuxt1NPgFA4vrOD4UwzTaTcuc7WYTdPhc6zgsRdyNCU+7mMa4xLz+Rs70zStEGW7"
+    "SDygYmigGmw339sWikVnvZzYrshcf/7pv2iJ92Ce3Hqm3g/a726T9WYPXrhSWNKhPK23XnYNFbyj"
+    "+x21WGpAi9RVwb99yyaOj9wfdxfO2NU/2tEJ9t0X4232+JqYKkIJJ4JAAgP9fXRSavTeAlnClQgX"
+    "QTgkecIgkvt2Kj2B+nAAMukYvA26MYeJTkcjZ8e4hu4+n4NM4aGps+tr7GKJ67xcATVMiAKDzxKv"
+    "2GssUhV7GdanmxIOxj2XodZES1V1HGMRFQ4dIbpR934YhjaOjzz1DNt2MffDOpxtmn1jVG8iT9e6"
+    "y7NbZSyoh+hx/FUDdfzXpyb4Ay/Ex+lXv3+KdcPXp6YHar4C06bJzCH653//hyMxcI3XVdhfpDv8"
+    "Yc04LNi5qoI6YZOxVNA8sBnK1oCt+CIhk7BedWJq07TO1qxXNEW3C2yiL6eIrDBJAozJMN07YL8U"
+    "BEOK1/h5xTj1GTFRuqBW6ynIHdsklCkDbKuvsoIi/yCyGLe3pRZ1LR6Z8Q5qr/PvAFUO5ptD3ODD"
+    "1arVnOgc00IkpxGYD+opRkG3mPnhvCq8DiFrgsCC/Wlpbz7irjaVcpx32YhC8YraOW7OdKRiWvWC"
+    "GgeHs+mAAQh5kJpVvnYzX3/McHtD6JNQpSYcC9XIHUR1F9YaFY+xvNU3v/YGUx9LGC2Fmldndo/B"
+    "p1gWcjPTbY3PmHwf1dTZ1yIpQV5Mw+7LvSWEPj6lYKB0ZtsJ3TdZUF9087v6cvD5Cd9AKJUSrAfq"
+    "lxLe2SLHbjq+kbcH4lt5/LevD4bEUFizrli2L/q59Kmh7w2jX/+xFU7Vg/rmF9e5wczRU7iroQhj"
+    "gdkDfCGwxQrqHQtw1pVE9DVqMUAOHUOmzjr7XC1DVYzzPQoK82jZN2klIcMMZqfbjQqBAf7vN0UJ"
+    "2fUH68Mxi92iQ62JfsJItrzVYekePSualOW13+ER1j7kv+fCGCk9jKU8NT8r27H19Rb4qEL8V0vG"
+    "fC6bK1lHCFdq5aJkTNURxyYGtuZzLpAVfd4zqZFNV+dQlocAL94S2Nf82R+SrGlNiuGa8syubHP8"
+    "6MG+6L9xMN9vA2X6AJlhutTKXqkM2CVqZiJ+o4X/k+kHKMARW12fBYntcRL+fjyst3RJjZOcugUH"
+    "Zv8HUEsDBBQAAAAIAMCeUl2bDIIUkiwAAF6+AAANAAAAYWNtYWtlL2NsaS5wee1923LbSJLou7+i"
+    "lh0dBtUkJXtidieopiNkmd3tsS35SHb79PFxQCABSmiBAAcAdVmNNuZpn8/DvuwP7If1l5y8VBWq"
+    "gAJJXXp3pmcYYYsE6pKVlbfKysrqdDr72XwepGE/idNIxGkZ5bNgGolZlotgOg/Oo0Gn03nyZJZn"
+    "c+H7s2W5zCPfF/F8keWlCNI0K4MyztLiyRP1LD9dBHkRqd/TDFq9KpN4op7EmfqWZKencXqqfmaF"
+    "+lacLcs40b+Wk0WeTaOien+tv5bxPGL4FkF5Bt0o4N7DT35RXi+gF/X8w0/vx/7+D+P9N68PvpdD"
+    "k2MFWGexLriXh8s4zbCdwio2+9MkVYW++18vD6yXckw+DkAVKqJyufDVaM3SxXlUTs80yEfj90eH"
+    "++Pj48OjY7tc/K+RP8mj4DzMLnXnL4/Ge29eHX46sAuXOc6hxv8yLXsijdOfA79YBGlPyP/LIC99"
+    "LAtA9YT84kdpMEmisCcu87iM6H0Ekzuz8TZ8IuBjdjpZxkmoAcMf75MgffLkK3G8nEyZzMQ8C5dJ"
+    "VAiPSvfEaZRGeVBmedETZ1l2Dn+mwfQsgr84YpFH2FxPLBdJFoRdIC41riiElifXojyLhGy9gB9B"
+    "KZZFhE/nQ3FywrCJfv8sShYnJwJh0E8nWZCH8BCbFmkGDJDNqObgyZMnYTQT/jSJfYLUB/pbRHl5"
+    "7RWLaDoE3OVd0X+BfxkTwCU/BkkcBmUEHbwZ/zT6ce/txzG0jqx0ctLvUzt91c7JyS4MDrgpFVvY"
+    "5JZYptOzID2NQuK4OnZlvRhwJ1FMTFaD7gnVc70huLv0WnaLD9Q4gzD0l2lcXvvAvct5lJaFtxhq"
+    "Vh7syafv8VfeE1swPcE88oPCB9wv4iQaAjazRIzEd0FSRISbA8AoIwfLwqvOMf4NCiHr8CgXA+xd"
+    "9evRM8Jov08gdXr6EfBxNAIhVT2ZR2VwEeSjzoFRDOd6hH3qJ0C9NXj1qwjAFVWv1PNH7FcQAocK"
+    "WCBBUWbiAH4DDRbZMgd5hINBugEmSYuEBKFAoHfFLEYyJ3rs2I1PSWiChENaxsr4N4zKaAo0TQSK"
+    "HYMcTfClB/MTLJNyKKL0Quztv9t7M/Y/Hrz+8NOu2AGcZrNZt+qgy0joboRYkPmTPMiBpAzcBVMc"
+    "xKhTAE8i8y+jByG28ykuz4TssCcmAQo7ZFmFQOC4CBheMCzAzlkmvPpQ/bevXx7tHb0eH4+edTt3"
+    "GmN0NU2WYeQYYbBYRGnYcdDS928PXz4mOdk4OI+ihR7+HBGCuqk8iwsiGpEik4DMQG0mTpNsIrJl"
+    "KSVTnZYInyhOQU5GQYmCe7dBKP74f++//fhq3GM5CcoImBrkVOgiHBYIeVRkyUXks3aSoiSMcx4Y"
+    "Px2SguV6W/xHihx4TBJS/JmKwB8UBUCs+IdLwpAWyxKbXFWSxAi+0DL2mNUl6xqoDUyTAdV4Aavq"
+    "PghsU9hCVZDARQTaoYynRXfAAvI91IvCKJ1GqCMqqKHsC3hQAScffMsjfrFNRU9OBgqcJ5IajIFr"
+    "lEoxi+B71fvuILoC7RuCksq97kAi2uuqlgzEOFuq3q9sSVbxpHmxDaSCIHTMcjzVxVm2BNjyZeqT"
+    "pvHZBgIzz9PTzlNNs4FSXs/GBxAPIMKSa7YXQZVtgRZT9cOtLRCMEbDDLM6LUul6YD41D68yqAHC"
+    "EAoiH6EgPDnZfwdQvI2LshiUVyXMwEWhJmlARgw8mqPRVwyRJa5Jfi7TPEpipH9q2CuzJQw7y0PU"
+    "ViSLr4symotTENTLBIReed0diL0Z2LvEVwzhyYk0F47FL3/5L9F/iX9OTnpoUjDZ4lh1qb4kh6E4"
+    "QLh++ct/Fiy7+3EqcrBzxGWcJDAXgFxBwxKXZ1FKLTnG6QEOMwAmr6wisMhhtosuCq1lkEDnbCP8"
+    "8pf/uAShQoJhmbOxkOVovolAzJbQqZ4FEV1EwCFSToFVdxYDZi5BceURwc/SB0HLAOJs8jPwFBth"
+    "NplPSCCNTIImKnQSHmo4j2sA7dFQ96lJGCoQYVz4OCleFwWdXdaYaLOgslQ0nXqGxNEkysIFBjzJ"
+    "CmmSWALq52wCVAMWhEsmgdwcgkyZlp9BIqF5nH9xFSvKEPA+MiRUZegAro5grmOQ9HFgTgIRTgYC"
+    "Z5en+DIu0Lilh02CAjwQRUk22UKwweTaAgi3yELYYiC20P5A1hvOgO+G0q5l5AENDRBZzDL2VJqG"
+    "Ja8LYGmi7Mp5kJ9zLUQ2QzAJAQWAkGreq2nneecRjOTCbUBU5nXoaUcLN5xpemTItgAx8R3M8UFW"
+    "fgdLlXCc51kuq1KNGT5FPL3f+/CDbMwmxrD7RHWxSpyR/K26ns5xVJ+pWA8shuMOGCghfnupv30P"
+    "3zo0F50vpvpXJGap40UOlOV1RGfwcxanHrTfZeEz4unq6tLIvLQKU+PUUGJ/LKp7FXGPYIR2V9WK"
+    "GCcZuwLtfhZNz0cok3tIyyP411PUyn/oZ5TnGh45deFzCxF9DUD4ReEVSVCAiYITUtG7rv4N1O/0"
+    "f+4Q23hYuKurNnDVxNNzF6JsQpTT90Sjr1rQ8iuA3GKjdgQ2kff8fth78v34YHy09wEW64BARe4A"
+    "iBRfSmhpeQ52ymlhrKsOwNaDEUyjxmISjRhdDVUQGZZo2p2cSONOd65fS0ECBori9FOA6xTs2rLk"
+    "vgE23SoAijNJMjgrBtB2nGfpAIp7nXoXHYVdyX/U7gAAjhdgeyTZJdogasJPiUpAB1boqTM8rJWX"
+    "EXP6rLNMz1N0alRq7+b0n/JbWAdcLXhVJNfmN0974ikTTdV097bbsXTPqUL7Aqxinue7Yt6siZoZ"
+    "n4F1WXs8Ym0fp91qevRMBMsyMyYC0WLPQ5pZAAKGeencsPs6spem7LadR2Zr/jwLoycmVhpvvRo8"
+    "NWCINBQFsyuI2YmsKW+RBOmwcvMYnpzKOWLpxU/YRMOQI99IwxJClbaFPWwJb0s3vIXGuqr454rY"
+    "uzaSFQ2NRooPK4w2FB8UV+jjMdLTJ5Wgrh7SkJnQcIrdjdL/jUbpab1RtmK4UbnqAqVF6Klb3nXs"
+    "9momDljR55c4jW5zhPQXo7puaACTbunOtnaFbGdLnGbo7UC7EKCCvpEHUKyjrDk5AULnLywKa3OA"
+    "3F/zJnoGWUs6QiFeDdQYoh6dMa4aTzQ4gc1Wn8xWYTqe09JnVwa5QSP0M5pl/UlQyJn5SuyzjZzD"
+    "BKFzAJbgzA9RwU5UyzgWZ3FZIP7YAUldCeqKbS1sGP0z9c48Q4WxBaC0lf6iMTHS3wz0TaIZeqBG"
+    "LePzsJMKX2V+bVsOD8L+LE5xFWK3GNAqakN4qBU0+tHLAdjzOohHHP08Rkx3aoYOfqgp0BMmLgc3"
+    "2MItVKTuSWvhk57YASaQSLKeam3sQsDD+OxBckcb6ZWA0I/MGWqZFlsWGeuj1VWVg5tJ3o/Ti2xK"
+    "a3NeV7VpSzDT/jQBwY+7Hj3bEYSuC/UV7TGob22gEM7K5SKphNMYl6Yl+b+y1PTkC9qOIu/pLIpC"
+    "dACgeoKVvq8kF5bCGousKFmc8QaCFkTKBVJNAkA+KDMfrZb01OtWHj60WXkstYdo5tlPaGSDMCgD"
+    "Wv26XqJDpvYS0TmIw8iHAReA5OpN00gxqqEgpapgK5jEX5Wo6XA5nbkPswwEdFooRW740HEG6rrf"
+    "2isgh3BlGsIKr6qNbECV0PkE1OtPQCKgC9koUzN367XrZsf0TJs+3daByZ2A+mBcDfI+huHbbjbu"
+    "xAHX0/5iBwJqEgQo0Of9KaaxhknUzkSw3HYySU9UjDhkMJlvYMGkueZ9HvVJOqgdM9LvvQYnEIsw"
+    "gMUuq6aCWQagE0UaLGCxXDp3m6y9vGmWJEh6p9PswgeSjIpGee6v2sT0D14f/HHP/+Hw8I3//oe9"
+    "4/ExgyeXc1jcX5yBYgDoUWIZDzZS7VGK7q7It7XrMoQpbdTH0fpqtHpDNriIfOtNox5ga5GlRcQG"
+    "rzay49TXb4pyOfHZF9m0zXHDlrFfGegwjZIyr321tclPjeLSbLfRUokxhFq6fqOwZz+uZL5+7p4N"
+    "/VqqhhHxtPwhXozEc2uXpWXQnt1pVwPOVmwNpKZgEPVen0lnUoPiDOMblK1LAFU6EJhrEAOBeB0u"
+    "0tdFyJZFbZNH03ghyXaAtHAWXQ22Ot1Hxbyb4O29IbtJURvTyDVQXb97x1kExFF3FtMAxG63zgoW"
+    "85zNDFA9p9J3M1nOwCKMs8ExKdvXh6bZW0WEAJPxJo7PCwkwWmbdmqPIZA2DDKr3NkMZRST34TJ9"
+    "hqbgBTodJCDFNUw89Tmg5ZjHheXLhnSgVqXINoU0l9cUpyFjjYr2clycReFQfG1ushL+gORoR4j2"
+    "+oiEgMusB1EyowfmJEqrZkf7OBBKqfbXmW6kdR5mv2ntZrhL6pYZBzxImHCZCDqHrTuFFJCn69WO"
+    "1WyjaJySnrbVgmHrJcvizFeFyuw8Suumk9WCgWfznVERKDQoC20IqGkE6rIAtc1NwzwkVFe/0Z9Y"
+    "0QORlWn+o3j1DYNx1G5BmgbkaKU5uUZK4AdsV4vjR+tN0IbNObq7UVq3P+tNtNmnBs7kjjX6KOq1"
+    "zXfNmjhkMEIZKwtzjsgi5Oe8d2+/qWxMo0z1sF5aWpZmWfmoJqQbSpEMOZIIlaiDES1RALF6dCm/"
+    "t3F6HoVCwyO8r8PuEMafRKm3srWuseDHpTqu0zfsHj9nIXoDbD1HbT0V3mI5SeKpOIuCMMrZexKj"
+    "FwWYK0mG4iYdcAmfS0BPCTLHbfdpozl0NLlLN4pyKIodO2G7JJoSXH2eCvGN+DoXv/z7/1NiQZBY"
+    "gIdfF+KXv/wHyPanvUa9ClvkgHC8t4RMswCg0VXrIg56joFsotyJjhrU5aId09HFusvdulTqTu9w"
+    "097j0q2iWW0gyDckb9GIaJPF1YaDXeU+I7Yw2lHzrMYfkrOvh1/YSwW8VHQBKVtWzz2HTvEqOrMU"
+    "+IJiI2X0HXqwpPpYt2a015hNfy/uVHCwZB9Vog557PdRC+NP8tYFolhOUUvMlglLX9OByyKKWvGx"
+    "FbcjiwuYbix+Yvux+JmkiHrDtsxDCFvc6tItpFZviyQufTbineWb0ZJsY/tlNAdISsMZDz1f4L61"
+    "0aRXK+xp6Hq2wW4Iyop3aBTMM3qLEzsxCtc2IPGtvQE5vQxH5FCy11faAXGJcV8bmn3KQuUvhvnH"
+    "pm4jlqsyA9nIcXgpJJ/WPBU9lxdERlD0mm4MbSKKfp/Gg4E0MiaFQwTL4DTi6ECOehEp+QLROko4"
+    "Vj1fLsqWgFnLlsSYOzSVS9Bnc1+uPxxr9pb9NBkH1yhPYGu3x9s9MKmP34w/7P8Af6nGJyzAtOYG"
+    "QS2LqKGRWUs6JMksZ7LriTCaZMt0Km0I9Utsi2c7OzvckuXvvzxD9CJJuQIVZh0expC7x3XxDdoG"
+    "9GtAgrx7y9b6rtgv86S/j3tCRZktgLZJjBO52pqUpwoFN7dzGcSlZxfhiVUF6Jcnq3VXwkngqZIM"
+    "mld0ZZfhrhnR5N1Qu7fdFaA29kaIrGcKvhFNabOEonIYgb38YnNTr7LU+kpNIbJO19kaIwKsqqi+"
+    "wlWfKDHhYiJrgaxOtU2TRs9DbU1S/2B42bbocLFOe7nNVyD1zwYrEvPTxEvTFVspGtPN2lyzW63U"
+    "NbChbe3SYLFHC1hoGhJ8HyzXKHzPvyikoScOj+WXI17KyV9V1EMXI7ei5gyiGok4AEoulgOgLOk/"
+    "EJJ+JRBvoms6wfBaScJG5IDyEkznoUWkrXEQWj63SlIKrLRWgo3yTocrq/zHdLgqvYbK2zxe45nE"
+    "1K10GJQzldgAu/aj9KLiDwomY9Gq9nesGFttqKjXvLCoQgPtRvQ+kLsR9breSFfraTxNAYp6QDPF"
+    "beLjrqG4VQgcvZRbWKvigpGlR2vCu6vWGwt06KplaQ5vmkvrKli5Xqt6Y9eyDcJpEoGYRcMP/XTR"
+    "FYaImJEEMtgwn2OYsacDxypbjIcxgnUaIg7/Ergj4iYlnRv7gkK3VAkNFPaOzVIezmppL3UFjrKp"
+    "ouXLJnt41IxLasmlntttSx00eNShVVp9+lagoo1OlgTUuT6ttAvjjhd0vg6MAxX4ZtZ/mIy297cN"
+    "lD1Q9z4MqvUa49fSFDK+hviD7AYbORReZ61K1qoTxW211qQOqa01NsCziTETI+1KyYfF3fV9NJNp"
+    "f1fC6/jju3d7Rz/5B3vvxg0/JfVlek9xC4Ea8un8TN1lGxU+aQqoFs+iwvDastujWMLSNL+2HMN/"
+    "71qJzP/P1GdR6wcdihQ2ZWgs3PD4/IXjhfG9QrUuph9QwWFjhqCLMkpDzz1jHgGiftnwdK3YdFV/"
+    "6GKgNKvew9wVBaxbJfyvXh+hltoG8Pp9Dex3r9+ODVEoyf85PWCCQzybCnzzY0I19aibW6skdcm6"
+    "qvw6rCbPoSxx5aXed106s9YwQLxMyH9n8XjlrXHsjpg+c93cf/suyT+2QP7HtkDws8kW+OotLVNg"
+    "SemMzgZTWnsm0pBOlTYzjGku2SImVbskJStm3rZ0jwFHQ814smNplp+jvljOvWckAGlnRHEQdJmj"
+    "k6RcFhRbmJ13mry7bbIvxYvvqrFLZZ+dMxOrfnvqva2c6QziOXZkFuZxPnNqbpAAV/fQ3VyxijEy"
+    "m+spdy1Oin7GOORfjMTfuLa1FgqICoS/iZlKB0sH+zxKl5YRWlmTNWPSUG+mRWgQxPMHLDZlCLQL"
+    "uRtqOvwoXFVVrLWBgk0fccVvjJjOyiUlQreBulT0Y2lK8rsUolpe1jQlTVa3Mo6rZlx6kSbRnuj2"
+    "wAFsqlUnkuinceI3M5pSRZS3B2f+Q5/+Q5+u1adNGWwrsrr2statlhrjlWiHg1QxaQ6xdnXgt+bS"
+    "gNLouKoK5lGAO3RXpRel0wx9/qPOspz1/4BiDEVaMYJZgtXnNOp0B7S9h0HlwOuf+893hl+s5tVG"
+    "Q7/fFzf5oG7d3grvpur6FpRav99RJxY5kAy6dO1ddP5vKrcAcQTdljqPov6lTCLl79D391Pzcvf2"
+    "gU7j1aFcq/eRf7Pa/e/aw/uP0Dn8/C3ruSpWuhnhwYHtIUaKLSX+5Y92TyBFzKB1tuaorlPacO04"
+    "vVApuNSyAtsDEVDGebR608p1yqDloKAPhIsg8lCyrFxxzI/sywjzDGBB1G7IhDLKvQ24ys0jq9eP"
+    "zs86R9E8u8CD0Vag1g12cttxHQxTFQ8y+xRjlUMnKO36rZPEwVd3nyQXijEYIijtIHNqn1G9Tuyj"
+    "tpSZC9ub8uoR5R5WaR0k7wZIkclbIvdUf1xbDdV4pNay1iMzio4e+T8XWboZHsxNgUpck22ln8tI"
+    "nxoqOjJInhMmybQ6p/GFPiTcVyHpytu5yvCxfZzhRoqort2wr86g06bkeqamci0MLYx4AASsB6ss"
+    "J2ZOmSZ3uJCRZsJMkpKKm0l4KxMYirjk1EHdDbDyjLFSyrwBirgw0UiQJCgdpXWuftkrV6QG956f"
+    "m3K8SckC224Bbch+h02SCvX4quYZbyzAjeq1PSfFRBqVFvcgHGW24LHBl3Wch+c97sFyUTJTrDZO"
+    "ZuTtaJRxhibQSmJ1aII7+6Zn049vlzIMmJbn0iVpvaWpszaTfn3eRwh+E0wvrcrmhFKKIIkstXdO"
+    "rFE/amO+QOxZLzeQHIxKEBmcw1EFFD5UaMyDhW9mPJK7Yos2fGmehTLV6qPpVCwmuLayCFDacarH"
+    "kfpi72rrbWvFavVtaidebujA/mZD3lTsOdjHKyb/c5Kvhk0EZSI9PpPrDQUhtRHGs9mvJAZ1+1Z0"
+    "ln5qnUnlBwau8cEdTBO1Muft4HaKRVNuoXd8qdYXixDQqkbDzXIp0VkWCu4QL8zAfkPIIdB9BHrI"
+    "pw9BxMmWWOSB3TvPcG8ZHhyMP63z61jSDj9ZEtqbuLL1TRzbHFxttZ9Gl7gwxhefdyovFQWA1mU8"
+    "+vNd4r1qZ70kVp/HlsjqszKSpzFDNCMwC717aaLG/BDWDBoBHn4+NGeuZ+K7ddnUgPDw7SuGkgDT"
+    "9PTq9dHGitKWw6GKAatYX0F3T8FrgPyriV0tCrwifLjEtar+U03a1iQSdbharibxPC7lUn2A3mY/"
+    "S/3TPLuUBIqUQUXq54XmwRU0j2dITvNg7odRUgY9mCLpFMSfKG2och3vFilakyCbEzf1poffgGWw"
+    "LbBxeln1Qm8m1yWuDju1lueYA6g8A1Om38fB9bO0z4MTNwTZbS1guzb91csWQmhd/i9gaXIf+9y1"
+    "/Ddcfrx6D04N95h8hkg0HX6Y3Nwqx49qxRBKh9ttc6Na2k9X1LC2C/WBMnyD4fjyRUNk8DgJDG1b"
+    "Q50+tWYEC131oZX7SQ0N3MhAgWfB3XWORJO7bRqqNvl0hka0Z47XblAioKU99+7z1bQprCxk3UCR"
+    "TQTWc0mnBTmS69PtqQGP1JeeGtxI/l3lokRqwJT1nzCdKHSC7rZOtT3AReXBUumM62iXFG7FyT2c"
+    "AVc1XHiXZxGl75p1brDcoFhOcKv58/APX263+dF5nIa31JtZgnvTBRpWqnVkWEJBJUmYToOi49K+"
+    "s44QNwTTLaCe6lBmLeElQUGXKYTipuJOD9f0A/zPwzxbVB4L+liwSsVYk4YwVoTulk/wGGjp3ko/"
+    "JDaEZ3mQv26wgAqjK3xZ9FbHBUK5oSEQoXFDUlDrZVYGic9JwKALEEktRSiMt3trRgo4BB9trflJ"
+    "DF3fwxWoK2trG7778sxzJFsv1NUNf3P7WOtCPms2PgV/1g3Nz1+6Vfincug60eTJEGNp0AJUxUhD"
+    "AJVph+JO/l4A8uI++ozq5dUNL/Crx39yv1gu+I4SeJJNATzOL0Fn57jD/E7OnXqzTQ9Eh4oM5RHJ"
+    "j2l8JXsueNUTRsU0jxclXSxQFJQpHFgN8H2+sahteCC4h7YQOXopY3QqJNRiWBEjjeB2A01eLWmz"
+    "KbjUkDOJH0wid0M79BsuEp41FNEx9LzAazg4UWaj3QZmdhzGPBEUT3gcJhG5QTGNsNyIrJ5ogjXV"
+    "pXkQoM2254Hfxa5ff2YMyaJVAEYpMBtP831EIFbX+yBGW3dzIfwNCUWJQwtvBqZJhDl3/nuCr/Jg"
+    "YuHvvD/A8q/aIZBqg/usT1V1r9LjTFfV3t/HlBn4q02b/umePv168+MPX8yt+Mbct0zw5rmtN51i"
+    "s8XNJtnCmAXQPbAQFV9ctG8NX7mYcm4GBhe4b6jiAWPWCDq511LKw7uD6HYfzhBpVGq/VggpsU9R"
+    "LfopNdGRpM4LeaSy6uqmvaNXH18fHPqvXh+N9z8c4kVG/qu9D3so/w+PhSxn32y0Dg5EpQuOWioT"
+    "zigwybJzsY3GfM6g0R1BDqg+Ho+PZArzf9tWIwIcvo3T5VXdC9H5t+1X2ZSvCzMLz4Pp4fH2J1h5"
+    "ZJeF85IhYqcVE2NovOx0JM//GyNV1gxd5KR6Loy7gTBhNd+48g0xardjuQsQ4tFnRvEXKy7JRnin"
+    "f9GhGxEk3WO6YXl9FCUl7vTU5I12nA2YM0Y36bnum6KDQqunkbOnB2L/DJiY7hujvA/vo3wWlWUm"
+    "/nh8eEA3IZLxLC+Lksc1ZZ5NmSy0NoXq3q1iGqScMZSzhUchJnFw3j724Whvf9w6rbBYxfU4oQHP"
+    "PtKEFtBQUQLS5pjfOo/+tIzzKJQpGZjcKQJyQtUkg6voJ6jBHPY9C+VI3qWjrkpTJx+kcTZtnwEU"
+    "0R1T2hpwrMZ/NDgdCHnJ1DC4yIdLJHXQJAXIPTCnZ0P49rvn/H/xu+HhAqRYD/5/PprUUe79aZmV"
+    "kXHnDuUlVKnEC+g+AYOZUyEXmPThGt/xTXE8qLYb36Z16q185vZYJUJROFNKD+acWYaMsx6NlWPe"
+    "ZkmYYDNWsEno5B+viU3KFCPjCM0bvejOwBzRA0gwr/cy+98VmkDtO7pqsrR9LNxxTZDyWMwIxs3G"
+    "spfE8kIea/cCL32yn0ifGSjYVXACeHEY9WXYoiFrOs92/nnnXzRfyKBHjHEcyMIEBBTHiGf3hELj"
+    "dBbCEGnmnX+y6VdREpVKkqDmkNnn+ajFWuzad0roN9OzLIaHI+u60030GOqDMsNrIMHekddimKnr"
+    "FZ2Y/eI1IrDYSYOEsjnXmBGv6aBTNVyE50o7HdwC0ARbKktsZkOuNPFTA/VO9zDq2zRtNI8UWrwU"
+    "b/7CCE0nWjbmkFoS3TvBWJvEvZbcY5QE2p2UF8Urf8U4Lrs5d4WsKFUNj2EXCvZdvokU+CRoSpXa"
+    "OO83m+yB7pNP8yGYehUXeLiCbwkN6c7RbRA7cZCW20plW3GcyzSUV9nJm+4weRlxbF37aIrO0l2R"
+    "AYnkgA92Ehk0fvjyj2AU+vt7+z+Mwba5OzKk16/PkcM10WqHFeuXd7nftYawD2cY9SNvXMWv+kZR"
+    "fVUrJolE0+grld6vSmPZjiQDJUfj48O3P479Px6+PJZsP49T7w89sf/+Y9HdFc/ooAJMUnIPfC2s"
+    "FEt3Jhi80lKmU5P28OCMLpwTeJGJRSpqO0H6/6ZRXyGEdy32v/mmjg+FQ+/7/X1D55oycf8HvJvV"
+    "PWzn/cLTtSgxbqpqqI7q/qfVeJGZw04t01HfNWTYkJyZ2rweZ5ezmQx5x1sYFxfV0cNmS3LNh5lA"
+    "lKWckV9nRmGD1UlVeiCSpAiEe9BPdUKgxmuOMwRN9no7/nH81oHmzx28FxvXQBJ2uqkl43vqQEV2"
+    "vqxG/7tgUaCFqYAYSCD8WRLAGv9b6veFTDBLqfFoWrwVcloN4x44khaYvBK7zXg1jko0EaVv9t7k"
+    "RmGSZ45LxFfj7FDJ5EAjZZucfULVt+/7LaQd4DSSZY3uoE6z46tgjnexNIqKpy2TBdM96n+C/0X/"
+    "E52we3ofKi0fJueqK1ul5UDXKV9W1yhH+tAt3s9UZT9W98XQ9d18MwYzfg0voAxUCkNPXpyVJtc9"
+    "o2Xr2BDFYFEQkTz/UtAWjPty5TXIUQkdV2pEtQZ4vrPjIM93xw0zUd4+TSjqCUzHKDNocpo13Gvh"
+    "ESP+cNnw7hj0WpLEBWiUNDSdANDnxmajkYS2wWhGBlgXj70/PPrQXFvRxFM2ULf5SDSBbPK0EPJI"
+    "IRuIKH+wSeEl8Xkk3208Dkzn6gJy/92rjUjVCbHwkAIlJAw+tKdcAHq1xWvh3TqJ3ihWvRV0vvWM"
+    "1u0FXYRs3CWBLotazaeL6/IsS38nbtSaUYtd2t/aLrMsKbaB34sz4P/FtRgMBm1s/hXe/4Y7UXQF"
+    "8hl1i7gO9DUbJyfmPhpepFiA3TGcZ6G+q5Z32E66AzkPsCT2Jb0VHt5qOzKyTcj9VdtxNG96jqr5"
+    "kxUxKc91g6TY9YCvjNQ3yNKppCSYjTxbnp5xbCgJg9M8WJzBOCq7XPB9VVLO1Ohq3lh0sw/K7Y95"
+    "SZ0iCHxps5Q3rA2L67QMrlDAyEGpWIt6Jyb1av9PXUfVHBlqSWk6gkwt0+2sGJXZoYrR2EQ93sUB"
+    "ijcEs42Gc2E5rFAEnybZBDdocBVPFi/6QRHLQN4YeyXvMkSR17D1iVH0BG5vbUesGuErGPVfoQcu"
+    "B1USkEcOb/lr4qXBG6tQ9EjuM+0MYk7qT2qqVZIUpUjTsmRomrE6BQyHXFKexVTf0sG4RVxaCWA3"
+    "oDludNOJ7nyigCiYIbazcZ7Ina1y7FT659sKdS+2TdjXct1j+tGarW/uSCPxbk8JnwVpb7x2L6vb"
+    "d1ZzCSnPeWujDcfTKtg3brXhKnqUVhtulUdp1fZPOP0SlfVl+SHu2tPCEsAbw+xeNM97ZO/7QaGU"
+    "opHYehVX/pWsD+uDHa5bGtKutbk43FgO/ZWu9poY0E44lL4bLPka0m6l0USJ96SxNL/azFii7Ekt"
+    "OzWm+gXdgJZKkKjsI9sCk0+JjLZmcYjpdJnjdmtyLV2UWL//s+CbxKyBzK/W7dzVraaGUWOaUc01"
+    "ssOC2rB7HNSdLBoinGe9H5+vMWsYp2zt8Sgrp13CqQN4d5C2dONC2qUGkhvmjDVsOTs8Ag5Dp0Vw"
+    "nhUF0la4nLbuJtYRsmI70TJR1qPzcTcQMcuYsVhymjAYAyAmUZJdopPTa9k13GbK725Klj8bwMCw"
+    "Hs+b/T7Icf8pUYRKib1ITmAomGK2MgMWOovMSJP99x/5umSwXOUapUYfakkTUJsc30h2Na9vMHh8"
+    "8Ox30hlJaZOQPNPkenMqMfy2Ln/tSq3naO4RbTdH63e13Uxis0w3R9sPN90cjT6C6eZo9RFMNzes"
+    "DzXdHK3+SqabawIf0XSbX60y3VaJy9+m6baBgvitm26AgnWmG+kjNt6WjhApdiFqcjxaptKrOEBP"
+    "nnSASqpcbuSLaivrVv3O0r+eqrcdo616vNoT0YaeifYV4P5VhQM1J4E95m7n4THtPAOwFzFeF0de"
+    "rW34tT1dDpbFZJ6F0XyrlRRWKtlWcB6s35ptbqTe2iqH+XUfLIHVMvs9nqJQWwTqZjnc5HE3a5LH"
+    "QyI8msIjzGjal0UkI//IXrP26olWWLWp7S0OvdqQnn+bqmO9vPmta45li+JgqnbukzgibI2lP1Ib"
+    "2cLNwHbD/OVkdU5KbQ9A8nDJgguw+uZI625PlQtQAR+4woOlSclQvk6LBUID0hZ05ryNo5SbjtPD"
+    "UazyNGgJVmYwXCHL1AQlcVbtWJBR2rnKRqSzxwoIXJz18D5RQfEodJ78NKoWqTI6R8FZrMQRdSRL"
+    "LtrAqWaZTkk35ncMCqMUgO0CI6em0llT1MLOBEKFV7/IsKoJTHgi99V5bIU9uysi4dU5eBf3Hb/+"
+    "P80tgnYQ4Stt7/OWNvk2iBxndGErKcHn3yNR/H5n592dAKRj+U349r5vA0+BImU6b+RBcQnGs+d0"
+    "1PVfcPMX1pHARulyPonoht4wuK4zR+MkwmbK7RD0mLr4/hJj4S7pAPskkmfYddDuYiVhEaXUWMVm"
+    "PhYVdelmiJHuxtxN2U9aiVbn0GigfR9kKeKRtqvFtjjaeweIR25Cb9klJ+HCAIYiIoThseHr+SRL"
+    "CsWOmp4bO7dF2EYddAzMgCXF00qjzpaLWMZvv/uzyzKU+WOGgtI1cSAG0Ia98U93dqNdgkXruYs2"
+    "hbaq0bbne5iE9YgD6DYn0Lq71LeaRLWNyibIiv7N9YKz04PoUhSg/Ya1rVyvHsbf2r65sHAsKNZ1"
+    "q0fc0oOFwWuHDfTyaLz35tXhp4Nj08aQZjOTWXP9ojMIAiIpI0Cgw5kUjQLuWVNsa1GLAUViksH8"
+    "J3inO16QtFhDrhi4Qte0Vn6QKnDI6RN5C3Xx1iIV/CQh3AA9uAG78WbvXlKojV72estr5ESeXaIE"
+    "oZ1f72n/6ZC/ZqkoyhDPSmNQvozgRXw5jKJVQNo5cjbz0r786cO4GU81vgLd/Ywtc5XUBx2NeOzv"
+    "NAcCm1yLKjsPtSG8naHAMBPuvQG1W1DqZEdSTOYLhxHEor5yANBP0MoTRBn0TxmEcelQY3Gd5JdT"
+    "bpIhlLec2pKFWi0hypRSteQW40ZO1ebKKMkukfbKPEiLhO9bRPcZiOcpkEo8hXWtTmqJTcj9EWYP"
+    "WisYGV5N5OaTOwqmWgSMxlrzgJG7g/8+3wcFHprxTfXAgm4V3l8Y6dNWY6dNajz7vduTKmfuw8e6"
+    "xFiFGFgQoCVzt7MknY9ynYxXshdsbl2jNGA5wu6ZHllfpDS5KBTkjQ2ynFaM/TEkGoUYLZNEGWAP"
+    "lGcAolsyNFNUywrFBoxYM7x5EN81TCiQYpLBlLGkrCdB2740X8IDC0d8Y+il2giKX5v9mh3cyzB4"
+    "6ZaOxWMaBRKdG1gFLSYAUbTGtHEOQ5Zai/t7mgSgtBrcvQIzANvGzPNWD6cR5vVi+1tQr4iHF5jG"
+    "lkKrkc1K0LtAnP1PSa/ff7eO4h7PUKnSPz+UrdvW9Eb+a6nyJ4lD5ZOPqJokSiylDyyyA4m8LXKq"
+    "Jsn68ND1fq6Vusni2l0RIOqIkOVGNfuGNAefwcNLXLi1urcAZjeKqmRaau14sXLtiG6wBrhv8MhA"
+    "IACEuTpAzvvguGBXO+7bykPsGcmUurYi1zkIatv3uA0jY7nxtCxYfUsM9yYXRcEZhgbi0xl2E9ON"
+    "N2joyH6rwHAKqW5u30dxDov6/Bw5MlZHZWScNSq+XfN00fH46Mfx0WgHRBsdKOQDct1By2Z+cbGC"
+    "VggDawIXjjnpExlrzuNODJB/fLj/ZvxBRRkQ9vvfLuPwBaWNUsirn9XlQZIDYVdMkxj3VbX7HDsB"
+    "Cm2LZlk1NMzJ1Jc5mepLgxlMheP4hevwxfF4//DgVXPFgEml9EovLkSSgT2O63my0cmiRjFb4WsH"
+    "aJpO79ZWChdNbcoifdUONXaO+FFB+ZLWkbZgcaAXeBdtqxAsrsRR6hJHmP5Fd/cunuZZn57Ng/y8"
+    "QDko5y1O+Yy1FkyUN4aXHpPUvfTgMq0rjwkmUtTtuGUAn4hoTMp75WOn97jvNRSz+GqR4ebQRQET"
+    "jRIQmr6WMf8YIY0nSxP7qNq2FHKNTYpJdI/Yf+BpjTvpN2xJMdFp7YWFqlPR/37H2CkuaBUV4cEf"
+    "EMUTunC5kOZjpC2segd1O55HfzdLnnQrMDFwutStNHipMhV6SRzD4iXlBaC8pKyO4xY9YSTekkVP"
+    "15NKlfWpZflFnroeh/1I1cH3LPSByej3UJ71RAoia9IMuLdhP70nfcjYNuW5qrfj0u9rAycfcBrE"
+    "MY5VFKhdcRXOmBAnAagOQGY7JZ6unOxq8mTxxfoJb0m+YA1/ZcoJnGd30glyU9DmCC1Ma/ZN696D"
+    "OojUdDB/cy9rjM8n0nlvZq+5FCvVgRfhMRPKCuRoDlIxgDGthnrDmX4pkYYJBtGl3Tq/bVsSzQRj"
+    "yiPGCcgWMj0YXkYm9/M3TInW6ZCtRlIHy1XxAGSBxBQji10K7+REZnA6ORHyvHwIdlSHWYETMslk"
+    "4/wDD5IVA7BK4jxLB6cR4MtMoCQHLTNeUpUqF6McGGZ75NxygAq+kk5qazyS5GMlup9SgmDkoKRJ"
+    "hAGn3kyZTTfUEuATk0Z2wHrq1NJqrut0FoPyTq7NjJGUD5QTwtMIPEr3Rl/b7tSQ6eQQIW/hK1oQ"
+    "Mr1XV15nyeiTSz15ezXfQMLTPA/iFOG6GNIi43NR5l/EnzkB9YjzaVqTjEV5ai5kKsCLZtJqTKCJ"
+    "bz4/k1eDsqzQdzWppHOqxUJlyM4HMlE2PCOo9LzWrtLjLXkYCyebM252bk0qKy1DeW9m5W3Iwogc"
+    "PcZbo2vZPZVyZvA3JhsLmaxUZyHEObTl+5gT2vcpo7/v4wz4vkwnnQcx4O+YNv3RN+7R/MCM/39Q"
+    "SwMEFAAAAAgA7J5SXWf/uhvKIwAAt3oAABIAAABhY21ha2UvY21ha2VnZW4ucHnNfdty40aS6Lu+"
+    "ogaeOALVFNTd9szZka2ekdWy3etuSdtqz+yErEOCZFGEBQI0AOqyGkXM00bs68a+nA/Y/TB/yeat"
+    "ClW4SGrbG7GMsFsEqrKysrLyVpnFIAi+1pku4kqrg3fxpX6blFUZVTeVqhZxpYp1Vqr9YrZOslwV"
+    "epqstJrmy2WczUp1lcTqKMl+iKMgCDY25kW+VKPRfF2tCz0aqWS5yotKxVmWV3GV5Fm5sSHPFnG5"
+    "SJOJ+fpDmWfm77w0fxXa/FXelgx9FlfxNI3LUpcGvH00VPNEpzNuuIorHMA0OoGvdvB4uoSJRtN4"
+    "utAjmMwqSbWKSzXynoyW+UzmJB0m6ySdGYjhhoLPl/joJI2zIX3VNysgzIjpNJrnxajM18VU89sk"
+    "m6brmS5HZVUk2QW9pyFnI0DVjPto21UaV/B1WXcYeGjK8hhEy1WaVIKS126WlJcMU3mEETLMkmKo"
+    "rouk0qPJbQWYxFW+TKYeiEWeX5Y+RaZ5muppNcqLmS4AW2wyKhc6TUeGb3iG+eSHab66Ha3y0qDH"
+    "jVfAHLrZCBiqq40/89V04SNzcvDN6PWb90P75ZvD/deH8j2ezZCsU0BSqM3PAYrlgbi4uKqf5utq"
+    "ta7q79dFvFrpgh+UVVxU5eg6qRYjfLnQ8cy8WwOy+LCJcKHLFWwLYBUYrEFIHHpU6ZuK1n6mV9gG"
+    "/q2AurCXhh6142okr1cjZH0hH8DP0ytYQGRTXFHbkCfmY1Ne6qqmIH+Trqsi/wHHyeKlz0RVEU8t"
+    "/9AX2DSjg/2Dbw5HB8fvTt68PRydHrx/c/JhFyhUqL+pozzTao/+2djYmOm58rddOS2SVRUO1PYr"
+    "7LFLEwH5Mh577aLV7XisqhwlFG7e8Xh1Wy3yTO3g/HeqfKfdPNogYB+A43kvVwudqVkOpAcRpTKt"
+    "ZwCHZwbAAdjJXz98c3x0sv/hm0j9BRvzS5WYxYIeTA6C/C/JSoUAVOGreJLiONks1QMcSYFAWcMj"
+    "YF0YTuEyqHyukqpU+XW2S3+wuEDwuPMqnfEuyOAZTHU8/kLGp7m92mFalTtfoDx91TljoR79e5Hm"
+    "kzhVncvDUmfe/RIRwgXjxSD2ByLDKqJcDdtyMxoxl40GtgOAxj5RuZ7Pkxu1t6cCwDBQKKnoRVJS"
+    "n3BQD4Kfbnz2kDVC6ic8Hg7qsXRaah9KWUyhTyeiaY77dDSKLnQl4rp7Rsj77ozwg8oHkSmmkc6m"
+    "+UyHwbqab/9D0GiWXOiygoai96JyEb/83e9D7D6IFvqGG4SDs90Xvz/3Maclhq5N4Qw7ZEcFwgEB"
+    "/C2DwMMmHwQeRFgJ5HbuWZOdVgJftGV+yG2HNN3G+pCYiZNSq+PTw6LIi3AO42cWkLrjzvcNkjy0"
+    "rtxjICIMrImsh2dZfox+DFe7xIogXqC/LzpKwywDYBXQnbC8wfffB0MV7ATeEJvBpnqmStsKvg/V"
+    "JjTdHMBz+GaG44WYgLADEYmSdL3UWRWWu+3BYed9ye2UaadCsrPUT//2n58O1E9//w8UBkV8Dbsb"
+    "ZJyaLmLoUOmiVGGhf1wnBYqYvIDXMPl3+0evodEz+Pbnw/df7n94844FFcP8LLoZRGa3V4aavRNH"
+    "sBmYGjB8dqHD33/mrK0GboA9eh7AYGGwF6gtlSEd4Im7p7UwDQCpfMaY6AsEcNYCcOazo1Afmz8D"
+    "nJ8hyI2aq/4cp2vNjGX4Sii//eM6B/5iA4nmwkQQMsEcZb1Yk+aybmKFhPh0V6Vg7p4BiPMOfVPT"
+    "e8enN3aFnpmGJUdt5iEEWiW/BE0BhgE31KnGdbfrQh2BNEAZi+u5XY8YSUm4WSpRhwhNDUB7HuCj"
+    "u14mhAWPB4N7n7WD77Mg+iFPspBgWcog7VYj0fQs+8h8GKFOs+KPDa8QWAi0VG3xquly1s3y7/Uy"
+    "v9JAs+03yJ1z0n5iXYDkAkMiL25FbypjgItzwcspmvrw9OTTl6jaxeRFvwQglrpChS89i2gK5iFY"
+    "KFNdlnkRzdP4ooRWaIkRDnek7COeX4Tzuzea8QP6OKTLQMPNkvkcbFbYorgQ+koDkvomXq7AxgbN"
+    "DApaXYPu1suJns1gnWGh2CSHORR65youkjirdtCvQdjkGYF5gpYdyla2NXGehDd5ROqajAq1tZXp"
+    "660tQ6TxmFDewVnAiBfioc0QKTYJwNRZXyyYsCAxyHCJcuRNGOmrf/rySF3DVNQ6A3kCe3sWqVMG"
+    "/eE7sDKqJE3Z3EEAhQajgBfrc+FQ4KvidgenJSYJUCeXjU6mMnUEs7bYxJWIwDtEa6zQmoUKrBXA"
+    "NH5jGt+C6Vz6xoioIWCiiNjQVfzCtvCObW20aJ29ipuHd0xV3Po2id0nJPKBTcWqRY3pmAodEnEg"
+    "HtxUg7oVXebCLssnjJiXkRglcYp/NFH4JSNPyhVMnCGyownLCkZLGLT4OxgoWIUgGBjS9mkAWAQA"
+    "2zMheBMVDKBG87FWKOEN9FJrkBiwW82qwZ8hv1pnyY+dK4rss8KtxYvu2Y9sLBp9Q9B9WwmeRODW"
+    "ga73nuNgBl15BfwIYyLzPaAbCQ/C1IKTTY7y+241VN7U71utGJk+8ji7YAXm46xEiUWt/Gn50JoQ"
+    "CNErxNS083t/Qls7AOYLRDyQVKV9G3QKR2wXki4DwVXk4MHQbie1Nog84Dj4jzh2ON+EQe5WV/do"
+    "Nc0B8CZ+2QSSzjdxGPtmk79sNmdZrwr8367Kj7AkqmE6cqsCHNb1JCzmQfjHL37z/ekA4MIzXU5j"
+    "VFZXg/vwj/g4IAhD7OXrRCUqEYejIAm6EKIYWxGctvYrc1/vgaeOHJ4bUrKjE6U5COLQ7jZqhb7P"
+    "NKinf6lv0VTiQaNplOM6gAmYsaTUqXREOkPPKU4JlN6K/725cUnZgLVaPQKtJCCn/SBO2wBc78pQ"
+    "MzBhK+jaIaJMPAtHq2VPWIsU7JJPKMhgXRxUyrg7KFZgWiIHA5UvEzRQAU1QVkHzJUX+Gn2dCTKW"
+    "TwvHhR7reTMbtl+x5kxM+Mp8GKWO9jaWx9EiQEUvnb6DesUeJZBHGFpbVN9Ib5ELwcdQoBlk9NUO"
+    "4wXSE4D0xTwba2uJhuw1rPcJ/SnzQukzRKw26sl/9NR/AzzBCpeDC50GBqP+8fYvGb2eGEEbRYQG"
+    "Rv1gAVc885bAQOzIXh6qyYz9VVAgtyN9o+XxNC7RkndNnQ0SMgTlFEBL/Mxa2gdiPKN8Ho/F3ooW"
+    "aDdybBJttJma3JLdB5b4FmKxBTSucgo4ge12MV3Y0NhpvLSWOBJPTHhEB4NssWvwglcknKV4cTj0"
+    "xdTchmE0KlwwpyVSKVHp0hisgBTb2GL0ip/AEWkQ7WhNUlRiyKY8vcyzCg30EjwIYB14xIYGot0I"
+    "ENY0wNAah/oWdGzhjYpQE8QymZIVzOTAYWWVt+kI5OuDA3D10ltjsPN+xX2GVJTorLLG9ptMLatk"
+    "STE/TZ0JCjs/6S2BDjsQztfpjMfBh0Amwk/mASqbgA6GYJTg6ORhbLrD6+mlb2XjUUlRibBhG7Ql"
+    "GQ2r7LlB7dDtwszLfA/0kZYcDg+lg8gE5o+9Jwp0lkOhK5d+iUQSgcE9vHDgE3XSkwRbQ55169qh"
+    "IesQKUZSzQo0IdL/pHSiyMOed/gT2pdidPpRBpFndmnohAA22nqCpwolWVwPnSaEE6AF/sFjmJMI"
+    "6DeZYVAykgAmAsNw5Ty4k+OZ+9Edstd9dAeUijDMeh/NAgul0CkahdazYsfKwEdh2uveIJcKJZqn"
+    "OiHPzy6SGaleHmIbdOrMUINaIxm4rbh4k4rQ2FoqpI8dX0uAgPOMezR8AYhvv95///q7N0fHo4Pj"
+    "94ejL7978/a1CeWUK7MQ9aI86z8BCg38BtvVCHyi3ibmLGFmnH6R5aCDwHEHymyLnCSYKO9eH54c"
+    "Hr0+rf0AB7EzDlWS/WEfC7eNknJEYiukQ4PZgFbuvEZOdF+LPgjXt5xIZw57zo2GasvAGtLyAVMN"
+    "+C8jqZDQ28AnW2YIC/7cVe1W69byCbUY6Iq9ebAycRyt7uqTxXsVMi+D22E7sZzcQzHgAUJltHdm"
+    "cDivX7LmhHeWO7dKOmsK74R2bTLfk2G1N/px4AD6RO2nZd6jPlV4vUhgZWFb49eSWhhVkpOSS6rB"
+    "rquBHMBzEM+6WIGUrgDsFcarG0YBq8iS1NmQWAAhnb7+1r6Z6EXCzuUyciePGOzJhhyKXBYbK02y"
+    "S1zySZLpERjLqBV0aITxLmjYKRlOtODtoO57FmEYUr00dg6esarQxKrwqFYdn26XK3g7T6YopXcw"
+    "pLVeTvBAG6lccpBdJJSJo3YeADjsVBpBj+xesnjxoMyToqzCLRygBxKu+iWuOrXxgwRWY4Selrsk"
+    "5eY70DD+Vdv5FjSvmngbHIu87BkjAOMGDZMoF1064B6feIScr9NUiXpUoY4uImU9XllRoz2jZTzN"
+    "yxsruWBoJwSDWDCt5kEvhDvoc+8HWhpzbs23EzAo9V8AeqMBtxffwLcjmm8tJdoK+8rQ+shw6LyI"
+    "L1BKARf1kgeUTfRyqH76+3+pMF9hKDpOweqE9QLBNk9ujEVFjGl4P+R3Pcy5wvyHzpieYd2kPmuC"
+    "8b3jJgLQw15gKfDAYCEk90E3Q1MUrc3Uk0LHl/4oiGYjGuhyuwkLUbsBn1vDX/5+bfIk7QxLpo9j"
+    "y7KTdzjm68Pt5x7LH2Vb7Bj+2M9ugUrZNibQGNmHoR7K80opkydFe4COZBD6DklJGYKAgEIwK1yt"
+    "V6muJW0jggtSh0KSorbsciYY30AdjboqjZeTWawur3bhv7Pn5258ghf0StFhQkXa+2rQtpTxg0ot"
+    "ydZ1hOgS7cVLL/ImMANKWApIgqaPQBEULtOIM3s4OCsr0AxedvUOhIyBCVgDXhiVN2tWP34EFlLd"
+    "MCzKc58YtVVKq+P3QvqHDq1h794gpZtMgo3h+dmL8w3XAkJ23xi9fXP07ej4PZg3GPU2wZVd9XzI"
+    "0bdd9cKJMu2ql/eirT1l7cR4ymY0lYQJsRXaN+dWXYMZvU1WhQQY2AiV1DJiNDQpiE3xYFOFYqwS"
+    "NInE4RfBbSBRDtH129M0YX1fLRIBiwsyHvfts/GYwuZ3MhfK2rpvZtnAS7KFwfBCDPHgMGP30xyl"
+    "4T51olXkF5zbvq1FK/Nd5SwCyUTpP1R/+MPAi0ed+eE0BwWEfW7sKHFuZX7t6HYOhC1wzcx+p4Xx"
+    "hX4F1hfKp26brMM9ly2F/foCyEI8K4VHP4Y5W7s8B4uWnNK42X9FDiZqldSJdDJJgxIv/rS6gQHQ"
+    "TuyMaVY3Z4G7vAFKNhzQi0bGxXSRXLE77vjt2Nm8Im+MDuPOTQZKs+egvyd1anUg59hd7cYMQyTt"
+    "EKENGgstiZTthQY+69DnsrTtoAkFb50I/mPr+TMW6MGpdawbTnV0/OU/Hhyf/HV08nb/zRGfDnkB"
+    "/CL4f7ypv4+EFN9H4R9PvsCA+6vo2eB7s8V/C/YFdH7z9RE44Af7p4cbgxr68ekvAc2PwQB4xebt"
+    "32DjrG/+dg37OL8uB78NTNKmMzrmaMpKmlxYhDtCGTGCxQjxW72ArJXBJ2OtbAXpCdhPINzo5G+7"
+    "rG5TDJeiXZNQXnYEW3c8Bn9sjsJ2PKavQ4kAL/SN+07rFZ4P7v/5fZ1qBG4gqgbLA4EPmnRF/XKS"
+    "5xVn3cnL3zkvYTRUIW57GBEfua2432fS6t7aSkgNT/ELM4HlmrDcHKoXz58/x4BAi7DoVI0mTOCH"
+    "XUr/kaXyu3hlMpYJE/XTv/67Eq6/JVsrtLpF2kXCJsY+/KJ2pV5RDktW1mRmD6zf92qd+ruUkIk1"
+    "54Prdv9r220fZa4tUYfUOwx8P1Dh4aVnuC2JF5fRRZGvVzBnnKyZHcbWPGPcme2Z7YLfggFO9/J/"
+    "z2xJWnVOGOEuHwFFLLanGlP0XAtsIWamWf9OMuH/atqYlDx+KdvEJPSb3SJxcdw0D28W6xDafbKP"
+    "2Udg2oFoh33R2hJbtblFgQ4Mzs7WKz4yQoyGNB/K4Cas7AYRjJHED25qSU/BZaYze1p+aSRxtE5p"
+    "61talnjnbGURKyFMY2VRXwrWt4kWdivens0AQ+Pe7macBl4NfuDtY71XFnlJNmc7irDiACVjamPj"
+    "jidfH1gSspJp6x1EfqnLalvP51TBQ+CUNT/X2WWWX2fthfZlH6w2mjdlvZozOjyo07bsxk2GnCep"
+    "wTWmzDjC2N+ZMR+Cb+cBhXsZqYDTnBP1TL1QX6hUZ82e+FmZzHZ8d0aNz/2Ag1UrZBFiEnU8ASTX"
+    "FSZSE61DOvVYUcJXE31CrcBjyFLPOlAntAbq1Z56SejGngu6LZOIwVszmzt4/uLlp5/97vf/9x/+"
+    "EDwiNerJ1VPijJqfMRv8gBgWAxdTbLrcbnjk5DdFOp2zqmo8n5ZXj/rVXvqdoI5nQnGFNnKVA6JO"
+    "HQCn1NUpxH7XjslSgpmk7vRGSGHIR51/SiryMoAk34bYMYqfEkDAta3hPNK+gZt7DsV7vnPL2xxF"
+    "P7XJ2JR8oNfMkj6xTg+66JTlOh4ff/fh5LsPsIfttsfEDGMNmbCJu7PJirdniQ3GQknQnUnE+Wpu"
+    "QRIzU2+9UiMRpU7GpOeiCtIu4xE1aEpHd2SVNmlN4OANO9qAAu+SeXDHZ5jYqQmIbNlOQNocmLYB"
+    "YacmILKAOwHBmz5A2KkJqGmqN2H6EBqtqfHFWpclHfo/Ra/QsZ/BwXR18gJaCEibjV6c7nDh7q1u"
+    "4/oVKhME2ziD1bRMZrJusJ/JuZGDuAeZ/BTrF1V4cnz65p+J2SaoeVX4F3HdpJjmc+J5iq+adBfM"
+    "q8DQ1BC2SKkrta2lnACT8FAkpaAG0vE4ctKi8zJi9ofVwYCaJQiMihrRzIZoYI7VKbI5MuscV3VO"
+    "XF1v8Cc9XeQqn89RBgE2aT6N08CP0U8prd0QxZM5Xh3CdND/LvAmB5pW3ySV2pmoF455WnHCZPB9"
+    "0ShOwARXetiUhSFMq1GvhE8KHc+oUDKkEqwku9iTIqwhY1HuBZIfEJCzgG0b4hfhMN8QIPwfdG6A"
+    "a0VNoRdLj8XTlqVcSGWOmbqZ+FnwyW92YD/tQAteGmAUPKA2C3HOVMm81PmwXDTIUS5+MTUAxBMJ"
+    "QalNe9gBrJMqRAcIK+W0hyI1+j/qef7ixQt/lOkC3vH7v8l7d4uXC698B0hia2CX87pC1rVS6aHJ"
+    "f5CtTs+2+J/lfORYCruuHSsFqcONHo/lK6zdwGy4d19h8IMydzjgOeOnOOR4PMBQK2Z7EQn9E3VO"
+    "2arq2tNCa4lHf4Xqi5Litjn7TeJLpQqblSWY3uDPYwuFp1NgI7UjyInjsUTz4K0tP0tKqjchDWHA"
+    "YHEpHQPZ6hysRcmpY13GYkqtTMEswaZqGIDopIoYe4pNAckykNQ2jN9eY10Xp8px/QnC5hw8cAcl"
+    "qs8bC8Wg5KdIfQvn32UEyFTncBA/dgp46gKagR+cR/YA/DACLIzSMDzQW/Lo26Ob8hy3sN+0wzhu"
+    "2auzVU8yE2A1JLC92UxE7odNWoJucpYAokkgdjO2u9uwC4CcHzpJQ/DoOf0Fi4iLJD4TGvo1wAr0"
+    "HWXtnyW1LgE60nMQc7A9gpbl7bpgPjjzIYDke+FqrXwA6hk4R49a0ICB7zoBJiwpcVh4C06W+rTl"
+    "UMA8lOAN43cN/eKRoes2jl0u8oxyOEflZbLyy4x7SwwmeZ5aSfShWHONlScwPnwHBozAwYSagqrD"
+    "2gmmYam12p2vs+nueORlZ2LOFIoMJ9ro2JQflXheh2k5A73+bs4InUd4gNjI8enCq/PEsCsQceCl"
+    "OHHhrH/TxzbQDOsDw/H4CzxdeLUjuhrNVmy5Q+/NYeF4jPCxfZ3Ra2nt5ASTCLbl+5m+JmkfZ5Kb"
+    "jcJrQC0F6v7Bu/1vDzGic3jwQcqb3x2/PtyjYbBukrWFHH3KRR2YxD1vFdL1rtHDyYmiwUEa6ewq"
+    "KfKMPaw+zFAWSQZZT4wZhSfBhN1D02i7E3bwh9gL3QxcRKplL4POclXRcnpVcm4ubQes3OhJvy/z"
+    "oU2WayXYtzX+6yJfyXkza+4t31/d4qMt4/5KViQsGxnRnSmVwlAHnj7jmz9SVMK1hUAFnN7CU8Cn"
+    "sMWe8bTIy1JUvpbKyvdym4jArMF1WQaSgWWe5asKywbQTSEbC77jHmBvHTMdda+GL/nM3FIgUvu2"
+    "nlUU9E9///+YHrhK2CbKKN2EYFPGCbQFGOAqlmiIEEmp4JYT9fF42SHmh++QsTkvn+ph3U21jG8n"
+    "mBI9B0288AQJlQ0TVSRJ3506nm/dVlKnawaSLEVZtbfy1JzhL9dlRSKQkzUxYVIqH/JrtAqZMsQM"
+    "eYFGFbg2mPF4m1PGY16KhVOtJ+XnpgTXRWjH1BgwviUtPxYwpBwIF4GQXcVpMqNi4o8TCxQzcbIQ"
+    "KJOjuVvNhnli1MbmINQB8UfSgEuTBmwC0+btyvjqaBI5wedaGfqVuDUmXjiQDCo2gthyCmvTaWiK"
+    "bduVx1/FaemJKVS79kh9mVhnJGz4G50Bs7YCB2Kw5CgXZBeDAYuJ1V+9eXsoBnBSWh0TUpwfOOBi"
+    "OlVglCiwaEBQ15r6B7we5OHrgkIvExxMm3evbQLSD8T28Mx59ABFuP9XT2rr2ZqN61oeuY5jRtW3"
+    "PwDR/2Sv+Nqg/9eJ2Zaox8DPU9iRIJFN5MW/duCiiFcLdKf4yiwlWRVDki5DE6cccvAGTMblyuj/"
+    "A3PbGcqbJHM8OOssRWpLUrbJGYtTdMJv6YBimZQl1vnTORVX129V+Xq64JY8lFqvZlTeH88r1DTG"
+    "6wcfbD2daj2rdzb9IVnoFMEyxjtIT2ZB28KJall2PDdOkK5fUmaPeY5c03VTE204xLvLbWZJRoKx"
+    "97Vbe+EmiTYvhOpe7K9x+erDJrz0IpttZ3pdFSA4eTl4iXM8+dmlrrtjq/7HnyvH8vUsCOo2rhO6"
+    "G8FCkdK10WCZD30EunEOmHser1PYeTGxwx62s+mz+Mal9CO9RMbwtWnIHE5JIX03gqZjEYcShzRN"
+    "PD7xCwnrjHjgamL6Le67NWQNzSwJT3HMLRUSA3OggZpPdHWtoR2LMT0DDTV4UhDTlHQE0+WMtj2W"
+    "Mzu3/px3uKy2Tx0ka/V4vGhD/m0VZtAUu0oz+soyzG439Hba0B5xIZoVbfNcp0vTwe2HZAUxjyMv"
+    "UBkn9t2ybkg55OKLbqlG4r0WbOVHHMPwntpz0KqD6XuT+hydqn+ocUTfZMsX5FRJNmRPWmJfZuRe"
+    "IzPSZv5RmOKhxFKpPuAyIdE/bGzcgqdzo6drupvNOcs0tYvkakr2QLcLWrfEAiPiSfInhSOl6eDc"
+    "lDQ1fWU6TT2TLFtTMFy6eROefJHUHGPLdVRwsmeQ3YbmjsHQllYPeqjsmDuUBdMqGCdaN08oifX2"
+    "nCrnla1qRhNu6JRlMXFaKfoEoTOa5o7h3KeiG/d4eDQ7w5E5tVKvmJ7d023VVXZXdFK4xQ0e9d5O"
+    "w7zdCPk8WHDpQPSLLntB/YLKS/xwjIldhL1HQk7+xGUe/VH3BpZ5VFdi+tFQkA8UEHBQIe73bnNw"
+    "zlQ+tr7Rn7HT/alxglUrLtAGN+LkoDpLCDdqhK4/JT7Zjl6u2Gq3/8Y5Pz+rKet2WyR+YnUoMxLf"
+    "h2WqJr3KxpUt2+ZNRpEeGrMTEUkYEkngQnEDKMagOfPivo0rM6aLzns8aILZTHXIrVabsC0pmgi3"
+    "w8dFz5WsONASjy0KLHmQ2csDKfrtxqT+1hAGn8DMKjk3JSPXmBARXmwMWhoY7WKm5Po6dA7wkGjT"
+    "vX2huey4fK37aeX8vL9KX6jSqI4yi4YLBX9HbPbUS9ZfZO3t7gfqrGXhna3eZuRWGS+hxjqj9byn"
+    "tLfVri717dAltNKOddDRXxrJarffU51we9T6WmDzqanp6TCvTYdpaudr64ptUbGs5f0u/SmXCtE5"
+    "cgdGxpL1r1LpHKbTtDUfa+K23tDU7KUtna+36n3U08BwYs9rUxnerm4WMdyxQt2TcCuI6VZbL2bj"
+    "sTWpEXv5aae26uAbIsPeAwRx/d09TzIP+4QKGzFuvUdXDYgxCL12fCAt5rbrNxkwD1xjZFSBXKZI"
+    "JSt1jYf5PHuwU1xE4s7Frrpwbin7+DoQmQDb8M1qEJnZ0MeqPpXgfzeDzZZlc8Ywsd52asx2ryjn"
+    "HOZ6RumMTuGRJe6vtNED119TgIACbAb9O9vF8BfsazFi7GyebrY8wrXskbF93VFbNmxVbok5bPp1"
+    "3QFp88tr68tD4rKuh/e4gC7dMOdS3dWbHRy6wJsMmhslOMq9uwLmdBteCLjyTZ6dVYJn0Rd5+eoc"
+    "COfDslcIRC92opc//f2/hqq/5JurbzjNQVptSZMtU0QvVxF0GdPNu3M9TObBHc72Xn1LedkGPMHD"
+    "gwyKPpv7dlRY0hnOYLcxH4DirNHZ7mfPz39T3N9twsQ2TRaz0wCP2j97zkJ1c/O+iTUxQpcTZTik"
+    "0YxjHCN0FZ7mINmeDqCCrtSsAT3kbjT663TuiWjznWU437pk2zTtX4IlJhmlXHTsjqfIdwvHiKF2"
+    "dWHdRN9U2KSlYw0lnGBOS6r1SDQrzRBGQ3iJ4DI0GLY6ssCyZG1IrYbEstOw15w0b8kzUR8gEsdN"
+    "61OZjnA0NgOmwgV4wi9W9N5l9/DvU3QVmNZ3CAkGzhmWh3rr4iR5VWgZtN5B/ZqoO47sfvxB25rj"
+    "zCxgh1bpSrXFC7EcHId2nl3WtUgeSpI0VSEqlFLDZlVQUzu2dJCTdsx7tttLRcav5RJVFT9Q2uQv"
+    "YSuW1FFeO3Sg/+8IKElN1IPlSF0414GonxODYuH6qFxtdGI0OBvt4ZKFodSC9QEYFYS1+dqRnGeR"
+    "QOawfI7mX0tI9kV/JPCDdVxeDKSxl3ujnhYFeyOJ17HGtXWX8h3+7MGgvqfYQqqvIaaT5PyyfaM8"
+    "fmwdEKbB+fwT093/P7McCD+trEcDtrdUBz+P5DYSjCZrC7kFtuBCFaEOH7ThfKK4XgUXBmUE3+ZO"
+    "W47zYi50NtLl6tOXWPAAtC1hWEqyGHwuN6F3wJQUGDShkgoDUHLGj3knzXJrPOxpFmBHHzdfP/cb"
+    "2AGfDvqvx8aPvSLbNG9H2FssSe1+rfiGkfJctKFCx4a8f8D/qZfzl3s/9Y8ktW0J/HR5By3dYihQ"
+    "I2YMEPw9q6dYINju1zRBun9H62EbxODgGCE++n1WCLT6dc0Qf9j2GrKZ3FwFKsb5WSaKM4FhTYen"
+    "GimR0x+8d0rb+Gh7xSzAY3qCz1UlXYCCuH4vc2KOp+4tE6gXSqtpDeUpyquNlNep6xS/1cWuGzUx"
+    "5V7YSg7NefGS+Uhy9kI300pSUesiaq9k6y/040Nb0mhLrbMUE/Co7mHLpugs8hQvBL6J8VZeTsuT"
+    "TMDwUlPWWmUu3a1PzdN8QnuWIHf+7pP5sauO37RqqUbTlgp3aGxWYDhMbwmq9TSJyj2/HIEf++sR"
+    "NIbz004hwvcSrgimS/fmaUZIS7PrJAO0yW5/lcU/A5G82MqtbcE0BoK4xRdHm2CimJ3mwkiOxZqr"
+    "O+0qAOnpdif3VOHOm3pg87MCDmwx/1n7tbHXA7p2h1uijOo+FAhMHU1JTfUqcgO9jbZSc+7A5CcO"
+    "TN9Y4xPyrJVJIXzioNVOwG/i0go6eLustbMau9StZgs6lxTEJv4TzdbLVRnKcuDNDFjIs/fSK1jD"
+    "JJg/8a8DgqXocBiqlK4fFkJNgxK/7NWhfTu+8SOmdNF5V8qek6rUHK6dON9q0UybQSr5IzP0ZkdJ"
+    "bI+Wl5RQQl/KPUwJHWKRJIj1/JK+ioow+Tc92UOSnz2zyTcWIRP70c0bGe2cAsZtmWTJcr0cmd8a"
+    "C/98+P70zfGR+jR6+dxVYYHUVIfGEODEyqPjo0OvGf7GCxcQHP7zyfH7D/Y32+S3rk7V8ZHbYU49"
+    "pOaAjrTxTmhyb8BB8GzCQP6u/fiODeNFx9zfzfqEbE7aJLiB3VsY/epVPHjlZFL7Y2F9bfHXuMST"
+    "QITdPX7f+I0W3pOZ3ai9BbYSp3vgZ8sG/Hsl1DxsZBQgdEpC6/c5vRm0NMy8/lky9du7O14XeXB/"
+    "r7YPOcft4Z8gq9HA3yLrMYN8qivrPmHRlXsBnOeHI2Cx5ztmbootnzb3OQ9KWdd2+QTEoJc/sNdf"
+    "jt9/++boa+TUw4MPx+//avm1l6uUMr8g19tk0PsmGGy0HtbbwmFYTg1v7NH9t29r4tpuPpHdUIJn"
+    "qA3cDgMjzztRpKcP2Q6evdFSQU1hOWz9bp3olMHGfwNQSwMEFAAAAAgA5WqtXFLRZzEEBAAA5wcA"
+    "ABEAAABhY21ha2UvY29tbWFuZC5weY1UYW/bNhD9rl9xUAdESmMlGfZlHlzMs5M2GJJmTYsN81ya"
+    "Fs8REYrUSCqJN+y/70jJsZJgwPxFFnn3dPfeu0vT9KZR0sPUilZqAxZL2SCUpq65FqCkRgdSewPc"
+    "3t7Tu/OuSNM0STbW1MDYpvWtRcZA1o2xHrjWxnMvjXZJ0p9Z3P1zlcLHJHkDq1X8W7jw9dUKnLey"
+    "cfBnazx9sHUowGi1hY2xcGtN20h9ewTOxNTRfPpp/uXi6iM7/+Wnq0l6j1oYO+a2rMZrw61ICXGN"
+    "1ARhvQp/Fb1aFQT7fjYDjSgc+AqpUY+WK8oOWGXFLS/pJHBB99x3dKDCGrWPVfLYg76FmpfWFAmb"
+    "s5vPny6u3rP52fnF1RlMiIeCamqkwswejObZYjr6nY/+Ohl9z5Zv80maLb6my8M8PcgTdv3hRUL6"
+    "lbHp7HL68xkhZ3+Itzlj36R5kiQCN8AigcyiaLXg2jPTUrlMmHatkHW0Zm4casxh9C48xwnQj7S8"
+    "CalEN5I8qNQT36D4Fi1EoQ9DvyeH8FChjgSRJ9BK6rviDsg4kagiiZhfgnyBk9klv0P4DjIKiDUI"
+    "wEcsW8+pqkjhSQ7BZyF4tSp5WSHrOybaw8ciIF3VoqDU6BRJNTbcuShu+qN1DX165PyWML25Q+2K"
+    "4K/gLNb5mdLaEH798ebitx4x+i/gGSrf1qR17/2G+8pRcVSgssjFFlrdFf8DdS4dxdVcahcU5xv0"
+    "W7KNL3ZkxqfcgEKduRzeTeDb2KFbnCxhMoGD9KB/H53uDjolYqLWxPiEbk/HdL8/38REGq1gwBi1"
+    "Two/izSG/U0yOHC9P4ZsZETm3glhpBf0stz7IW4Erkmrhkol0bq8gpgh0fXO6Pu1kEViwbYKXd6b"
+    "YB6tN+plD1N4Nb08o2HlqsUwVBvLb8P0dFzfYUPfdOAI+UlHeJC+CnaLiP1yaCw6tPcEmgU+Sto0"
+    "bU1vITn698FYAQKVrMMQh4KG2jSKl1gZJehqvO+eSF8su8ojX5VEJbJ6HGbwkvuyilHPZ+clXMGb"
+    "hpZLVhdxhLKTPE9eCLRJB1P8dzDJEIDg4fQfxtKukK4Iam0CL7dJ4dp11t0fAenZfegNTNUD3/ZG"
+    "7/QY73b7cdhwnZJxw3ZB/dx03Bbwq6Tl+OB6tGdbOiuK4gga4+Tj5Jwrh3mYnnATl+xFOhsfX25J"
+    "97KNsh5TfNA52KTHk5rUl2IoPY2CsIZWf2ksHt9zK2l7HSu5ttxuKaFUrehnstOx4ZbyJjCsbEfU"
+    "rrzPtsWOEVqDr0QO52HhNGGWItxezjpwff2hqIPkWZMPJ7B+PnIEvRN8qOGC+n1ywGmeL/cYSKT9"
+    "N0a+Wx2h5mQQETfH/9vwXXQ+3AB0lPwLUEsDBBQAAAAIAOVqrVxMvNJCjAIAAF4HAAAQAAAAYWNt"
+    "YWtlL2NvbmZpZy5webVUXWvbMBR9968QerKhddnDXjoyapo+BEJTkpY9OqqtNKKyZPTRNGPst+9K"
+    "tpTEc6BlzA+JLZ177ue5GONC1ZYJeanNnlNUM0UrI9UeKaolt4ZJgVLC2YugNdoxs0W9AbqdzxAV"
+    "b+iNKJ3lGOMk2SjZoLLcWGMVLUvEmlYqg4gQ0hBHpZOkP5M6vLWcmI1UTWddE0MqTrSmOpjHow7R"
+    "ErPl7DncPsBnkiQ13aASfojlpnQWJaSSZujyu0dcJwgevdeGNmgSfebdSZr5a7aJiAnCU6J2TODO"
+    "0j2KQlrC0+Vb2VBgv0J4zp4VUXvs3vvSfPmKR/h+MFHLnT4i5LIiHKKROodCMiVF/kJNiueL22Je"
+    "PDxMi8cCZxEOdN7iQDCIKvXX2Ugk58Mv2nYK1fLhz535WCLjpjk5oAYNsJqqsQbAlKxeqam2z1K+"
+    "oh59jeZM2HdkXc/X699Xvff1+htqSLVYXfWlcwgPmMrKNlQYfYD6AfxfPY7+jovzsR5/mvBMmwIk"
+    "SW6iHlLQw08qJo/K0izxR0GdzlzHmi+dlt9AwEG7jgJkWbuKKpTq2JMsbgBGdSdqxxEEdd3JzR2F"
+    "FvdH/uymVbKlyuw7I5iIllSv5IVqPwya8s1gII4ydrd5cORyDrb4HLkPgXv9sY+7CIE7F9E4+PBF"
+    "bKjZyjq6cVunBIGmka7i+iJ+nNYG/UL3UlCYP/d3QJ2Wawzlw/67fd5FDcjg53gfwAXTnmOwFMhu"
+    "ZK8Uy+nT7H5RTmfLu9vHxXJ2tyoHOyZ68/sEaLKcvrcwKS5+GEXw6bgpByWOrNtDuo4j5Hwcsf3n"
+    "iJ9Wd8tBxPazER/203BEoLVpyGdS1ydcuep0lGYXMbeJPYfJkj9QSwMEFAAAAAgASZxSXbObJ+wP"
+    "BwAA1xUAABMAAABhY21ha2UvZGlzY292ZXJ5LnB5tVjbbttGEH3XV2z5RLoSlTQPRQ1LQAIkaIDE"
+    "SRMXBeoYFEWuLEIUSeyu7KiOgX5Ev7Bf0jOzvCxlSUkaxC8yydmzZ2Znzs6u53mvyiQ2UmSFNnGe"
+    "y1RUeWwWpVqLKk5W8bXUIi5SYcoyT5YxzELP8waDhSrXIooWG7NRMopEtq5KZWBalCY2WVnowaB+"
+    "p6S1rmKzzLN5Y/oWjzVOnKzjlQyrWGkZmY+mMdFyfSNVtJLbwWCQyoVYZEUagZ/UJmp4RjDRmDBK"
+    "M+UvbyOgyMKcMn4gRlP+R3wS52UhTwcCf3DgbZashFlKUchbgImTzv+kVPJEbIpUKjGbtYCz2VDA"
+    "NxGreWZUrLZCZ/M8K651OGDUpyrdZEUplrFKbzFEGCURvHJhZEFBTSTg4D/GZlKPCW82o7Da/6VJ"
+    "QrCB86ZkPOu8qL0TizIHIy18GV6HGPkkfBT+PJsFoXiPUIGHAH2BGMjElGBXxGvMfltu8pThsgKO"
+    "0cd8Kyry3iEzm4nyht2tUUPxpoBdgwYTBCs2iE1hkAMMOJs1KxBiyQBBPsNAZ+CJON7EeeZkkypL"
+    "g1DV8beUFhzRNsRhpnkRA7tM9Kck8qvgtWuGdGssxsJzOXgBISyyXO6B6GZRUpf5DWzYJEF2Zyml"
+    "1KnIM20uKV2uxERcXvF3gIsK0XNpGql2eIJX1dLngvGrL6PX5xDGVSWL1K8CN0IOx4ORcTA0EsJH"
+    "0UzyeD1PY1GdOpXkVyGlRjAEAuWWnFyojbTT1Zgd1OWjKydctgbr567+aGV9Ht8oBoXBFuCQ39/A"
+    "pRJvtFH2RaySpfN4Yn/0CkWw7AbXRYu1oB9rs9Fw46BFW+9tob+zbLs8tHUk/KaugBXwIr/47dl5"
+    "w5T41WX9XtKDKBWPqot8pM02lyKHduZcOgpJr7GqPOQx1eeZ9WY6bvRgfGbBp+MzQpzSM1OYonb+"
+    "/fsfQZIXzwE7FpVUIzue5Ugz7E8O7LwsV18BTVEbdRLXjGPYJwzbLN20w+rQ94M+K2EgXscFxql2"
+    "7XsVbiAdaV1XWO26rPgTpZJR22gea7kr20ORx3OZc4bsl/B6kk4KMs1y3umfq1caHlqvxuQK+Der"
+    "nyyzPAVA2DD+Ql3aV4Gtw00RL7w79uP+9K7FuveC1pgkd/IVe1qwW/wEALL8o5kzV4PMtbS0GhHp"
+    "Kss17NzRKxDpjEL5sYIGUNb4wY5ecp3Dul07jIXQNcni4cGGGv9QsIfCs8BtPjkRINncz8jxsmrd"
+    "aIp//5BNClqNyVe5gJGfcYFwvtWBioLsSuQxjj1+1cql1CNa82tgvXbfOECrT2mtrzGP335deGhg"
+    "HKlU4s5OixSmme6FnyxlsoKG7CwqODgovXANW6fRrFxYRbjjQvlB3dtR9fYTZ0jcF9ggz0vzokQL"
+    "9lypUvlg2Ww+pCQRNU1RrWa21zy+/bA9bXoPt5zeJnZkT+k6g3ZnednKKeE3ioIuoqExPhnb9u6M"
+    "fqx+Trk3KCtija2jDXXXCbZKtKAA7O9JaHndPHqoT7R0dcKgdekbP+xeakzKFjvogOLRH0lqVmxk"
+    "74Ohopw4KcreUH62sd83mdlP/uhU1jN2yxxxp54FlkcmaMPcKDaZt3XYlZKbJPvLynYCkx3T44EA"
+    "Mg87QNBxtDb7zp7a79/aPDLKTqvIvtPx77vX6b6z3rk94rmCwWdRjnA7Z1t3ZAfQo0qz68Wwwxn2"
+    "uU56T67Y2XAROLpsWkGe2Nm7B9G7388vXr5+Hl28efPqffTuOWgpGSbluqJDhPLUBgWylh9CzrIP"
+    "oX/5dPRnPPrr0eiXKBxd/Rh8CMlRr2vdFziaFYlMo3ooe6h9g3Nn121pabs1G0E+SJ62L6lRkMZv"
+    "UkaJNWXoA6ohtTWUsYztZCTDhXGa+uvwWpWbyn8c9CLCBg1hhyVHt1F6VVbglGYJkxoS9ashkgWH"
+    "cri3+6WfKoM9TmLxL0jF7am5i5OYbwXy3t6B4ES74RO9OGECJ/UR4Y8MyXTCM58IPy4Ejgx5htJF"
+    "3hjp2KNu0MbxcTozOK8rGadbdOMpn531KkNtpv0z8ueivxqKG5Z4moAkYq13zqXMq9cfki/8NrwG"
+    "1ioQE0j3zol0V3ptYD5NDufQKvgK45vDS15rBipuZ8xR7VhLdY1Z9ifG/1GSPkSbJc82ODA0eWnr"
+    "Ljwj/lMutSZH+FrLcuKlkcpsCYjvi9od3rn7qpUmlR+by6/uTd3/8seJ897vS9AR3dmRHIwNe6VF"
+    "1LW/p9rcsAaBewsX25MwPkl8TaTGxuEf1OD6lrEeNHIHCcjx26cXv+KI3dx/tXZJnnW6XN8JLjcm"
+    "y21IbpcZTsiT+l3Ij763b5KuL2ajB/0wcfb5024jDgoHZ8C3DhgPHSxdoWAYw+JDEHY3VnvpuQVL"
+    "Yw/dFDk3NDs83dPof1BLAwQUAAAACABJnFJdvd4nqMkGAABfEAAAFAAAAGFjbWFrZS9kaXNrX2Nh"
+    "Y2hlLnB5nVdhb9s2EP3uX8GpX6TMlZsOGwavLtB1KVYUbYq02D50hUxbVMxFIgWScuJ2/e97R1Ky"
+    "bDdDsQCxKJEi7969e3dKkuStMFZaJ5RjUpXijlWyFpZ1GBvmNoLxdcNvBFvzNW5KacTaabNjqdLO"
+    "z+vV33gU5rM8SZLJpDK6YUVRda4zoiiYbFptHOMK73AntbKTSXy24XZTy1V/23BjN7zub7XtR3Y3"
+    "DJ1oWjIyHNNyRxv0Z7zF7WTygP3aNS273QjlbWz5rta8ZDXf6Q7bVrBlx+CKNiW7NdI5v9Do7nqD"
+    "q7Ss0WVXw+sNV9fC5pPixeXV62fviz8urt69vHzDFux8MpmUoor4FN7/AvikGXv41NsxnzD8AZHl"
+    "8tnz189eXRTPnz3//aL47eXVcsm0YcvlE3Lm6Wy8B6ZSK1e1VNdk6HIZJ4FznA8o096G38ISbXOh"
+    "ttJolV8LlybHhyVTGJHl1hnZppl/UVb0bjDQbyQQKuWtTjGR5eKu5arsrDDxjfGKPgJ0HI291xmb"
+    "sWTsSBIBKqW9ifAIxVe1KANEK63rAaIXvLYiBGxA67eX714FL4AJYrJcPsJghmtFq+NY6TjQVbVc"
+    "DtBs7wdmvy8hc76HJq/17bHDW0ZEl4qlySNa7o+mgdL0i0OTLDoafCRCpoo3wrZ8LeYMe0/Z2Y3Y"
+    "YcY4Gx/Yrqrknb+BoQjPCWneOcLKp2PMRtDFH/F09mTY/+kM3tNdyVY7xgE26OoZvj/ybABlg7Ni"
+    "xuXIs8c//pQmfz1K8r+1VOmwHtFXa12KNOlc9fDnJMvyjbgLO6fZh/kPjz+OEfpKAszYYCDGVfJ5"
+    "8+Vz8PhLzwryq7CQgwLnpgTa3PvvgXBdW4sPHiipnP/5yP5hb7QSo6TybwFK+UlMWeNkIwplM+AB"
+    "2pbMabbltSy5i+JVMoz5L4CR9iFKASTa4ozI1UhrkXIDVM7s9ukBRBdeaXKyOBJE3K1F69jluwtj"
+    "tDnJJTpkDFMKd7zFmfcHt9isIOMPHgx+DKxCJAiopg1pU0OtxyRxDABaivhIra3uzBoyntKzFegD"
+    "En2SURGDVAIPL6Awcy8o3Kw3civgLRKGO1hcFKScwhQF2B6nQXzybpCS+PgEgg+HQfbaEddm2QGH"
+    "rDcoPSJFxiqoZEvZ599FSaEFRZYbYXW9FUhZMBa1K7+u9SpNzvJ2lwzIgYsDnCOGgUgIhccSsI/4"
+    "NEKf9LlnxxSMeXge+CLdiCssjeUBGDJelqC6EY3eCj+gDMi+TqfoNAUdEuUp5YlxEP9v4djD872r"
+    "tuhUsKdMreKt3Wh3qrPvTUcyS6IitgJ1HGk0FPXDLCIA+o3OAJmsaxIP0Ayc8wv3dSgqQV2nB6CX"
+    "GVsswlofyjKeQBEdbIwuUBkWxWrnhC24041cj2I29bk7Z3761Ks/6V12RmvOhjrOfacQBBS1jCqE"
+    "BXHaGqpERdYI4rVlioBgVlCbYJzkdWiBsnzit7/yvlH1eRGrjlTol9BNaCqi0jNh6DSO2ySwheoH"
+    "OUdyPg+oh8Tx7ZbsBZSWcsV0C4DkJ98mebPXQJXMROGp2Yqvb0jZYKk/l46MuZ73YJzyzStXTJTm"
+    "hiQ63NgF0WEKlkFTCn3jb7PhtQrhckBwMbRceNvSOG2NgJgv/MZEdPY9S/KkL2uLJMd7uMVRi9Hh"
+    "+60PzKO/W4nERHyqUrdCpXR0crtCWQThqsOl3rTc0yWliGcHs/sYp7Bh6n3fr4j59Cu34sIPgfLh"
+    "7qHBados7xR6sJs0JvspPJ74iL/4lkz13BnnCu0VmV+ERrRw/DrF/3yQJ1zDRg/AvtgaU2J2ru28"
+    "EGlV79h1xw1XTkDQbewZkGrQZxIYYRAq/LIt9flohMY2oDDjvC+zz+iuc1SFWjSIkqdeHso5TfcV"
+    "OzQF0djB0GnfXM/jl0DITsrT+fisaH5eojG3aXrkM0rgUYc97LuXczE+f6QHYOkYtfhBctQuvI2f"
+    "ANT7sxWqRah+8wqqOV8e+LachuZ83yYAUCGvFXQd86Zr3dd1HScjWXpP6Tg7YmhkSHpx+cJzZMr+"
+    "4HUn4vj9rg3D7P5OApakw6RvSy1pEVcgO86ehr5pz1B4USOZMJWx7xbsh/EEHn549JEeH4fieNV5"
+    "WHUYHr/oP0yN9/Q+usUQQAKkD99Y2r8heldeb0HpCC4+Io4/39D+xmBaKO8QS5YOgfSCuqPq3XC3"
+    "3txTnClgfbdHJSKUpP/X851S1nvbM3ps6FcRuSe5xqUvfr9Tr+JXnrF01cnaoa44UCpoxBxKDFBn"
+    "vnnExfMEV/r6mJFM4Ne7ieubg4YwOnJPcZ6eisI4b/8FUEsDBBQAAAAIAC6gUl2bDC7H0ggAAIMX"
+    "AAANAAAAYWNtYWtlL2VsZi5weZVYbXPbxhH+jl9xhacdMIVYSpadFLE0kWSyYkaWYpF2nWE5AEgc"
+    "RMQgwOLFFuP6v/fZvcMbSSe2PlBY3L7d3u6zezBN81WURGs/FsObkcikH8jMEblcFlGaiBXTufCT"
+    "QBQrKfLtepHGovAXsbTFx6hYpWUhijSNlys/SsQiSvwsknnfMO4hmpPSpycsjqfnpyINhYSUzMRi"
+    "W0iRZlAvrHeFTHJf/EPcjydXR29FGGXrj34GE6s0h36Jn0UZxUHe6xt3SbxlZ7RztvJMe5z4a6n8"
+    "I6u2wKtM/reEBlt4Xh8bwKLnwRZRRaYo2DJo7z/WepZpAqcKtfVALsoHESVhSpwikR/gdZzCfNA3"
+    "TNM0jDBL18J1w7IoM+m6Ilpv0qyAcJIWPinMDUO/g9FyWSiJwC/8ZeznucwrkfqV4tj4xSqOFtXq"
+    "LyANYzh174c34kwcG8bkeurevrkhasDE5NdX04tLkCeKnN4r8imTkLsAcark7i7H0wnIH6o1PP+T"
+    "n/91f/fmF7LwPZkYuf++H0+HZOPxmOmLm5u7K6ZPmB6+G16Nb2GM351CaDp17y5/Hl5N2U8iR29u"
+    "r5RfRIxvhuyI4U6ub92bu/vhZHj/VtkYjQYD9f7d+Pbl8J1+ORoZxhNxERYIv+dJNwpwRJ7niGK7"
+    "QbKs/eUqSvCA48kRc1tgOdvaYrNKw9AWufoXxv4Dskau8uh3SYt0zvQI3ZtVUq6Js3qHR/0G55YE"
+    "j33DvR5evBzSPj+N/DiXjjCvr8f0d81/pi2mWalfv379unr9GeopO23trXbDD4IMaRqGuUSKKptx"
+    "lLy3Od/Uuh9HD2o3tI7AIKrju9u2C+P6r7E/JvOv6RfGKS8u7252ZC4vW/4SxbyGwRkohnE4zLI0"
+    "s976cSn5secYAn9I+tuU8pthI4wIDtJM+ALJnSz9QgaosChBFeVRToWEQpR9LhXjpzrFLaT47zI5"
+    "I/u9xuZE1aCyFCWBfHTwr2CSIuhQDTFFkWzWOKINSZFrKBXhhqZINhRFXFFM/rTJ0o3Mii1TgQyF"
+    "H8fp0splHPbE0blYAPKUf/SXSZR9wi+Zpc+eiL+JulJ6X7VvRlfnwD4/UPy/5Hs3CIDgoKGeiDHF"
+    "j+hUOH5RZI4HSyMcWF9DXe4Jy/NucT5USSXYQxQRoNNf5GlcMkoDDtfrNAH6snl9PqRV/E+QaDtl"
+    "SHmdJZOdToIGAPY6a34UzloWK8dTnQW+ZNw32lAN6UCugcMqf6oTcV00rsJ1OeI2A6XD+MgHRE41"
+    "B8SHQhxIf2Kx6LlXL1MjEzjwxKoZbWFmC7Mn/FyEjR5OSAId6An75Kp1/LzXXQ5FDEXM1RMvxPFz"
+    "ih+TM+d0Lv5yJhbmfx6/DxECs1nCCloFIiqsY1uc9Lo2Ocn8KJdNSYbmp9rZzw4Lt6rR7DrFnFGO"
+    "BnzW2DsjKN7jclVPPhPmC5M2o9ifMfuxkEAOYZ6bHblwTfFoS/9daJSc1ZbnHZHM/9iEUHXE/tKP"
+    "l5TZFvT1DgYVUhTSQ/zfGq8GpyhkKjt3grYKKAzaWJls/OV7MmWT813OJ9yNqA6phDxP9WekbkiY"
+    "mIh08RvKQMMkL1O71FMIqJe/3oL4iKbDQERTxd65kHa4A6dmg/n+su59muN4h6Pqf1/qalrs2dxW"
+    "4oPq4bh6OOlqrMq5OnYNCa5+bzXddtfo3sE2PpyJdsunwUur2z/ctuOKB1GZPe86SRhKLi5Mc9fo"
+    "gNKo0vGCk0vrOZBJlR61VUpZ1y9oi5XpStMcZXXo7bN5rwtFFfRC6axjrul+VmQLd+lCRZQ8WOwC"
+    "VGOXPfrH5zI74d+n/MuW1QkiDt0oUxpC3YrgReIMZIbMrzdcs85b4Lp7oApkq2Nl6G+dbU1DOT8z"
+    "Bsdo/bOi3MRy3gQVwSesUmq6mKC66Kw5xIPAooefQ8jC2aRd+iqc+GOMKBP5uEEcABLdCxE3YPGp"
+    "tvW5hRzsA8JA6TxwdmBi+IhZCLcGAYaFpJN1+PaCnIrRY0s0lihX9xmygGZZGR50IQE3pLzYRSeX"
+    "bgwKovZSdbcadwBWu6z0Ioua0YaB+k/Vie92q7s6zS95CMUYcVmucknlKSVp5icP0lIa21lZeVBn"
+    "Y2uqs5uxSI1ouGC2kIOKTr63lEDjJs1krU5EbrSPkoCBWLjtkPpvSJ+mxfiFdlR80g4/eWznjI4V"
+    "GWo2q09e77WeB3lvDUzo+WtvFkXqFpaVc0hzCmkXdyhL+3xXRprSf6AK6em17KuJrJl5uZzrMbVV"
+    "0hjLhrho4d5PGdse3Sy53hRb1QbJ+WizQTioD/Z4mKvTjwVwDl/jtuqEZ6K57NbOt4tQqUQ50RIN"
+    "WgQ7jPu80qdOq6G/Y2QXIvZQSX01qKqiEpu11Da83zRZKqw/2GmUzX59TVRkN13/qFyVb7W4Irvi"
+    "h8GWL42HsFZZwu/MaWazo+bxrwfht5FPS5TtTkpRO2yhP86ML/CcB0pZhKu/uzuL7cznYTPuHu7l"
+    "1dXaTelLFLet4NFWlyyFInCELXfEafb9ksKW7EHtBxVW2H6meeq5RA0lO99FePTmu1ZbB8LY91FV"
+    "SWDtuVYH1moGCZ1jdlX0e47j1jp4HOnn83Nxald+djNtD73gCW6BDNO1Nf4Q5ygo7oA1AwqYVDzh"
+    "PYLAzH1cPgMLN6SBWQkoS9oKM800mjosibDRv3P0WxUkykHm6837gVymgbTMsgiPfjCp9uQm9pd0"
+    "QVLO5tv8g0vbr0ae3EL2ONVFtot8imO+e7ul+yqnzdEFgd5km7+l7F372CfJ5nQ/04Bq6zInRMpk"
+    "nC7586DaF303Jc0TxUET8B4LpgO0E/oMqT5A0uW9H2wTaPU8/sYJEZ/eeF4PtvytzYryVCF7yuPF"
+    "1d2rlxdT4n7I0nIDr2uMBYR3ryxkobrR6C8AFXZ3i1hHp6niGsXbQNkZBTWa07W3+pBpt4G9W2/0"
+    "UTZKSnlAg+4H6rMl7be+M+HCrbz/al2VN+rTqfIH8vXDRY8t8Bjb5w9Df6K6VaR5J5upZv4PUEsD"
+    "BBQAAAAIAOGdUl1yYiSTrBAAAP0xAAAWAAAAYWNtYWtlL2V4cGFuZF9ncmFwaC5weaVafX/bthH+"
+    "X58ClfdCuRJrZ1vXqlM7N3aarImTOenL6noURUISK4pUSMiK4nmffc8dQBJ8kdP+pl9eSAI43B3u"
+    "njsc0O/3z+VGJqFMgv0ozUKZyVBMp3crub+fToV8t/GTPEoT4eRRsoil2Ph5LtJbmQm1xFuWbmSm"
+    "9iKTcwxNAikWmb9ZDtxebzzfJsF46gdrfyVd0zOSuctEQ6/6MhXLKFdpFgV+HIOWnwhfzKN3mzRK"
+    "1FhIzIav6TYJe5kc6eFgU3+/9eOtFP7Cj5JcGabkbZRucz1kKKQfLE035a8ghthuhErF6aPPwPdC"
+    "vuuRUGBMjIMYT+PpKyPWNyTLFJ38MLfI/DEXUZLIbJ1iRigr8deStFUqARrCv8OeZjVnrqBRGoaJ"
+    "N2mcLkhWwQoX6CLy7SxXkdoqjPVjmnBfCcqT5kORp5oJkOrlUqlYMsU0kaAk1C4VWhCm6IvYV6A+"
+    "Xku1bIjkZnLm5zKcYiwpHPrKI8V89pjP3TLNJWhvtkoESz9ZyBAr+gZiFMuCxhz0tGzHmb87Fkq+"
+    "UyKdY+ZSESHxyuxg4fIAtiQiGio2sR/ILzA4gmKTRZTInk1wHiVRvixEd8XXqVpijTMpYZKB3Chw"
+    "KBPuOp2Ozi/PXlxMCpt9u00VLXK2hbk6uZSFJf63bYrUV3qzDMx4zNIyjbEknta4FyVe6IUS3MBI"
+    "ByJIt3Eo1r7CGvhBluZ5jziQ4UKy3IlRSsH3EOoV22Tmxz7rgufRq4OGymWCfRCT+b2ptJ73Mj/C"
+    "S2GRF4UjPvXf+xkWDksgs4T9hVc7k6K0l9neKLFaKgWLIgOCA+XbGFqmAbO9kqMIvq/YGmWEUZnY"
+    "+Xu31+/3e715lq6F5823aptJzxPRepNmCvMlqfIVmMl7PfMNFo1FXBSvmdSD1X5DS2G+vvA39GoI"
+    "t1aj6Ob0BH7PLi8vrryvr84eXwz5Qws2vEJA3f4b1nLYG/R6YFlMCsbdhVTP8Sgzp68Z66PLkXgN"
+    "1xaYb6Txg9FvtsWCQw05bM8wlasMROxp8+nU7Xkvzn70Xp29fn3xGlMBb3o97/LlpZYKXzLpBul6"
+    "E8XSyfrX/767v/lYT/t46UMOrHBOhjWdkoFPadErc8erkxN3bCHEDa15afyEa0Bh74eXV+fe46dn"
+    "V8QB9P5ewkSV0z/7+vH5xZNvnj77x7fPX1y+fPXPq9dvvvv+hx//9ZM/C6CmxTL6ZRWvk3TzNsvV"
+    "9nb3bv/+5PTRn/78l0//+tnnHthk0i0hzkY/+aP3J6PPvZtjdDoSbwgVZnKewuC0VWYaNSEAg4VB"
+    "5qWvjINp50eLLetMLrYEnoJwKpZzBdnOve/Pnn934T29OHuYkQlzAnI0Z2boTqdjZihXfmZwy56Q"
+    "GaL2hARgbNPs0RyxVJIZeHV18eTZj96bs2fPmxyMnK/G5zU2Bl/9Ti+vFTOCOKXIWuhhKOBbJKOM"
+    "5+S38E74W8qOaVmXcGBerntPFBKKgxqVZE5L/uYK3Dy7/MZ79Rxm9vTl8/OLqyZzzld/++jn+8HP"
+    "d442u8HP98xbT1tTA26cCwZdvA/G7GuAh2ccHHSg0LnBiL2jShm0usJoDpwTGg5sVNJI5DLS9GBx"
+    "Qvtu7hV46ZDSx1ifbCBGX4pZmsZ69hC8LCHRCb/BshCjyDcq33IRT51+f8jrZnimXzSnrpOJ6N/1"
+    "q68VzY/hpeVnGVfd7zu7j+zuhr5u+Zs4qQ+gXyYBpIl44se57FkfjDwkkNaEDV8IE3lDE6UbX+PL"
+    "TbkilzApxgtSc2eCYuMTKeyY6B4DRwjOA526cTiDHdG6WDxW0LG+Ph2PTm9Y72uiYiG1C98NEZSY"
+    "4UFlT7Xso2S4hM8K0x1kEgNyC1jqlgJpmWpSItHIMpGSEKVvq4wFow2eLAGISWpwhoIdOEOM8/NR"
+    "lH/BBNmpdCA8phQYNnzMsRTgbgUc8OCERY5MUYoBbOAWiVXRq3BEjtv5mCK8nzCdwzFciTmUhYji"
+    "ByvCtpp/ECv0Qa8K8qS1n61kyCS3ic7/OKYXnJRJHSOaydJN7CezyOSWoSYCdpoV6Bl/gvMhQEbK"
+    "8xxCniEpclzEa7KyIRnfzVAcD4XRFczRGKD4j7ikHHTC/7GF0kNl/0TSZYphFKiKHEbQB15z20XN"
+    "DCRznRD9isaJuFuxDa6G4pbMsJjFjZRc586AKMHNqen2vs6LVxExT412nTO0+K0J2hjC9tUh4V1z"
+    "bnJou1/dmzuHFIhoDyM47OzM/mv3VFvEq2vqr0eZsZ2DkXREt9Ja2wk9OtXyHAlHJmGBMjBsZe1d"
+    "YLDpSiZDDtKcFhOywCR2SC0jna8H2wwurDiVchuzEzkP5MaGZ8rtWuwz487odCgcRtKhBtTBoE7M"
+    "OAj6arzl1r8XG9bS7s36ewhWiWLjZwOmjWdJD47CGMO7Fe2OBC9wWAfbmoFGAA0qCGqKIQU7TWxQ"
+    "2AXxdwZ8XZeQasFqLBOnZpKDyiULZKm4qhtXjcGLAqyCdLOn5Rn7SmUABX9XJIo64Nby1hbwDmpM"
+    "woNsf+h2SJXt26GuNmxSWCa9wx4sczqwZG+yraz1Mbu+BoSSLGhpT4+s3g3lbLtw+mWJghduLH4P"
+    "+Nc4WCJtmbIgYQC5A9xV0hzeiTgFCA2aC81AZ9OxFtoAt4FeIpt3gC9bQEcgNQbAXxgQu1aXiVJg"
+    "xb6ZAx69HxeRgpOzZjwz0ZV+b8jw8WeZ7kB9k8kNTNybbaM4BMnY31Mg5Ve4tVrmQ/TK4E/RWroK"
+    "Lpu7xxSFk7CkOJ1GSRBvQ+yrqQhBVRGzhS6jLmnMFd9rpZuaSNXKYoQppcslUV2p0LUgDoxc3Vhp"
+    "10U2b6eiTWmh93ib685AszguqVK+pDN0K5MiPfuI+Dvaf4fEELUM2fXL8JWY/cOuSFes5aqDVenq"
+    "tThIWwHbMep2bgyrZhFmnct+VAor3U/bXdlGpSJsfLhLlPNktbDGpIoQ3aTbygGacYKV8kC7HbmZ"
+    "eBG260JC9xSkwSPt0J1V3TehI+4wEbdtDAhSGGDSwBEzohPISrZd/NsxVZFMtEcZdTTHYYxWQ23A"
+    "kfguARSn8S2sppaRB36iTZZsybLbHdn6OsoZtfRW2q2RrCsTuurUZUMMTjBXpf75lZ+uVzesUv2l"
+    "uRW5HYg/dIn1AV0cttYyo5y0Q2AVMj4YA3V+P7GzMc4RxxDkQ2niSu+6k3p2eF83Vuw/yh5WEdfj"
+    "Im5T10QUAwxZnRu21MWfr9HvpgqRGrnxzcHflvpIHDNKb8BWtkj3luLaHJYajKPc3jnSD4D0yqAW"
+    "mZ2pmftzVdT5rUZO7qqNVlX0rqUOPOe4mgsSXt9UoEdpoZ2jInbqfJT84xRPqQbP8yevqXOA1XtE"
+    "kXcdKSXD2sJkacfatVaj7MUz/zqw4L7XNJJ4O222Yc8GoRxqp4zXqFgn+F4654bBYHBTG7dbRrHU"
+    "o9tcQL1DqgZwykRdrrHRbpsNhEYnkob6druhrkR02nX3gINaKCWWSGgnWikMxqDfTpXM3LozlHZ4"
+    "Ml3gblaa5v1GXRxmkKXbxVLcYb6Psvv+w3MeRPZSDF5U0GqvaaNbsHKRg0FnDonaucSkgsGgmyP6"
+    "zZC1rFqtEvuRbgb1rJt005EiV8wbxHjU2YUdr2C8C0O4g4UUhSw6+8SIhwtNmtK8yurpRQdnezJy"
+    "OerVuR6t8YVIrWhTQBt3aIlCXexgUYFnhzD4v1GSMLtdHaps5rnaO/ktJwqHGCVf9cgDM0pNHetA"
+    "oBEw6hvgD+1w6Zf8Zh5b9mJX7qhiqpmo9vOmflob10qLmI8J92wbddsBjG4xqiu/MniljxIzfvWT"
+    "fZtzZYqQVvRjXasHC5J1QdrcHomXlH5tk1WS7hJOw/Rhg3CKgxXaCIVyvYHWEzUYVycEXPxGK3YF"
+    "6SjduB9QRRsDDuEhnWsC9xAsQ7MjoM0AyXlnmdO9OfvtD7ptPIzygOh1IQLpxnKjav2NG63b/sN1"
+    "Hizj2l0AnTfOSUWUk9eJ7qFXqZoPqzSpMjACDepdRw30OQAamlmiWzboHKSW9XWT1R07CR8Jqpzz"
+    "/lXR2Snt63JVT87pwOVOb2XveKPrYuccLO9HiyBwac97T7WTlmsQ3TL8mtpayzB+cyAksu1ImG4p"
+    "W5s0kKTWpUNb10SsM/+sq7AyKAujeMrKpJMw9+TboX4I/XwJ/ADu5VQtSFR9H8plSkdvmk86Vuqj"
+    "CVsCuXRFogGZfHBHNshPTguZTIemSq5PbtqLwF7e6tnIvroDtxnq0f9aLOKIDoSHmoUWY7aIh2pn"
+    "wVIGK09fKIBVOOuhKTFgzLA4LKQpW9QPKox+R+JivVF78YnYIREY8XbTFLZiqQ88Nfhy/h1lWrqM"
+    "9wM72ozO0zhOd3kb38pVpzy9fE41haYmDauEZzx7dzpkLKogiKeC3MlNA+bsyLl2KfcZDLlU3TDJ"
+    "QQv9eH4L/pqKr00EMNTrwHmFOSfhJy2GfiYWx+3CNVPqOB/BvulK/iKD4lIN3awwhTrQH/F6mPsz"
+    "CcUgfbCqXdUUtbDW8b5Wseu4qqOv6dCg4mJSpHSJWl8V0hGEK2d0E6ig1bphk8ldhmS4dh+muPzD"
+    "JX5sI/jQPAUU85WSiK7vgD5k86vKGgL2msaY60NkXeYwW0rFzJEOXPGYVoRL2yTIrU8wSnU3oDXd"
+    "C+IDDzN3BSTFTRzi5AtxTEtyTPhPDJoLQZXHTnVmXQigrDsLxWmZWajyubzVU4BG8aE7/pTdO0PQ"
+    "QWIlPLcOx6nIzGvZamFLbBUSyzOkX5V0tG8tUb7RDjxag2+1yRfeT89V+ZROHxnpXF5/9imkegPb"
+    "h8FjPcer3e1w59s4ZjNziFoj7CE2k3w8D+nDsNTuVbHIaqPrK03K1aDBr9PT6Ly8crP29wKwm9Qv"
+    "lXToTCc5hFE5OYbTRyOzVIQNHc9M410fmKMB7f/kyZzbWRxVoGfFZA1zFsbx9YQxlWgYuw4cJ9bg"
+    "7Ieldvw8petT2u1jq3pfej5Nc8xsEneME9MpXb/5pISd6bSBa2oZZSAR+ws+Es+FPBDRhlRtIWzq"
+    "DmqBn1jYXuZX3e6udwRlmkSQ0+3ouqNVUO/MYrnXgbxY+/xDhc3umXXHh3JnOlYbWv82Uzfjp5Vl"
+    "TmCZcB09ae1zfahxfDIEp34rys0lJcoarmgz3NnKEwwedpG6RGvCxK6bTvaE9Y2nH8XWjuWUK79r"
+    "zunqBx+GAe5vtCl0yQ3W+eVEnH7azlYamYrRR/sYMy4JVxvXNjXqwajKDyaTpscPpNPUZ1hcZRKn"
+    "7RqSmd17MEWk35H2tMbdPeY8XyL9K5xlLBYIxnShGr5lh8qWOIdU0pCZdo7myez/m3ZPzW3J2ple"
+    "PWssVVpLTUvOKnOmWwuTrsxx2AoZ2mptX29uvhknyhhOb83sk7+Z+2/VBqK87zUUmzQ/jL3V5a8C"
+    "cadTGns9xrAbwGgnspoX6zYknj5m+KQzVHPz1KCuvnoNA9j5+9y+I1lkgzr/o7OrmVxEicZWwnaw"
+    "cOyKM4y45/uUlM/SdUdzBunT3ejyIAyMYKtrLkPaG29OCzmO0alskfWqlOpCdKlkUV1mMhaOefky"
+    "3bipa7uYxm3GtHXx6prGjYTZqFDKZlob1/9aWKr7U/Uy1ZLpGn+kb3AR5Yjp8hXF6j6udSuxukhI"
+    "h/YSiTuoReJLcdKiQdyM+vzZieiNuCZL5j66/dzAs+HUkmOCZKKYovc/UEsDBBQAAAAIAOVqrVx0"
+    "nz8H9AUAACcPAAAOAAAAYWNtYWtlL2ZxYm4ucHmVV9tu20YQfddXTPkSUpGYxG6LQKiCJECCAAXc"
+    "BAnaB8elluRS2ojisrtL2Yrq135AP7Ff0rPLqyTbTQkk4mWu58zMjj3Pe8+U5vS2yvMdfahYLjLB"
+    "U3otmUrpgm24Jv/th9cXAbEipdi9lqURstCh53mjUabkhqIoq0yleBSR2JRSGUgX0jAnNxo171ZM"
+    "r3IRt4+K18opMyzJmdbw1XzqXk0I4eTpaBS9f/XpXfTpl5/fXNAcqmEiN6XIua+8y98/X4efp4+v"
+    "HnvBaDRKeUYlM6vISsiCFyaybqKcxTz39Yy0URMaT2jDbqKcFzMShYHN758HNH1hv85GhAvZfWSF"
+    "MOIrJ0ZOm3weLkNCDoqpHRWAJ6BMKqoAIdMQ06JY5hxB51zvtOEbFwppvtwgEIeYtW39DTIKdRX7"
+    "XuRNSIfwL0o/CJobvA2ciuIAuCDfEPx5N15wOWsSuELSLzvEfCT7lRfzT6riwci9IktgndSWF6lU"
+    "DgP3zFSy6p8cvZFI+zcN1TNKRWIuHXL47wrhO158gM2qHAizxEi1m1sxkGBVX5ZKllyZnXuyrGR/"
+    "xEVkPfqa59kh2g3ir/BVGJ7YYrIfAacFNwVHLexhY1fY0nR8sC3C4ro8Pws6hAeQWWehdTvqIjEy"
+    "qo3fE0nMQChy9PZOuUbtdrbvTLX3LWK3vVeREUq/9trC130chGV9dO8hqOHQm3jhFykKH57Xt/P9"
+    "9tZz9bWe0NZCoNEcPPWHtkPAtdEomOA4b9iwPhCqtY4Iu/TjSuRp5Jqkqcz7GflYV7Qr466jXFAN"
+    "97U1FIgCH4WkR7NH9GiCf/NHNmTbJPqQl5Ipl+3lANxJT1Nz20J71el9KxKHcDtvIStL+PHvbLr1"
+    "sNmC/6m8vVu54QAva0KdoaCnQMZfUOVRwpIVj9Z853eaNqVJ9zTubxOJAbvlSiNZ16G2YLzhdzcR"
+    "VXTNVAHW6lFHf9IFOIOs/emlmxpoejQybPkN4kA6ymCaqxLdY+7VuLOS3oobnk4xsJYoJZQLVUXK"
+    "FS0WLNmwNY8AiYPjyWJRnzn02OUMEpI1W3JINtkvFkE46kz/tuIFjU+yH5PQANOQv1hMp+1bqE5I"
+    "GPstk3nqJouRZFacwALKqofTxpLCaSgRkJvoDgVD18IlkGVc2V5oTFPOtzzXlErX/xtxM4hxfAq3"
+    "iw8nxsoeeNqwGF2WiiXXmPAZ2ZidzrTVQRAS+SuRct0XixwEklTa4DzNcrbswtArBgRtehqN2CZV"
+    "V58+DfCIYBejVf747tX07IcfacVvDoLstMIV4ot3BiDVtEKrj3LNTbJqxS2/oJ+7E4PQwryrgbDu"
+    "B1FssYjgSOOW6ZpgMHlIXD9w7TSg8bgDYjw+jmzQI4WBhHYn9nisOfoSbqDhKu0JbZkSDFg+6U55"
+    "FxKh343i9shxONaZ/vPX332O9jVKCEEWSV6ltiJYoiSO356h+4EQdkgOu6UPeYvW8ofN7zYAr507"
+    "/cy5rgWP+uBIOszlNVcDLbuL+KfleZ+TWPbyR9Vyn8rhvO/PXnRisu3HOw7O6wdGd+a1Gc3317de"
+    "MNQzD+rZtKBkjpRi+aBWl+J8H8uhapzL2I7ez08PZ3v7vRn9zbYbogPROb7VCnmRyJT7XmWy6XMc"
+    "FyH6qW4nH/vc+dlVszppuzonG25WMu2OjNJu6s0C6wZsv9a5AkRM+gT7dhs5WkGYQP3/yvKKv1FK"
+    "Kt/jm9LsnEXvlDiYLXNhfG+GA+/8wDjGeZM//UTn/+Hl4Ku9Ms/N+Q0GF8W83U7dUuqO/8uZxR/D"
+    "YBKG4dWElkhlr79Tg3XLXn1E7TJR7xHtCoEUXIyXT2GjvnvW3Z31FXj/tru/HQpFTQnUBs6vjoB4"
+    "QeeEk4CTd7AVtoqHINmlJllVxdrOsVakxXviHS0z9qql5/XvCeFHxDuhUxvODmahKCp+l6o395w6"
+    "YnrAwgnBmdeM7oO/FGnvbIA2a++oxtrLLXZdUnX6c5Tbs1PRhqbLLnnL0PYEiaYPrT+/rov5sDzm"
+    "hzUyb28mrf158xuM/gVQSwMEFAAAAAgAYKBSXZ/RlZBzFwAAjUgAAA8AAABhY21ha2UvaG9va3Mu"
+    "cHm1PNty20aW7/yKHjizARgIkp2arS3Z1KzGYWJvHFsjKZtMyVoQJJsiLBBA0KAucVy1H7FfuF+y"
+    "59LdQAOg5FRmXRWbBLpPn/utD+N53nG13KZ5IcosqVdFtRGzWSUXaSmjdVFcq2gclUldyyqfzYRa"
+    "yywT9Fz4doMqYf0qXSR1WuRBNBqd3xYiWWySaymKst5Lc4Vr5FJsS5GIcp0oGYnztbwXSSWFkrUo"
+    "clGvpdmk0qUMRaLEothskpGSZVIlNeynrSJPNlKJNBdJLmR+k1ZFvpF5LW6SKk3mmRT+bFZWcr5N"
+    "s+VsFgJBi6KSUftRFEVBOJrLRbIFgLVBpayKTaoAeDIvtjWhxMTW6wSRzO7F7bqQN7IS1Rao0vgu"
+    "ABH88Bx3jCxfVmkGoFSd3CMtCMzwui6KTIlKJkt8vDkcjcaA5fHLH46/n8av3r37Pn55/PLVdPKC"
+    "CFZHs9lhC5lihV8Ab35rsGYkiY1zVWTbWo4E4SBAgGuleZxWQt6VSb4EdhJ786XI0hxpBgYgaff1"
+    "Os2vmCmEIi65rdIahHa8Ak0QCQBW28VCKrXaZsgKOhYorSVjVwA6TL6v0l9BmJs63UiEFKIS1AVA"
+    "OFwmdXI4i795/d307Dz+4fjn+G//OJ+egXgSQC2vUabL9EqqOhApMhKkuES5z2YvSJJH+xFLIEbG"
+    "xCiS2ew5gE6IUygrwKNNJcLZ5ot1kl9JTVgLV+RAAgqu6hT+TnPmKJEFQH0FekffQlFUgr7N72up"
+    "GLvrtCzlEljEZzOMJLtN7hUry+1a5iKtlRYHKE1e1AB3DpIrsiXAJ+syWqxCcZUVc4XcwB0o5lJW"
+    "9T3xJklzFJIqE5BCEBrg2jZQQCuACbLy8UTNTaYQThV1lSyu5TJAQhKQMqhsesOKEvV08eT49PjN"
+    "m+mb36uOBWsN2Q0gBG4A7Jo2kvRAtuBoQKj3oVBF29CQCECTJAdaS9TDNsAdVQ2IWWyrCughsD7p"
+    "ExwCCAC9L09+RBd0Iqs9kgPqHdOdFVck9BrI27sBb4biBwyKCm0BLRSYIpGluYpGnueNRisgRcTx"
+    "altvKxnHIt2URVULkhx5OzUa6WdA+zpL5+YrHgYCMl8LZT5V0nxS6y3oiP0GAO3n7RyYiOZlniAV"
+    "jE1DfcRoKYPV+Rqt9QRcy/ROLrbAWN6BZrbIEqWapfYRr0AGA+7m7Ql81bSzeUXLVF3Hi2QBorP0"
+    "JcuYmReyZepvzj6tsmlzMvueuJYbdJPSWc381wsXxTYHQ0NpjEYkukpMDFujK1m/oWd+HKO2xHEw"
+    "Gj3phi7W16PoxdujVhD73//+H9BRuUrvxGaravDc9WINiCULUCiwQtn4aSfEgVo9EaeggAk5QYox"
+    "EJhkrKMK6ykRqEA1QjBs2AsKdS3xAFzNQkXD3Qd3NK+S6h6sQC0KdLvR6OR0Gp99Pz1/+Uob3qvj"
+    "s+kZ2Nq2zOSFqisKXJfAB98z0cwLifIGr5c/AC/fpAqsHdwSWiCYfghs3chlCiwHGjViEBcpfO3t"
+    "aQoYg7ev3/7H8aMIgOUJ4TFtUYMMP2baQOy9N04kbpbn1yhVeI4f4XGHpqQdbgbQ7km+mH9YFOV9"
+    "NEYzB1LHY7DY8RiYrjCPQF9y2IR9uUEmYWgBR0L823+b5h8ScO8A+nAFEeNwppWU/r6SeUS+Laav"
+    "M/RfpA/6XDiV8wPCHmkiZ8N8b2PbwjOkJQClAHMaAoORaWijgFSl3Nbgs07eQRztiS9+NT3+5gEZ"
+    "Wu7DwZr9jmzh8S7hdl+xdFtPg75oVHIj1/KOMEdTRJeuMysIYWA+YP1oIfM0p1PYIrUQEHaco2w4"
+    "5HPImQU7aT87/s/pq+nPD6mwxgekpz9aBpg3cGjzKth11Pnx6zc7bLXhCCh2sycGc/v29c9oYct0"
+    "UfMu+At3fWQcrKkcCs9ho3kRGWybQ3pLzZuoK9pdwDvve/t2HtVdED3gEbp7+0uGdu88emBNNOx1"
+    "ujudt9EOXR7eNECn68r6WDrv+/uMEe7cqBfYncYTNN6nt7e/pL+78Tq7tzdrzP4n4ji/FwUmZ7tc"
+    "8AvMZjgOo8mnWPdAeXID/nZ5D7Eb6sYMrD/NNUBt6WzeFKZj8Jps6eDqd9lsTxN7S6KH7Hrn9mYN"
+    "7v80Go2WciUGsfPp70O04EDsHeG/4jfxFjLTQz7Y805MDn8NoUcnIbBfjGnrmAqL2Qy3IKtWUKtc"
+    "58VtHmE2iiBK8AwD/gPzIT49oGWws0ROY6rfnI9/Kgk5I6TUdhkV45B8VrW6Teu1bzXCCyggZTLX"
+    "kMURfWktaMCCjAEzWnfRWSQOL7unr4b16yNA+RQxoXolIq9Zjmk61H+xXt32/76paLt+lMTQ8chW"
+    "FlNMuj5Ta6ksga9Cp5FQlSG3euEacuraCmuOzYrJDmPSSzJYgOuirLiFbJbFB2erQ+yLXOhgAB/1"
+    "K1SW61DcYHVqqI4gEdkovyUOECyKHnb7NwFIt0rL9mv8gyVhmm+lfXiNqFw7eLRAXWdtJZlnVDnq"
+    "FzJfat0xWbb32GHg/fA00pU5KVdLS0o8B17DokiVWVoDYM/BiJQSVwXihfgaUaFvF3tPLw0B4k/A"
+    "eYPOI9hoGhkGgEjVMr2CYx+jAuUUJcsl43JxYA+3VkhSQGl2TQA4TI9Qs+O8yGPKbMAr+KpxIKy5"
+    "KdVBoAgNkLJKMUXwHJ9/8Kl3CKwj1wDq+peDAKDoU82BqFqQbsml7ytSLWqrIcKIvGIetiIDgAAU"
+    "Jw7CTCu2yybiYuU1xvzJa0CaDZeGMQ5Yc2hDIICLkrIEzfIHQ1TQdhLEJh+2BNpVDGeJnO/tchUc"
+    "G8ahWQRsiU0KeijmUFUDfd8mmZKQAj7kVk7g8L1ejWKapvJukW2XmN8OOx6sA+RmLpdLbnVRHYIN"
+    "DYT+E2bI4w5yY3T0dbWV4a5MuwmBgMc+Qdq1sol2unBKc8QXcPFNTTyb7e0xCnsGBewM1/eZDCLD"
+    "BPo3Bo4ZdhslOaQSzPg1/Ow/ULVYO+oKxFEUeVejojxcAVg1fWQ5ZvEPa5cJQCX3PICLfzwW7VIG"
+    "YcKQwh4XlkrjMVeR4/FwMeh3QxJrnFwGNi45hJVkpCXq2udE2IBzC3QMw3bZ4RFa4j+PSS5luv2I"
+    "taMpJMdjqpWBOTurZVXLUlleoCsaIuSz+dH37IPwwgGdMsxaFFkmF3VszqNzqBkc6971Y75Lt157"
+    "1Sd7KmtxlpPfZhgYc7oZ4bPpTHMacKlJStHBaF5YrvUM+eLSZid8RwNbNE5DprrYLGltDKkMfk5z"
+    "MYiIZbOmMHC4CACBg2y9r99+M/2ZcgaozDZlCuytvPeR/375VfDepCXv1fgLL8Q1r797++50+hIs"
+    "3ghBcx29DEbh1Ra4Dx8eCcYbOLKFQKRkUi3Wdjejm8Mi2Odvoquq2Jb+04CsaCMkRBNx0CbJz0Nh"
+    "NjfJhKsmwxzaoRMN/iSuln7gokYjTvn82cw31wyIQmhVztXHwNEQKFtAgCY+uJqia5zJQxWTky3x"
+    "kp5VaQUrMQrzEidTXae1Ohwm0dXOz86db0yC+/+WRJd/NIlGy5l0O+q+i28jQfuoixWAeeQg5K5J"
+    "x3w22aDhe4RG42NemCWb+TIR4Bs61lRDbuzaLm40lgeO21FqdA+kt3DSLXzC+whSYaeUPqW+oWxu"
+    "M+m6hy75MLa//hmUWa0x44EPUGOsMbUCfv+U5sviVlEbealflygv0vDZzCZb7XVif4GXXsvCdpLL"
+    "ROG7Cw/egk/x9hfwd1bkVzGicKmbm4CCvcuBR1twiDr/Ql19BntxNWJ2u07xFkItkhKCvU0BZzNP"
+    "31TNK5lAuJuenXz9DB6/fHfyD+GpauEJb6lqWEWA+SrXV/ebsi42aBMy0enm+/fYK+brNEXGkdzT"
+    "4zESTd12vJsrk3u83LG3HEg5gdYFL7Fpcg4J50z3vZmPUANRmgIgOOraK5UiX0BymqXXfPkHrlBW"
+    "8AYvHAmYmzWCVhYqoitAzDLy2nPaDJqZESiNf+HtQ0a4r9YogD0UAKBySVozgf/gw1ourgnXoONQ"
+    "uM4G84EdjmGY4lPp0hN1LhTPrI9qlZ5HE/F1qyY7QNfUKQTbtgYLUkwPtMLgwfJO6jaLrT1N+TqZ"
+    "kE65ltmhnzc9A4oboTxCfYcDjDgGqPIgqiR4kIUED4R4AYpeB/+csGqMxRtGnajc08asRRM8SMiF"
+    "4VtooZlPzy4fE2iHJDR1lB/drkZkVr6HDz0rQ/y2W6nw7WfqEwbwnYBg72cIBhKY0x/fnsVvj3+Y"
+    "YrOoN9Hg6QXnx9/hey4Q+MUT8S3NLfANeL3GMYT0V6nnGBRdoOMNJTiPeztRQdcsPAiCd85CD0NE"
+    "o94gBhz3VLx4IZ4djOKT4/NX8dkURwHO352edTOti/fq+W//8uLIDybh5VceXvucJ9UVTvascEyH"
+    "r6hgD9/5p+CGoFA5orkLHtF5dnTEX8D/xqfTb15DenYORJ9+Nz3vnnZ09FdI5fyL/7KnXn4V0KFn"
+    "NEJh72DJ3zjzH8tCcltUrYtbOOndyfHff5zGL18dE1GrqvhV5thu874Y/3UGMO30A6d5P707/X5K"
+    "S/+t3Qqmu3FTG1CsspDczPuEizl0b3qUpTf1g0Uc4Szs4NNzsUVQh9hHkb1CLpb5jTnb64GzNRln"
+    "YAAQ0sjsj+Nq+PLPQ9dAtBi3V94kVZPLDiFsestWgqXx660KV0V6YIzaYgCTvJzpMoYel7dmI+Lx"
+    "73ZWwmfQ2m7pEeT+wFQ+3xQL9MVkMOaSRA9kOZNYjmI+b9r+xkDv9YiQGRCKdHwCCP1rRr5n0Mf9"
+    "kOAdvxlJYoCHkFRWhzPazq2dRNE0ErasqXbO5IrGxzZ8EKk0DiK53S8jGpo8WsYIL75Jsu1jRX2n"
+    "CDVpvXWeN1HFXPf2379vBZ6HkvZ2dLpuZdCIlI6rSX7vL6JUEbpaFRYI66YRMkK4NHSRthNZyuah"
+    "fJvjaNsT8fdtUUvdfqC67hCTtS/AwXn77MmwMYcZ6i2URMxT/ITJRdedagXElMAE4S+9L1k3bVT+"
+    "kkOyk0Z/BI2moa28qDb4wb9lGm+RRj6OEypalapkrnAJTb5hfgVvlvImh5LTXG2ZLLzDg5BnzZat"
+    "un+oWeNceOkCw3Gy1FxXHwosiLGOoAk0ENIN4URiNt0B+sKn9tssVt2dloruZnelGAR0Tus2iVao"
+    "2Ey+0dKddQfqv/WKaP5sUmNYPwa9AF3E+Espq57VsxN18HwMwMbCNwNzXyqUC97l4gCcJixxQmNN"
+    "oRMH/1CCnHhrwNrHAjE0uUfjnXQ5Je9o5IfG5HQF8w5VsxcBQSkzQIMm4ey0Ik9BQvZyVSUbmvpU"
+    "+laXJiNDnL9Zo8dIOHFegOnUiAJkFav0CicPV1AvKXGTJmAGqN5YbFS7RnRDqp+oXAB8KB9iPgCW"
+    "NOqJw5PkgXD0FKqqDJ0r4sBNPxrc0r6RB4GHAylfbzr1RS3vap33P2prRotRQfE0145qtqPatSNS"
+    "3Rqx6qYxEbIIoq+PKAR9lUbNso0KMuAdfoL29zoWt8jvW+cud88jve+a/+PXYd4+dUBv9W7QuvZX"
+    "AsYK54NyQwndhdmlSH93IghbII+p+g+GtY4RamAolIYysB6/bIV6HWkr0TTQ4iZVQx18+MxQPO4N"
+    "MFegY0BlcQ8eN0BWX9LMh9YDcpM7XBKd7yRx7N3IMh/r//Xp29ES7qYoKzO/jagxNVDy6syFfIY7"
+    "PQ4bTL+4af4xg3deZO9sFXNvGPuPv6s77OogE/LbpBfTnQiqI0bZ1RxtVF0Fs7qE3Il5Op2kvHvs"
+    "o67uG8TIlxclNRFqLDOrOWYqSqwGDUhPFUdqnTz7y7/6qwhdM2h0tJZ3+nBdid4tJHjkd2fTqiqq"
+    "4WipMaeUjYbaO4ijUnQHVmazi9YAf4yDD3wudrhI5gACohs/5GyIbn03eAFDKhSEzkjLJqUJWKsk"
+    "DnvoShodDqBH2H0+dfhdYzFpnuA1NsCKzuLXZ6fT73xVA+x4UywlO2/+TlXzC9CUbgncHGVB9yTv"
+    "qNNFAzDUwHuccwRhf43QCCPknxwctgXS8Tz/BKbxrzW052rzSrbdWYs/EOXo9cXB5QMOjYC0ycae"
+    "Ee972t/XDRC88Nlle3iJ5NTnegP3GXK0VY+dQvVpFfgnSo4SnTl8qeudzq9XqPQB34Zz7tiYeODn"
+    "JVzOsrahEOM0T+s49pXMViH/sAHQrAa71iQsWEcuBQd/zGqIoE0XqMWjBY2820l7324OhW0KBS5o"
+    "xJJjAXVNFiiQFAwOWJVDZgNPQnob8O3Tx0/udkCmvm9qPUNmo6VMJzLkkLnd0UxCfJuTr9foUK2N"
+    "OyJ7JaY1BUVML2xQRp2jJ73AikDdr6CIqJQMoHuJ0VPM1kPMwXrWp61OpxChMYWcTnp62ZrXaQmj"
+    "zwlX2k/ge4VoJ+b3ODZ84jTZB0xjF+DTa6krxAcZ4+YWDZu6zVVkPFBh2P5g99dK6cJIiG7MDFND"
+    "cXEBzHCCRnDZBMsGicvLYU0iE7e802h9Du/Qk1gVKovSqlCoPeLggOMj5+N0C53+wIG0swOx9QuX"
+    "QSsMG1xtirBJ7mOsjzIwNz/RhIKPaD413sLE4H6puc0hhioxTsbkCMfzcff3UVQE+iARVowAtqCm"
+    "jS34cXvcIemb1tx9tNtL659wtT3XV7o+aFicFYsk89dtwXbSzRboi1bitY5aSTvPmUzaR+G6dnnD"
+    "2ASXfDS1tBU5TDx/3kozETg/TQI3yfyFf+WHO12Bm9N/wVN/ca5tLclBD6NfmncuuCFmDtVEFGhu"
+    "QUcVabu50yZOXg4qDL1vLWoy+jFBGHNzCupoVXAcbP2khH7uCU+rLJXsd7GSB70VRm8pYbXqQ5gd"
+    "9s9s7tgzAJmZJWled67f01Cfgm2B7UZiu5gpbTGMYMC+A0dUH8gXo7P206AnLD734sMl3soxAEob"
+    "HBtck9XRcbCyxc4BaRkkGsBfiacuivZOnL51BlRp94SuC4lrnSPomdl/cdlsphcXtP/SvG+cuNYZ"
+    "WtS9Pvdb7rRVs4aCUwKbGtkCF4Q/L5Tu73b8IdBAetLNw8gZN1GTMGsoox/t+Z75LQi1n1u9XP4Z"
+    "X5Tmq4IXiT8DYs3vcSFNwR8AtprSoWlieyw3N4NohTLA15DzyHF/Vi1Yoc0eGGqNl7iYuEalrFYx"
+    "0WPvcfuFHP46sRWWmHC8NuQKdWKBu8LvTzw04ZZqfVyk03df5+9h+3rxJd7hLE/4G72mGtKNZV35"
+    "dfIjFORgklAl+Otd0BTkAwH3V579JSTxcZVAyFkK/6Oh/VNwKD4aIv5UfYKaln7ZyZ7OUQs4WKvE"
+    "DvlET6FIdIXkD4hE7IG0AjEWTw8ODqKDYJfaOmkpHM8xnEluWRCaFFlqx+X+QTvCVq+ksLRJc994"
+    "AyiJIUwsyi2T41MkeRqK4ctGS5oFNhFP3ThmnCoRMKxr2vvRBTRSYvEetCdS7/4viv1NchdrNCb6"
+    "3xACKK7jH+LycNbE48qJfoPNDY7SKRHMb5chOuCLCJR7k9a+xZalP4huj+AmvKzwkQbdOguErrZZ"
+    "bQcurfl9/mB4owbc2RrurTlD5I5adIbHe5NMFJnzIt+TmxLSVqfBRg1lKBuu0htpemVhM5TJ6c/r"
+    "B1vgSvfNqdDl/xkFJFT26m8FWsj/Kwr+P3Kwz31OgHfe+mrAVJcB4zBSYYufD2r/SJ9/wYkUbIrl"
+    "NtOtmmKBF3D5VWdoHPvJE/w70j8T0863fcNuxgndW/eIBosU36HwZKGyMz3tS287jdi9Cx8ZL0FT"
+    "ndrMscNN2aiDARXPtnPCl1S464Fr0YEg8mATlD0ntzqRJZ/VAu3mRTTgpxf3k5xe699yGokZTAAs"
+    "um12OPtZAWza16bVbenuwoqrgMnATaS5hAx6ezi26HyJZOebw0Iz8aYJo7xw6CpAr0Z5Bz1GNmJy"
+    "taaPPiVniH43mSd/QurkQneniLpgLqgWv3S8HoFz2dvkIysOtOIjIfjJs3nJQJZLN01wkHGlA+Tg"
+    "HzdC7g4iqzTHH3P+3jSEivJg9H9QSwMEFAAAAAgAA55SXS95AObwCgAA3R0AABcAAABhY21ha2Uv"
+    "aW5jbHVkZV9jYWNoZS5weaVZ+3PbxhH+HX/FFZlMABVC5LjTmdKlM7QEO5xQj1BUbI+rAUHiKCIC"
+    "AQZ3kKyk6d/eb+8OLxJU3CknI5P32Pd+u7exbfuKF8erJOVsPv8qyZZpGfP5nMn8nmdsGS3XnIl1"
+    "VPCYLZ5YtNxE95xti3zJheCCOdc/TRLJWZIxiZP6fJwUrm9ZsyLKRCKTB87SZFFExRMruMjTUiZ5"
+    "hq9RLBh/4FgWeVksOctXjIMATmf34FddirKYFWUmrMGqzJaD+X+0FL7eT7jwjdgiXBX5JtTU5iwH"
+    "bZZIj4Gb5rPMN1to6rPZOhFG2E20FVbEyALfCC3gA5hvI7mGEWAURyS/cY9tZLLhYSbc+dxTusZ8"
+    "mcc4KflnyVKe3eGCQxuGRvGNsLawbaXGoozvuIQMZSbBHDaNlpIXwlUK0kWjhra98GAWbDHovI6y"
+    "u8Yg1jIXoJBn5DIhIwl3EQla2BbJBkeO7/kTS/P8vtwyyKC089lb/BVsk8fJKiFycCH4Rpk1iCMZ"
+    "Debh+fgiHL0Lwus5W/BVXnASCw4ouHKX+pLlEj+WeQHdByQfjxPJHhO5NjEgog3X1rJksrwnDpLd"
+    "c74VehvWZI95mcbsLodyoJcseYx4MaEkeJFEKU7BSHm2LIuCZ2BQJGQsRh6Gc4ooTXkKmyZpLHwW"
+    "UNgU+WOLDwkA71uPkWBpJCQrBXR2Cr6Cf9b4Cqk2MCTMhtAjI1VWmF3enP4Qji9mwfTn0QTGcF+B"
+    "o5DWfD46PR/9GGDvdHJzFoSno9MfgvB89CGcXr6/hhsgAnIi5quoTCX77oQ+rhIn5SQDDAdl0ict"
+    "DMxp8YcEURD7bJQ9MWMBXhR5gSwS0YIc1iQWXMJMhEnKFvpuctG3bNu2LGWeMFyVsix4GLJks80L"
+    "CTfBzBHlnbCsag2BC/uYX2l+d5dkd9XPXFTf5Jpc39pSnjVukGvEZMXkCj+NBCZDocJ9qEWvmKoN"
+    "vRYCJzzWnAl5RgrHHRISWVLfVrljWZCVDSuJfSTVBF954dj6ju1a1lfsTbnZssc1QGw+78WHOUPu"
+    "FJJyHsbKQAqyrFZchZtOwdrgKqYp0X0rvIbPz0cQ4IUVngVvRzeTWR0CWIXTQ3gdEryPio2JUAQZ"
+    "nK5iWMsUUagAbybTGxIDogKQ8jTmhcpI/Eng0r1QBP2Xf1fEA4obFuePGaEUHUdqAFAIWk1kLGCt"
+    "mEBExRhtxDnCSSVwmTWomGRIOdIs+Hl8OgNPcDnx/wEmO4ChuNQhXIGB8h1BgbLSscrvw5jACBNA"
+    "WiNAjs3iMRFcJa7OW215owNMUtm9Bicysn9iWRbyjIWb6HNIaee47Pg1dJEDi+FTRI84lwufZw9J"
+    "kWcUJo79bP7aHrNt1xeySLaOq6jI4kmTUyRVnKBgfHZeeMTJARPXZclKceMp1NiLCHWbf17yrWQ/"
+    "R2nJA0ruPaL797R6JnJNglDCaT0p14yimsBuYuHYt2xlV/e1Vf2H3034/uGLX1NE40tghrUEPgo2"
+    "1kdndPKUyGj6gBXUQOLssZ1KSII4VMiEt1O73AoLk0yVJQNsqgwpnCLKyn1hkiUyDB3B0xXAYKF0"
+    "HCj9PHbkscq9AzK44ngBgo39DDIYbax6nej5oVlGJFQHOvuGHbbNt+52xRv71dfugXUiafNk51qi"
+    "WqO99TDNUQ6HDaL6EyyYSKPPV2xK3AgmJDAC/RalQEb9xWDDYZb5Ki3FGv1HlCKtkbXUqSD9daUX"
+    "qKYySelS5u+w3vKMOA4AcUv5CSGOHqbcplx/hWnbf6q121tI+/sfO6RkXuqETxOhSNGpT7f1KWNK"
+    "H0UaQOFv7ika9Q8xnBUlIgiFR8gwv1c/3R368aJxl48OIONL6YCNYwi7nipBeSmHL0/8Ew+tFF/e"
+    "hwQxoTbt8C3s00PX55/5spTcsa+mo3fA8F9QCbIoDYFwfPh+NLG/4I54Qj8GQMlLMby4nJ4/f6ve"
+    "Ual0Og1Gs4DNRm8mARu/ZReXMxZ8GF/PrlVqoHWwuxdUdM6CDzN2NR2fj6Yf2Y/BR52HjKrCu2Da"
+    "5GOzskNFpWizaxCWyHq6ETFbbnPvOUMYLcYXZ8GHPi1CRfPyQv9y6JfbZyN045tEIv5rNCCM1kDQ"
+    "oIDKeR2rKjjrqLtl/97BAiCLAq6YunaDSw0eUS0/IrpAlfmcbmIxp1JMCata96zKs20p52geXQVW"
+    "FflOMVCaSF1iqAdXCNkoaRD/8noH7uljEJskqNepXx9S4u3QoRraQo8dQjnVuE6CqzIHYm7nIFUo"
+    "nE108e8arUsMfz+9GNx2dqmw7Z/fs0afVIcyof2xr4NJcDrbKS4e6zjQBOrb6eW5SZX3PwTTgBn4"
+    "/t72DtInc3hu/77rr7hcrmEQx907YHzYqSR+jz+7infcSp/G+LTFEIVk5JNb9hdyOIInVOls1l+0"
+    "1itb7LNr15m/Uie6e0B1yo7daR/UBXtfz754rJmoErfHopc8jtp9cffpb7fsn6pfIn18+uOgbTpm"
+    "e+3tAUWrkuNHWwrzbnwb6YnPd7ee+vflrS+2cJdj/yuz3UqKl7e6RUOpqgEHeb4HOFT/BlVah3hq"
+    "4SlnonGg66MOyVYB7OlLABw/lbzkutN/xY6EPGKbEpCxQJMU0XDl6Eg/so+OVJ1XMxh6rVIJ85tO"
+    "5tCrnfW82iM8qXcf6X5bpqZvWrWDjL0espZzyDc11cGfe17meZjxxx3va898GZQdwr8mBgzAfcJJ"
+    "ajj28YTSvJVQ3k4S1YBCQeH/kieZY2qDtxebHdqt+qTaLxUw/R5/rx54v5LfY93/0lymfuPV7bCk"
+    "yZh+rKlZUqafaGrK0DzdOsXnWevBmeTxjqEU62a16toOZH9nOVNA9qxRWuLEi0Np26D/Jsqe+iuA"
+    "Pb64DqYzdjll0+BqMjqlxgJPUA3yQIWb4Jo533us85+Lt1q37j3Q20r0oPj+yv8g3M3VGbU6Wpjr"
+    "YKarEOrNXvlhjgOzAUdc1WhsydUdy3+JZJSUnXa9VyqHIstz+4psVUtPL28uZs6R2yqY9rO1znBX"
+    "Mfu6+/rpF4I+cZFvdc8ggBgUL91n0xGrRwr9HPu8cbhRoI99BgXhkf5GYHyx0/ruXXeMgdTxFpHL"
+    "6VkwZW8+agdPxufjmYqyZ6k5ZIBDrQV9Dmud5nd+zBflXQ2leo4yYGYgyL6Oe2eGZFhEG3F+BiX9"
+    "Je4WTt+JqpZWJ2pwW6a54IfArWna1Slcs/T0ZLA/NzB9edULmSnL29F4EpxhUT3OdsYbCol1MdHz"
+    "jUNE65nElR57Hj8mlek8aqHqxl5N2cwINWZOPbo9G1//qCUansznLt0ps1Idq/H2Ls0XUcr0MY91"
+    "FFAHkCl6sd1SE6nO0f0hj9qtKNC9/eGn4+5dqxuzTsttBBjum8rpGxo1k5Rha2TmtsdTgfqH5oRo"
+    "QrA2oInEWM1XVNfLgHDVwxz0zNvGY53WuJbvUITXThmwrymSwcjdUaqJFZoPHDSHHmD7Bb9DH8YL"
+    "R1XnsCek3PagzDhBx9/BK85ODtjq/5MJMGqX91f6/dgZ2zfTesQGpekWh/UcGQvVtP6LQ02TGu7E"
+    "Ts2gm6WtWt6JFd2l6e7lz13e8SdzqN2ACt+i9SuKEpe+VR3qsRppUwu6iNrDlv/D796e/0k9rxsF"
+    "e+9OrVyFS9XqroLdO2i0xGEICqnzNwPl1uSBJmK7MDSfO/RC8ph+jNGcQU2uG1e3hg3JqhsdhABo"
+    "E4DrdTx0kKXPuU34d+LZ11KYH1oY679QSwMEFAAAAAgAG55SXS5m8wVmHgAABmMAABMAAABhY21h"
+    "a2UvbGlicmFyaWVzLnB5rTzbctvIle/6Ciz9YJBDUZ5NKpWSTW98kWuU8diO6MlMyuMFIbIpIgIB"
+    "DBrQJY639iP2C/dL9tz6BoCSJrWqsiX0vU+f+zndo9HoTOkyv1LRi3rdZkUZ5dl5ndaZ0lGlavm6"
+    "nVV1CZ8NFqfFOtKXqllto6xY5e1a6dloNDo42NTlLkqSTdu0tUqSKNtVZd1A+6Js0iYrC31wIGWl"
+    "Nn/VivutyjxXK2plOq7Vr62tLVZtXauimfHwttEb+pxGH7e1StcfyjI/uVGrtilr7rlOm3SVp1q7"
+    "LraIW1Rps4VtmtoP8MkVzW2VFRem/LRRdYrDcmW62qWXarbO9GWySldbZUfP6mTXZDuVFHoaufpE"
+    "Fel5rtZB9yqttUqam8b0zst0nThgJ5ssV0EPA3lpnukm4aIEDk8HTZs6Xdll6SotphEVrQ8ODv5k"
+    "gRBDl3+oYv6xbtX4gIqit3zqxwcR/NRl2RwzWPCzSHfqONJNTV9pvdpmDRwcngkVR9EjOK7dLqXF"
+    "RWUdTSJqulaVKtbQqGmrXH2CptNoNpt9pkqDSUl5peo6W/MU0T+jd2WhqAWUa8AOvzyaczXV/0mg"
+    "diuTbcyYCW5Ax1rlm3F0+JyW9Qm385n3R9NvIqyf9Zdhm+BPBTNSOxwyOtrTZwYrzKp4HHSFGapZ"
+    "phNAj3gcjkpAVgDBIvpUzWqmx3j82TbS9aoz8QiKRsHq69We0c3I2MKOPXWjDU1o+ww1eiDyCF95"
+    "VzYCROARP21vIzw34SrRdarh7+JSraO4KS9VEX0TXW9VraJmmzaCMapYcUugpRXCWK3HzHBwVBkq"
+    "CdHSlDLumlKDEDSVK77KUvdRted5tkq2wExUndQqR/YwiHQHydvTl8ni/Y9nr06Sk58/LqCGwaFV"
+    "E9NgX0az7Wgawf/yq6ro98r8XvGvmxv+Tf8DHdNvTf8vRl8PxjAZInTC7AJpLmZiI4SG6ZCaBJ3l"
+    "7L7cGDSc5eW1ArSINkCLNwCESM90lWdNPJqOxog8tulXmQi2gCz8vM3ydWIFQqKb9hxRTMdcA38y"
+    "Y5g6qXHM9CVI8JkWiPCyOPAK+HSjouXyGQ3y/Mh2PXq2KXOA+vOj5ZIWq4BvGvwwgohP/YcUOB5w"
+    "9GbrBNfp65OIhozy9LZsmxnIBBWdLD787t+jKk8bGHH3WFP35bJWq6xSs21ZXupZef73VVmBkCt1"
+    "Y/6ewBqoNrrA5ZYFyQlE10slY3yh2WZY/tXbBcyYLM6gOwrK5RJYnFd5WujsYttoKDcAsUwW8MfC"
+    "FWnc9nJNZrtLJHHAAxCFmshuGqkblALlpVAhcQxFCC6IQcyjEYaEgCVxV3iHZimfTwA6QB1TPhKW"
+    "z2mkBaIRThLwGhDTTVa0rj02maXrdcy9HEuMhZFJ+UP2JTSA2J/s+PxjWCUVEDFMo82v54X7Jtw7"
+    "B43g2PAEquPN0Z8Bp4a9gaLimjGcpMs8Gk1Gx10GiQtjMZgjka1haJ9GTfexT5gwDgLP9IBZ7Kot"
+    "pbp62bXhZwjgNCuAM4HYzdcArfg81YqpcFC6AYIt2vNDhrOOyk2UAlLakwc0tWPitIbHAp+u8Zjj"
+    "FQx/mAFLA8RtMtATER+Y//qSYkV4tSK0AHVDrWldM1ANapJJ0+hS3c7zdHe+TqPqGGQhjmM2TFzI"
+    "CbDPsmvU6IT93Ma0YW+jwmGEK9vNLpdSITxE0HVC3SdThPdyiT2g/jprtsAoPIj4ii6QqNklFsLZ"
+    "0hiOMv3GIx+FsBg3g8qbL44FWFalqdNrRMYBlS/G77HVt6AVtJ1dABGP8BskA61lxofhY7FguG0e"
+    "KGgoUSYj2wGBAd9GO9MJL8j2FY0Ne43CWaQGGpMyF1sJ4oSMGXCfrBkbkezPaHSp0djofFAb22rR"
+    "AUe88nAjDqoMZUGD2EEfOM6cweb0IFuLkJzjf64oAN0cv1ydAGAuv11FTxucQ4ldZ0ZaaaRyrWjB"
+    "rp9sbQ6/uRAZ3p9YXwegIzkY2nQSOTZ8AYXysUf7RCHrbNWwmm2ksaWSH9IqWqVFWWSrNLfqGKFa"
+    "7Jl6BBSf2kT8LlR9BbyLrSQQshUuXjfAu+1YGShuN1F8vCvXx0sxSMxqqW45jtoiV9pI5Bevfnjx"
+    "/Uny+nTxffLqxavvTuZPlsunkQIaBSy4Tm9ppuNNW6yODbUmTa3UEpmaIp7lNERfC4wyDUixgUPc"
+    "4qIBV5otFLH0DqRwthkw2HwK9s2rYDeB/UYlytOcDrosYLhZcJxMAahjnr04+1vy8ezkZDFb5Sqt"
+    "rSBvC2CI/VMGkvny1cp65MNO2Auq+AIdORYz60H7oSfTidETJ/RG3SOYOmOh3jEfYOs9U4kUFO1x"
+    "9jtXZKHxCbUWX7B8ZmE/0NLxz6G2ckzUFOjwUfSXFuwYktZpcZGrQ1j8CsxuS+6gMq/JWVCgyrcF"
+    "4RJv2jwnpREKNTAC4Bl5tkOJqMezg+T03au3P74+Sc5OCCQzsJkr5Pw8/+P//EVPHsE/mQD+GsX/"
+    "8eHZr88//efo8ze/zLbj0T/7bZ5hmxTaPOc2zx8zM9nk6YWewyw//Pj24+nb03cnU7QqHkVvce8o"
+    "42HZE1o3HhuCRUe6rYB1w67Pmfa2oB5HryxVHUUN6FarLRx79L///T9RgTQYNajeR6mGsfsepVjN"
+    "LmYw0yNZcfQMGWNxMds+h5l3LYyP2KiKX1vVghFIJuFyyY2WSwTb4uOLd69fnL1OXr//mHyXvHyx"
+    "OHn34oeTRfL2/U8nZ30TbDP6grv5CoaYJQnic7BqJxtGqG6t0tHUK9EauKBfgieUq5ugqLmtlF8A"
+    "PB/NN1ewUcVV8A2kH4yaFQ0OooMyXf7h93/wSwhzgja43jyYe0ebCEuarf9dNeQl84s0cLqwQO3S"
+    "alvWKixs/r6rgpLsokjzoKRZpzmUdsvqi25JU+6yVacQ9fROEci8TgnAqltSdgoA2TolRcnUHBYj"
+    "RvVLAgg3F134MfjCRtkugFQLBFEHBQVIxgDC190m1z4ajZ25DwzZkhgY32AYlk2Cjj4inti4M6yH"
+    "omPwEOefk8YctAX1B+zhlYpHv/yCut3RaDwOOKHPAo34uIfwvCXv2rzJEq0udqAPJP7E964Y5DCa"
+    "VOgDKojlGD5BbHSbalDVQUSBSlYCA0J6BAEBSke8eP098KMVnDSMepuDTnwgaoVjNaAAAEGX+qhJ"
+    "9WWH45wr2O+6BV0LmI7lO9hQ7Hg2OFmtSC/gPDSaDex5hfVfGq74NMoa1jdIw1yjc4l2QmvzWeZy"
+    "eXgKg6MGEyohgK87OLZ7TixQx41peUSmJQ6A7qnvTl68PjlLFj++eXP6c/Lm/RnInNcnPwc8cp+H"
+    "antzM/pKEmJxmVWRBmWxQPkGWwF80O05rlvzQWXFBlVdrK1TYyY+spKRdSbnwEkW359+YN/Zjy9f"
+    "n54N+c08hnqTItcNaE7dwERBybpctYhuFGboVATUqnTT/Q4Gml2Avtmed4uCPiEjzNVFurqVEuer"
+    "S4sVjF0aZd3XkMiDJk5760LbZ7x3HEhk1bIpn56Dqku4JTEBlq6IaIfnoLeA6gpIBqxmfZ3W6qgz"
+    "jKGQE4EvzA2jQTdV+/6Bo2egVT4/Mqdw9GxBcz1H1RyMZ6086Y4jMAbDASEdLZfUG9bM49JaUfaG"
+    "DghL0VPApwyDG5qIMs1B69dRWdCg2BkAmwJ38elOK7J4iUoCMhL12IEU0OzT5453zFQ499iqRZPT"
+    "nY6zFa36kCCRAaZfqPgPv/c0XPZeoZ+grWf84evZXDJje37uu/eIw0j1sBJe4aKkRbggf4KawDbo"
+    "mTPbJmdcVY97lQSuWVqhORs0sCvHRcPOwnHPQSBe2hIGnrf1jh5tRIS6Id5AVkCCvIXFA4sFSw1O"
+    "LsgwaXEbVyyMuiwEz4WqCBFgBY22YhQkMOiTnpl1fptcqtsh08lRYc9kXjRoDQIKHq7bSqFOjEIA"
+    "VC723cbLJQ+LYiWtQHtGdRiMayjSJFQc8lsPlfOjlW0j62F/+rAtJ35bnmh2leYt7MZDFRjlk3Xc"
+    "upBN37ARHx16yc0ogYfu7XH0NvTQCTCNI90ESOjwOMDG5APcJ3HnOI2uAOQp6AF+mR3ECy3u438f"
+    "Rc4gq+E5gfPV5JBnsUpWU80awmRyrmBgNZlEhgPaUxd+94KZihXJFdhx6YUSrsoxA1mzp2oARxJ5"
+    "BjZgkd+K4GvEzQArNJzzmdnc8yMZRmM4Aw0koCRAEvI6SBVUZNgV2M/UmEuHpMBYt6N4YspNo5Cu"
+    "m+4QFH5APYIxDAAFSGrWYBjqddnma+NvK2vcFeyBTTX2nITguhVQR6RxjRBQIynqhy30MJNdISuw"
+    "6NDhWujurQd4HY1nuNBKuBAzPx9nOqMZQCei8QL/Qi+tKQZlqdMeB/QRs1PfmNA3N4ZamByEG2jj"
+    "cTAXNwdupqom+isS0kldl3XP40vbMhu/chsnxg+r+TeAVL0HCld1oOPxUEyM6EsgFxj5jHXsyAkT"
+    "D6xH0Iu3gwH1mZmcSWfokNsbHAgdasslA/oiL89jdBqjxOclaaiMPaFtsh3GftjO0c51ml+qteV0"
+    "uDCztxgWRaseT4O8CS4bB3EZWs4AxhBYLIcUf0vUWXzg8KITH3DP489tpvI1tbDFKvf6DMjm3oaw"
+    "bXdDVGa5KIu8Litt1I533nfl8hFaLZmietPh03Vn+R3TMI0r/GlCw0+Amlrmge6YdAFSawuAptA7"
+    "SIUMDHUOse7s4dFYewKLd2Cc4wp4RiQv5YyC0KM7viHMZpzuAN8cjW43m+zGBtBED9pnAj3Qp0i7"
+    "ZY2J5oBPJw89mnTWC/Xgs9c2aP8bzjk8YXuS1ku3ltMEAjXCkA9WzEudbpz4oimiWG/TdXmtLWsn"
+    "XteioeTUj/8nx/fgVoed33dAJYDtfaQy/vTkwSkpqEv0OZ2fkIIkIbIAtC0K/wMxxFlj5T9DdYot"
+    "EU01fTt3g5zKcnmMTDIPz21qxCqhuZEqRnTb88EBl8tptAEkYg0DiYDS8XgUwGxkqhyiRX+qLtt6"
+    "pWhW63gAuK2JhCOp5ciHtdA7/hHg3cbIn4p6iCMjIstm9nB8L/gi9TQyc/2nqIDkSkxFcqJMIyAo"
+    "dBYcwVp35ZX5E7RN/JPoHRePJLzaopUl0AFL3Skf9IcA22SUeVyH+aPNLhMIDKeeMd/qDYGMS1qh"
+    "G4T1UNisO6qMYAr0ZxzkgGsNwawbp8NwALHcPP1HBpoXQZpUSUWxgCDIM2QH4OxiCwhXMUToKeBQ"
+    "dGw6DKrTd2hraBuabKlBu5gYt0R8ZkFmnSeLMUjetZiFvUCdZ5zyVCGzNcXEcOsqNFEDlchU5kGi"
+    "Sk/DzOs7pgwGzPfrWARfP9zYB/MQd/kJ6XMCTSdwyCvFkbgSqJ4CKYS3h0jMEidFPRBrHHkeGn5j"
+    "6Vhbbo1WsyQM7dm9pQxn4oq8FmvSjTqMDw8S5pg/QYml8QjBZDgYOhCdc8PkhoFtKcG5cSjzjTqw"
+    "B6U7Av9f0hIIv0hDIPdET1/oNQZNT1j13HS8Q53od2eV1Y1COdM8jlFNOsmD/QXTMQ2pJTLDPY6U"
+    "ARDcN6K304etzqGmcRwFxtQAXLuAkdMMfA0PCDf8xr0RpZmT97S4QSBgWzkkQ0aDswVWYvdHen7C"
+    "0YiRil3ggBNYlYaix+MBV//gJHcYnfetxQK8wwlmKPbjME+L1j20qEFF2OOELrYq0885U0i+MDMM"
+    "VLixl4EjQlra8cTOr+eW6XVBUpf2RPUuc4ZYt2oCzq1j+n+vfO3nqp7xtok1XxbldRFx2APk/YT+"
+    "mqDfz6pcvgZHVhtmp3hOvjuSOTpVbYVb5fWa7dACOhvq+StpIx3nmVFaUDtxGTL+RQ+2BlFFG8yv"
+    "MeqKBpmkuql/OHvcWb7xKY476YsPl5/HpLgfL706UjVZpMY28yhMNxKvXCdbHBrWZXsBIqNxZwFo"
+    "vl984joxlzPcFaagQTerX1CrXpbKYN9P0I/YwJA2EZAQFhodz7N2gEnYlBlqvt+H7flXxVwPrcoD"
+    "z6Mw1DtUGcKcMc+g2TrvAjm/wWBUV9lKiRNouXz59uQ1lWBaCc0J+IsqvucAN/lkHMAKrBEKwhrH"
+    "JwVN0mgy4VknE2QJ/vmbzJJwUgZsShlkDdgSfpfHGuyRGibmJVGqG+rpNAZSbWQp20uBh63JfZvl"
+    "kkZvNflIAA1SWGntOVV40SbFmazJtuIEIRMpMNsnm578LmmOGQa3nPvshc3MkbKhHwOAxcofszd8"
+    "lzWYn6RL48k1iqKQ+LokmTaC40rzUcQJPoEDXfYq8VqJTtNsZIeGfl8PJe/OQDMN+dz266NedGNf"
+    "vKajNgYGtZeJZqlqNii9jYTHUFFAJpGMSfaCt72Hu4qkh5Wz3cSzEBa2GX8GPg832LTTS1iDzxmI"
+    "9RFi8lUJD3AhEnSuZkz7wZz97OKOXNK32WUQhrb+E4LmLq2mgJMNh03SXQnUNrFLmliE57Vb9ryf"
+    "vQ3ijNujhTiPcG9GoNfMXncYahucSYIMfg935gH3AHe855h7Vj3pQolVekitf4iFL+n4lPPjq099"
+    "6hB1y+TamymDO1KCQX7sjjyE02gyFYZ2TGFagAfdhfBEC9iK4qEmMdLP04/XalViQC1XxQUObVOn"
+    "kQPJeuJG3YBWzH6mCS5k8tQl8AMxtwXiD/orhZlOaIUTFMyUMCyKxH+J89Lsj1rNTvnrI272FZYs"
+    "/QsCT8nCFUcZb3f+Js01Th0T80xzZJ0Gh3eZBsk4Nl5EzFTINCM+poKoNRutvZxjuT/KWQ90xwzt"
+    "RYGv06Mzyi2gdaMqQkae72LZcuqRGWTwGuBWYpaB8aIbZxyljWcW4cVUqaGkXTyMWBVwbCA056O2"
+    "2Rz+EewBhfaHno/EShgFYbH3i+GYmM3XF0E/33P+cPx74eQGZbBULYMFueYU8Yq6T2WKgPi6leTk"
+    "+6DqQ6NRnLdrgDKHwhLxNBjnjKUSyVQlB59BZ8zuS1cmzffj2Yt3i9OPp389SRavXrxLfnjxc/Ly"
+    "bx9PMOvpd8mTJ0/wn9CgpLckRu34e3kuKj4Qk0c5kip/drJ4/xbG/fP7l4ulIO4uK+I/ApVWLcip"
+    "tmgobLdcfgv1l0pVOvRwawU6RO40err+UeqZKq6yuiz40sXAbAM3QtDFl177avDtIALu0pv4W/Ik"
+    "4bUOz0Vwj0FbpXJTwIzDG4XFwl4T2ivfA/kWjQ52+ydC3gvgox9qtUHxpGrPukvXfJ2dUCD7h3JB"
+    "EuMzL4sI8/cQ+6MKGV2K7NyYVBaQL98shP1g/gB8AQJmeY66gm5R1ZKrjEbzZC83gz+/DexbuXgl"
+    "NguNebxTwICXaDws0TkvzEVPI86T5h64kY7Z5N3BXWI2wZUqMC8NVUYh0ZQzAcj2k03xquzenjID"
+    "wxoKQ5wevaepanWBFldZX0a7EvVGggzzNoH7IRPsFsMkqKUC+VwrZoMg7tUxj8ywIO2X8jEpFxNg"
+    "fFGayAgCvuP6J5EFZJg1SUJXu6cRUstxRGKH5u2Y88To8D6zXNcXVtqpq0SY9V4TiAFxE9wtujJw"
+    "qqmgBd08TipAr+xmPmIpc4hH5TlueGzaaOB94McLQDQOikxP1XGDAA7pIR+9hUoliC5Q8VWGKVIf"
+    "SPYmzZPzW/L9ZpSwtp9LDQARzuAvhHZkiz/W/UgTst+yoscTyPkNZ4jZulcmBRB9xcxeLevBnztN"
+    "cuEx2IYc+hYWA0xmAGQUVLDGOzEoBAPM9yR0RlehK3qvHtZxr7J3aO6fNHHPbhwjEz/O/tstLOY9"
+    "TDXj2EcKkr6+YC+UDXk079QL7tjAp7oi+yRrej1wvuFx+v0dYc10ew6GajzYEX+GldApnMrU37rR"
+    "PVkZGxytB/VMU7oeoGNMW50yzQ14yRkxvpkzSDC8fP/OH0Wve9JfLsSgXKM7NERvzOwqdMUhKSgQ"
+    "EzukHMORw0FdnBBIe5dypNGXBrP+6vd5pe226krUvBm+HQJSr3+6ezQ3/2fQCkanGE3zfN5jNb1R"
+    "OHXU8i3cj/CsTh7o/fYE/uyjwJ6afAf9iW6xxxYSzdLhYTDswxBMZqAWXY2YCmcs232OvspBOrv3"
+    "S8JlI9OSHRXB3vvZobJQDsA8lBp4UStsmsddicZEvW2bNTSKr9OsCe/q36c2WweFE1Fsw/Gv3yyt"
+    "uFvlVL09KmD4lMfUSz7t5BD4efhxgA5TT5+ixDf2SGfa0/KMEhmTZDG6Im3dOaL9zJrAODWZNcG0"
+    "XHUgkRvWYwYaGKWcHTqDO3Nh3FAS3h9cpmi6KDN3JAv8C5KU8wRMwJ6nCDBy8IEJQfhu2kC28TBh"
+    "vwA0PHbutZ4RM/IH67N9128Pu0Ch1WcTptsg/+ltD6WJnjoTWXp3lJhv5tzwLuMrlyBkXf0Lgcd7"
+    "bDMeva7Ct0IQCShMz6vv8CFOreOocY/pDGsI3vV7/2fz2Pm3otEX4/D7OmJ75Qus7uuxvY8ELbZ4"
+    "GfRxf7BQZwhO7WFSzV2GEI6ecf7bgfcaVd+75S7CWelmuc5Lexk3No9V8PXiMTsmvHgJWlRaksai"
+    "csXPpa2McRivFfBiMJphimxl8tVOF++jV3RxbrcDHePD+8Xpz/YisL3AZWIr/mXdKX+vs5I+gygE"
+    "r16U/p1yzwTYy29TokUq710SNkszs3PqP6V8yBWq8BagXV3/ft/gqnA0LLZRW7s8yaHEu4T+vUNe"
+    "LChe4VL5uYROWGT/szt0wcMecJgQSzEH70L4bJMBl4TzYu+n5zojB028m13UZVvFo1/5JQz7nfZe"
+    "xvCRmLKoYQS8wnTP1VJ0zdzDmrJ7b3s+YBBJzPggzQdvpmKbgIN6CRr9i072khM2Cykab7sIx3GV"
+    "QqlQ13tv467oH3Oo7iW+qV+6qqrE0rdcww/eJ5oaeTv4hEegCdlgQph556dudVQa3pvJ9E0AXt0A"
+    "kOccGuxt/Sn7taVeLOhDtrp0pMykJWEheyEUWYd5PgUZCTuTgF9pTIY1xGWbCz/4TtKdOeHS3LYZ"
+    "hgt6Y4mYYegpJwWk+JTBCsME9kqSeS9H8UUY4AQpqGwgGfXGe/TAzHAceZSf2Wfr+DWR1GppolCR"
+    "gkhOfONPdLl+QCd+SNa8EyOsibi98SW667TuXSZUAfTQ02i+wsl5YRzZtnc3Adg07HJJ117xO4Kj"
+    "mY2P0cdJd57xdTN8i4U53Z91WeD9Z6AZ0C4YkBo5ekkRdTuvjIrP2i2XR/L+hWXW3h3skTcwyGC5"
+    "F8Xwgz3dVMDTYUNgNxdI6bewHY+ixKBGRsPPhDYzoDqtTaDew3S+EAVYBdJPXJe1l/3CKcokU/a8"
+    "MxfFrZbjXS4Pr2C8I/oD/8rLiwsArRGiP2EW5HKJ5BI9j77lUADfU5VsmiG/Pginrq+ZpVK6RsTh"
+    "bTvzv+OExqPGUhSFZE+ID1sC+/a2NcMWAcCe4ussz0VS4WurTzuhKkBDgC0+CWQuLLIvGJO5O7dr"
+    "77NaNnmrt8mAaTLdb9Bw6BT4zD0vHY1Dnsjh+/m+mxZWBlCm0jDHIOfacBX71kRaiwG0Pz7/WwLD"
+    "XkSYTueYX7wdstSoIvbarhOKUe9RNvh01T2vA8GWCWl7pgiVzveEozomNm540MaO2Uk+aJyO7dxA"
+    "MJ7z0ro8zGkDnGLKAzAq8tuBV98EL02Vl6M0gb4TomyNiT0c1T12yTR8UlMQJ+IFYcZGb/YFrmnn"
+    "ee7kVg05dwI/LBpYpPEzZsvV3SCVTJrJu4S2MT+D5H13/b0egvUHDB9RQp0PO/deT5wFj5x5LygO"
+    "+62CrdkEwHN3cOLZid0Tq1P7vuqA9wq9DNR0n77aDC3D+fywey+ZFw/LKIgBsQRD+TUcHRj36+29"
+    "voa2Me65lR/iYQjO16H1YPaxnFmYCNBJYXHKr1D5oFnseTNsSIiSDVlF8T0E1lIftFE76mwHMcyB"
+    "g5n02LxDAfNVdQkijS4+USHqBuPACn9CVvgMaSlt4q0H2kfRAjPnJKqJ4v1CFXhbVSVuLSKR3ego"
+    "d/nViGqbnisWY3gBdDwLNirpMOG72d5zHAP3DfbDpvpteRED/lUPfhsLwC/sSvk6HvBbjN19Or5b"
+    "xbIjGFgUUHx7Zi6IXJUgVDZNJ+edmRJT4FBO/ADa+kwmRNrf8Fpbfinuxd6zQ/6wl3dj+XAinjT/"
+    "lF8O5eBlm55VdDfhVu350OvP3WZil3bZMVsKA0mEMjQ55Xz9oc/IzU932XudZ/jTN/H2B93M6VIG"
+    "rDmTYVeb35ye00SPYt9LPN7fO1AH5oynexsD/s7h3/4Gg491z6F0uEsfqOM+rU+jbYKEgy6Ze+MX"
+    "pAE6Tjt3f95N6jRFf3Iwi80VO/Nafm+UNWlm1eAj8/iDV3mH8c3Mvxec6/2Q3jzOe2/e2kdQ0Rfp"
+    "O16Poy/rrwMOVvyRAEFWYOJLeC3/AaLUE2ocFZPh9hkb4ftYZAAYBuFdUvg/UEsDBBQAAAAIAPGd"
+    "Ul0O8n47OQgAABYYAAAXAAAAYWNtYWtlL2xpYnJhcnlfaW5kZXgucHmVGNtu47j1XV/BqhhUShXt"
+    "bh+FetFgO70A05nBNG+GIcsSbauRRYOkk6bT7LfvuZASZck7bR4ciefw3K+K4/iz1KY1VvZWtH0j"
+    "/y3UHh6MrbpONqJrd7rSrTSi6hsE2aMU566ye6VPvzPiKKtGagH3TyaPovfPUr+KWp3ObSfFxQAF"
+    "q4CIsUJW9VFstwPB7Rbwelu1vdSZOFfaSCHxeuSRXvOzVmepLWOjANutPnRqB2+E6sR7FfalraVI"
+    "WJp7lEacqjNdsbrqTWvbZwmEf9v2dXdpJDIHYNtUVpoU2HcXQ6rVSkvxnXgGESuwiNUSVAddCcjk"
+    "EbGywhyrRr1Egz65eAQUNuGTlGeHBvKPegKlDigURRQJ+Psan2x7knEh/jii0FHZmx8zwhFxfWy7"
+    "Rsse0NZrJiD66iQzR224kQlwIhgDpP2oernJRJ7nm7cI9CYAKH2EG6zoDSOD3y2I/5qxo9ErjSjq"
+    "rjKm2H7gG1uxbyXQici8gHYFfwSjbb0zODQyYdRFg4tGq2eiabWsrQKJTV+dzVHZNI8exEulT6JT"
+    "6ulyFqrvXkkmM2CDnIVzlTdZwoaAGG0aEPc7oeVJPcsGHItRF/Wqv/eR4myW3AoypJBS4FDAOiSI"
+    "dC8jx0przY04zcUnFNqLREFQH6v+AJJVerApcnipuid8PIAaeRTHcRTttTqJstxf7EXLshTt6ay0"
+    "BexegRVa1ZsocmedOhza/uBfleHL58oeQS5/8zO8OrJVfaqeZN605qmsQTnpcRKKNDoq8TpHHhi8"
+    "HELLn5jy0jtt+GwPiV6ih0qMGjrqVNWU4CylHY4Bt8nhJJ1IMxaYiTAulLLwBePKceCDcgiB0icJ"
+    "wzWEXtmFJAwEnj8p7UCIjn05KzliS45Yhks7uWWuxYfqUg92rNWlt5mgsyaKwEFi5d2UH6T9AI9S"
+    "JzHfjdMoKh8f/lr+9Onj48PfP77/AtjxWE8G5WJG+/zh4fEvn778o/zb+4c/v//yzyn2lRIGYilq"
+    "5F6UGJsGneOypKCQSMX9j8Jezp1cGwv1t0XB4Wcj/kvFo3B2hDDspz52ZCDL4nn4o07MVva1amRJ"
+    "hWfCOUPvFYODqcQWoYtJtKat7USGr1wNsSCSRlANZ6ql2YiklbKAA8olwC/H1xDsRAeMZDh0kZVT"
+    "cZ2dVhpizEIJgsQ0c3Ajz7JvFgCu45gSKpLWbbNA+hlbsOpHQCip92dBlsrda4DAlXVAcK8BAqat"
+    "h+Izg968pxoZeIp+CzJ/ECKDswI3bdg93InQOFDQnQ0gkOpMgFYQokRwPdh74/MXQI7Y6AB00gpj"
+    "JHG3yImbwBrIbTX1z8QvKxJkgDmBVqRF4t4CcjPfrFDyAez8soL/fJjSLxpyFB9tMarg3OM48i8k"
+    "G04QR2DnzeGdGurmHOeuOkTv3BARfThh0DCDJmBAPveX0jCRwPacdGOmWiylFw3l016l6nU47JTq"
+    "Jmnp2HFKbsRqtZCV1OumvSOZiulFoXLMt+bVCqdI5g2dcrtdc+RdDT8b6OFoCyhhwYBgLrv7sfH7"
+    "Yag1MAVhscPnvYAOKyrfWtIc2zEyIwbg7rAdes2CYA5bzgQMlKkdm6CuBgZ0E10eaJPx+BZ9C2up"
+    "xmbs31m7wyKYphtvaC33kC3HsYEmu8pI73Xo1IVQu3/JSRHAIOAeMXjhJw4awa2dDH+HhO7g5GKg"
+    "69GghvJhg4ft4Q4w7zLhB8f+ctqBTwDgxyWQCkTvZTPYH+mVi05ACNsYLnOQcjPDSIFYFF/fhhIF"
+    "MyOeIty3OEDAf95JraGtp69lAkJmHPOju4AFUqzX328KUZOqNeYb4K7HEX3zNtaWPcN4xKfUGFUZ"
+    "6Q4CAvU1Ur9JeuMlZfRZQI1UKExGOrenJTYhE/ZnbCik4yPQeQSOvueRT/ECgrTZtoMMLslYVRgR"
+    "EDwAz1o+AwhQcBhKEJaG5iI4qIWJOFUN/3i3WRHW+g+bCQwuM3hmlCvy6x/IEUu5PL8TWiWvztg8"
+    "EiSSLmOCddv+IqdCd+2NCuvq1QLb/43ljN3op9+vxA/RLWoLNTad9IdxKR3DNZtsof7xLRuZQmH5"
+    "E8+9SUolhpYA2oalr4tQAxIfi1j4XUpizdkMQx9nsOutY6Up9tA7iu3P11sDbjM1du+RxxZKi1aX"
+    "w5FKDImQ87790BklzpcdsD1CqtCC5+8P3zpw11tcaK0iIjclCcvtFhde4g8WUh2OQo2SHNq49YXf"
+    "VXj7c3oOA4ZxBY0rcjh3jYVtD/vGpPB5s4UomnMxqANk+zDxUCpEyluDwOQqKGehxh85VsHGmIyb"
+    "SJzBKprjYV7tDAGpyqRBpNa0Fw1bYkIEoaFNtqHxAvWqbFKJbnQw6l3jRVrIvGyvHI75QCYOSH7z"
+    "Dn7LggsdFE1iHFZmCN4lSmBZQhW/WVFLnRg13ImX9c/49jT1YZuEVWN3OQwSOm+8g4B517gCnJhU"
+    "hGp608xE9KUceLtEd3W0FzMti/+z5C4WxGH6RB/ON4+pspQHa7++YVTT3BqiUAqs/daWd+oFtE8R"
+    "Fc4WMG9hzRb9hH4nlZEouAmKonfxw0GCss5r216r/8ge2NAI8u26tkx8K56rjr6fNWL3CuPq/Bva"
+    "MDh9K0tjz+HebyOZuEuuc1fzbqFpIEHNhm7xa0l8/a1iGIUXp6ylBYGGH7ceFNfJef2xI4cNMA4L"
+    "DPvLm5yJkQFx2fg1QqfWGEfJfbhEGUDT21+K2OH+zo2svjZIBn2WBSqgU2jwZ0KvaTbs6/jvza0Y"
+    "Y9Z7EfyXd/ayBmDbWSoBRAfd9a4JP5q64uW54DNymDZ/gka/AFBLAwQUAAAACADlaq1cixp7lhkB"
+    "AAAOAgAAFgAAAGFjbWFrZS9sb2dnaW5nX3V0aWwucHldkctqwzAQRff6ikEQkBcxbZeBBFrapIGQ"
+    "QkPp0ij2+EH1CKNxIH9fBdmJWy30mHtm7kiSUh46ezIIZ6SjDx1f5qV3TN4YrMD4pulck0sphajJ"
+    "WyiKuueesCgg5nli0M551tx5F4QYYkPeeAyXKIkKawjI/akYZJU8cQGdY1jCQwbz1c1zF1ekhYA4"
+    "DJ7RRGLUXt9evjbQ1UPXCKslPAGauFMjs92vP/4hjwkZie/nz/12v8mShW8mBg1y8ldSl1b/oLxR"
+    "ebzD7tqP+tPNXW+1qwxSyEuDmlQS2knxAxNq+54wFR8nD1wh0UBODK7zJLr2ZDVzTBpL3SNylnCn"
+    "LWZhATNlMQTdxIPM7s3pqhqN2xSl+CXkrqL4BVBLAwQUAAAACACnnlJdDaintwcPAAAPKgAAEAAA"
+    "AGFjbWFrZS9tYXRyaXgucHmVWm1z2zYS/q5fgbLTMenKTJzOXHtqlTmnddI0aexLmvZuXA9FiaDE"
+    "mCJZEIyj8/m/37ML8F1y5jSJRQCLxWLfdynHcRaLcLUNb6RY5dsiSeXJNtQq+bRYzESeSVHeSL3a"
+    "iDhXopQfpQpT8fyfz96UU7GsklRjV7aqlJKZTnf+ZLJYFEoWoZIBLUeLhVBVVgKT0BscEaZpkq3x"
+    "rGQYTfmAZR6qSISxlkqEWQ4wNRW3G1AiZKjSRKoJg5QiTGnXjg+OCGUobnN1g30Gn3A3eX4Dyn78"
+    "le7zSLxJsg/hVJTJf6Tni7M0NTOTJCt1mK1kKcoNSGUyPuRLII7WUgt3tkrDspwtfsmXz3hqge3P"
+    "DBF5zDcpw60UoVptEi1XulJyomRVSrPGLDsqRZosVah2QskyTyudgOTbjcya+ThPI6lwsSwSRRpq"
+    "MHkrNrgJTUIMq40/cRxnMolVvhVBEFd0UhCIZFvkSmMf+BUS3nIysXOgR+k8T8t6Is3Xa/C8HubN"
+    "Ami2T+UGxKXNqFoWKgd3Gkgtt0UMgTTjZCsNTa30fUNcWdP2nIdT8RuL5hIUnX+Sq0rnyuyMQh0y"
+    "m9stzZSBKEK9Aafq1UsMLSeMwvpGD+zyMxpcpmE2BVFpCqEE61X+MQCHJFSip5U9LLhCnKxrNGcq"
+    "qpIsp8PKHlj81zJr7gYD6C2y3jWEvj0P3rx888tZ8PPFxavg8uezd+fvQEFe6iAj/QsIPCg2YUmU"
+    "wT66Ez28+fIDXWQVrqBWFr3MoCYrGXTXAqO5vb2QRQHFkAFJriGuSLKgWSl1tQy2JM3+sWQwgDL6"
+    "ZJWCpspqu4Xe9mC1ClcNbWURZpMJNE7Ma73zQddrPErlOmaL400mz96/fP1T8PriBQAd38wb2fjY"
+    "B42fRDIW8hPwRQGxPjBeyaXncgYLKvVVqdX1VGxlVnVnxH/FGzLoOX954uSpWSOhXc8mAh/Y1DnY"
+    "xnIkgz5mrMfkAZdJJiNxm+iNIG+3E6tNnuCCBMUnHQt3sXh1/u/576fT358s4BkmjPOMCRF5wWZe"
+    "u6oS7iQxvo8PA4Hk/xL4EWBXSRTJ7HsRVUWarEIoqiB3FKm8KGTk17Tyd/hJ1rfkPxp7JF14Skiv"
+    "r69x4atrBmVfXcgVncw0C0xc2bvT50busEsWU/ExTCucOmd4HxaiE6LfdeaQUg1uWEBQVx99ukHh"
+    "enzIRzrBoPBLXEG7ztTxRBKLBu66wYJZ2CIdS+TQI8ho0Nkpe1RLKn1UmMCz/k7nnCuVKzd2oBlQ"
+    "fkjq5ITZzgI5e/3+/GrKX77vQzXWwHhHN/tC3XfuQ6z0Q7A4i9wrt0MF+NG5mKXl2mzMKz0TUbLS"
+    "huesTeDI3X3Lctpk9LM5agmTBhRBE3dL6ZYtHbSJVC6njY3f9uF8o2ql3WOi0+uzIrbIXELsf8QN"
+    "chDDAwpG9pHjZZAgwN4dH/OMUUt4m+NjuoPLx3r3Xg85ruhDYWF5YZVqN/Z1HhiFJdbEBlhJ+PWM"
+    "FdGlDUb8rudZm7UuDtpdkiLxaEYqypZotDbJ9FSQiMzltNq1tyxIGZsI5MM7uleZiePOyYlF60C4"
+    "q7DgaAgiikrPf1MVoo2Wn8yjIVZ+WslCi4t3rDftIfYSroHa4kglfQ64rnLcP6OvvT99/nLgt6Ed"
+    "EbPGKEmPDS6u4m79tcqrwj31wKbuxBPPY2vYCplCD1ziEQc40WQWjUN6keZL5FaLxckHJE2cl0Ri"
+    "uevlVxQrMvIfnMaIJo2xLugP8lpm6elcnPqn31CSdHnx7uW/4IHgc/AvFC/evBec7yHjKaUCR2eY"
+    "ff7y+YXYIB+hVIGQLRa0Lk4QMQqJpE2WIEvnNxLZXEFhO6KsK6/WG4D+evbq/PnrsxfvAOMav2no"
+    "CNMyrzNAyXgpzyL3Co7iWEYIrgGKfGSbmOkczEEqKDJCx4LEicdE0zHnSxB/uEr0zpifkoZboYiT"
+    "LCk3NOK8cp0zMsbOuWXpiwv6viWfIikKGEpxXMnbP8nIMuDkAxj1yT2dMqvEo0ctL7zFonXP/MC6"
+    "H+BwHQRuKdPY7JoJVvZmI4/ZFCg6tRpJO3w+Zt491OsDNGhaqG2Suc30tMXjDbYGeluwHfbj4wAo"
+    "jpjAh2BId+I0XJcPYWOLJUvmzNJHOg/Tcni244hhGnnpZ5RKf4E8INMOi9Zspqd9zsQj5aabn34z"
+    "cI7NPXFwnbL625uInl0kgJDt3OYgQaP8gdN3gnES59gPuij/BCvB3wYxfBCtD7YAdntD8y796a99"
+    "KX6WVKwg2AhKCR7dKnj6Wt/Z6oyGm3SrFOcXz8VS6luJDStUP5ku/T23jCNDJCHmY6c0ugje/vTH"
+    "2xF1fKZbb0SQcL52BBKZVulOBvrleeMzG8Hj5Ng5+XDXbL9HGG4YehJWejMnkmZ39Pe+YyCU697c"
+    "hmpd8tlsBxSPWjnCnl7JHco6lIRqXW3p/hwoZ3GVrWa2VvVZE9Yyo/hglGSBem+xAMf8gOYYDEZa"
+    "p09W3QYXgUOkrKNvivSx7v3OkdlHZ0ZhFGzEc6JyFBhO4++w1kd5fz8MMncOsQaA1mBbpsOhDLh+"
+    "37JqlealbLnUJ7G+CanBwTuA4hYJge6RqdGjnuk2uMmQDiK3hq22Gq63ayDJOssRlSUF3LITivvH"
+    "GiPlcyeTf7SFn4mOv3Ku/1aWSEPMsZRWzUzdRUOuFIIoQejistBYWn4DbxSHsPpIuLZJoATXZh5W"
+    "mCSB1KfCAt3K1oRsiQxuKEUI0pX1bvBKvM0oET8ecnso4EFiU4bug7A1aCkR1COcEKd5qAHx2H/c"
+    "udbBZdM2SGQZcK8BrnqJhJEyQoRZcwSVaSZNHZzPq/9AVlUgzdw1WoZiKyA/1yoa8XOUKLHQGqbD"
+    "0pr6rc76zCJOcm16BPq7YkQyLjOpQm0ZOLXNllmbCk2p3oMPDFCD8TXN/ZCUS7WEHnNkmgysoVfJ"
+    "p0ldiJILMKV+IxtO8uDV8WgKKuQwVBDTUkfNTUZKEQRlsQ9uxQE0JkN2brPFXrbKhSJVvS7hJi3t"
+    "J82OKVudaauyczqxZeYghjFCduqEsBYPEN0Ch8xWOSVoc6fS8cl3KLXCkguTHgrmf7+p4I4Aaq74"
+    "psaWiAp9uqaH+hhWGnP7TdH4yQi9N5o51HhwB+wYbaTUO06rcuOO1xoxP3DBzo0aFWxuwYkyVdCU"
+    "4c/xnyoko5l+J1iNT+5Ux6NuE1+pBXhQFn0ZjJda6vtre5tJ7kCiA3uaD8ZeH+c+wbYQvYKqU6D9"
+    "GOL60aUZjcqs0jfedMrPxgPDpxonDY2OHeOnzcT3cDRS3HU1/97pnuvaSm4q3sIkoT48YjOQ/8+x"
+    "MFC3LhHhOvdtJfj8xumvwLtSUtvphXVkjcoDvNj1kfVc+n6vguRLWzdqW/B1s6sJfXXnh7sORiam"
+    "yWzin5mhQr+NiWaOWIjN3a6mWTie1tVYuSfjN4t9j00MMf07s6qMBIIkknWC3sCdPv7b428tHEU9"
+    "ox17Y6cBQjjrNTSb0MZl/cTYGfNGBTBJKoL31R/TThi1sS6Rh5uD0zpW5elHUxIc5AURWBC/uyHX"
+    "LqHm2x3eSKtBE7oPIgig4mkVyc8QuzdE9tF1wyVlD9NJ2wTthuS2GcpJizg2KnXM6bYp4ocN0gp+"
+    "RSHN/qHWtaePfuDGeCnXlKo/fUR1sVEwLtVnqL11mEIPFfmJtJaiqaipByowL+wLHte2nmbix8v3"
+    "gg3E+14gB9rC3Zngu6FRmO3qLcZ9YDLPVtI36ZcwLaGm9ucq3wCCZOhYrnZHpS3yR83nbmXP9rc/"
+    "w+CayqY93GGfdMySnAQ/+Fa56tyBmTG3t1ecoheVcQWmCXpqNZhfRM3b5MjlrVORUrlHwrAVGgj2"
+    "kwylZ1tBfWV7H/B+eKSj+CHkfgssVrhflZ7TevYWZTtnQyBvHk623Yb2zKb6c6h+sIBtncXtL64Z"
+    "98TWqyPafXR9z4KyhHmdjHcXbOU2t2lt03JVrMS1cfcUu9MKNy+lLJDpPvbTUvOeqts+Hyd443dY"
+    "Loq5wLx8LOdDvnA8KgA96N1CvOYt0qhN3HCYqjG3Ni7k2ZxRWn8G5x1YO3M9b6BZ3Y/i/lD3mizf"
+    "Of3pJqLLaO9e4mrdHsdwDPNQdtyD6zJycIhvU/Lee7n9WRzzjkg/uGps7fB6G4hHiVT3U7ThcS+W"
+    "ccCb75l7AH8nEs67g8NbHs7Jhp9hFJ0PJw5vHUXX+Wjm8OZhwJ0PJx4UTRN8593B4S1dpzDvDh5m"
+    "DKL33H4/AEiheM5/PwPUhvT5YPy5jTbQz3uj/ZvGNkWfUehxa4PqlDjjrTaHPucvfklJWTM1TrL8"
+    "r3Amnr0+f/z4FNko/ypDUWfeNtG3VanNyzudF9wuMQnqQeOuM+7YudO7QiLX9oOA+rxBcD8Td/Le"
+    "2buVghlvdZ2v4LO/KqlCGNXUzQH7uYNMWydZJUeLo/x8SPWgP/NAtr5v97A70+k3dNZIT1E+RGPq"
+    "TKSqHe9eIknOU44sPiqwbaLdtu/CfOmVuMv9XZWm9vUeqmopWDFC0MUBywbS3hZoFAkZBbqslWoQ"
+    "BpKYgQ62EenzJbKw9h70iyHwn3K75iUv1W3mtyWaOlFICbOd3tCLME4swGFAb6SS/l7JPFwLkh92"
+    "QeSYG/vUcX+bZ6CSI02zGYJpx3omU7Q/3KC6nZKatmo0KtP7eQfCFr0+RuTvC4gkYyN2swCWGxRd"
+    "rvPblAOYR92v9pU2v76mV+Etre2lHvghCqcwvRelNZWmzi3AOG2r3ECHy1S6D6Rzg5YfEvNLqU7s"
+    "7ymMaOtW7iOb55Ph0my+VuGWL089ZrHcaUiqzuxvk0hv7Ju0K8qCHZKs412LrwWP1UjU3ojv9ucB"
+    "fKPWauH4jmjv0eyHOz7m/l6IuyNDLia/vcfIEn00e/odDZnyegCPUZpnp4fUXglLfycwuhWDOZ2s"
+    "eUhi5y2jaWAo08kA2F37uoIwTw2bTIuDfrnjOvZAx5t2Jgmq8xKMiCWbOnH62seaZ159O8YpWoCR"
+    "r2Qgx8b/qIN6wFfLhrFgenxW1uQNn9XQsc+efus/ie9L4Yzx9lvwNeAd3dBIhvhBlzDfHQvjKxyd"
+    "GMmMMDNfsc187932XScqfk6QzEXbqPrCdKqsict+C67l4V62UTS2e+gXMv8DUEsDBBQAAAAIAEmc"
+    "Ul2IStB/5AgAABUZAAATAAAAYWNtYWtlL25pbmphX2xvZy5weaVZbW/byBH+rl+xZVyUdGTGTntA"
+    "wcRF7kOuKHqXK9K3DzpBosWVzQvFFbhLy75zvvYH9Cf2l/SZ2V0uSVG+oBUQmPs2OzvzzDOzmyiK"
+    "Psq8EOt1Wpf1j/mqUrfrtcjrQpg7KWRxK7VQW4zftGVV2EmYEG9VI0yTbzBMk3n0wpQ7KRq5V43R"
+    "SRpF0Wy2bdROrFbb1rSNXK1EuaNRrKmVyU2paj2buT6l7ewiN/mmyrWGbDfUddkZ+9zcVeWNH/0L"
+    "mrPZ7F03K8asn2R9/bemlcmMu8QH0vxbdfu+Ns1jNhP4QcHvaym2ZV3qO1nwaTNBh8DGtdhpoct6"
+    "I9kS2uSk4pYbLEs0bY1WbvjwRpTGnpgk8+zVTmeQY7hH1sWgvaNtQlO1Zt+aDAsbbm/Ubge7ru5y"
+    "fWd7ufvdvlF72ZhHbhVyK4q2YTNCeKxltU3ExR9Iqj0h/RoJ0+M0+UN8ORc0J7XKiAvb8somsOEL"
+    "8c+mNEbWopYPRhg1RsaNhOcBjHvZPPbskG92+SdnJZySjIT5vyE7qkJCLIFElz9JAXux0XZqJ2sD"
+    "hZRFGtxSWqxRk2XSPg/5xlSP4kBLtqqq1EGns9XHv39Yfff1xz+LaxGldu+V1RIL4YMZmaYBsFed"
+    "7jGBJmOssI2qUpvFABTLDhXvgzK5uP/q5dgIAMe2rKRQTSEbEa/XiyX1bsWu1IDMLQZEW9P++U0l"
+    "bSSQ6A559KvKGltcM5hT1tXA5LGsN6qAjOuoNduL30dzIZtGNfo6QmBVCLgoSfW+Kg2vjxOLroeN"
+    "3Bvx/V/f09wj3y+Ws15rtc8bLVfO4jHLSZzNpsYyayuAcPm85RQheGIUh3QaEGuQTLKgld2pCutR"
+    "j0WjPpTmLo5eREmYYMOiNmXdyq5zT5Mh3y4ls8TRDyZKBmJlHfO8RLwVX/2CwIGLulCeU/zObdBi"
+    "N8SXlbi4XCbzXvNq2Hy9DIo4F/0jr1o58tKkIjBmmu/32DceWDM+UmhurbD47dJ//W6ZJH2PQ5bz"
+    "L5sohIqOnacn/Ra8PTEYouWPjWr34txJOhc3nhjK+l5tmJ1SS1+2256K8gZHPQU3+IZa4F/PxpqZ"
+    "QVIeYj5WNVjgtlEHQdAAfJh33rDYXOhdXlUIRT/fERFTCRMZ5qZeX2sZHD47fbgAWSQPsyK51+KD"
+    "qmUHY8awt94Abn5BqXkFkYH0lPu2Gx66n9Tx7l70UEP9i4urpR+TYainmBff9zmtdE7f5c2n4POY"
+    "c/WqKJseG5KinUM/yg2YjdzSyGDCQPY4+Hkn5Nzb2mpI7HeUNaYJUBuoHrQRr8Dl3SJiORQIcTgv"
+    "nQILttHP2mBshczyWbhvyiyfo2ep0C2PLsXlhC4DNbr0kqQHZENpiZkFvBTRDzVx8oiln6fhPVUu"
+    "1hfsted9McWgT0MP+QTFeRYSe85hb6CYQRS6pJwXBdrHTrExuV6TZKQvjsJasZBDrtlgWBdn27be"
+    "ZOshiNYJwdqleZ7uslNh6x+qmzKvFeC02yOPoxowpBcZlXCSA1gHzqRzrg/Wa5YvLkxYA8WwUe7q"
+    "nUry0choVA1Q9i2Us4POd3IY46TatTgFsGMQAFFzW6QAl8Ti9wmH+j0h/hRCTmdul6fjJBlCHpv3"
+    "se1AEzvUzHspIjnK5B0FgWhsOUV1lY8H8SvKTYosFuICnEN/Tosa2IDYVaDGrGOoORdRcxMlAu7d"
+    "DvkKVaOUn2ISnAwGqAanKGW7fFl10ikyXZ+QxLQAHgoZf2FN1FUzNt216Nzke1nE5Ccup0OgUVnT"
+    "xZUFLFVkPCj+869/c0tTkXcGgM7x7yxzNyR8nuGzE/+Geu7zBn2f6MAwW6lD9RfKI9ozZJhN20z2"
+    "l/i85K/DHVWbJWUPOIYO0UPG5g7zqG9RLvt5iPrBd2cR61qCuq76Auwdj5fR0JIwHonsLBrVJW3j"
+    "c09v8tDn6LsWr58vZ4JCYrQDjbSjasiZy+8cRemPqqxjzEuSo4noDUZjvFVanjzF5q5XHJLiVz6e"
+    "Blo8u/tRWbWy9zdN+ZiL5gCy7i4GGPypLuSDv+Ks14QjnzLR4WTYW4e7cGMG18uA38WVvWPUCJcA"
+    "qlMgoVXJUXUNiDhQZP+LB/sispEIZ5Nyyrhu7OLKmwvcUm7yamXjdepmFsJyfAcJvvb1BrSJurqs"
+    "yQ8E5f/zVjW8ptEtze31UsTYIa2gSbmPE7KKHyLY0fYBXy+IEIgsjLvjFta5LNMbmLLiHCRSSa0d"
+    "MGhNSf10PxeOXdJwR8nLivKIdzMu8v47baxi8HAyuATxml+L1+S7q6HnghnZvxnKzV+4dI3t3rnJ"
+    "hwyr1Xc9jx7fy/l9KbbfVAf0UFCUG/b3PHg+8PR6bYPFBhhFDb1JyQd4cEPWLHf2i0mOb+kXdIFI"
+    "yPznYbtzVwN9Yx8WYHnULVVbUDn0Ci3d3rgHrzcuDdCbRK0aXDeQ+QqR3+Zlra13URnIjVH+WaS7"
+    "ZXDxQBNcwTJSARdGX72gjnoUrtzqNnHUsuZCZ1jf3OSaoBmEpcic0j84kWmzSTNizc+fbZ0mZQ2q"
+    "kmZBdqcBfCNrd89LlUIWH8VnqEQdtjhf4pQkjWqPWhkbf6VmteJkiipCUYRlKYpU3ieAtv9WMEEY"
+    "yVEWGT8fxJHzpkC4R96XAoFxnGz4nGzPV/23BDrqXFwluNinLuIn8s84Ppw+ZIajJw1bu47fNU6K"
+    "uVHFow9MivFuvcjGQVqpGjMHmYhWJ2O17My34vILVfBpCbSr2CmKPTIurWivRcbCl0yLXI1GT9FQ"
+    "zwOikWRNr7e6UaWSjWsMjvLJNOB/pBtzP++xuMqWGVGwbV0uiVHt02Ilj04OfQ+c1p7eRcd2YU+A"
+    "tj6RvHuEZWGfrh0dGIQK0R6SDArWadk0i4gABgEYn56mEBDO6Xl0zAIM0bk4jFDYecX56lg0s8Hi"
+    "hDiVLPlRi5a6ixOiIdDKgMlZkmPyY3nD6+y8/67N3IG/HYl/faNV1Roo0GNUHGVnkySzCkrog3uQ"
+    "xvHG/wvx6tQ7gy/QdMo8RPLpI/YdXM9Bl6Bw4nWFaf8LUEsDBBQAAAAIAEmcUl36pK7qbgoAAK0c"
+    "AAASAAAAYWNtYWtlL25pbmphZ2VuLnB5rVnvbtvIEf+up9jyggupk+imQL/IUFEndZJDe0lQp70C"
+    "rkGtyJVEmyJ53KVlI3XRT32APkQf7J6kv5ld/pNkJ00rIJG53Jmdv7+ZWXme92OVGiUWi2WdZkmY"
+    "p/m1XCyENpVM1xsjVlWxFWajBL8XZSZz4S8WMt7KGyXiYlummRLT6VrlqpKmqIRjEYSj0YXcKrGu"
+    "ZLkRUovZqs7jmSMN+X9QhTsSIOLHhfDdpr/v79I3ysSbiKWImOUiGO1Ssylqw/K9+sEKlK/SdV0p"
+    "aKDKmcgLqGZlnV6In//xbzF9SV9QsciFhHpKb5xuSVqpGBrcC5knoBy1lFPeAJoTd0ylnL4puMQb"
+    "Fd8QO3WrQOxsEoqPkGpF1kk1CEhNo3Lsy+5Huw3+So0WRt0ZMJD5WulT8Y5M91xDZOuIKCvW7Iw0"
+    "y8CCpdACGpc1aHebQrMLtiSvZZKEI8/zRiN2WxStagNbRJFIt2VRGSiWF4al1qORW0ukkXEmtVa6"
+    "WSrav/QmU3fdQw1J2qd6WVZFrHS3+V7bg0tpNlm6bE79gEcnknOrNbh7/ZIePiCwBlsazze7/JHA"
+    "h/e+IfdPuucLuNo+HkaJXXcxZj0TOZPp/rt0FTkLTkbBQJDWE40kW1ndRHa1qodCI2ti1eyzW3Qp"
+    "84ngF8lo9E0XjufCFHW8gX+bMObYmom4UhIpSUGtjdyWAkm1rPFNAbM16VaFo+jj+z+9eivmwnOH"
+    "OZNPyAmnzVNIlvexEspqfXv54ioI+Uw/QIiMErUSkdKxLFVEBD7yhQjE3yj9AzH9DX3P2EgIKn6V"
+    "UtI4sIDkWZpD4MXi2WKBk0tSnmJxsZjhpUQWckRDptzIu5Aik70EucHZLwN+TFfC+2vuEW9tT6MP"
+    "8AfR/WeZ1eq8qorKX3m52tGBtJHkFTGHs1gq0SSXKUQPx2bik/5F9eDZYyqFXMARYaWAYrHyvWfe"
+    "RHjPnnlBtyR4SfSXZrw0A5ehyW5JNF/PDo31NQr1xBa3skrlMlNfLH8jmQvsiJj6FgC7BBHxLmkd"
+    "/K7AsXP+OnD0xUYBbhpcWSH6xsRrTLh/skzzEyDmNLYI+uH9xfd/mcDhrzhoP1hAsO9+TPOk2Gkq"
+    "BMR5jPPHM4dT5CmzkaYHuqu00khzOgoYt0IgFUiByuW0jbylpD8JVMHVicvfTUpDpyzVhrmEzWIb"
+    "ZrzKGUCYTLFDBuhc1BCEsixVnviXFKVtDqk7FdeGHEPRoYvsVvlBABdMYzjCZuSEA7s7J7hqDy90"
+    "mFM9nCNpc+N1p5ayMiT4ZYeoISnxq3ibsCfjgL0Qkw0aEa9acrCGZY8r1LIP01yryvi/hLhxIk4S"
+    "4YnvxGMHst5gCumDlhdHKmQX334rvPC6SHOfWXc7XITakF6JTDU7SOcXQmWI/9VzHCJOYuF9on0P"
+    "3vPR0AZUcCz3x9V+SuVj6rKuzPinujCUGla9YJBZRzRzeZUg5au0pLp5mFZLl1XDPDLVfSeT3hS7"
+    "nEEPcWHLNyIoQyG+VZEp/GViBVF3sSpNDyOeZNGXfeW9cQ1JvgZq0OYHwvjo7fnZ787/SJa1+eLq"
+    "lvqpRuIlEToWTT0M/BP+2pu4nHLfVY3mBSWueW4TBNufwY3des9A9I4eu5fIFfQcdMRjB8DAJSX1"
+    "/3iQ42Jf7DFMCFXmYh1/TrCrxulkaUZS/bjPJ2L8NK5SWlE2XVlPssJzUrzTuQWmRvxeWNucoe0W"
+    "5pwWXhOmg/Kd2HxJuO44hqqFP9akjQP6rLxvECoNUKrcPDgz2Je2R/s0OKIXfcEDyhPp8yA+kVgP"
+    "Xgj8hm/8oM8FrtySGz8Ny+ZhqWI7BsFQBuvwI+T7GUku6YhblHjMrl1edTEz3NsiTOcGhxoYAvpb"
+    "hwDZlo7VIB73xG9Im9I+oPSG9Z7fISZ/a1tIP+DotE0rJ7NPM9ms66InrvEkhz0al7TcFvzjI6Bv"
+    "O7n9pjm81kWO8Q5RxjVc7U9PrtyfUVNADe0riQEpNHeG+kW1Qr923xvYljK+gdZ2RtoWtwq5RG/3"
+    "pUmNq/NuvnMU3AklAn2CQukthEYvHW8IBImx2NZoKbqZUK5lmg8bBzi6M1fj7y48eu/mPPza0SWC"
+    "togDryejZdftD1FCkFPh9gZ7ffug5x+rGoKqO8BCVNzwY2DtZcfk+ZERhh1sY2JJqcSLnRzD7EZO"
+    "u0oAs8DSblA/MsafNnMnN+qwfOW66BDdzNgVDptJBCsU84Qs9nTu0mZ7oY9ZlgJ4Hzltbh4Gekvt"
+    "oMaKGlkDzES5KfJ7Lt3H4a60cNcTCokh68zYo45lltswPMlzDjg+I/rM2jJDnSanD6Mao0Kd45gb"
+    "f5tqjcjr/NrL4v0h0+8CZcLDglWQxQ1IZSy17YdcotmsQQ99Ee1RmsdZnTxVlzjH2/U20ReLqaO1"
+    "cRAVpQlpAv35n/8SzSmcRw10IWirFCGSFIydru21iaTtxYvtyRGI4ZFm/LILIBpB29LUbOlCiAZg"
+    "17zTzg5WiTYlwoos57+YcGOJ7UEwbHSpx67NZSqm4sUVEfheoy4NStN0K+Oq0F7g7nfsxYTPNJiM"
+    "U90a2t/j7OTDNje5ciA4wkenBxKxHwO9i5Z2hnOVz1HOu4nlOOCzrR3sc2Bi/EzSmFuMSe9y5Oqw"
+    "CBzC/vv8EGY50+keS2YOieD8g/u+KYS8t1d8xOscuWDxAY2KJsvTTYUlf67368Mp5jjebO+vbDex"
+    "N+0xW5lhpkzuhdoSLCUYDTeSgL9YXoMTpn8Ih3myIOjnkTk37NksXVYSA6XdpydcxCoV0qWkxXwt"
+    "utu42N3UxTLLcP6NoharVZ2uZriAZLAylZU2tslSVFR7vbikqQFiKrV318luC+H5dJ07H+7krdKw"
+    "oDjnS8MbdU8z79g6dSyWCgcRNNvpiKHQIC+U4YN5dG4NvEpzuMtdC55CXYdz8Ke7MoRuxB4W3g7L"
+    "31fVqy8pOP1I+S8qjXsxQxCaS4pWzjhl/KDFEVsoG9DXIbdUup+yj1bJL6plDkp6rS5tbQQ7wAUE"
+    "BwKjVoMXjX4ySQY989FDnuxPmw+LPP9MLeBKOyD9bGHmtnveFmiyDt1STA7MDPjZDqx8vJYzk6Oz"
+    "A7GlocHV9QHFV9Z4+jzRQR8v/o93FCxha4JO9+D/Vspp7rPobdu5JjrdNMmLSI8lgHEmlkWR2aWx"
+    "/boulsB79N3Dht6+VPltvxbQzHlsmzYJYnFuF7gmdPEGUHhpO7HetVyDlEhtB2q92WPR3O2RaGO6"
+    "CZ5e0+jgbD1rf9EodphLGLgUq6EqqEkWHkPuMf/k8cPZ789f/+HszQUXFuZqhQVfzg8GPYilUkBn"
+    "x7mpH4lQdGVC9QfBLRMHeMKoaksAOQQ+xojW/t19XoeKBDz8g0e426TxxrdXJ157n0e5aq+Z9654"
+    "X0PYd4V5XdR5Ym96LSlTrGiVb07PPr51zOyEfMmbqFF55U1clxG0kywZ7ZFLS1B/R0A8vXZ0tLej"
+    "bOKpuyGrEEJ+mwKgDyZs4bm1txVq+CtHe0XFBbH7ZcMnBHGWmXT2JEDp3V1114zECgdO7I9mTXnJ"
+    "b+f4N2mC037xI1zaSvUfUEsDBBQAAAAIAMCeUl2P86TmvhQAADY/AAAWAAAAYWNtYWtlL29iamVj"
+    "dF9jYWNoZS5wea0723bbRpLv/Ioe5OQEUCBIviUZjmiP7CgeT3zJWvKe3VV0QJBoiIhAgMHFtEbR"
+    "Ofu0H7AfsR82X7J16W50gxRtZ8IHEpfu6uq6V3XR87zT/B9SJPN51ZVtXl6G4uXbd0K+z+dtXpUi"
+    "KVPRtEmbN20+b0RW1aJdSNEsklqmopr9IuetmCfzhYxGo5fJddW1oitTWYvp9KiVy9Xjg2S+TK5k"
+    "DGNp3MF0Oh6PRgI+R1fy+vFBpAbAMstVc3CTl1kV/dJUZSiKpGnjrpFpKFZF0sLqy3iR1nG2urUA"
+    "zKtaHoTq5n1S50nZHgjzqUrZ76cr81b4nobmBRacIp8dHL1OlvJxfLRImsVjC4iCQ9NXsDsYWyf1"
+    "tZjBZgspfEIe9qw3YzCfTnmJedIcMLmagw8fDo5q2XRF+zi6qcL0dusS86psZdnuNy3sT/B44S/b"
+    "fCnFhEgjYIEe+jIp80w2AD+k+xzY8CFqfi3yVj7AQaV8D2CJFMC72bVokPV+s0yKIvgLIL+/v0w+"
+    "7CeXcjoVaV2tGmFgjkbT6aqWK2B7POvyAvYlmGEsD92sraUkccFVroFA5RWuwvRpF3XVXS5G46wr"
+    "5+NpLYFnacz0iEkskFhTRILv5tVylReIyKzTi/DWqwxpgTRJFVEaXHZEAtyIRQ5fB2KZN41siI4a"
+    "t7wk6APCAMvEG+YLgk76rQDRQcrTEe6E3m1jSBOKpiJCNjRDKRLghkvnZZXKsZK+8pL4C4DadUX0"
+    "aUYZrNSIsmoX+Bo1sKCtwgOYflkh1EasZVFEI8/zRjChWoo4zrq2A07EIl+uqroFAgCMBCUcOKWe"
+    "oQrp66K6vIQV9G3V6Kta6qtm0cHq+g5VNwMGmHsgPS+eJm0yB+lD8qqX5lEoslwWKQ9cJe0C1EQP"
+    "+gluRyNABIWX0YkuZfsSLmXte6w3oI+j+PTs+NVPpzDMc02DN4qfvnv9/csTHmEPMOoGY07fPT17"
+    "e3IS/3jynzCklpGSJb/2zg/3/5zsZxc3D+7fwlJfiHcligtOBLLnDYyeA4eLa+Llhr4gZ5KurZZA"
+    "6TkIZgr4C5/UoUHxyor8ctEGEeL5/fOTs/j52+NngC2g8c3hYXSIe3vxXyfxu9cvzvDhjeeNxb1Q"
+    "eD/irzg6EvcO4e6VvruPd8/13QO8O9N3Dw9vR/HxcxtYo6At4fcbHLyAiwewMlymcPndNw/peg3X"
+    "34o9vr8djUapzISji7OkkT6KQIwKX7Zj4p74TbxGCZ7QTyD2H9PjMVmgWoJElvTAninQYShZQnbj"
+    "dZrXfhCAknoD1+ApXGBqA0wHpQJQH2D1pq1puRxQodVAF6bTR/fuvwIDcQBqff+5urgXPXqeP9U3"
+    "hw+/e/TtN3D3z//5X2BgCyLrz/ISDfcSlDdfFbIJIlQsBLpkccm6ogAOzxcgMD83e/7P6df+k/HP"
+    "EfwGTwJ8cv7jq+dnF08CeJw/eRo8gWdeKBDVEAG8eP76zduTZ8enJ2yc8ww1XCwZdSJWkjdS/HtS"
+    "dPKkrqvaz7y8fJ8Ueco2+QZh/am+Fb78sJIkfkC9SDw6PHyFFL3/PFCeS5EdCONnRZW0/jK6BFO7"
+    "8u8BhfeEJW/n+s39IOpWYJ384CJwCA6Gf0BvAmlR/M+HjSLtg8OlJvL9hbr6NtXcWCuSN2DnS9AN"
+    "PxEz0qhuOUOz2IDJuP5dlG+Wi3R9QTd/GMlh33dSHHaHBP82HRB8K7GNOp77PbFxOqhfEBXVmoiu"
+    "aI7hR9KylJdj5CCRHEjPSGOoRbEAGBbfe+qhmcjp5xX/gJx7Qb9B3LJAC3L/odBTJxMe1o+yt+Dd"
+    "lLfiBgfeejjdTHnqCVkAtXDEOLqXmVEGTCkOJrTUqKftMbiEGl0Q0dfdJYqWEoYx087dLKyuZeVI"
+    "HFpcY1S9fc+hCTjdVVISZXygbcimLAiBUAu4Q5tHN0u4+eYwcKmkF3o8ISh30UYPO+BR0WF2y1QA"
+    "eak8Wxa8XzqIxcpq7W2zpRBSMZO1BVNm1FKr42evjn88id88/fvJs7P42fGzv53Er47/g5QXNMkn"
+    "SZxOH4KRI3GaThEAvFkvJIa0DbihA6HE2ShVnaxBraomkuX7vK5KNL++t2stlCoQVOBKvvIdRQJY"
+    "G0xBHOhZW19vvLRMOMxlWPLDXK5aSwcxtoGH/WSIC6J1UpcQG/hefllWNYZFu1Aeiy8bQBugBFvx"
+    "Y4bEbdWBVcGIhF0Z8aLngrMDHBXxBAfvN6eEtD2wadQCdwS0Pl/VVaVcaCgwuxmLFGIKJQehipFB"
+    "MQrIss5x2MUAP2DpKSUYOjjd6wHvUdCNoYnOSfYUwD0B+szRa6KCHBDSiHOvPURkT/g//NvT15Av"
+    "YEQL0U6TY9r1z//+vwCNtIqyq3IunUgaIl4Vp1NuiD5hDupYQurE5NQR7BrtQrVKfu0k5oOYZWFq"
+    "kQO5APS18I0kX0kJUf56kbS4MM6VEEepvdOvyjYmot86CL0KFje5yMOj5RVGGxyLNJOzupMoLEDn"
+    "uLqi290sZlFiTQB6xSgbgILCBSIYk6wykuhF4D0+iFJMXHwcgDlC3caw/cZa00F33tUULk36daJa"
+    "JmmMEH1ZzqsUVGHidW22/523G+kellFRUGOEi7RFdaYwDsVGD/3ThFDvYTjIOduP1jXkTYwX+9/t"
+    "2O3C0GgPXijl7GnaB/OBsfoqjwSLr7XlblR5xKey/mN4YtaXl500DxW+CiMQQTspwYjqC7G/LxrQ"
+    "CLRjcP2vfwDoX02SNaJv8QzVAPMXYyJ+gBi7MflKW4G9Bz0KxToHoUWdpPwZLq4howR91yUEym0g"
+    "QsM8hrwHAbyCNJkiQSG+EH3BBKyWpwwNXUNCzaKP2k/jWVvZVDCA33pBRAkCS9d2EHqfs0WMouiC"
+    "3hm+qxABBBiTJpY+SKS1heTJ4EnRmrYXFzCO0k4fLHECYX2cJWReJjiamawqLxRmIdg7CXo61xEB"
+    "5kBstOkWXb9GwJCe8f4Cyz9xKt+DnrcxoErWm9ONqgRz11yFJMRcGcFUSNXI9nCRvajfYkyz2D8M"
+    "98nfNnU1PkBjfm7KNQ6lmMxE0osLZu5fV3UFFr29pjv0YG3VJgUvD5Fakbn5Fn6UW226JQ2ILISj"
+    "9+jTG8jqRgYgEsyCF9KDcS+2n7cAxi55KA4DImSOhgCiHh9h8rgm0MlMjATXK8OKEAGhl4q5YOMu"
+    "Oyuq+RU6FYCftG0NEyAGAi7yC4gsKNW1oz01ZU9A+ol2Vd3blpWC56aFZSkC0nitk+IqRu43fh8R"
+    "BFYcSAFKKApENwCnWGVKZGp52RVJ7YgO+34fC11oZvC2EdeoB7qe1OdXAHB+BbtESaG1A5aX9QIB"
+    "0tueDSk7uPlVtKp0GLjVzmK2QNQFnUFTm/5Og0r2KW/dUaQvyObhi62oGJSAYlHexIhOVhWQcsXN"
+    "9ZJioMkPCbAl2D7PEClKIDUuUwi5kRfB1sGy0MsgPz57HeYRLwAeiYTzDiAbMHbRVX8MfZXYUdl0"
+    "GPuygf3trhjYRPHg7wk/zAoY0ifES07oDTQqYtRTf2AAwk2TF3Jk5ZSbCN2BsyvlGqyc5R9QWigi"
+    "zLnEH7GfMXjhe6Z3Q2OGujhgF0RqANxnFVaGPVK2fRAVmR2cwyR0Ra75cYdb5koLGsxyx5i9QeLo"
+    "841enug/QCBjJgGoBvXI96LK2yJ8tLLyguJryN37mFqiwispoQcBZcmUb2xYNePICaDx2Domhis9"
+    "Fy+Hs3k7tjVFMEpS0Iw4GZTfu+AtpceBuwZTd0K20j3qsf2s0AGCUMcQGzVPSK+VMWqoEGcMKL6E"
+    "xekHRGmzWBp8jg/Hau3tjqgCLfWdjr5/+Qnevh/sqDdExHUu0e9hYiJT37LiuJ0gRBWYFMlyliYC"
+    "TzAiDO92px09ULWkMeHqjVurAsH4iKlGSuMwu6Jv1QgVTh9xLmQVJlyXHhp1Td3e6Pe7NNzRL51l"
+    "LKu2oWqGj5uvSFBNKB0qsva/vspqPczH4b2+VYea1pPVfOFtuocg3HhkieTmSzeJdnMvd3S/1o6A"
+    "QKVmvVit2PBSoU5jDsmDF0SQQtZ0DkAWTMtB8GkRRL+OkjT8UJa4NUHEz92sxM8uduKnZ6nJfUIx"
+    "GzJvFgaB49RgzDA/3GTZFjJDTqWNzYGVYakTR2VZwBaEwrEZyqbs8nUIGUAqR2A7ipVWEldFiDtN"
+    "l2X5B9JFKkaDi4EoOYL8HFV0RfvHMKFutQ8auqANteRas94ShfewTiuXztJc/26sKGX7/HOei0Sw"
+    "WIWECwW/ClWtzRaxPlBAj+ivwv7VJwUAn+H8P+b4bTJjBR4ovLnfTf/tvLWdMcYO7sMtMQTrhPzQ"
+    "IjqaE30m94myZLyQzXPzUO/W72XLxSRQKTTVN0FjzMyQShbYhyHowJ7qVUl5rY/Kr8pqXQo6bYfk"
+    "dZ3UKXcJUCIbfRR7cnPjz2R4RuOUHtjO/vcEhSoCMnEMocRpcjMwI9pRWeQxhaZV3f1hdaathaaf"
+    "YAH5lsRDH/Uuq/dYpdlWDMGOhlSHQBDscPDBxQUJDJHDp0kGrqB/aDYYm2X6mg0lFPx8a0oxKJsb"
+    "57MtJXD8jstAboWI6iUSHeyCoKMIGUt0Rc2wdgihyqCyGXUlxjE6N+/rjeq0FQnqRrqDipMb7rIn"
+    "3gsVffg4aWwdJTnjcEByKcdOiueMuKyTuXRqbPw8ra9jQG0sZlVVwAuKwsIRH/QPhYDibTzF6LiF"
+    "oiTLgxTfUxjs6ZM20uRSFBLrjabDgsYDTo1IUZHbiifi3vbUGYXVnYF+BRhJxxwIZo82YZagfo0r"
+    "DBhqeQmmADS8icSxObEoZNZyaF9WXIdUQZiuDJJ1KathXxe1hJAYivWiMo1e2O0xL7pUpsNDCjwH"
+    "mdyRyrDMgNmCEWj7Ikq5tDHIPjFlsM+FcZ2IcwgnDkIrtaVCNjzqzIx9wmtywnBPVbavlYchHUV8"
+    "LQ1WG4yskuFOu8BxmikMUoL2Ec1lQpVFNYfVaZ1/ZX/7Q3+ZZ/buJ/aJs/7wxvfVVocm3Sp40J61"
+    "m0NsHH+BvkLrlZtBDM2YKp1SFgYm2A6jzUS/Y/a7vKdISdFAyfFa7MOjPiJ4PGGttxIEK8HrxvZg"
+    "HsK7QJXakZ7astgj7thYZQw2Tp4Ujm7g8thYL4dWvcTsMruI6yYfFArUVmPh4OqL3gNtdygpLAlH"
+    "k970bgjLrJbJ1Z0ob/dr5NLuJtK22hU3QGre9+n/EGOmLY++g6TbUdoILA3AO6RYf6gGdafXwxGX"
+    "7IVu/C7CkyWIcyJlnPGS8u5ethU+vcHTCo/7NjURg0mRv0fY5zu0QzsCUHaEhRKoVebCFlcCRZFm"
+    "Ufi7cIU1aEtmRZwZbGHFDsq5cQahrJI+MsO7og7adnUZpXLWXfqe3Yg9Ni5Lb5paJEy+oTv1eo/e"
+    "Gxg1M3Tt/T7fuk9D/XBDjJT94GBHljB47oY7MbdO7q7vWfgNO2aOVysIID7eN1NW+9XKapIJ/iIA"
+    "qKCIU0jAxDrzZIVQhmJyVwvPNpPiauuwOUb1bU+2RX0c8GtYE30Rsq2eDLpIzeIMMtLudmTLAx7T"
+    "uzWMgWzo4+EvU7J6fgP5GMXsICVIsTX+Vhl8B4MSUCFL3116UG6yO9rUQCsb+PhgKx/YMVhTyRqi"
+    "6pJFTxsLlLKAruHuVWcXrZAS2ALM4hqiTdDhLnorOx79MjrMRON9zh7RRG/uBT8Dxg83qkSMIZp+"
+    "g/5PGn9IGoi6qxreY+oDirmxvW4stSVF7atRGKhax5nYiq86QrkdH3USbetK1vvaNk2nR1XXzqul"
+    "fDxWDUKB0EtRszyQWCHCDUnu2bnW3XQ2KJlxd47V6e9p/SGbPDPnd8GG8qpI26lv6i55hjUyzwE1"
+    "DNT4cQR3JQiQn3kIenyTzm6fLMHJTGosmXV1rvpQ0DXDtiePosMd9VSFDhLYB8iR/CDnXSt97/Tk"
+    "JVg8wXVHqtiIH96+ecXdWF4QZbKdL9CDWdWuLC/hyWAFhDovKnOAoaquJ/RD///hDj2s0LwgClA5"
+    "NjQb5l7PTbVyNInx2tGqd6O70GOQmbiGINJf5KpdI1T/5djSIts3a97D9nqxp//9QbMhh+GZAfWw"
+    "fkk9rs4LPpTC5lK1uhLKuEhmsvD7Vj132RUWOjHeyKhOL+gfS+df4XWseui+urj1LnTXFTde2q+9"
+    "gJe2wmgV4fie6n9EUnnknmLVq5FL61m1agfNv2YldPTDVqu6r8QBtWDE7YSxxmTm1m1tptruL1Ve"
+    "+jQvcDt5HcdIfN3txs25lTEML3NM+kGzp1Pu/7eFZDod079kanBEVsuhKiFs2ILoMxJvY1Qmdxk2"
+    "E4HtytTV3z52hwgLmWCAn3lvHIdyY1a4hWTuBj2qE9IGt3rD5JdvbAcyTLlhrGouYgoURFaQSlr7"
+    "awGMDjWyDiB+FtwGpBBqxMZRrRd4qkkEWOGeMJKtx66tQSa4O0hnx/k5UfrF3ZaRmhlVn2VRJWnj"
+    "D8Nn91irb9MMdrVVbhw/+er8KbS6lodBPqOifAY/oUwcnuX9VnmXpnlJJx/9LAojuHLv26m7CwGk"
+    "Qh1iTw5t37GgorEyaxMj62QQMo+MKam9h9WdcPheWdh+RG+ggflbj802D8qwt6g3d9mvs5LPh7wn"
+    "3pZzSVjqfPzdxeYLR+axFWxYf8kvejLq1q9NMIgNTu/MqcmAkDvm3BuyjYQTU0E6nNFHgNtAuA5M"
+    "c2TLQOuPEZyuI8fpNJQEQXumLStsOqlg91kt8RBLSZZxAtM6AWeD3d9o79UJO12qPwJwVnWKly9f"
+    "PKXfv704E2+Pz+j1y+PTM/Hu9OR7/tMAAV7nKR6mgY6jFFO+ANzivB7/DMm2CVtS9xCnC6uZr05K"
+    "oARO4SFB0NuVbVPt5L/sD9U8oX3XPCrwbxn+mheZh2KNYP6Rr3xqiUVMAzAG6s8O5uA1/hQ7ZUQB"
+    "A80LM3Wr4vcw71D+XapLmrtNZ5XK9srqkKEP+rxntrsED4QkNiihDyHtYHdj/FF/ynRr0nsa4lmQ"
+    "bz5LU3v6BADUhuOrP5NTeV77DfE+T+jvt/wHBsjcKXK7we9bQ60b/h3Au7lDCW8DPF0jV5zMCojb"
+    "HIp+Zb36Csmq/u7kxEZE5dH/A1BLAwQUAAAACADlaq1cH4hfY9ICAACNBgAAEwAAAGFjbWFrZS9w"
+    "YXJzZV90eHQucHmNVMFu2zAMvfsrCPUioYmH3oYUGbBhxw0r0GNSGEpMp0JsSZDktMG6fx8lObWT"
+    "Fut8sGGRfOR7pMgYu5POI3x1da+0AdvK0BjXleE5wCfYGOlqn372eFweZNsjNKpFXzLGiqJxpoOq"
+    "avrQO6wqUJ01LoDU2gQZlNG+KIYzh9nbyvDYqs3J9Y5+i6KosYHWyLqyzlh0QaGvYh4e3RfJS8D8"
+    "C9RqG1Y+uBnQ62FRAD1UyQ8KBQnlGE32Y5trBT5lNZuQmgFV4qQ7TgJFWSTUOdwHp6yHb79+ng56"
+    "G2v2FKURtkYHpftEE55UeITgpCLTDjZyu/et9I+nwH0E2pquQ03h/AqMg1tBOtWAnQ3HhOhPbNJX"
+    "NUAiJrlKNYghMuH4OCTJNfz+k06cfIJl9nVIKgZ8Dhz11tRUzpL1oZl/nnu1YzNA54zzS+aQVNki"
+    "Ewkg5V/Qxyd5Hwht9ZAsm76hn6EoEjGTVzrmLL1tVUix09qodIoa/0cYeq8W85sHuM4wcEVEOnPA"
+    "Ubs15DFxeFCm968g2Hp8DzLiXGQunY+t46JEXfvYGs7WaybOw4f+jcGJRymtpShOMKI4zzQ25ozd"
+    "27BkMn1YXIwrYQz9muqYpX+F8wOncuAw5RYHwsfZ8WSVNImZ2xUTbw9vP+RLgGzJEiiV4T/w3s/g"
+    "QKX53HNOkTO4Gauj9UDW/ZuqaWXQ+eE9NhRynpMkW9Fh1InC8mDnMSfLsCQ6dDusWrOVLd9IGokL"
+    "jelKR1v1H3sjQdWULBoTmJicl72tZUD+7lYacwgxrTOHDqV67A7oKmLE6WpR3lRJ6G2Lr4vrPu7A"
+    "qF2cCPL2cZk0pq3RgZYd7TG+QR/m2DTRM0OK8rQkbOw3MXBYNkrXsm25Y+v6+mX9/Zr643Nxuu9O"
+    "d1vpAC9wfsNjahtHIKGdXWNLq6dWO+r3xTBFyNPMEya3Qvzjpk697ZlgSQ0e7aL4C1BLAwQUAAAA"
+    "CADsnlJdQIKFKbYJAAANFwAADQAAAGFjbWFrZS9wY2gucHmVWNtS40gSfddXVGgekIwthpmXDdOw"
+    "0WNMD9E09Daw3RHAyoVUxjXIkqJKAhOz87ofsJ+4X7Inq0qyZLt3Yh3hWykrKy8nT6bk+/6HyYSV"
+    "SiTFspSZSNlC8FQoNi8Um83eq7SWeREtZjMWzGY8WfJnwZwsG43KBFfCyPOcINPPokoWQjOep2xZ"
+    "6IpNrz///BO2KGHWMvmouHpjN7eayTzJ6lT0zxmy14VMFqyss0x7MmdnSogvN1fXQ8gJXcb6TVdi"
+    "CYNIXbUQLFXyBRZbw3XEvspqAVlnHQvgichfPJwy+fT+4zT+PPn1+BBmQwaOl1yJ+LGWWQrZVyUr"
+    "Mp4VuRhlMhdY4WUpKBbvoC5OpTo56EalWvDKc45oYw65uqf7Th2ZK0/QtWiiB/crHJPgCLKXrotV"
+    "CZ9EClOREFmKKCnLqIhKXlVC5TYHoxVL9vdH1lvygsIw2d83EX0SFXneBPads/6EokU7WDH3cJJU"
+    "rHjNYUkqhkwXjDCQFTztWR09mfDJHOE2OxlCpWX+ZGx10Wb8icscALjKszebZbKDbKLv10WhBZtL"
+    "pcmuH5xdpFVvoouUWvTsaQQgogtw3+W5gY0uapUgdpSoSuQm/OyVvx0xLQQbz+s8Gc90xVWlY4pr"
+    "TElzsQo9pJqAnYgmQunYE5kWrwuhNmDIXos6S4HCCnnSbMkTVWiK/1LmBFL84Cv7gz9q+lECqzlf"
+    "Ch3aWHuIWBMlY2YuCKYcTqamvODxEpEbOFwNbFDeJRwFFKuiqE4OLIJbgBSPv4mkYkYCuAY8gWVG"
+    "8LRLun6sUC1DRniuvHafhlkuuPA8FaXAR16xecafkCyHW1KR2hzag3Q4ZBQesspUiDMo8iZtovFt"
+    "DrNGAnun77+c3p5fXsWTqy/T+Jfb84vTdVEnC54/CXJTFjECFiux5KUte+AQZrx5NQ7kSGdSIO/k"
+    "X52nGwVINpIZ3nn+wjOZ8koW+dh4QRsA2JLxDLDQbMGpnOHyHDVnDrmU+W+cKTFSdW6KENnPAbI3"
+    "ly2vjwMlqC4aw4Pr049tVhsQDVleUC03FXDAXriSPK/CozZ3HtypKOa6IhEDCBgA9WZBMwBCCRNl"
+    "mw74ZwvwWbwhLUW+zmTrDSrDoyxAhAQIqFBVIxu0ErhysKwdWVw59okolpJAIKs3MDi7Way5jme6"
+    "8BKulIRdu5TIJuwiisuMV0Dz0lVZPAdDCFUqmVe2dCUZ1dQrxdpDzNt4WlzQiQhVKXZXAOwjisJq"
+    "8tyQrHFDDRlqnViPQmGKFAGGXRQLkc2NARqCeYXkzDlaCnvkyTOrDNgaj0HXcAP12+MoiwuPEJUW"
+    "sIySPJfVEZsYtVxrsXyEDS0p2QIn/Moq8nzf9+aqWLI4ntdVjS4TM7ksC0XGQpcBrfY8t1bo5pcS"
+    "dh9ofwHeazZ9xl+PrIl/nb4/nX5hx8xvgeqbC6fnZhUx87148u1bfH17dnb+bXqN1cAnOvWHDN+J"
+    "/Vqt/NCLT6efz84vpvHZxfsPVnD06ZQERp+a789dufdfPvRkz6zMjf36G4meX04ubk+n8cX55RRS"
+    "Crix+QrU3r0e/IC3CzN+3b3zH4K7f5z4D/vhHT73oOCXi6vJRzDIp0/Ty5sNDf7B/SAa/PV+cICj"
+    "PC8VaEwAs8g5kpEGCD+R/pg9FkUWstGJ+TH2GF5yzprL5j+9lEBucnajamHWXnBcoSNMDFIVeQRs"
+    "Bf56cCAnf/TDSFdKlkEYZcWrUEHodTS9GKAATIFvpfEB5GlBP/KCPov5vGe7g2HgCG5scj1kz+Dq"
+    "MfCsjBu0Zs0Gsr66UnXT2rrnz2Z7KXu08xUa0IB0DFjQduYFfyH2aUYAuBRGhNSOA40Z4DGf9vkU"
+    "N9LDjo+bFdMWnFwIwTUsO24VdYX+GTjvrFc7XDHN144gBcrbtcbeUEoEY9xxugabNrv1yPR86sLN"
+    "qRH9YfuAO9i0DTpQoAkGgS3djmlrsDjNViLS9XwuV02+Kb29AnN6d08e/+sU+EHQs2RDbu8Ylshx"
+    "qwKZRFA1iJsYcAlaw7Rhho7+9ILWSMrPOrNOM7gRnYGbwZM1ES9A0ZIxcLsgscfaNEXTpppJz9I4"
+    "phrSS/RkR9pm0nyqucLAjxZh+fnmFpxKAOs5wnHEqCijxnNblHnsfEHlnVGhmOVKva2L1HTRAmOL"
+    "CyXmkhzTK4w99utqPvoLqkooVSh97GOkz3gi/JAGm/lahzEc2DJjPfK3ccnxw9qa7cv0ElQGRkeE"
+    "TpcGvqGhXZJQRsLv2I+7NdGLhgKZO+bZfNEhw354aOmOtO6zn9j4YdiJ1+ZOSPdpFBB+DHyGSNHl"
+    "bZsNdvu+HQx2+CYdzNnJ8fdc+57lY7MRZrds230tyeRu64iWHBNrsNtcmLHcfbor3GX0pIq6DA7D"
+    "yEEi8O/viX6RsUjpMpOg9gMsHIZ3o8MHYrcOjZEmsUpEWbGr6ylha31aid7f5QibBUsB5hYy7rC6"
+    "3qR1YtCYmnuz0BmZ1nTfo4ivpBRLqIJGK83/mGka3gBdV2LVDlaYPGczY5a7fwBtbFBEU3+uvo/X"
+    "dvX53AWbmpoVjaSOaf4Mwq0u2ilfMgYDQisx9w8O2AeRC4XxzLQo9zTB3KcfsWaObKfr3zth+eM+"
+    "99ea9hpKYf7vziSMvUX2ApMiDmIvtFwF4R/+fb5ndln0UPGbNmZ6s+lj1IsRPOV3XGmm4ONdrdk2"
+    "5TUaeyzlItV0HqLLmOIQbJJVSFijK9sA3mKE72Gwh8OO3RE90MiraPkMcwP7Rx9TwYEiV1JXcfFs"
+    "/oZbOy10jcX0sU2yvTnH1PC62bteHWMcfwnoY4ya19Ud8IyC780Aw+YOZo32VpT9k13ixrZF/sQ9"
+    "a7IPRBgpNolsJwH2n3/9m+A6ZlvPRsyYjlXMsQxzanNq2x5nMzqqmfQ79wPU7AjvdBuKCNL9BA6u"
+    "DZWhGZOke0DT62SosY7TANDdg1nXz7Ls9TZygBMMTZzaPBCzQrSf463N30UKthul/Yl+/H9uasf7"
+    "nWZsEfdOhZGdg4h3gm3F4Z+YhDBGlAZ0IB5uzwKSBnSI0IOMVYBIN6NeGHZJ++88q8VGzTjkUtab"
+    "hN3JsTSp8kcrooM1fvyHVuZwfOhk2lsiuutxeHroVgXEXVHwNI3Nw6Y0dnT1J2XRL4S2Aga0a9A+"
+    "X2moz20llM8roTqgbCev9T0BGJ3+2qdYHfyb5w1xUVbmUYfUG0/H3DAKrl5rP2qnyFfMV/bZj7UA"
+    "t/VVUfRLglMTOGxBL4cWbSJHMVFdmZDcjdF+w/EWJnF36SwxMXfm+xv4MUdImoi6ebgbWM2cxo2u"
+    "ni5ghsxK8Wr88OD9F1BLAwQUAAAACABHnlJdGC3tsbwOAADyLQAAFwAAAGFjbWFrZS9wbGFuX3Nu"
+    "YXBzaG90LnB5vVrdk9u2EX/XX4Ey0xnyyqOTV6XM9JK6dScX2/W504cbDUWR0IkRRTAEdXeO4/7t"
+    "3V18k5ST5qGeyUUEFovF7m8/sGQURXejGHjN1lVbSrne/qesTuWRZ7tz09bZt/j3bVt2W7YXA+vE"
+    "tejZdqtoWCVOfdPy7ZYN505mq9V22w+8Lwde0HKYaEVZSzYeOOvbcgQep5Tx577sYLQfRM+HseEy"
+    "ZQOXon3kQCpEKxnMs7bZDeWAsytkT0xoA8P7IMRRkeKUPPKxOjAUYBAVl1IMXwP909CMvCB5YUks"
+    "hpUZ65rux3K7TSwHWHpNg5rzXrSteMrYzX7kAyuZPFfId39uGYlgjtWxRjKp1Nh0wP/PNP3Ni0zp"
+    "qUAa2HwUDxyWDOypGQ+MP/Lhw3hougfWjOyplKzmQ/MIPPaDOK1Xqyvi33SPoirHRnQs/ts/v32d"
+    "sroZeAW7kd5Ej1MySbV6br774eb7l8UVbPcCH9/99V//eP1GPa8YjLy9ef8KHnj32AyiO/FutOfX"
+    "VpXiPMA5vwYBttu4L8dDymTzM0/ZaWxOoDeZAAOxpzV7sD+apoQj8IGDHct6jWbS1s7G59HuvRPl"
+    "UEs9FP8JRrIWDteCEVKlD+JneGuLghlAMyzenUcaVroHoRVPfHqBJ3ruxTBqamkZbrcKRx8yB7ft"
+    "VqlLnxT3a5vuyJGjRR2LgaQZgMEXTVe15xrxA2QwI3kLFmD780DmtEtgUy1QAXbJDnof4PrAOz6U"
+    "Ixh3u/3uB9DybSNHrYnUU2RXnoAGbL0IdnS4k3INEAPYwu9UoQnpxe5HFKsqqwNXTCvAJJn3EeQr"
+    "wdQHMA9oh8VzT30S5xYVIPBMT43k6NTARcCv0NNoAwb/VcdEo8Rg8sMiSDzEelBpQQUcwGKgoviD"
+    "+4MQTSfHsm2NNVMfD+PA4XjaqnDEbixBHYMfND4QESwzCgCWRgU0A7Hq3weEGm5CUuIxYU8FMQlm"
+    "SNl6f+6q9RZDGLlwIbuylwcxQrzj43nopIsAuMd2W53qwgXFB4FYGYeyeTgAX2GDzGsvyKDQ9AyG"
+    "PDRwPDk2IBNpV64MQpHK2K4ZAX/7bBVF0WqFsYIVxf4M8vCiYM2JvKDsOjFS1JCrlR5rxcMDRBvz"
+    "KKRajA4OWjMr38KjZutnAjNtE0LK7ki2NwQ6a4/C2qMAq8uAEeGmgIBWtk0NzmB4GgAU6oQFSjRZ"
+    "Kbp982Dob4b63HTi7YysbmQlyOs15cD3gLSu4nUBYCZgUn6ZrjoWCtN6WQxwYYCdmhcAiVOf0jOc"
+    "pzDgtiOyAIwcyu6B12bMcCt4V+5aM47+jdzG4sg/qCECFniGGDQN5RA7kgRS7n/adUY+zAPBpIKS"
+    "seC7l8Xd9y/ff/eqePXmzffF21c3dy/vUsJbQQGmoGATcHBhL9DBrbJq6j+8U6n6tRi5Gj924qkr"
+    "DACU56kDzjBRgdPVYJFwnjx6cl5wm8oapBJgPQgCOFavVoBklhs8Z5BUb+EnH+JIrY2S1aq4e33z"
+    "9u7Vm/dAGPl5OFoV72/+jqOqwlFjq1XN96zwsmKcsOtvKEbdj+e+5ffgyCl682azJuFVCIAcMkAU"
+    "U9rCf/ExZY+JfcSqCUcgooHHZXqDDOqPk4wdWbNnxwzQMYwSw3kcRzqRRymLTBKPkoQhO5aD9JjH"
+    "I1qfGOkJYoAuytlr8mT2C4pMR/FO0aAy4U94kgChMa4mRmrTGBaqx5Rdf4X/2W2fSojK6O2YBeR6"
+    "pjPcaJMyJxSJ81p0XG0PcexOB1Z2hVRXX5PaSnZqpMT6CEghUEuBoY91HLKWHCHfwz44W4J/o+ew"
+    "uILqA2NekmFsNB6alX3Puzr2j+D7sj6lMkZ1HgAbOEKPT5QkIJbiRNZIOqaqGHEAEyiklD/k+LS2"
+    "1lRMHIGdmIkDNFNpcCjxlNseKZJ+XrmDEOOiclGRUCMU8rxDBqlCidRwRO4xrk3WyzLWE+HqqWgq"
+    "J8fEVElHK+xvNY8nUOKlqnxzA3MwvHSFIOpZl39hTcifK95DOdPUNe8QH3CyK8v5iha62pA4x08H"
+    "rDq22+trVSpe75qOQh6k6kr0FPsAX+I89udROgzJY9ODOT+CvhAXWQepqiolj81AuZM9eQu4Cuq7"
+    "R+3GVhpfCVCUq7gTJZ98+1jzYHwOrOPW/k82MpSa8f16A0eYxioiIBFoS00bTENgQvRLPzhFWZQE"
+    "RKjtX9WOef5RNB3KLEFM4o07g4otRy94Iqoy/jziOV14m3LqtN47ZEUKtBit4AoH5QkUHWjTGIP9"
+    "2q9hqNRYBxWFFywVhPGvjpQezO+X4ikq+X5jI88Fd3VEmNSV82LQAYkyNUI/bVmE8yuLFjwgASzy"
+    "71iYJ+wzXarMqLt0eU+OwkOVUreGlVM3ifeC9tXA+gK8SF/Yi0BK9CQAA1V3cPoSgjWU+gwcWuIF"
+    "FoM6/IXHoanBu2EncEBI4fZwhyc6mhWJFBG6zwEO8ARhNYIH1Fb2COKKwTyVQ3VI3Xq0aHaWqhz9"
+    "ncv7sjqWD1xqFuGqOUPHwtPtJEtCNfaUKJtSQbqGO+WIECE35aMuDfzqgVShWie8NgWE20D1TX7J"
+    "L9a88TGBauDi7KMzLYKWRgt9DVMXie12jfZk6uh4J7OtGvxlrCyVNWcHnutS7QgRZj5lU62HTjHo"
+    "rSliqFDWu4C7xGTkg0rYuInl6TFdlNTZlk44CXa+DyrbBdNkCwRKPuOjnWhGDsKNy2f2/81qB1wz"
+    "LR5oLElmwWIi6OzI2sdDQTVAERJyqLDHYq6gphPQNke+Zhf7JBALTK/E3i8sOibFgyob0qnH6wGb"
+    "TBMXCHeQZfBsyzfPeM4IAaKO+jnHRLZBYY45Cgcv2Ae3bbozD4BK95xl4cwVKKaNQl7z+hCJZxUi"
+    "DSYTWC4HbyUIWHbeBYs8nOANDMVduMrF07pD52OczHDAcaE2go5U1uDT/DJL5zJxJYi/cwwPSaY7"
+    "IJ7dYY3Kf+oChy0eqgcovdGQbvWoUU98jAJBFIWrYwzs5gHBL7pTpu5C/sp7WLVJrIO842dsH0EV"
+    "I9mss7amsnKhcw0XDzAExVYoh+qj6nKkmucOcIodAj64DrXq8F17DThTF9smmnbRbPUZjfdenTrt"
+    "CoTnTC90ExIXu5FcyaXbHhj8Gklu4+r6mTShxj3RZsG215ia94jiWaBcsNQMJptk0aJL2NmE0rgn"
+    "bfldbeo2G6A8vc+ccUeeGPZ/rRd+bonXUw7p584ktMdopxLWIU0rEWwGRMcGIIV9BBUho99jz/nl"
+    "emnt7La9SKRPFTZVsBCicybAxBujqGNrfFBL3Nt2B4pIJTwIpB/Dfg3KqQoC/1SMt+DB+Mv1gqgB"
+    "iOJO7w3Ev26qcW3aWBL7UWDSOIx9WquAr2e8QcJ4pm7qDVmnSU3I5N35RC8IMOhJfTfUEn+0Co+w"
+    "vozW7qaQjaKAA0EJHSeuao1QP0DmbBIU6UnK7IR3u/RGXbb1uRpPMQLYGOFINMaA4j5wnLmj4l4O"
+    "q+mleY0T1bW5RFTz/iKFQvp8gmxyD9PGJhvtGGSQKS6uv5pzwGo9Pik3O6mSNDvx0w6C7ya9EDbw"
+    "37JbWhJvbaRbEaBOukJOYibh/kK4VHbEm0iDdzRqvCijtXv/8cCfg1mtSVN1NZ1SrIt7nnQW5XNz"
+    "o2puMw2226yj1ym3Sp4RDHoesOC7RctB8KCfunaUhbke4qC+UswPeauLhWW9gfGWpDKO+aFQArln"
+    "lBSftRBw+TnyDgcemxL/1593bVOZ3DPwNtSKkaqbVD/AGG/JZ0zxBQm1bOZJMATJlXGXw6lbOE2K"
+    "Ei+FsNpcjgLX92kCJsr/g017ExOI7JMJiTV3IXHg1ZpiIAVDGxqDiOj0r18dhAhGreeUiRVSgkk0"
+    "UU52CltNPoTy8LaO/zSicuUw+mnCega1HEZCEg28HP7vJsKuvsYMIYnkYBbNyA5ZIBxAT/eeq6i+"
+    "j/obRGW/S+g1SUGLuhXv1WzEk4K8LlC0o6cQrfYpQ6eGn7wHPuDBPovLaW/C3YQevYGFH0QG3YrJ"
+    "NeEUvNiNxgmDq42fyyxOHBIwj+X4Rgub5ZLHtJgS3cazW6CrPNSca3ZaDeaeMu20VWruerN20mSz"
+    "HDGthLAJzxdEx+s8jC3+u9CFZEezCupwk17IU16eU2QwsEBmMp2igacFGsx3+XLSAxjm6Jr3bUPp"
+    "rm3YNzn70oFgvkRnNO1PtK2f8/R08qsJbwCPgDORk6QkI9Y+qWFgcWcqiM1SpPTzWW4w7yyoU1uO"
+    "TmBHTYbLySscsdEkuolDiE54Of5ww9Z9SXvT8XmUz+/nr0rjq87rUtNZVZraeAecOpOys4v9aLTF"
+    "onzJhIuRP98P4mfeYRWtvHQxhQSepz1KhRCdGCiQ6EDwGTGwRv+LemsbJ5RDZKl6xu5jit/UlE+9"
+    "76B0NbTwFhFfn7Mr5HfFygsfbdnXOrqzM39f7zc8VNhyFy7VpYLYt/RmQUuu0O+/y5/0s11wf8Hs"
+    "e2qncHw/7Z4+Br4UOTVAwnYPof9F3ntszOvBa+0JKWZ0oHEfO8wo6OBAohQQzumbBrVJwhl6r76e"
+    "X6M87p8ugWT+xU08eWt4CQ8WRcHVD0xOY/obPfRC/2UhIYGRIZn+loNJyOGUTyW+MkRW2+3vgY66"
+    "Uqrnij5asN98xMs4IPsn/j6NpD48CIQ+m6qq6/JGsIpc24PKBl9Rexrz1pZSdPg1RN3s6c3AaD4p"
+    "VEflrWHnY4r4hbBa4ul/ZKgVO+VK8CN2PgKXmJlvTmd8UEWBLnUnhz7ljBJs2yJ0l7l6pOZzA8Na"
+    "eq0OA4ucdfx5jOM9gWhvQ7nyEUqqrhezv/9yk+DR9nALor6E34k0LCF8UujEHl/4QVHs13nTpvMZ"
+    "lB4FPpJBYTx5V6GhMS3c75V3et0tq5B99FHvDsJ/stqeCBzG+8h+/UfNcLC2DM20KC1qW4vbige4"
+    "Cu7OD7qnqz6pM5S024Ad1nrN/iijVEsbdIy8zg1+gvr56PEbQkVbyvFCvFBfXAoKFrw6qg94pYof"
+    "ksV0N+D4gYH3DcH/zfl/1eL/BVBLAwQUAAAACADhnVJdwxoBVSoWAABNRAAAFAAAAGFjbWFrZS9w"
+    "cm9wZXJ0aWVzLnB5vVvrdttGkv6vp+jAPwzQJCQ5OdkJEzkry7RHZ2RJ0SWTXUkDQkBTRAgCDBrQ"
+    "JTTP2V/7APsQ+2DzJFtV3Q00LqTl5OzoHJtgoy9V1VVfXbppWdZHnt1xdpv6WSi2F7GfT9JszhZZ"
+    "uuBZHnHB/CRk/HGBH8s8nfFkxaBbwKdpHPJMuJZlbW1NsnTOPG9S5EXGPY9F80Wa5TA2SXM/j9JE"
+    "bG2ptozL3gs/n8bRre56Cl/VPH4w92fcXfiZ4F7+mOsuceqHXkWZN4li3mdzZMCL08CPt7ZesI9+"
+    "HkzZ4N3x/sfRnnXvxwW3GPDE7oJgO1gsmMizKLljcz/IUsFs6sHmhcgZ0MqCNMn9KGGZ/8Asx93y"
+    "3v3kvRu9PzwesT0g3Q3S+QKWtbOXg3f21f7gP/3B7zuD77ybV86eZV/9w7rpOdZLBynZz8IiSlKY"
+    "MgMxppOcJ4zPo5yNx4N3+2fvLg+PT7z3P7093lveFlEcupPfbpPVeMxsGPRbkeZcOC77cHDA8ilP"
+    "YMI8434u8BuTVPsCNoqDRAIuBLBI2yP6xIjPDhSr37OHzF9gZ18zH0c5z/wY2Ru93788uvDOL84O"
+    "jz94H/cPzk4Uw+dDlheLmF/BoD5zXfcGRGBvMfizTPKtfr3t7Qk8NRt/3j873D++aDb/9eT8wjs5"
+    "h2Zny7s8/uny5GL0ThNzcHraKXs5BcjfYq+Y9clyf02jxIYOXAT+gtuJQxueMNjHjQw6MD576ezZ"
+    "P351bTn29fkr5yUQsrUV8onSNmUQtn7wsjTNh6StDhu8YWEU5FJA8N/NkEhbALm1/mybWbrBBYW2"
+    "ZDfQZAFdu9TaXji1PoaS29TW37ACdaN15CQZB6tM5FzAnPdxdHzpHe2/HR2B6GFyMLrfQW94bi+t"
+    "OEqKR6vPrIcoCdMHgY9gKql4tFZaMvDPL+Lcm/Ok8NIFmbcHK3uEIjb970XhkJFcJLR4YFDDhrTW"
+    "ChAg5X2UgUXiCkyuwEA87C5Li0Uf91XOikyyNAMcYvYcDR8MTZvd4buRphTsmOb9G38SYI5FkvMQ"
+    "7UHNHPu3PBZDsMsfaNo3Lq7r/vABV3vj/nBC3Q7DN3tgnGlGU322r/sDifKTkuMnKUSa4gHMGWwU"
+    "dzBKaLb8IR0IfgdT5ZIaQNxIgK1PSAw2d+9cBrYImsLEggP1GcwJj2DI7PaJnZwDi0pySm/4JHrE"
+    "vbWWej9WklTZgSZubgj0X67ka7CfWSVn2j16gX/RhBBm5orcz3LxEOVTWy7oVJ3wD8EUhMDLRgDC"
+    "HBaZXcU80UPY8KZ8v8D5yNhF7hJ3tuUqLVYr00js5rC9Pfa6vqDSD9hXNEHsdbVz01dPu9U6PG7N"
+    "9DU5Otnz9Q3Y0APPbIcgpGYvf3RBwT8jG9oRF6xQKa1dzV0zY+qnLFHCgtzgCkEkQD7bDPvKDkTz"
+    "xdYmA71AWgwrnKFtRUmeysZBxgGOonuuQ4knlvhzME9b+rpeX+kzPoFvcdyW6moGEOSV1hLiEN6t"
+    "1+y0+Jxe99l9XbVdcIdzYTv/ChWHmaV2VxNbkvrPzQyMXeFQZOe+5IZEAsLXu+hBaIDcqT1ts/aC"
+    "vS/imGm4IdhkPkQnmcZDGVxI0Nn99mMVHMm+0PRWwU25J+WmNd20/rP+gc668tHt3VtqTlbusmJl"
+    "ZZp/9fTcfSQCyX+WRLrEhT1zap1gW+b1YVrks6u5y5PQxl2sRK+METqY4YIk5YuChduuYKGyq2eE"
+    "CrdfHiqo+T8TKFQIU04AGKm8vFxTt9OQNrBUyPQF4EJLhsAJvrTrSzhGD7dYhH7ObWORGhuyl+ID"
+    "4hvMTB6moCIxuFYeetAcJSDEArIMSAw8GRt7KjYWds4fcwJPohQ+69jXiuLvQUvSbOhnwXRINIGr"
+    "J0Bs9by2APGurfFYxSUnSfwEJjjhQY5BOigp8A+eAJKGMpxppC04j5IvASvYgp9FfpLLAHuagsli"
+    "VMD2Y8gawqcBJRQh0UKpUUkDiwS4wknOiiSY+gkKtgwl6AHFB1lGbM+HaMCUYF2V8VspF/yTlERJ"
+    "AmACmuiSC7N3nX75/NoxkFL6M8ikljhwtWctaejKerllbuSGxMAVxa2NxPUZbpeOUCXImLsaJZ7e"
+    "8XUbmwHHIxqoOMB+uAWlzFBkKDFEH8AmcE2QVNJraKynVkJt7T4B63gsU2eB6Z1MpvsSZkH20Yy3"
+    "VcQyc0JcE0FYCWWOCSrkcrBczOsZoCRiyG79YCZiX0xVAh+mxS30lVklsCeikGMiSTOqZDLjSm4h"
+    "MYhp5kGDK0b5xb9GPTQte3KAi2v4Abet62tMSq7hDxJ03frSetlnL6Hp5WYFU7O2VKxM8zs06gU7"
+    "2D549QqNmd8B6VoYopig07PjFKwG7I22WMZnwFLgCz4AScOuRxQI3Uc+GJofojzHY/vHyMF0IsFC"
+    "CMwHrnrLOzy+GH042z/yjg4vRvh5fvn+/eEv6Fct+8ch+O1PcVzAv08FPMHDp8L50VJK70XCIxKB"
+    "NlJ9wgqPdtcmGVZKf5umcQVnGWw/OMAedeohIGD1oMmuHfIgmsNDigq98wjUT/mjowMPeDEeF+Px"
+    "9ngcy/9jtAqSERdleEfxjzsBVqQfziYWimLwI/C38+lqd/DdzXXYc5brZLGylAYZXl5tIvKxeY2d"
+    "x6udwXf+YHLz6k8toL6/BzvnSvpFQsZV7UDpYDY4kjP+kIF0mQLnpACfFZWIogAC9i6IXWh8/c2O"
+    "/Dsaj/u0Bbs7l/DsgObp9UNpov/v1hk9R98agZi2R6u0R433TUHrBXec51spcpoA74DLv0voDzX4"
+    "S6eJPgA7b9iPn1CEGvPULkxi/w5iKAkc+t1tGkL81afKHAsh9NDQisiphaI2sFR9jM7+YBziVBNs"
+    "dG2i6rhBIetxkqg7zVDqUUkWTG+klp2x3KY88VhvSSOSGYj8KeY1IWMwz+959lTljCoVEZyz4QQC"
+    "lOH4WVs8rtJJxeRyNnymdtw7teyCGNaJxUqJKkjj2F/AfoWQxEYBRKEelrM95XI3RRgHaihwzsXi"
+    "69fb2zlgsQAZ/PO//6ds1G0R+hN08jB7GVIoOWYAx4uysow1UIwzsgLSxjl3y2ogDl1tY1k5z/wo"
+    "Ru0lMh2GyacqZskFtyG+QWgBnsMikDawDUNlFXo8/neYBTLQBeSViiRpALcQYs7QlYl0LgESgtcC"
+    "xMbO+W8FTwKMQlQgNERKKLUcj6d5vhjiAohmyCd9cSgUoZDUB9fK65WtoEB0QgHTVzAkEA8CswFk"
+    "j7nMRAkksCq/Pbxxtpev+4jtmXW9uw2fMFENzmjUHjZ3olaiFqxowJZnqcOfNaH9xQLyA6X/n1lr"
+    "jL6gy4i6DOJzavw5U9CnLYTic0w5dKC7otAGqMazDGiEr9vwuSKV1sGnDJggR7nEUBZaIgFTAqpz"
+    "oCSEwTJSFgxgCD2bVnzz+InCZxhFC4MKuypuzjENWw1AWQc8ngwgTpeGAAQEaQamk8dP30OYc5dx"
+    "Hj7hcFCT1c0rB3s8pEUcwqQiB2D3c6JVVmIlCxhRS50vuSDv6W4dHh+Pzry3Z/sHzfMi63p59Y8l"
+    "rHC9suh4qMwqlmg1LhY+0DR0VF/xiOc5WgRSlFKEDiFGPUCHeaWhkegEhGUuO5ZDZQKi041OaZlS"
+    "QhsUs2ixwHzQe+f9vH90OfLOIf06GnUz2D4Qu0ahIs+OZJqMRXql2wz48wwuZdwgTG/2nMipkqIS"
+    "oC+MfI0aMXuydRBL6wo244ucdLuUkz4jONVHoNIlSXAtREeK1ji1QzRNi1wFAq7K/EippdkRwX1z"
+    "Z6vV2VPE4xDjbmm1sBqmlh2JpbLmP5mDgVz+WIK+JJGu2vlTh4KsS87JqrX3NY1ZFpWErFhLxvzc"
+    "b5WV6E1Pfsz9Rw/oBpQYYtwFTO2+/kt/q6UvI3mCDYqv9ATwrCd6eHiiAceAMSBc5FFeUDnUFsUC"
+    "z58lDgHNVXAhHcGXaLQKvVD1PEbnzJA72hUXEDKX8v+CXcW/+p7uOFe7w4FxBGHsFkrVveO5TXXj"
+    "aoSz1fChBpwZm1nznLLjl4gg0eHsZxwvIWyHzzUYgca6UoFvwsAHazzyQZ1+YDGdsKRZoWzrz7ff"
+    "rFUe7dvqHsgsxihbLcihqUVZnKYzjIYaHniDHWjq+7IGqiZyTHL3DJ1RMpAXJgiVdLzxZIsFDyoI"
+    "NQ70ayHGKQ4Fj40w50s3OwjiiA0GNN1AT0eO4a6gk4Px+G+j/9gjs0eE1Q4STzgFB1p8usCgmYbA"
+    "k4N0kRwXWV7Yjs7V8WiBXoNRWHsWfQehYpORgvsRUPgz6tMoy9KsfrwwsaJEVuSaFLMlLvlVthqi"
+    "wMHvY56dJgOQMLwsOahSUEkWxTx7RIM+iNyDoHFXvcUTni42ZhsIfh6NRBbYZb0kj+SYFfnQQ3dT"
+    "3+vy5E/2aOu6Xs7D1UDfMf8kPGGf2DHs/cbzvjNJiA9avXjCqmhPLtMjx8e4D3FgXSPoLk+vvmiP"
+    "+RDMRrAHNsSYOYxNDB1RQmzQ2SoOyLo+tqC/VecEsrVCVxyrg9auydQGr7WZCqLoEGjNyY93cPLx"
+    "9PAIQPLv+2fHWJs+Gv08OmreqgCF41i0VEe7dKkizajJj+PqZoWRocqwKvMe/CyhcgAE9bFN/3dH"
+    "RD+javkyJBqoUULF3Xo2V89GwY3bg9c0oz6bNUzfsFyUk1yZLNRytObrU3K9edBT2e46uVTyB75h"
+    "MJZ3UQryCo8AL8tDe91gx3mOcWlemeJVcbikD7AxyD41DiDepZMhWypiVk7d6mJtc6i0T+v2ROJ4"
+    "l8E1dmuNZZ3zfO0WaTNau4U/0BpvEIBN3K7rQDO2FUz64k3LLuICI2kXVVcm6K7SXvUNFVg9+ljq"
+    "lSHp4eQ5tEaCzSOBTpJKaOzWFxuJkWUgGAWBeFivB5B2Ps9uFHZTmDSx1hC5jO9XJRph30h7atjh"
+    "Uv/IJHSzDqWchnlQ7/rNj/a4NXRYnZMZeKcnKV9crZupBV0q8DDcBgyXBx2j5A5jNMR3VW9odYaN"
+    "Hv1yun/8zvtwtn/6VzTgu8xfTC3d/P7wl9OTw+MLfDOJHhdg2blVD9OaHqv7+FjK7zHPWimAcliw"
+    "An6sywS+/aaWKnDijcwRXpo89D/j+UQa33NGmQPIcMIzWdLKOMSfIgLNenLZZTJL0oeELR9XreNU"
+    "VWTTmWpZIZG2iJm2zA4x1VTnxeqMVvWlc9qwwEBRn7t35JAiLQ/k5WnwbQxUqru7kBc3T/N0QbEn"
+    "JdMbsiHlW2NTNuOyCpPec3kqiFZRioHR5tM89jAApy6GY3WBV202dXBPlXP9gN/GEMrW19JKgwXG"
+    "gV6R6ljGESWWNmNgAhmD1dYoqKeVDsApjuaRLH5AvFIqSE9aAz1/TywRjUpD2BRkhfVVfC9ncFz2"
+    "NoUo5w7P8bC/AH+JpVCAw67y5LLXU1cvej1S4BWiCT0RIKirDdWVBXwrF98rVVOLpBUArefYhuXX"
+    "Jgn1db6qm8DGuLVQul3Gq5XOaaNaygfwr8qFmje5TUUo73ub+lCrJdTeIEeOq8HOdtbhSCWCNVdR"
+    "1iZ6a61eK7jgcx8UL9iMisNKcVX9ta2zjbpBUwk2FQX07sh0G4u3G9LHe8rRa4qw+/ov9WIudKhK"
+    "uXp2hViwgp88YaIuXZuD2oID1Lfydmgtla9n6Erb6E69nHVddl/L5b2zy+OLw48j7+TcOz07OVWH"
+    "smsuo3fcUoYneYfZqcVu6ljES0UZ5nsIaFkU/pGSvPYJ43HPVTSoULvnSkLKr0SNvgpUBjuIobZR"
+    "0C7vhju1iyNYPsQQS571uNM0nQl3kXFZevzaVXcH5EWCv0tCMEiSvxKAoEx1qIg04FQfwwTzkG0H"
+    "7J//9b94+AIZWc79EJUd5zg9OT/8BToB1VM2UL1kXszO+G9FBCio/Js+ekrVyZXEwB6zx+O6jGoS"
+    "UvJxcLo5bInQdwZCHa4J9GwV5KCFoSBUXYXh4WBZgAl8CFijwI9VQd7EZrw4BUojjzEo9qoobsVb"
+    "zdwGB+vkZq2ONpG6aeHAGUZFLt2FTIVugyA1wWIDhxSomLRCvQZEaAvG9N2uncnUL7DidGCsb8oV"
+    "UHAzzRfeaZTXT+G1bmwc2JOm4l3W4UDNUS8nwiLYpfveJL6pX1WdlVTDezzwqJM8i6mqYspdLYJg"
+    "NIsriqUAhQQisXFLGhyFmMNSPt/O5REszKoKnm/aKgZdk+GZ4aVGmOrCIkxglLKrWduNWforZKQe"
+    "qqzxUsx4HkybQ/Q6AFweABiahI5prd2db3f+zar3S2U9vStkxqMLT18Z29SH7jR29diEkYcJMoXQ"
+    "QWCFbMh8UX4XaZEF3GjuPLnGVyCF8qIkBFQK5noELDXM2Zb3HiNMXEvEcbCIigd+aXUmir9rS/Gn"
+    "WL5WzgCDRH0+TteXMKSPHstrCvpCnkH2ytrGQ2tMltUVLop6FBqaoA5d6KBcxQd0Bmem68DIOc9P"
+    "iV+nb0JweRSvZgXPd05qsV0uTvU3+mmX/yRJZ7ccVpaRahCnVIymCn3Nt0S0P/iOVL2vY5tnOExM"
+    "XeJQ436v7WXAt8CmOR1OD6B8dH769WuCcKFO1kwPBJ6M5tXe7Nn+SKjfACFHtUIWTXcx1QE76gci"
+    "ubZq9sTz75lxxUQKxoSBcd2RqBC2TLbwd3hP+psUMYgNrRnPSEtBooep+rniCRibtz1NORQMOvQz"
+    "kKlllM0yj7yYDndUjaExTIdFHeP0q47iRNlHBlCSEfz1Il47qtUspCkEuoQpha0Cf3UPuV3okIPU"
+    "6+76BsoGBqIh2J14ihc+KfJSA5AEekGOHUdvM4t+cGnBEz40R4CkFAlGVUY2tCZS7TSXem5O1yjv"
+    "1CfCebZMKFdjMcAGtm3i00B5neiAUaCHLldyDF/RNUWlqZtnmD7oH8/gUKQOf2TLk/LD6E8DXhAG"
+    "VhcvKvREu/UbiIkxqAG1dGUJIVtZcp9wVkPZCzVGXlfw4dv1eKzQlsSHmaOQWKGaJWJQ4gBOAWLX"
+    "cqIr9hUbTFg3RuOPsSL5Y5hA3LMbwscgxYK3xFMs4/DtWke8B6Vmt/3wV8itklzf0pQOU0AEQhxA"
+    "4GpCOQXfBpzTDRhRBNOGsBQsYXQjza7TbJVy+Ldolw0lcjNpOtY23oQuh0hlkCPqKrNmAOqBJwyl"
+    "cNZ0BPXBbkqL1nQii9Szlea5bkptMHqAaUDrxhgGQ66pkgww3WGUz5OhhT8Gho8vkmNr0CZZtjqv"
+    "k2er42dl2hrxTLm2xq2XbRfzW1WFFosS5SxWZyhnDZV4+u2OUzChB8Ag3RFF09ENYg9XxbzQqSMS"
+    "7hgDud1Q2pjxsgpJ4WW50+0ORmBedjQbWyMM6IEBlepVHV9UV4zojNIW/j2f8keKXgHgnKGsLk5k"
+    "eZfuM3VGzIAr9Rud1W/yLGMfKzLKXW1RjTqlaZbK1uqiNEj3KhVMdlxpMDNTinIK0pArq7ovRWcS"
+    "RtdmT713a/vqlSgxqY82f0KrlsReEKiUI9xisaB0t5lptw5V9G/MaOba2eBzykrqWAUTy3ZMueHc"
+    "sNebgTHc1RK3TZmWilubyStF6fKU9fZpw3lO970U44ymlRVr0itSQZb/B1BLAwQUAAAACAByn1Jd"
+    "r6B5eFsTAABDOwAAFAAAAGFjbWFrZS9wcm90b3R5cGVzLnB5tTtrU9tKlt/9K3rE1CI5soBbW1uz"
+    "DnaWS8gMdROgCJnZHctXlu021iBLupIcwgX++55z+qHWwwlMzbgqsSWdPn3erxaWZf28jeIySlhx"
+    "x8vFmmV5WqblQ8bZLU94HpZpzuzZbDDIcg7PFrwo0nw0F4tmM8fr9U7U2k34wBZhHLOQrbbJoozS"
+    "hIXz9CtnUVmwJV9FSYQ3XVakbDYTq7xFls1mLOF8WcBCvX9vBTvzrzx/UOgrnGseLlm6YuWas0W6"
+    "5B4b4sPhTNLMA7EkQNwAkSzgXgL/ClzSm828KElh01UUw60wWbIoKXhe4uO04BUR8HBV8pylCdwM"
+    "iwI3DVnOb/k3VqZ3PIl+x6dAJePhYt1DhEPYcLPhSVkAn2UeJbfsgC3WYR4uENUBy8N79SCO4FYY"
+    "CxpMCcOTBHfPea8AwJiL7QpmzwEPPAGCoyVHdjYgOyRgkW6T0nEJVWhIm4UlMcqKRQpqjQrg/xgl"
+    "OGZJuOHMZp7nMYdNQE5FOWWPIB52A5It8ClxnfNFmi9JeKC3vShZxNsln818nwGTeHcV5UXZ0xoy"
+    "dwdyBETMB4IEVBmbc1AwWobL7tcRWl4MjBFoZYPzOF3cDXu9Psuj23UptYEwcViUJk6TLJAxXm6y"
+    "NC/hyq5WwW2eLKMV3E1XPSYNCO4gqWEM1LACbTVK3pIt8gzA+dLAzqyTfLkF8/HWFmC5X/OEsEgb"
+    "XYcFoE3AXpy3QLVkUkuIdUkIVFmCOlyBrCkncD4UBcDPZi7gvo3TOViMizQREmDYRRU6gvQ5L+85"
+    "EQV6r0lFa0LSQG6I/sBMg1+ECdsWXHqCdAJYuQkXeVqAu19VsHecZ7BHlMREBsmdrIh/y3K5Ywj3"
+    "Sr4B7ZacHQOdY3iwJn6XeZqhIMJtXPbC/HZLXsNsDZ6iD5Rp6gj/QANBELBocJ/5Fv0ZxHN+ffIp"
+    "OLm5uQbEsDGA4iIW9rZJ9NsWVMOFyMnaM7AEYE9gBPcCXZXAGwga4w0EJV5uM8lKnKYZChfulmEZ"
+    "LWYzbeEg/w3fzHlOFHxI0+FwHgLLAi/JIN8uIHgWHvug1oCm4TGg49/AIBNmnVrobT2ycoi3Ze3R"
+    "bPbWDKTS4Rsmv1LWzmPzd8ERbR4mizXICDAXFIIrx7rPwwyMCikqlatDjIqEUaRJ/ED3BQrpJpsM"
+    "9s57qHSM5osYxId4PXYGsQ8CCzrMgqO/zB9I73vSLrI0SkqMd2CS9VTw1oTrVY4qRLIJMxF0YKNS"
+    "BXyKZfMQHpepdGoRzr2eZVm93ipPNywIVttym/MgYCIOgOBB0yHpodeT9yC6EvQyLENgpyiQH/FI"
+    "33JhQx4vBWAWlus4miugK7js9YKby1/OLtgI0HlSSjb4FGM50sPoY7+7Ol5GOVriVz7+dcL8ctr3"
+    "9+x3w8mvfuL70yff95y+Q+BPBC6zyPjgoAn1dOD3vf47uO33D578vzvmMplSxvB0+6enyfbLx6nz"
+    "7toiAsBINuPJr7bj+34xfTx0j/7r2fFtwOU7ADAiAEfRLDAaWCwixILFiaTEercLdp9g9w3Y/Xcm"
+    "mfeQUMaTk8Hfw8HvwdS/r7GebNG1xr73zl8iHn6WXU0nbwbTp8m+f+9N64LK0EXGw+HTYPzkfxZP"
+    "QPKu0AH3PgEcfH0WX//r9pxecH5x+vHL+7O60nJL6GVPfMHOMng+CX07/txyccE5YHh/fn12enP+"
+    "17Pg4uTTDxAhe1Ztzenlp09nFzfNZU3FPh0ceH2xJzAWnFy//3J+cRn8ZQf9+7VtJfHiYnJsTWXm"
+    "8r31ZGxNxf0/7iuOesGfT08pjp7//OXmLLhuMeXPg0CH3iDwi75v+zYp2nam/SffFj98x4F/PrF8"
+    "9fHk9AxZJczBp5PT68tO1IgGzCGY4v+Hg/8Opn1a8nR1ffnnT2efUPhA5Odfzq8CuHVzefN/V0L2"
+    "nwEZeOfvUB7x0n60KISD0CyM39YzEPH56uz0/MP52XULlOI6woochr90AsOLr1FebsMYseyxE8pb"
+    "GN1LiJQYz7AuFGGpwMoKghliFEkK0klI+dOlHBN25X6vF1xcXgTvzz6cX5zfnMPPv11ev69TSWb8"
+    "aEUrpAeSFH5BxRQTscV9BGUHkR3KHxj98XuZ4v85CCNP8FeZPwg48Tjh99JFAJTHvKS7stSwnnvI"
+    "8GwmKkQI4VROAId1VoaUGzHTsZpp2HYGAZovHYfKScHlhy8Xp8Rjl9Jqy5GSIMAUU2Sc1BPG0W0S"
+    "FsQX3EYyhU4+Yh1ItbGqzZFfJqpHo/pSskeGgB4ynrOL98EVEtWgBT3O+g/8b4yb9Cpz+/nj5ekv"
+    "wV/OTt6fXcMi6+CAhYtNeAdFP2x1H+ZLmRhFoqGaotG9FH4CSar3PzrB2GLr0U2+5U6PbjFdYw1J"
+    "Q5h2hiLb4OUeOxrMQY1L6hKwbJRcGkUl2CH0Mx7BI9QQUn1JVyiBITYgdGWQW93c+1FtIWoFlDi2"
+    "PbUSOsyhD1k2yBF0aLBiyMBFYz6BDal2nYIwbacmFimJ4ANY+mcoSqUkdPE5BLaKciLwAG/UbMn/"
+    "GsiniJ6yuC2rzWAVYnH2MEIcImPIaFkEoYiSAUh8nqYxLP0A9TaXgrlcrcBIYHdoDFRF8r1exBWa"
+    "qIoXswuQOBvd0g6s9a5JahZgArlXABSRliHPXWBgGtEXwdG2QeW13VCEDbfpAuj1gEwW5NgQ5bbo"
+    "RqUOMMdi9Jk6bDBGDQxVDr4hx4RoCupBXEWGPV5lsEW6zeHGGqIqhDSo5+k5RU5Z/mCFKlsaT5VT"
+    "6baUO8NeqNvJVBoH/4pSqHEOyAiJpFjXK9GqgpdxjdilLskjpdkOG2ugaqUkwcMKOlnaFrOcXsf9"
+    "0rsFV8hsp3pqEFh6COPIGoVilmV5/4BC2QYcjhQ3jgmyQDc+FCMLG+VJztqS9zXf4LgFErnRLR3o"
+    "Dsjom6icNcYt0NghjhMFIfs9VmzBv8OCdbVZWIDPZo3AL/eysSN1HCjqES1kKcDCZENGkwoo9GUv"
+    "Ri0Httoh9Qg00kiTxiQAfi23C14Quj5EklUcLWRPIXfvMwjAmJYLMb+AsHcndiga4Wi/METhKeHR"
+    "N8oW1NOqhbxiO7ehqCQApwa6o8TpWCEVDf6Cz6DqKd5glmEKyCN920r7QQaReQOZGXXe6XAu6+NS"
+    "0S7X41XLNq4UMsJBKgFLU/03M/vvNBvE/CuPQbsjjKA0LhGhXpPkSIvpq+37Q6x3VOue1XZzpc/P"
+    "ZscykYxp5gd0gG3d8ziuawHiHSrSZYs4xfkXpgfLnjweo7ic6fPYctCB9W6YlQSEBJAuSVQUncFi"
+    "sc0hlpVNiZoAZS32C4mM2OH340pBzi1d34w21P5LxmSUwYBLkGwExQT1MVY9zohN34zYkb6N2Vgg"
+    "U8J5HbIRuPY3+9CVlwN25NRxSzDglDAXhM9t4BKSVbFOpQUpVCPkGaJ2pUgnYLaVWDVQiiOCLX8B"
+    "LaMGLQIt1k+mvDGiw5MmKJGiY7TM/Sv1AHOPNJoqar+AVRXCwfpEEM/IQjJUk1hPCUd7tkrFQRWU"
+    "7KLctMyRvNgoZ+A/mZen8lv792xmY2nnGkETKEAQRw0q+7hFn70B/4OyXNaIZmcyT5cPrvCm2QyX"
+    "QvGufPKeRsCgPm3dlRMgXuE1IrvFPLEJ3lGFX4EqwodjqUp6PBkcTUmlBGFpZeBVpQBcNlAuAI/x"
+    "+pj9J7InsBAAA1R/AFSOYR1SLVWF0/LhCMnPw+SW2xKLywb0z6nVCmKjSFDrvNBLa4vszkUDc5Fh"
+    "ufS0vgA/85yHd0LQoKTdjAKWCGT0E8oIlTOJSEBGkEBRIX3fkZYwJ+p5R4oXQuPKK6gT6VptSd0i"
+    "yLOj3fsuqbgFmQJyjusb7Rm5vuLip1dyUWao8UDligA3wyJMGKgrWNBxAKGhHKw8qwsljSNHgmxY"
+    "MNQCsIYW2RONK3OMVOZlZ6/vRVgLqaoJQZ3v2S/pAvYULoljAHHzmHwOKRIjaKINn0xJoNUEpEJO"
+    "694YfqXU1zljQXbkuARhNO+0R4tiYTqmjlG13eWsiqikYSJK2ZXTFkUDcYFjARz0glRegB0JjqaO"
+    "qe1qhz32XtZCuq6oiiI820QW5lyWqtB9cyiheO5Vqd8gZmVVhx6PZiFHdPwELKKlCWdSkGIE8Dxm"
+    "jxrTs6W7dEJqPLHbaCMI7UdM9KYkv2c5zK0JD7AgvmcRZt9aOuKKwK8ev7VUstrhOkZZhYkpzaht"
+    "pIxVtY86PZ2DFr7JA7yOE6GwFA2hapb7tEWf2Ye6UsVMprORtCiRlHQiOBQpQGFvR4VDtRjpVQFS"
+    "rJXp4/hV6eOuSh9HQghdaeOOnNA6xvr0NZlDrhtjQfsvSB6SnTu0EtMszP6+WIRJo8FsjGBAA5/F"
+    "kbQ4Ef8qz8fVMczQGNK4eqzSPMFLFms8HFPqxG0xSqutZOm85Bk0jkrge+wSSrDW+Zk4LMKZ0ppH"
+    "eTVoo+O9+uF3mabCXQWGYGHiTqojNTwRFyMuW5/ayCN56FVXIQgGm1es5usjGj0Ha0+8yFm0xxiN"
+    "hprfRECPMUgze4+u0rBCoMswcRLlQUW5xFMg0qNhj3eRHD3o/GmaqnhKtRhNXppFdrM+N5doITUW"
+    "LTubIbm6fZzhbZAze+m0bRcNxGvP6Jp1v0RNdtNG0uJBgqN4RZGBu9SHZe1qoEaSnplRAoIYDGWM"
+    "mh7VVtAeWmXqg36Odl8/TdJykKI7asvuxxITUV2ZX+sxfvaYcZh/m7KuFyVcWZSVKXm5OBH2OtHt"
+    "NOSWivBTL2C7BWuMNhszswqLjJZo/7Y8JYlWeIZBPxL81SGdSjSqsZu0j+f0CGepRzPT726Pl/oM"
+    "Rr8LsFMH1TMyG9VhvoSOXWSgN5LmrFfs7mVp0z9Jn7KJ1nDyVakuLb9Ck+5uQ5Ea7poPNCQtXn1B"
+    "WW+Fil/vv93WH5U4x8LqIdfpoDrT2FAhWGJBj25CQ9K2M7QiQ9kZElrhaOfsqCOemeG3a9gjYcTE"
+    "pFl2qI/Ir2+aZYSWt1jdLD7qq1tFiLE7mo+AerV2tEz+SVkq+fxBy4d6YdViWo9Q4A5bEboxGPoe"
+    "diVZYm3yrTYU+aaHIgg0sUS5Ada6DzXL/rS+r65FWnrozhm7iXkWxCiEO7YZdEwTu4xkRRXZrklV"
+    "KyWtEvMcpa1Q0XyoTibpNNbXGkjXApmHD7vTsNyJyPguuRJQSw0FK8x5EQvMePa+tpVuO3KM+iie"
+    "9826lXqs/d1cVUW0ssmd+O0Gw64ha3kYalt+IieTC2GiC5og69DutMWEn/pdVY4f1UzvpUp7gSfX"
+    "Df7VldnLKjLZ9SCw7Hqwsg90DRvgcbtdnbm3TlJO5kUab+mQA8Qh3htUr7rNZr4F3YOPL4fa+JZa"
+    "AfSsZf/z2zbFszcOW2d8WTWzkiJE5+UckH/ltuOFRZClRfQNfuacWifQoo8pz4ePVd3dt/YhssCt"
+    "fT1fJo7SVdXJudBU48l1rUcfmrsjqEdHc2QsLjtUaxxqGOWJpHixurJOG+pw1d2gtMTIWlwqoGl1"
+    "CFVl3O+9sq1ex0bZ9nGDvkunJ/mS5555VEcD6QwkES4DvLZ5AqqH9nRkbcvV4E/ABs9z6DRHlpSW"
+    "5VSTecQ8NWXQ5Eucy8HXRDbGxsybnkyrs7pqpezq6mKRqOpDE8Cp7ujWd9rbLcHq5Lt6UvlLwTm+"
+    "xMHVWxE734XA11wc3TpmrjyhpyYcOPsdCswa90SnEeBwlTCNeqgxKsUoaYaxVvliNxc5tAqZeFnn"
+    "hqBeuFzabUz1uGWcymu52cB2zU20te/iqX7UAzil6jssuNspzBjS+POHytCZneXRJswfmPFnCjlO"
+    "hY0/ZMDol8Vb443e4t/iFqR4xLXL/AnKeHt8tNuFhBHJBfRiPUDT62TJg1109fb09pSyJFgqBzXn"
+    "FBxIBPheMZ4g2zTjiXDE6NZejgJl6rfAwpJuiXI9xDyDp6BHlSPcucyuPIGskSfbDSnXRqeocVIf"
+    "9HX3rDsrDLH9XcsEO9FQ/JVkigyIVU6CetVIbURWNDKko9gq6rwIBojsjpyqKHZcjR0vxZUenWtK"
+    "Onm8EzQqIChOquCRBJJ7eNAQQDHBm1O3Wng0NXxZZvU658R9K2C0ZIvTVKk6+FVVCR2FT2OwK+iU"
+    "h4K7ytY6UlMotRWGTOtyrWSr5EtiGqOliEa+jrW6OR4BTId1EQLhMxlWq423IPa7/qLFT/an8s0o"
+    "clA6EDCmjOghMl10uIfh7qZ3/IYHwl0VVsWvGK2ORA1SZHEkapCaQORfRCXCsauj4+ZkHB82BhrE"
+    "UfUnXfiXH1gv4/K7+mp52Cl2GCIY7KKPOA18CNhOUyRolWpW+1QUsiNorX57Rtm2rUcswL4AF1iP"
+    "cfIMfJOs40Sds9WX1fbofjW1a4Hco0WBeusMNl/ovak5IJF5Rv5rrX3DFI+PAhh/PwO7neomCPzp"
+    "kDC6sFkSj/FWKtLUAWqJ+SQS3Kejzx9TS/kNoTRzZA91/9wt6rpBth5rSZDNPO/Q+Q/1LSxP2x0b"
+    "Tn8wiXixyb1s6843EmmpqnQN3QR3/MFuvkHcKnX6BkRfn+Z1/TWXq/90Uvh5+ICQNllkugEqogI1"
+    "6zVe1us++DV2rTOlXtHpeI+l8wCFDoob7xyoMxKn9/9QSwMEFAAAAAgASZxSXVrdLCAnCwAABiEA"
+    "ABgAAABhY21ha2UvcmVzcG9uc2VfZmlsZXMucHm9Wety27gV/q+nQOkfIbUS3XjbTse73knW0SZu"
+    "mzgTJ93OOC4FkZCEmCK5BOnLNJ3p0/TB+iT9zgFIkbrESXrJTGyLBA7O5cN3LvI8b3JXyCwRz09P"
+    "xXT6pFSmyDOjxnOdqulUyHJRr1RWGaGzKqePN6LKr1VmhC9vcp0Y8UpnH+Th6Ut5rUgCNv1S6/La"
+    "BKHneYPBvMxXIormdVWXKoqEXhV5WQmZZXklK43DBgP3LDfNX6Vq/jLLVN1ZIYWslqmeNRJe4+Ng"
+    "EL2YPH02eRP96ezVRJxgYxjnqwLK+wOBf6X31/dmeID/fqLmOlMfdRandaI+FqVcrORHPc/w4qPK"
+    "Eo2fqcGCefB+5o1I1NnzV+dvJqdPLyaDYDAYYCGeyiRaxHHUeCoiT0XWJ35pimNWLBDjH0SqTXVp"
+    "qvLqmHWBO95gt5Ds7Ga/oP2CQlAquCizPp6Tdux3H/bYvyBJF4VKgnDA8s7mYogDhyLN82uD0xAA"
+    "KU4PT7/5RixxkCqFP50eWLsRlkOE58CZzx//9Y9/BiN3LEucTsfr96RStYTImcnTulLsf2Fyfuic"
+    "XAqjlOEnRq7wQ61kVunYsDhpHCDmeYk1shKxhMG3ulrmdQVEpTrT2YLUwiJ8gCjsmeWL2qyRFzbO"
+    "499VeW+9ydGVtxRzU4QclkrdVb7K4jyB1BOvrubj3yOQqizz0px4pSpSGSsv4P3qLlZFJc4vJvS6"
+    "I9NG4fLKOtlqdSIu0yzkAPgBm5Nm0J8UCE2R6oqX4ZWei/XCK5aAR4C6FbT3GCzqIjlcySpe+rzn"
+    "8tdXwfY+r4kUDMRxvnUCInWj/CBwUuHl4zUKyQqrEhsA2btMWB9FZtPDxpz2hbPICIgxeCvLylBQ"
+    "fe/A6+ynf3EOOGS1ah8eWPCbwnm2BiBen1+c/WVsqntchF/qHBsW3wEURW703clPEpcS8PB/1lmS"
+    "3xqxzE0VCFbZdMTSRpUQhM+80+NDKWaHsYd9zFuzku5n51YRuJMyL4y4kaUGZoVzJ6PcYc65MASs"
+    "wA8+U5H1lW9Gwqr3tqxVYF3jQoMdLVdwPKJZrdMkSnQZycrSBd1xS1DtO8sbI77+naANmEmqukjV"
+    "ZftwtH7f5ZbbUlfMwWQDTL9dwuYhfRgKDVdnRAnD9sQhKDxeEW1D5aKuGl6ZrIrqHqCqZ2AfFS5C"
+    "iGSt86Iy02kAFRU7D1wUihfMNGNmH1qF+6vADmqDUMT3pUpJlR+gWJ9ELBSTHFsJVoQISxtyIXVm"
+    "KrFQmSolossyOUAb2QeEzCFdaWOAHs5eMNnUCmlInOOwsk+4zhsssOsRMo15CVCSppvvnHOsZlYH"
+    "uM1omLYpIFVzmJHFS5kt4CK78Q2jgxjRz9QtIwDUdFeVMkpUEbHEYDo9dp7JDNgvcboyd5JkU+k0"
+    "5RwkZDWwF8z6sNKgX79L4DD8zFlipZAAcjCOA5zBkxqERMfpUszuK7vCuZiy8bwJ0opcS5JGgJSO"
+    "l9bpfDR2wA/gQtyp/DYLxetUVqCXFa4pJaXSgtK5roMi2qRuVHlvb8CIMGEVo4zgJK7YqlKNS9ms"
+    "jnNY8fZdPynMElBVG4Q1D36SBFvfm63XLUlKYki+kZvkJ3u898QLiAxTlfkyEN+Loz4LEonIgozD"
+    "60/zI+EggiZQRF4+Pr5qyNf9fuQ9WgsosIhIw282rV/10iSTEy0uNlxj3bA7D36h3jsOxGEAg76h"
+    "6sifJVtH/lmmtfq6UzejUYTaMLP6+/LPWlGC5ckDdVyxlexoW1/0gSPK6dQiD7gOiXU15ZRUJ8J/"
+    "Wia1znKLTDFP5cIE37k7DHTFqldwhT3pOLYIM9RUYZrfqhKlxcmJ8DoneX1t2OUqhWW5CQkPoeNb"
+    "vyxGuCBB6Mof33v/HjWDd+gFWwI6ya5XYEDU1fbq9QVqwsWFSBE8ABWqkXBRyKNs1ZEtNfERpQ6b"
+    "2R7dt/EzD8Tm5mKw0MdXwQ7cMxY2QbvfixD6WW58ANsbXmYfbC3Y8lizy1m99k+wbwnUfiAKW1ps"
+    "1DCd5GRcPRPnaariqq1i2rzlbxQte7qf15w1SzVXJbIP8tKMbs+TrVbTJ+q1OWY6fTZ5PXn17ILy"
+    "WUP3OzmbXvwXKft/Rcx8r/eQ1SayuxV9r8TsxIQs5cYngvEUEReZCoFCc70zMvijjckfcucuUaTU"
+    "dSH1qnGKXJuKQqlrWz5neTZ2HaWtfzZqKQ4YuOzly2euzxy//KkbMSoouIuSO+5PP2z/h0g20dkX"
+    "xy3yfzi9NA+20yC3qF/ToNK/TyXnrbP/81bVmew6cZDy5/Wke+4LAtTSEQ5fBz6jwAtvF5f2YI41"
+    "4Qfg02dZzQRG8cCq20pZ2rD91AbeR7bCt79W8i4qcxT+YA/gGq46+s3oSxos1lYoiRJ43WU1CvBc"
+    "oxmO8cCKy3ZS8staANHS3+Hpyk7VWhLs1717iTCuS27eTcUEELR3KrJQQF/ir73RCWV2t7tYZqG2"
+    "n8FD7snb5+1dxal9UHzNdXVa7KkAd0LNwu3z6ZnX76fojuZ7L/5Xavkww7dOLeXiS8pUpzRt262p"
+    "y/W0oL/rQJyvdCUUFbOHdUYnyhk6yieO2/lFO7Wx1atMEsoV7aTuRpg0pwFCzwMtXmhIssmp7m1f"
+    "2RlOv14DjlEM5bukgIejbgKM4ry4t17R84i8TmSAPnCOMsM3ZdwMVhJTdWazr5Dn2pt9ChFiiLVD"
+    "3F8xxMoh8mB6bycobqhAoLVtspUt/AJBUeWNcjtst5rTsOFWG9WMU96B79HVUjaWKe4y6XvUbYDx"
+    "eq4XNU8euHOQdIitf8hQN4SZXLz+9mhjqjKdHtqEDGEbfUgw4h6DFKee+TDVs1LitHz2AaUBvMmr"
+    "meYdl8yVpNGbneYu0dknzeIYjKf61NOO52sAwhray32IMpyyvj524oYnjGj2o+1p4PXes430uR5O"
+    "78uFhTR2Dmh1Cdm/FHgOeZs1MkPfP1gXtZeJh1z+1gzOXCukuvWTHYiByjxr6/d+hxtDDp6KceDw"
+    "olSxLlTIg5GwcAEIhyD1do7RjjBW1/hJeY/AzENGyhTg5Si/tjNHO9soqu7kA+f3WkTrFmuMXbq2"
+    "bOdaRG29fBf3PXDb2r0jUs0N2lN34/eIpMc8JHIImHlek682bWtd22pLcuf5LrF4uiV1MDgQP5LA"
+    "MQnszNaKnVOrjRmV8HdGckiF7iB6cX7+x+jN5Oc3Z2/fTl5FF2/f/XgB/f2ek0ddG4IBr8KPp2/p"
+    "uysvtONYRmXEbAJDLXwLnfVR695vYncbqc81CIo0HVurEDA3253J+NqN/4DGG53XzcSNaa87GEx0"
+    "0iHtdhS6F9GCYLJ1O7hAAgEWYjxvvmAq6yyWnzsglFBinBcuHDYV0ZdfKmm+/XJZZYsmideZUUNx"
+    "KmmEqhfLSszUnMaJlmqhCYopLu7IP3BCbngSSxAXXPwqSzREkK3HYhJ3rYin3VdcafrIOXInZS6l"
+    "oa8xu48+mDyzPkWhBMjyN2197Hegsk22vAsbSE6Y5jIx/lrQJ1qPoPdVmO+oddSZXgTbh/zt7/Z2"
+    "Ao7LYyAj5lrRVsxXnfdIlzS/osJw5+XoMPiGrbRtf0eV6IUyxGXOkSFy1dFvf+cXvTQShEt1Z5du"
+    "DH04MlFmuC0jo7hIjJrHX9d7ERyIXslH4UJVPtnQ6yO1oe8yZIZ2hxZbf9m0SJ/d6MsZ1z59fCV+"
+    "ddKq3Fdi5/QqN2FNq/1iJDJz4jspo0ZcsF2pdh1iF+2aaO30A5ve5F+OOqHikozn5sGaM2qPaL8R"
+    "5XVkGnvseH+0Ozi2dM5AZqAn9aowPktCsbOF7c8KJCv/b1BLAwQUAAAACABJnFJdOrSJmYEPAADg"
+    "LgAAEAAAAGFjbWFrZS9zZXJ2ZXIucHmlWm1z3LYR/s5fgTDjKemeGcmZaTLnyFPVlVNPEju1lLQz"
+    "roZHHXF3tHgkQ5CSVVf97X12AZDgi2Q5vQ/SHQEs9vXB7oK+769WyXqfXEqhZH0lV6ulSMR1Uu/F"
+    "RZvlqX5aL0RSpKLZSbHOM1k0QmWpFOVGrFbrcl9lORaKr/CrrfIySVeryPNOsO5GdOT7eVVyo0RW"
+    "NLKuaom/QjVJ3TxpqwXvYOZn+6qsG8UbE82s2NKwV+VJsymJP4l/mIc562S9k0rsZF5F4mxnZKn1"
+    "Tli0F2WxlkvM7cjSTlrCfZm2uVQebXQpZYUtxXKdJ0otV//VzEQ8M/rZbP2iBPMfGkiCPV7+/S+v"
+    "RbBaWb6iBiNQhrdaXZRJnSrzYC/rrUwX4iJRUlR1ibVNBqblhwo7yzQUVd5qvpqyzKGgVH7AXyzc"
+    "l/UNFOrqmpjttS02Wa0a0UDfTSf9H5T4pcg+CFWuL2UjguWmLdbLlf4ZV0mzW4WsLc/aVBapYn0m"
+    "9bbd45FaiOuyviTVp1kt1w0Y4a1lcZXVZUFztGtUUJfkxZ5qYCs4A/6XbaO/yLoWSV6CDjR1+uKn"
+    "+O2r7/92droyHFh71XJTS0WmZDGapJFs81r+1koIWEiZKvaSQkDXl2qpfXJHdkzSsjKG1QJBAalU"
+    "6zqrwDeWDUTwHBFYgrotzOJyv8eDSLxpmwoCBEbrROJ1VrxPFvDHrQrFtgSjqqmTbLuD8ktmtdsa"
+    "jr3PiiTX+pHwUONvpFEFh2RNl9cFNqxuKJY6mRewGZ4W67auQczjdeTlRVGSmaQmV2IBWXm9S4qt"
+    "VFqTxpZbaVQhP8DpiSp865r01inMI3M/Ey+aOn/yghzNCW+Ozrrt9EnzsRPcdi2VEtu6bCt45Clb"
+    "KCMWJLwqJakkh72xGIHJpawakoZCRiTbJCvIVY2sGEWIQnhSBmCDY8XbQN3K+PgOMQQ8IqfflHnK"
+    "ZhgFiSVKNHojqyKp1K5sInFsxPKud6XqAEaVbQ1psGKzge9t6nI/jJ4gKVjFgognOSxZwoshYZo1"
+    "kLWppQy1TZV3cUO7y3zTI6XxadWUlVG9NbjdWRsOnvaPrNlRrCQd3F7jCQL++MVPxz+cxKcnb389"
+    "eXt0AB2ABSjZgo3iibR0taKAMCjsRtjCOrQiFzd29taQh8LaWjRRBk8jz/d9z2NtxPGmbdpaxrGB"
+    "TcEemDRZWSjPM8+MafPswj55r8rCfkeobLGR/Vkq+01lW0RH94tRqft1001rdrVk8NcsEWxhJ8vP"
+    "z/hpmDVInWbqMubzoOOZB/SzGO5BCkllDJPuK88Df+LIchkhbH7EV1kHvl7mh573pXjFlNi/1zg2"
+    "XJRl5wCH5MMYGHh/5MU/vz358c3xX7FF4Al8fPdA8ReDZ/x3K4vR411ZXqrRs6xY521qhBqNFYRR"
+    "UzLlxXsExuwKeFMR23AZjQGPK1hbxhyTo0GV/VvGtSTljEb0yYSH0J+Xyo3RVqzaSqsyCMWT5+IC"
+    "QbzkhcgE2roQu0QlTVMH2h8Wwj9+Gf/y+tU//ZDjajJMZ1a8SdVovARI+BQQ/mh/WSQX+XR3+PzL"
+    "JAc2cJyO4g5BlRE4HZjo2tBM870ozZdyswF8UewQvSsYvFSROWPIrQJ/QNMHf4d+GOH4yKogjPLy"
+    "Gk4Xuqq4EoT2iNfAP6DpvC19KUr6iw174fozXUtGcdFJNhInPn3z4oeTM40lq9V3Nj8jx3j+ldbT"
+    "k+/aLH0eEV1Hqjq5/pRchjgx2EvHi7MNrddMOVISpwEGwkgnQq0a62Ecv5DwK7HxDaMfwQ7YALtB"
+    "eMsM+0YpOsK1PvIMZxET/VIcU5qCFKfOroDBGjvsuRc0cFxJWAjQlLxMhZHLDWFbRL6tAv6atvtK"
+    "BT2iBGEYdgzAOTFUFEtjocj67R6Yixhd4vBZN8zh67KQmkNaENFSQLS7h1kDRRW0XeC3zebJt3D8"
+    "P4oL/19F5wwUkPlNQH+RXzJx2kX8x9kD2C9hSjMnIoilR0PFO6LSYEgm5IWSIoWI2R2JZYBLQA64"
+    "ZJMuBIJyyQp8h2TifNFnBJ3IrOt3I81omDrXbNJDsDmYYmI/MsCwsKPkePHp2duT45+0FMiGe2+j"
+    "SZFlE27JrIbhYJy2MHDCmyzEOyj2wD9nYYZz5wxkJLzHQLRaflhTQvTm9KSuy3rMYY4EJei3Qm6p"
+    "pGsTzRfPpaggUA78+qIzvuEh5vMlQB5/ZYwAmc9Z67DGwBUQ3CdOjsg1nYGE72j9cwAFJQ6DU+8Z"
+    "JhEJKhc5q2hQfFExpg/DDjHgMTplnYA/sMcZ6WB5gg/sZvSbDNb5goE6dw96AgyhiL2PjC0ljsRH"
+    "n8Tzl1TtXAGv1tcpfmg4wfcgxDMAna89NuhhjwbIwBixMX8773ELG2HYbhAkcK2DhThciKd9ZMy5"
+    "B+VlsqeJNCVK5UW7temJTUIeIdYe4XQWmrgM75Sf8kXmrac6YJtZp3oc2c7RGEu6WYbLwLC5EL8m"
+    "eSv5e3gXrY4FYzQ7grOVhsgj/CpLfXvsmfEhuXs0gGJvTfCUDlQR2G1A/uNtqI8sSYz6TvjPaYqd"
+    "LiPODYl3zN55N3iNqkiKs7qVQx4n+qRPWjLi3qVQ+7kAFF8OnhpV/yBvuJ3wylZm0y3YtH02HlG4"
+    "IX1T1krhdAl94NiXWZ5X2wDiLUxeHp2++v7V67NwjpUHWN2ReKDPqZhwBJ5ovKAnU9VAqmBjzAwU"
+    "K03ZaOIINYipua0LBB/J5LchbE+4eIQqItK9h0k4HLqYSvsQD+98Kpb98y6rQuUWa9rOyTbNHI/V"
+    "pcsG+HpM0x8Te0TjmXByy8IIS6AsC6o5LFZ+FnoANj76RBwgRB54e//hYiRlPh4MA2bROJ8A8xSh"
+    "A7s+3DMGnHjenx1/NV9RqyLNqU1mwXlZ7DRrgmEi0VnhzO37jJs7ky7WgvpHw3KfKvMctVZbqc4m"
+    "oINy8ZpAYHoIOEeFZwLJJsbrXCb19HFbpUkjrQTv+Hg5n8lWsGS9o1S3m0mH03nvxjeZzFP+taEe"
+    "Uz5cO8fFPCf4GU53xWZdMkmtYMoj1ChLhYZ+RGooAqiRuz8ha5ObPbpxl5h+FzKKx0TgscZRnXJ3"
+    "GnZrdz3flO22xREbt5jMxvNNtrXTj+u0zYqSIlRNpm5+uyjsROrXTiZQMyk2HVfTd+ieeF36QYHo"
+    "7hMRCfLNoNMhlzMkbQT9JlSuDAsbwrvBcJ9ML2aI0KJ7iNjhMRFt03XzAQyP9djzSpqIqqRGxsnU"
+    "SEthzwVL3P9USLvWO9rtqOdPPxxyRy2DMr9CGtsvti1UcicCPXWEyOFKnchwPjWaABAneRwa7B1x"
+    "3zkfkxiPDyl0KomoAR9v66TaRbb3bmKktznDrIJy1pfAIqXbRp0m67JsjojU4Elff7VFzB1Tw9kA"
+    "sMaF0TSsXgKrkK8whaWtRAdd7a5pp9vWbtdaBIXUnXSCWdSuc3EGQtbNmVe91DPVZ0qn9uEsKCnZ"
+    "VFtU2shdD3rcYCSFqJKFo9RNFu1e1gQwVDgNDwCQSdvqKUYWZtWQkqZAShosg8tj5Ll4Ok00CLe4"
+    "btqkM2B2F4R+Fk7OIbajLUeLGivdw/j0Bif9nmusYTZvFhOS4QsEzBR3mos1gJkfLig3CXV0U5Zi"
+    "p/Yn8GCne3JEa9avD9wFf0EonPBXZFP9ZAuBdbKWFwgBz8kRzKOI07MYdIKJNg7nD6Y709OOg3Hp"
+    "oPO3sm2iTd6qXRDODUPSyTAMGFMux30Zpy+SVJTjLkmXCzHTmBkFY7ywVTF3va6TrMFynSYb/zci"
+    "m1E9O25K3p2bAPpR6LkaKBYPTNP7DhKle5ydLoX1Fv7//EgcaP84fPqteMIPb0livsAU8SlnN5oi"
+    "KwH4ljVxHOi7Cp2FYsK9emBzzuOHAV06ROreTYh4ZGlTe918HU7QqzDsEnGsyJO4wKYE2FTaXifK"
+    "DtGWSyPIXcbsE3X6AAxZIYKS8L6OGCTo7tXNrmzpChxpdoejrIsBgoO5d+dOhIyy6JgRf0H/476X"
+    "hTT0ihtN2riHC/H1uBq1fQqnDcetwWHfx+ndDQlkXTNI17xcLMyUaZ/tlAPhBg5KW1Q4vIc1yVCq"
+    "UR0yGmCTx5wnGqpGhlEL7uH1Bqts3FZzdiRGe8OOMYs+X+p7Vb5j3iXKvbal3ulg7j0HGH0GJ1Uf"
+    "k6ZxcbcrLwR3LJZ02zwTm9QUyYpNGfi2BdLnHNwK4dW9+L/L5CMs4g7KUlO+dYXRxrtHlE+nQ8Og"
+    "HTsyt95C8cWRAxCTXKFr/t8zjT7a4awBtHS2s2SuZwVO5bUcXulyP+iZ6Bz+Mzx9dkdz/cDvICTm"
+    "RpprV3sJOUN64LnUmpcFp1sk8tfLT++J5BfwR/LRCxsL+74GJZH6WH3AthO0o+xHHLn4rv/FNNCn"
+    "Udx5PZ/Ec58qPYD/rLhK8iztX1Z5mJoocxpVDmzWFHHC1hpnITN7b/yPXP6s9+kX9a3NxwyZT3PB"
+    "8XdPa2PEwWw/0SnM53p0XU41yjntxwU1fYHLt2KmoaZZiyarnO4rbf+krcQmwVFkW65O3/me5O2e"
+    "xE33WwGTdHfrPIfdeAjZzox1bHoxi/N3HgB31Wmjo6YHV+LgEUQ18KCbzJQL+sKP3pdZMfHv8O5A"
+    "GcIpNZaXROx2EhOTXh7rCcldT9u+IhGd8bdAl1VHnPAuOCSPdNJK24ULUSR7eWQ7q08+0rZ8WUvA"
+    "PWmVsuc6d+iDS77HqFCQhMVNtpcw9VJskKjY+yXT/J1WuMdrlsxoSzkd07ZoslzDKr0r172GpPv3"
+    "tBUfsY/dTR8LHMJM+i3dlqnu5b23RG2vs4KVTu7sGz0GyJOc9HVj8lOHkciyyv9Nrqv/0Xsu93eu"
+    "6CXCeNx2mTal7Osedpm+4DaNkFi/t6Z3ovOs6xfrm0untUtCC1dWapp3b6eokZDUBYWYulVusIpU"
+    "Sj5BeYt9Y2VcDVKGoL/F+oXJgFaYImiGc+NI87qwaTzf2eF8ILDZX1K1rn+oI/K6heDrvLi85J9h"
+    "v6QtAMaXwT5TOJu3wwlO2fH77o3bfaIuNQrx1+CgPPzmm5kubQc7FxlCeXSpPNeX1eT475BXg2DB"
+    "4Z9Gz5VsjJcHrstTMPTVvzH1ka32ArvcaGxwkWJnz3iDIJAQ5oWKil+oCLv3A81dBt2tEGY7Ch/o"
+    "5LPuxDT6xU6BGCUMDcHsmWYMZrFm9nTSSN0BxSOlnCxtCFYPuXwz72J0RuiV3kWHe8MdmZqUcXbK"
+    "YE9/4h13HmH3+rtpbAyx4a5rKlqiUVCVe9nsyPZa3cqphV0QtPj3f72G8aAL50+8nXHfUThJtN1z"
+    "639QSwMEFAAAAAgALqBSXQ5eWwcrFAAAXTwAABgAAABhY21ha2Uvc2l6ZV9icmVha2Rvd24ucHmt"
+    "O2t327ix3/UrcJneG1ChGWe3p6dVVul1EmXXXcd2bac5PY4rURJksaZIHYKKrXr13zszePKhOPee"
+    "+oMFgoPBYDBvgEEQTCbJbJXcCVaKdVFWTKb/EpPJgC2yRC7ZS3Zx9JFtZHIr2HTLpJhVaZFHTG5X"
+    "0yKLWDH9J3SxJJ+zLJ2WSbmNe73RV1Fuq2Wa37JUAt5kzhZlsWLVEpBs0mzO5mkJw4pyG7H7tFoW"
+    "m4pVRZHNlkmas2maJ2Uq5KDX65sZpcMwOvlgetkScItSMj5YFfOBXkksssUkfM0SCzYrNnklWSJ7"
+    "jPXXZXFbJqs+rK0/T6qkz+6XImeTCZCUrkWMDIhLcSseJhOA6eiPcRi8XCXVbMnSCtFOJvieHRxB"
+    "f1ncA4cKorYqqiSDqUtoLgspWLGg/lmxWqeZYHKzWgHXGJ9M4jmQdWiQA+fSHBBPi2ppdmNZZHOJ"
+    "E8KrtEqTjH1Nso2QYcw+GzbSJESmkCwrgD9zx0QkQ68fUOOu3ZdplUyBkCYokvEaN4B2WvMfiIRn"
+    "GAAE8sUmN2gBkZIESfuJrAduwBZkaSKBDtoAwF7kMxEiVgPtBAc23O1xluZ3ogQGr2HKn0hm3rz8"
+    "CSjHUW9i6EcCJpODz1l0cPARHyNY0DqREmYBQSVBuTz/8Qe2zpJqUZSrcMAEyiWwbg18MqJxW8C8"
+    "VUFM1cK8gH2JLIVVAYgRnbwTsN0RrKWE11+B4iSvWFHComhXB0lVlYPJWyT2PEvy2K5rAuPLYnO7"
+    "9DQAyMqRZNhdWGhSzpbpV8FWYjUleQbaD47ff4icWoRIJQCnFho07e22AvLzQu8SUlNf3qz4Svhg"
+    "I27zlcirSPP24FbkokxwU3CnQ1hFBvq9LO57oIJOcuNeEAS9Hu3MeLzYVJtSjMcsXZGxSPIcoEgI"
+    "ej3dN01xcvP0T1nkpl1I0yqFacmtVMiRilmGGygtdjlPZ0CxfRXB3ohsrgask2oJLDbA5/CoXlTb"
+    "NZke1X/19/PR+N0vo3e/Hp/+rBfi7ISB4rAVjF3+8mF8dHJy9i6yj58vjq9G5vFqfHr29vjqUj9f"
+    "XY0/fDp9557O3v5l9O5KPY+yxQcUJHqAVX4do0qMjX5FvRA4tqiTNyBgn0QlLJpIK1qw8Rejo1/f"
+    "n30+vWRDxgNte4OIBUpusaVkglpq0iDsPWPn2aYEwwECKxKwXlMwz3fz4j5nXDsAtKnAP2D2Xy7P"
+    "Ttmd2IJ96Z2ffLo4OoHJHu1kAxZYEfdmHpiW9IgYmJb06RnYpgx2vd7449H5+PLq6OIK5glOlA2Q"
+    "szJdKw8D2gEuA61CoGBHp+8R8l1ZSMkuxEKUAgwMu0KDpkHOPl2df0J8pYi1zeVlwL9cvgj5nwdf"
+    "5IvDB359ePCn5GBxdPDh5kXY0RX+GThH2I5PW8hoy8qA8et/fJH9my+X/d++9MGEZF/63z8Dj/sw"
+    "y++Cnp7n88XR+fnofZPs70f2O9rrOgtRjZgEdRVoCCTaz5Oz05/Z4cPhZBKibmUZmAP0wFvfCoNp"
+    "BE2JFWXvj66OcI+uRh9Hp1cofSCu/xK5FBV/DN7+/WqEG3z5y9nFFTZwAvz966ej9/TCND4cn5wE"
+    "O1ju0cW7X47/Nhp/HH18O7pobVQMS+TAWx7iYmldvZPj018JNOCKxBAsVO9/rZngiqThVbkRYY+6"
+    "GPiIY7SMSsXApp2B1a7bSjDJM+c99OL5Xv8TxmQZER04XkQNzC2VuiuMriOZz0sh5QBmrBQE2AL3"
+    "9Ay8HOhMXIAbgyZoVZxw5QviIgRXB3Z9MsFYjYErA8s3Rw2F4KRly6foEGI1RbEpZ0LR4HNHM+QT"
+    "xnQXxb1iSJ6shCP3meXJbwy9PPxo38i1FofQpRwiNNAjwo9xib+hR4f/xqn9pskk1HdpPncT6ViE"
+    "OAH7eUidSGm95xm71PSA2Uq0s3ttIk7gg5kKX+eaVsWFW3C8a5oQ5SXQ6M6cp7f42H0iFaU6XOU6"
+    "lHHBSNjiLCzuFP3/kH66+HwJO/3WGFnFbNCmMXqvgXJa2AXIvS6NtcWiOnv81+NV8qB4VifIDPjW"
+    "e2OCB7BSWV0bwbhB3UZ3y+dikWyyarxIKGYfIlio/RpJw/9jJIo8UgAibTIAn9OK0dqPtNC312Ad"
+    "0ROwiiFigTG65GjXItAZ2sqQHbzpHqx2jey8gPgnZ4+2g4yJc2dkKJ2Lr0MZT6iAFOcaMNaFEoxe"
+    "fgPGuV8Csit3YLvr6fbGLbUqxhiF0WppkRhVuTVZbpT7mOc4gyPbXPE4Q7yGsAZiTkhg6ElkkJBc"
+    "q1iOA5fRgmGYCjCayP2cBYoD2hwiPjaKEzZYghGBB2aUKURKaj1IFESsHmHYamDTKmUYrB+7gVCv"
+    "GoDY1QBGDTRQ2O547SMyz00BMqHSwEmvFbYmS0y0VYPVtrtT6Oqguq8J6uI9H9j2euAQzvVIsiCa"
+    "HCu9hiWtuTNyTqqMb76xzvnYd8y1nFJHx+zn008MImPMEMFFv3x/fPnu6OL9SzAnmVhU6JGVf0aE"
+    "Bfrm+kxgD65vmr67w66sRY6udsCqzToT1wAE9gJSsoZdQXt2XybrNfgOdKWvGcYeA43cLESZzCop"
+    "0VMP2QdIr9QstL4C5iL2RAyi2AKnHQabanHwR4iXRFkWpRwGEKNjlBKEkByxhVNBVCrgMoY0fjf+"
+    "UfeQfuISFpCuefAFcwEfCBQF9UITV0dQp5rw0KNEsrkL2sPWqFmRV2m+Ec2pOnFAMB+2J6b8pDle"
+    "74qvze2RuA8RgIz1JgzNsBakQeftu/+3ghd+VB5T3QdDT9FeMlC3omTFTYxPSOYqpmCE/xjGahs6"
+    "lot/ll5cQSdEJ19rs+N8dQp085ssw78xBJdjCow5DIn0uEiz06zhVejaP3jtH8M2S/ZSrIVOS8Me"
+    "jjw18vrwJk6lXINWdA23m6cSwW/unWV8pxggb+2Kn+ajReZY1oITGSEF8eMhG4JugQXw9TTcIyFO"
+    "YLm/ISrf+V4GOoEgC4aFLE0yBMrWoAbfuSOWz5Qi72Wz3rjV9+9znefd/N7DDzKw38mQfWL/tMC7"
+    "9u+18OtYBlBoJ+gh3+eQIt8RRS4fiyh31E2VNVIT0kmdcJIfdXzJgQsQ53OEjdirPyiSNN/zZijr"
+    "5TOUesvKaKIdBpSQSFBRox+goFAfeJquioCbwaJ1bjhGFwnSbpbN69YF6cblEt3QGWkcwFfNSO1J"
+    "x7pSyMXDGowbeCwKapV/hn/ATghMBqYIZ6NeBaB8eYrFUPh348IOk2XS+mDIZMJ1UKcSa1WKVO1Q"
+    "J+M2SKmWSaUK3QwaSZbZ+OMZbA91ror5Bkvt4qvIBsycvMSzLMWCPxX5EA/IuYbECQaU8E1cxW8S"
+    "t8qEVFrU9TtXWNUlR9TCyHu+T+fVUqrQG+KNSpRAvY2HcMo7gWVyxoPW0QeWbrrPQwLPVpXJPeqi"
+    "2Zz4VlQccIYoO0EQ1kQM/6pyW1dqQ5aRF78mlNxTXI9z2AjeoRIPM7HGAnNMIdO30bqhpJH7JQTr"
+    "nrtasgw97aIuxwxLR3TI4xqQ6uI2YLfcxtMcl4RbgjHOsbsD20OZCq32phHgqZMbmCteZMmtZP/j"
+    "Ctn15YMsExgF0hiHqZEYHsi42q4F+6+hV+ZW/D2s4SAF2IvDn58q500U+NgZntbFlctIszBsrSAy"
+    "NPAxeRkxp3G8fKCzDaEzzAfkqmFgWOMqsgFASK9q6EEKrmWM2o87zt1s++x6g4AByt25mlMnCIom"
+    "V2AAcVJzosMsHyB/w9qV8pQk1g/dOWqvpSeaGrSZzkmFKgT0uK4Vgh+DJj6MUCci9jc8NaR22MJ3"
+    "aE3tMikF14b2W8oR1eqdkatt0oIb0ANbtbL7qKcgK2EPmPlhxA7r/pQbkaMNVEtUs2EnIVOdzlsU"
+    "mLRwzFSbpY2Oas/An8wbGqE9HGbJajpPGLhifsBLk+yzF6wk8wfuqiTJcb4KzwPT6QbXw/G4b+AO"
+    "cKxwTBMpxvO01Cmx9USTCWa22oMCpVzXX5WfxCJqpEqb6IbM6WIfZ+nHyrKf6fNLfd6Mr+j4FzHM"
+    "8VSVhr95+ZN36vkGT1XprBMdYDKjcxWqfkMOjgfLXlXuYJbMEG+Cdm6eLhaiDF97tTyakA4VJxMs"
+    "EMd0Yq7PN5EQcCPFbQ67N4/Nqul3iqbM8AUcjCyyr0I7i7sci6gtWbRu3zPUOOe+rD5Lp+OyKGxl"
+    "sQOL9oYobbiQznCfjHdBdgbPe9VuybpJIS6jfSuwTBKryGmBj7iJFFhBf6DsJ8G09V8D1/ASJ64L"
+    "GeMGAJeSDBscQNX2qAIYmTE93AhMzRQi3bp43iqQ1RdCRf4ha83YQuEmsGxGfvLWyJMYX4agQvBK"
+    "inXETpQGEWNPLF9tecmraeJBda6LSca0wq8jGXl+TvTVSGpFGlrd107QoJUlFa6mKvh0HsaJHK8L"
+    "mT7wVpTh7OgepN5QSzqZu3Sx5d4xgmcpjRQqUayFA1ShUYO6plPHYhEKFJbbIFRTPRaWcrT6eZtO"
+    "1HSY7biHouCnrp5bUbCe20iyTrmo8R2H14lWeQVbBI9um2j7d/zRJVq7MGgmhGrCoRJIEBRODZPG"
+    "oh41EJKSKRMUdCTUmnvKshJcYH4bgcoUazLioeI8VzEGiC9kKSioTtQ1hX55i8Q8jBqRql5OQ+Of"
+    "og+NBcYU0y4J0DBaGwGuwQk7ZpliZYJsCLldpLi2WQiwlyo9G2wdgF2/utm9bO0hzI3vDm/U76sb"
+    "3yj8R9n4FAsdsQDWTWkHU00UYM1M6F+taLLVDxyMeusogEJae8lCpf97ggF611c/9SPCugvTEHsy"
+    "3y7YztNFC0HGp+OYEhwyxUYYQqjQ4rmk23ccNq1vKOxHZskpxBVUye4b2vphIxh56V32ygXA1y97"
+    "DVjfkNqPlLWBQAWv6chKrPS5u4oWLpIUbwoNaO7B5OySzDBe2DNd7pJPPMoW+jVd9TO3CGd0fYlN"
+    "BZ1S1KOQJ7JrCGXHRTnO7ZkiiKHhSLtOhfEtDGpGEmSsyMX5Q81bL2fSL4d1YDuv5nZ7XvvGjLSQ"
+    "7bBGsVsHT8jyoamecHvspgIrfUlruL8aQ9WXsJkvX1u6TMjNtcEyB6iRlxioKEAB+JkYmgmTMaQg"
+    "FVK7ZWVhJBqXmizzFh+HpuFOq4zUDevHgTrIH8rNygv57QFmx9kbkqjBKSH5Fqx3Xjj05KleNgkg"
+    "KIAMG0T/IV1tVpRpBmFjxv8bChrRwmMIHJqsqUFxaOXcP0yty5t9M7TMjtEijOVmsYAoKEAN1idP"
+    "VA6V+8/lvIniVI4xPfHr+3Iae7OZpvMKhJ3iblpMzSXwlPYlpUPoxvlk7ew4jU2R3Mpc40TUywxT"
+    "yHljfdHHAWm2Ga+AWtPMCyOlnJRnYc6zXzstU9eQQOXmDgZ5SGScnd4tT/HBD5wpehsXC15P2v0b"
+    "Siaabh3032FmRtc7Y/UzLtPbJWTtRIJFAuPZKzvofom3bO7YmyE7VCdjRNP13Y0l94XXR/n8G0tP"
+    "M1xygO60wqxkX+hkI25vFhXwQoBS3052MPRI9y419LQ1Eyb99KJ1rGtEzL/9os0oJYjbFW6Ed/7u"
+    "izGmgtuVqr3RmV3OuL1X6t0ppdIpxf8ATSxSqM35f/fZSOukw0APmX934NpDdFMPFOkChS6KF74e"
+    "UOTtfw4Q01X0UNk6kT9BSK0AVC812XJSZBcbegsQ+XXXvMh161ZqcyMMuZFab4D32oIa/0GSDOuV"
+    "utmAr12DbNVE6z2UvgwNmXVySPKGLT2sM9EIetclFa32UyNPxEFl5tCYcuSRQgSiFjq77ZvMznDZ"
+    "XrdyEWWHUOOfd93qSdiGLWpngbV6lqkHkrrGzbz0SdExFhtbdckxpNiKXoTNsZoaW2p6VMCWHeHm"
+    "JlZH/S1qQ7srWQrGDAiCBnRXNlrg0QkSCRpZ6ftznMi14t0gXgmbXULHCTy8cwXLIXGwE4aYCgD4"
+    "63ta8y1EQ9B0ty9r3iAX6TeG2RfNgSbpmpoKKmjHRmKKk6oPF1Zp5V9irFd97J0AhGqacEj/ENNO"
+    "nd0Fvb2vMNl5JBw7xh9fHR6yPsPXlLog5vjVYvffdOEYSVyXGHZ1JXlyOqgHohHkduauIRsy785+"
+    "VazNfdcfDuketqBAtHm0C7nJFeTN+kutgf5CI8J8RiU1WVLeClmxPmDskxCZ8m9/uu27u/7+zSi6"
+    "q5lpfwJCV83xfEMpGp4tLIKP6to9fQQ2YI+wtSYOweSZqMXrVt4Yp/uBDXPZIxm7qb1Px1wb49dw"
+    "p5XawJFVZbqhIDxLbKY1wakWYQr5pjHdTZtu7SE2vWm5yAaxiuAv+Wnhf3/E/QXXotnnaE6f6zJC"
+    "+JoFDUxYPMBbCcZMpzlkscmcJEx9ToH3NHdxw7/UV+ZWh39Tpfi4Svd5h/MESvDMsfsC3uEKHj3D"
+    "r2se33AHFKJNt3gSaPMy7Q6Dmlh8yd9u2eN0i3qySnMOMhfRDRYkMAx3SpPM8+5R0bULB3uEBmXl"
+    "8bmWiOeDN3/awSPuPbT/uMN3aO6eD36CB5y2hcZdLIUJrwdAj1c+7bxCHtkr5NRpH7z748RRrAJh"
+    "6LulUqJmPEVAuksHCsS7sl7Zd5s3F1WSZrQxjF0/lqrIubtRu0FzqPHKE/k8b3DJ5qKKSyrX1FxS"
+    "0ysuqROp3aOauc0xmHeqT/rdx0LuAyJjoUJfZdQRslVdCPX3ZMe07bU0VQ2klhlVT5LrQ755VOtx"
+    "A4EUIzw2PFeCwnO6eaESLjEPayxQJhy/gBQNE64vTLdNeKuK1jbR9NWUrhZVBevrahbaV7KttFxz"
+    "+d1a4goN+5A+l4vnm9Vaogk0N7dDzDHmkPENf8DjEry+afavOxF3ljym5XFE7zjr3f3x0sl4dQfZ"
+    "J1cPkr6eiZh4AJc9Lu6G7nKZMoTENURLuNt3VsPevwFQSwMEFAAAAAgASZxSXbOVwKIUCwAAiCAA"
+    "ABMAAABhY21ha2Uvc2l6ZV9kaWZmLnB5rRldj9NI8j2/os+nE/bgMbBPe4agXbTwcIcAAat7GKKk"
+    "E3cmJo4duTuEXC7326+q+tsOyyHtSLuku6urquu7ykmSLBZ8teNbwWT9b3Fb1ev1YlGy44Yrdt+L"
+    "I1sKdRSiZerYseWhbirJujXjTG6FWm2KyeRFpzZwuRKS8V6wctVwKcvFfzXaAtHOl73g26o7tsUH"
+    "WL6wq8WnT0yWgIwQs6ruxUp1/YkdpJATtRFs3/CW1UoyQKqY43XV7fZ1IxYLJgFeVCwFQLXu+h09"
+    "g/XiXnwVMmdNvex5XwuZPUUywOBksShEA48kIswRMYha8VUx1QFNkAE+eyPgUTU8uhU5E40UdKXD"
+    "fXr1A0kkJ4ZkwT7AG+quBeLytFt2Dfzolp9hE+TTVp4jktaOgxCB7PLEWr4TLDV37MYEr+jrrAOC"
+    "GnfOqsO+qVdcARp52O1E9dQTkSCnZ5rM6fmjZ2sQ1PPFAtjpDMztigPRyZ6rjWRVx9pOISNK9Bmx"
+    "2LXNifXdUYIIOqktg602vL0HTpHrrdgrkC3v74VEM+mOYALrupeqmLz95ltRaRxlTIJdotkYg9rw"
+    "LwLU09TtFqS64/tikiTJZLLuux2bz9cHdejFfM7q3b7rFaAGjjkJeTIxe59l19rf8iT11YorTuYI"
+    "HJgzt5UDw6KpNCCKApi1QO9gaagbK9YGao5f4OIdGE0EglY0ly3fyw3I04CCpVfz6CS6EzuHvZRO"
+    "GPy9eP/y13/+9vZfbz7ktH73+vf3v77WvyMv0lu/S34v3ndHvYoR55NsMpn84t4+of+z38DZ4UZJ"
+    "N9DaSvCCnlbbuq38qmvgEX133/NdyepWsSl77A4Qa7zbiuN1cDwYg/+V8aoCs/gPSGvXfaFfxtr0"
+    "W0DXB0ncwJ3EHIF54OEvQGgvenWiVSXWzFCeV6JRPJXg6xm7fY4U9UPxrxdgUeDzcFgE3LJbvRW8"
+    "91tU8Bk/RAIvhPhxPXHoVDdHC/a4qno1RnZ2G/iXoMqS0pCA33l8jDq0x/h7cKzFagH0agASyMHC"
+    "BVsD4ECOjim/NQCOlGTBo80rrKDIQj5wfYWJEMyuB2BeexbQ73jQyzWnQddDxymtA5SxN1pDv7aN"
+    "MbUk1d6BMWN2kurOeOEMrP4NJJkZ2DhFphTsgh8aNV9zSopTvJf9iVZfjK2++JOtvhhYffFDVo8g"
+    "mGJTuRxI8wpwQD12E1I4EEgoggAuTP9zjPhZPgaE5OMBYaEBWQ2c+DXWA5g0UV+6JsBfV7AF/rAs"
+    "rnpCCDbf8a8RKG5cAbcGvizGpu0APDK7igEvk+9EF1AX3if5G/VlY2+LQGA9BPlhR///XBP/bm7G"
+    "itZJ8m55mpVaO6A4qmRAY15bd31hTS9jUDWyHqyY4GYjjHi8POUGizFtXBS1EjuZZrFU4+iBFjzf"
+    "ilMKF0qfogEh2RiZMfyrrRhYhapvCilOF4HJyK3WyRkQUay/fHpMv2V36FcCa0NcQSl22F+SSXDH"
+    "XrDcYIU/R/5Til0Ugixjs1xHruFmyG4UszSHfLUKo5oLaFN2vphqBLqDEEQK+jELYFDOCOclnaZk"
+    "gzkjy2MpmRtxmGVeNJH64nCwBexa+viEWFEVnAHfBXBi4my6daynvc6nrKfEmcVX6TWDi7BKs6yA"
+    "QibF4/hCrcMYqZa8amRkVZhX2cMpELaR+DooxVWCo4gaAqCFX6MQ1jnfoeDqlZhCd1DlIGdN2d3M"
+    "qQ/kUKEmUK7GOTwjIAQMmVXs/NQm6H3v5jH3q65VdXsQISZSwd12hiI9k11c4kuVKWiwYKTqMnHH"
+    "ohkhQKX8AQJTlnoUIIiC7/eihSSdhc4moXwXVQrnOTRJp2nDd8uKM/Cz9DYdPv1h9Giw8IqsLsuM"
+    "q1INj+6ajquM/EqJQe4ZlycSzdxuIRrtPk5jEG9AX77T8DLg4DJwF3M2BQvwH7rrVg5SagiMuXDB"
+    "Bl3uIi6SicNvEIOQjHdOK8XKBqteyK75IuaUYjDzltSb0UsVtMDiDpe578hsEaUfAk3ky9ev9Lxi"
+    "OGIAtm4Q4w2OFyCm52SKOGrAdq3Q2fEjtPoOg78Lr+HNkZ8k9XeMOjqcCgQQhLPUs4JWzwz0hIHw"
+    "0sQBlS1ZiiT5Et55UIIaUWiAT2zfYYsE/3V0dw2KgNYYf+qHHKHNX3X7WmjyJu2SeBEhtfCLxY0e"
+    "dTz1Yw5gHbt3DUCNeK0MJwpnPvDawsrOZiVkqqglqK0PPZrwTa+0uKSpLPRXS9oVTShrkrOtxcLT"
+    "chDP1kCFYB7Fd3ReC2GBFKZn4BWnHiGz9s+YGCkckQVh4YtAb7/bk2fs0TGIyH3TLdOEJJlQIbj3"
+    "+GfhIxvRpoQlY3+ZsieD0pTXoJpXcOtNp151h7Z62fddn66TVs/VlJmoId0zEr6w1EwdlJ6tZImX"
+    "qXsGkLt7DCka5Wb1hXK0OhvK4dt8aKIl3GbysMJ5TqOdN3Ycw8QfK7/AQU+rMmdBP6T/8SlpGmO1"
+    "W4xqoz0FAqfSaJeEo0NK0wHDg8iqYwgFVBdd4jgKzoALjANuDupEgvMtkJObK6LgpAkg71Hc0g1F"
+    "R3JfaB/kukDYcBLCpm7vcQaJws3d3bcfzI1HhNlum0kSmv3LZm1A0IJB4ocWUfBlI8Z+jU+fkxtQ"
+    "6QFywxoLMz9tUrWAm1hDRWFYV2Pxnksq2xbnWFN3HQVj8eusw5tmyVdYmhFsIb7uQd0QxsBM9O1R"
+    "c3W++JbRzbRSiq/vnNbLURJwenQZctynRmMyHCK3OOTVRjclQVj+pjaz0bOIL/sW05SHOMm4POJr"
+    "svanY6FnrlqnXrulgVncLfiWoC0fVlDzmxsb0HjfdbtvNM3uPnioknH91vClaHKci1c4m9jVispw"
+    "J7TU9bN52M8OGtagA0x1q5q7VjVsRw1cXCIS1ThyEqO23ILnEpcXdtYM3hK7FyghcBaenp88fsxu"
+    "WBoeZpA3NN7iyfryNxtGjQCBu6T4DNk2JUJO8vseRK6LFFWrRs9GczPCiYrgHHx1TxrKsTIkMfs0"
+    "RniA70/tmfBAWD/vgBrcySllIMYsu2BsObv1xU5AszLJKaJMEXUY4eN+R5NJQOYtmv7okn9xwJVv"
+    "ouDi+cFDo8UH5fO/X3CNqoLFz7gYnPkjWOhS+UH5DJY0lPQmYLkwyna25lq2uxIkMRs+JLIA4s64"
+    "Qh8X0Zlmxx0G9TQxlwwQnfuwD9KXe9fvmPf0pvan95x1L3hJ4uFD/C79Nm052nB8FJCmdkdzydmN"
+    "66aZb/S9BcHmT4+N7lwM88YEwftjpzh+U7LfY6T73KTM9yp2A9hu3OcZDUhf7ehwebrxsaew6QCe"
+    "QoNHnfPlCRpcVcFmZMP4DIaPKtlZUiPqMvQFGcVN7BHc5sgMr9id7UktRrOOELq91KpaDrqp7AIh"
+    "NQkQU/9qceIiQqg3QmyB5Vyy7xiwjbGYG328JczORe3+0LLxye6Mne3PsajCCJTYj4oYS02/lRjN"
+    "JzPU2N1MR5NvnWY6Ng0HTQZomBjdtBpeGPR39nY4UfuO535q33TBhz3oO/SXP2rAnzKoGI9Y7djP"
+    "nnUrFbZUxljPy9MlNNbv+6D95UZ2oZd54egdI5uRuNfJixPRTjQS8k8jQO3kx75Wwju5GWNHnu7b"
+    "1bAeiXz5Hx/evgGJ00c/qPd0P5qTA5LzUaRcLPAOVJfWVRV+op7SF8+iOuz2EpXu5pk5yLCC2nv6"
+    "U8YeMpB/1MaNteZdvaBHpYj+es7whX2x22IzqBdy+rE/4Mfxr5AV592Wlpm/omWFaAk3ALarrgKt"
+    "T5ODWt/+DPn4f1BLAwQUAAAACAAuoFJdT93Zs+AOAABqLwAAFQAAAGFjbWFrZS9zaXplX3JlcG9y"
+    "dC5wec0aa3PjtvG7fgXKTmrSkXi+bx3d6Ron8WWS3uVu4jSZ1vVIkAhKPPOhAUhbrur/3t0FQIIv"
+    "xU3SmfrmbAkEdhf7ftDzvEsZVUlesNVKik2yF6FK/iVWK/aiWeHRPc83IlqaR5nICvnIpNgXsmQ8"
+    "LoVk6ypJo3Ay+XknclbuBFtzlWyYhsASxTjbpzzJAerrvRRxcniD0Njskr0WafwGwPrXj+onFhcy"
+    "4+WUYFSq4umkRVm45yXgy1erYMqSUrGiKvdViRjUYw6HcFPEYllkBOLq3VumxKZMipztBI+EVBN/"
+    "nhXRfMU3Gb8TIWBfBSzJVQmPWREzWeV5km/peFkU6as2b0IptuJwDgSXeFe+36ePjKsJERuyq/we"
+    "9l9+9f7yr1dLwL68/vYfV4sL2M7TB/6oELwi2AbmxPO8yYQIXi7jqqykWC5Zkmnm5nlRcqReTSZm"
+    "7ZMqcvs5LbZboNV+LZT9JIX9pKr1XhYboZRGAgzcpcnaYvgIXw16wxASpX38JX75mPK8tWVTZBnP"
+    "601qnyblUt+ntQ94a/dcpfGVlIWc4qe3SSrow7UWzRSEp+5Jv5ZGWqoFCG6wF7JMhLLwxGEPFCxL"
+    "kYFelW20peQbYTfSl2gyQVaBoi4sz8KtKN/Rmr9c5jwDrgeTySQSMVvGiVTlMi9ygF4+LjUuEfn2"
+    "w5xFyaa8USVcB37dTtn5nXhUc/wSsNkb/DufMPgBdWZ3oF2MntMS/kj+AJRYcEiKfzdlnhfUO5KY"
+    "gegRkA+bgxA+JHs/aEDgz6bIyySvRANXgP7kXeb4XSjTGnW9NHGOo0ISI6RQRXovtGCM0EeZQBcv"
+    "q30qmjVNLmj4DxryalUft/Cm7C7JowAM5GEnpABOwtdzNOjVyrOux4PHwElYIb8CX0M0G6K5UMBK"
+    "v8VLD4ysTDIRFsoL8CBw1l40TIsHkLm+MMCHw6PyrvlqV6b1SuwNeUfrnsIjkPXkNdtP7jb7NEkg"
+    "eNg074oU1kBBan7QY+1jfyP9zyL7FLWopkRJj2bPA5KRKs/VLtoLD7QkrcmV8nG5l0leLmsWoaMD"
+    "1Y3AxTeWtQaPrBGh2PXTlg5bw4FFLkv1kJQ73zt6QY+6tzxV2nIAd/O0WH8CwIgbNIVHylcarjhs"
+    "xF573/C76w/ffy02RSTIp50ADdQBNICp9VJHK6+mNFEYePC6Pjya6luiZ3Vu1UAn/uDGUJpnQRfz"
+    "j9J4gxYlhseqypYUvZYQYjcQK30jUmIvxFxxcDgNuNi/2fcgvrnLWKsqPeoMRjzQ56o8ABskRY49"
+    "OH+LuMVaeCza7NQ+O3zgEiOy7yX5PU+TiPXC8Zx9JkHZWlAHaYJomgIlF8Y5V8DqhSMudNdpkgv0"
+    "2MiNkEIbrij3qhle5hAqweVm5+PjluPO2l7aoqllY39aHKoXicTPF8h/Pwu3sqj2/ktH0g7H/G/B"
+    "qA8mrv7E00rrY9CH2ooUhisaE9CrCRTABM0poy5koKg0GQfj1EwYj4BdQ00TRc+bGGBSzdm3X1/N"
+    "VPmYCgbIZghXKp2xjSRaxT0E7g3fY24UUU5msDEfMleMpVGV7YMmJByW+4GY0AXdCw32cPSMw2HE"
+    "Sz4KQTwHghCQ1mTDMODJFj1732TxcpbbAUqPbtsID08jbaOno+7pqHMa6Bo9LLqHRedwxgeZD2kB"
+    "ONMQniYZwEUuDF8czw/wv3MeL/gLQAZE0AGi+T8CRvMRzGC/Kf1KocaDQU5ZdhjI8gaNOTskzFjx"
+    "oW296CLg4WvwQ31LbXKwgdXYY/4RQUo0Wf/lxQU7Z0gd1GsAMgiePguag8ZLNI5hPgQTsz38SgY+"
+    "b+wWiL+5tZ6f9BFyMowAKGsKUiRrx1sjgBAKIpE7qQf+xN71nQAdQlIVOyKwJ7Z+LIU6Invx+1RD"
+    "C56wBMMFyTNgcCH5VkCBATl8yN5rwSEdR9ptgITNlU1ASQdIHiE09j62sc1bBDKfPFPPesHb1FGc"
+    "zG2IOdEJ9ZACowjs8i+mWkvwAOgVgQueL0QE4/3Fe5YYvkmLNfj8ey4Tvk7hdiAQdkSErjzwu5ZH"
+    "pOURPUKBBKmmrvynLBX8HkvkI2C3fKLQWWxc6H2JRScl1uXjqMS+btEzb91gTGDksF2poZsbEtoY"
+    "2g4rr64+/vDhPeAGOC7z4KvmnQie+gwQYwwwxkgYbQCGKkaXXvoyPhRzkKrVJfmUbbLI8UZ1oR9+"
+    "BVlWKkoRfdQL+kZr9KsIQ5f4yyiRoanwjN9UO5FienTjAWRM3l9sPMJyiwwrVIh1MluAvuWlpx3/"
+    "jfdineQv1A63z+x290oOXXChho2ErCk1Ng/RAuvUdRQ4izroL3XevMAMqnmICVpnSeSQlINmLryq"
+    "jGd/dioZyizVAsIwcGAj6iJmMvkjpB2ms1XsqfXAyh0vSckFdWqoMWUaTVW+2fF8CyFlsrz++/VP"
+    "y7fvLr+5xljjzS6JBzPdwlpgS6O1gGBoIdLLkkfJYfHywrN9B5HGWt4iR/uJ/E7Fg7UqCEHk94mE"
+    "KoRiWqfThJBfjhS7Rh73pPKQ4PpUn13grxgzYF2t4e8ijmuims7MQxKVO6iHTIPGhIqmi+N2AChW"
+    "2l9NCvg96A9kENj5Q3PjUQQKqCA7TassZxoBOhwtETa7BKGgYzm3SM+ZzxUDjavKJFVaaWEnddQy"
+    "oKgA0aiS5YQnSrbUIoxNLw/S3e7iLtnu8IChxMkhNbMadUVPfZOK3PcMLV4wZec+rmi7CIhShZy1"
+    "1Aa3ji4jAH2eEg70ojl1ZiDRAhB04T4E+JkO0ID0OgQglBDXglNU9EWK7sYKdN5qyGlZzAfF2U5+"
+    "gGMfwH26IpPFwys2j8FW5qsGmbagFUkeeU/711Lwu6h4yCkU0TLwshZD/gDqAv+pX6ZpcsUTe0dD"
+    "PYlg/vqYPzw9wfN6GZHM3xxVZxl5Bcsclr0eVzShPpjj3HYre1f+GV1Efee6iU0lOsSgCDx2BrGQ"
+    "bBzkVDekO83o+qJWWNjU6PVCkZRgjB+tEx0bNYZfPOCuG+AWAMI+zg6YMQdLh5Uzs/fMYd4Zwjpz"
+    "2HaG/DqzDLutoYbggjE2djXK6s+QNjaH63h+PPsRjdMl4aRRGMq8dtfyn7kXfiqS3EfgAfscV/Bf"
+    "3WPCsAdVsPGxadwPqFxu750UmKSOHfJWIwRE9qMZLTzgCOAcT5mO5ehwA3zuDlMmDJrYf8XYuVoh"
+    "UKeXSaXtgjD6CPTm4jYgxW75cQjFuBHiQGTaWyAG4Xa4DBz8czNnM/IYek+d0GMM6EDRfmm8oROn"
+    "fEt6xEkkHEVCVL6cU37AWy23mUUWJ5hojh9DSkaOwlOknSAE7A8L9hLLNGrvQewjegIso/CbE40D"
+    "u4t2jF/IID8+L3I/sT85aMeh4tDDyJAIRyG6ekpDEQr2YaKWfA0JWFVCBqZ1Yiw/gwIPTtSdPMdN"
+    "jWaFurP+XySI6Ml1lmOiI2mxTj7n7fkaCZLyojp5gtQ/NYoNeV6t03BVJIOyRt3ypQDQz3UajmoO"
+    "DpvrtDVt8uGuQav3RtwdKiHILoYabrpF2/P+xvGT6x1uvn24biZauu/GIDcRfQymjRmJdbX1PXMt"
+    "zdyYA45o2ho6WoZ/pkAJRQc3sHe0Z3BCwMioKYNKk9rMXttzDhYapEc2Y8C+fCFpwuDrMZfxiIOd"
+    "YhD9OWRqwAyOIx94jB5QVZK6FnjNNSC4A5++zQspIOGvXaH2qDTGsEbMWV5la+Bf7SVbjWV9BSyg"
+    "fdVp4rS6y0MFtGu6k8kXelQIXpbSAQrAuvnZtTG6NTZAu9d+r0fjlcKuBRjROR48P1MULIAf+iYQ"
+    "HtGAMr6BkCBmkAFFaANmoq5C3Y/50pmgK7ZN7jFgmM6IGdBjSWs+6mYW8nm4iRow9K2oXwR8teo0"
+    "w7DPmiYZpMavmJ3AtJHbefgZxjkbileUzhmQStwLmZSPENE6Ai1ptEd2iayY4l/HuaDckhI8CI67"
+    "yXtYhjoelTwjug3MX1z/jY+Nrhinin731GiCjEF7peEZp8ZlZ6R0BkMW+omu90Eq4K+phlvxlbKJ"
+    "581HdMe149WnDaEtVTaOp+NtusMSl7/azYD4kLl9zzIQGPehXsQhF0bei+chEocEnI7WNTpKqFxg"
+    "dQ5TR4V6qHmiW9abyvn70MwAhmzeYdbpgd3Q7R0JuvO59acp2Xzwy6fN2tGWisqbNzPAeo3SlJtb"
+    "cMfWcNrbzFrwZGRf24DRS1rW0avNDF1QaNflDmoaP43N3aOGi55Il8vysLwTj7p5BR+oRVBfyfeM"
+    "68HEqD9KgcXBFv/UAUATk6HToX0y3uV34Zi5ySCk5tmpZr8phzvjSR/OI+s1HwYHCw5jb5Bpt2OD"
+    "Egq0ZkbSmZC4MKD0QTBPcPLg3epxQR1oDTlGHEErZBsAvailR+gmlmM0GQxdrZj1Q5WjXpWY67ac"
+    "MqZpBI/ZyZ2Z2ukc0a/DBFoXcsu+8wWssASyIk8fm67Kb/bkegTeirNz5mN0pXwf84tX9hL63aS7"
+    "BKrMKPC63k4HWQNvNpuxVuyGBXPi18QKcx1MxH+Bcpxf9l+xgIh+6n0RslkoJ1Utt7HrjQWt8Sg1"
+    "TGbbxeurYjTRiZrhxBgR/0eBTt8u7l5vU1RpxEzu0a56juJp7F7a9fYCkXQdhpCy3oOfh/YMxkKy"
+    "vtG3Yjo4G95gBSQ78U1fGpZbhdKJAD/E5NrYf02073KuXxN2Zi5U/g28ftCytWkn7LWup6eZA3xo"
+    "11M0tcLyYehAcyh13inpl2B6T+9oR8sw5TVOUd/Rr71uLkSk+iMrcANeH+pw+GQUe2wJSUKiLpC2"
+    "simpUzflp9vvhdyIvAQSsfvdQhd01EpHhNN687so2++kY/g+Ssf0MSrbxy1D6dD9v82Ah6N2mqwl"
+    "qvpzA/dHis0mJkVMH8dXZFFMqxWkjwryzAWOULD7LKDchGWDxXml1mlAwkO0PWyAalurgdrXUhoT"
+    "MuEDj/TCx9+USxDFuVwM+NHxI2avfiFrTd1fYApwDPFN8XXaRcqzdcTZOwD/rtUlpVeSYE0WRRkE"
+    "jne8pxeAY499wY4AJzQsevK0x6gXdMbmvIJh4wZjM32SsrYjbH/y+tFFf6N9SAJu+Q9QSwMEFAAA"
+    "AAgASZxSXZVV//KUDAAAGyQAABAAAABhY21ha2Uvc2tldGNoLnB5lVptc9vGEf7OX3GBmxHAUIjT"
+    "mXY6dJipRpYTTf02ktN8kFUQBI7iRSCAAKBoVdV/77N7d8CBBCVHM5bIw97evu9zC3ued3krm2Ql"
+    "ykqWVZHIulb5zVSEKi9EUaWywteJSIo8iRuZx40qchHnKeiLpmjuS1mHo9F8fnzcMSiq+Vz4Mr8T"
+    "8/nJ6buTf51FHy/OPl58OD27vPxwMZ8HolTJbS22q0KovJZVU4tmJR2eU7BcbFTWqJx4TddFOp3H"
+    "yTq+lWFHNQ8mOEJ+aWSVxxkRzudxlW4g+444E8gsZFUV1Wi7krlQjVC1WCvWFnqKZayyOqBPYLFp"
+    "CmKWymW8yZqpOMRVEK8RNGjiLJPpRMislsLI/cp+EHFWF0zKSlpxRVMUmTk3HHmeNxotq2Itomi5"
+    "aTaVjCKh1mVRNRA9Lxq2fD0ambVVXK8ytbBfs+LmBprYr0VtP1XSfqo3CyO6PqeMG+JgD/mIr0YC"
+    "Y+dU1UlxJ6t7S7JUeRoZS0SuJXa33UZJnEBVs88fCfzwUkSnTvh7RxchrhZkP15fqkxGsGgT3cp7"
+    "vZQVcRpVMkE86oW6KWAguxL0zu/Cw55/I3NZIXqjmkM9SspyIjKVyyhV4NGoOy1Xj01TxUmrQVJs"
+    "8mYi6jLOJ4KfpKMRbC5m1vLhjWze4qOsfE9z8ILRyA37SxDjGWLLmwjPxAZ9tAFBG6KTi9e/nr//"
+    "EP0Snb8/ffvr67Po4gwbKxkmxbqEabQxq6P/fK7HL/BP5Um2SSU+Xf3oXZ9o73wOV1c/eddY/MuR"
+    "sWoW39QzsHn369tP52/P35+J/xHX85/ff7g4Oz25PCM7jkaIeeG6NkLmSZ9+TWH1CpveF7mERPQn"
+    "EMc/0eqUj0AIj4lwbPLgiQJgKGyqhRT9xGJNNiIelIhFHYKFqoqcjOt7A5zIfF4QQgRV+py92sBB"
+    "mBVbuCJgrmoJxkgh1BrR84iWm+0ZK8jz7zjbyDOqEv7S2+S3ebHNe9YQD+tvqsdXyOEScSNTQbYo"
+    "luLhaCKOwt8Llfu9A4JHT4tQSaR0LtbGwoj4mlLcJtMqWqqqbvxFkd6znfcs+xFSSJTd+fyF8bj4"
+    "7Blvh6vPHopRkWf3pCsVGR3pIi2QBaR5nFUyTvHY7FUNqjaxfheDDkSG1fHp2/MptulNaSpikW7K"
+    "TFHx1yXMEeDH9vyfcPz3eLQjkrZ+3Z4OU9Yyx9FGKeudwagPaxlXyYptEjie0pakVdeyR61UnQje"
+    "5/xIfMekYaZjBEueDfOup8kI9LVPv6YoDHVzRdXwuu8EyKljCES70hhVyhidzHDAvmtE89W1Tj/E"
+    "Tknx19/+BxWQ/ULkl0FLwjzDuCTv+8ujF0QufhDewx+PpN8BwjIki0cNagsacVKkKFEzb9Msj/+B"
+    "nOFGWM88xFSGWuYFHRdoyYyujn+45j5POrcrSMi03ipIyIbsFNkTQBu6ZyKdH0xlXWBLX6+bwBnl"
+    "pnnGG4ie31Zxc7g1o2RgO+WC4+fUJMZEkBLFpnFhjA1II/ChHB0Mm8BqRPLaPsNPzWc4eMo9ltXo"
+    "tHISXK1j9FoGXjMETAbsJfJ4LSekRS4K/K70Y2qRlFXlKl7IBsmZZfet+LQFDLpzQ1rR8WnOcJ8i"
+    "b5feA5E8Em/NAwxZeqJE/5Opo0Z4kxUL3xszddBWWMub8Y7e7aZJ3VAylF0itEfQXvHNzDK43s2t"
+    "K/sAqUx8XB9ZJsb4RkjqrSlCqvgdORWRasNecIOJSz9Lp4FnGrr7CQ1aBdGucCRWFjGKGftHhjch"
+    "1n9Tb9RppqjCMUUwXGPF+eszrpY2cpNMgR2dDTxW0RnyS7wu4eOpQLaoZZwAIMeVduJ8/rAv4GO4"
+    "0Eh5Vwq9DpxMeUzZsAAfN7p2irF2+hNR3Dp8sBDS4tXL6y7kzPpuNJo2uK0UsoiqVKSW0eK+kTVo"
+    "lku0bqqD2leIfxBwW5wIAhemnmlAMhOmrLFLCZV0BYK4izHtHuvuyB3MQf36LJiK3IveVN1JsW7U"
+    "WkfCJk9WcX7TVg0JoG4NlcZNjLOJd8gCybbOdikB4UNVR5SuQCd8a6IlLs2sLFZnM+a1a0nTT0Ct"
+    "baTJidJWmshU74hKmbEdjDhgvlxuIz5DMNW+oS5lI8a0Y4xLiRhb+ueMFjot/Gt1bWX5Kn0tNen8"
+    "Ahlwc0eOWSMZkkSWVM8X944Th1oB+GcSmVoTcFfYoegaBlDCl9tw1MOT0ZsPF+8uAYBUwh0ce4B+"
+    "pP4YhuE1tfQHbbayqBXdyQDcpwD2Dyp/JDj6gK4C1KdRt5fimnZc9AiOi32yjtfx8QA32nVMxI+w"
+    "wildmYA8Nw1uBIw+Y1FtcnITMlvyhY2MxFdLEPqU9VW8tZgQqm9qrMcovXTzjN6cnL89e02JdOyN"
+    "ok8nPzsmoVW9L+yMukdlDDdIjH5O0ng2avudPoXbVHPvyy/yQGHWIVyr/0oOKs5OlEUKpMPN3/ic"
+    "oxaFVxsFR1Vdm8Tlktqse9kkKfqY5fNLg1ogkX8XcFW4owgCdUBhT1yUhth8L+JrDREzqyGVyRgR"
+    "x55fybVcL+C11L1bdQCBIOS07em2LvsDEduWnI4lSTkU223eMU/k5xp3fEeUYIdAz2f8lxOxS2OM"
+    "xGS2AZfxNh8cEehra+vmicAlPHKLFOIZqK+3xKnuwGmu/nDloqjBZkHjk5l4E8PkIxs2xoZt9Fwg"
+    "McY4lUqZGNszxwz/hEQmdUWFMmnMR45R+RuV8eWOq1Etxo54Y9PWL1h/mlwBh9JGGkbR6WYwROiE"
+    "mCL/bDL2m22zLqGAwznkUs6AxV1lRPed8EI9WLB2jbDfYGyKS9YBTtdWa72YrFNCXjYmCUVd9WA7"
+    "PbGG4ZiOqU7rCtTFM85yH3JZ0k/jHjeSJD4Qe1ckWofvuk/ga93av1FUKsfFX5gkhCrOTQUShZsc"
+    "16Fb3zSnqLidfao20qGp7vsc2e80xvG9odLh6aCb0a+d2w2bqh2hhai4JA/ieCUTfSw+xyVP7rTz"
+    "zCJBhB2x5BfqXi67Ux4gftTfeAJB9XnHHFlxE6ZysbkZFl7436K360Cbim9ro8xE+DKsGxScigck"
+    "3bwk6HHHvaZR+Ua6XmHQCDu3jX369JanMYkT0xNm64KDP+dYU3tIv9HX7DH0lJ2mVMGBX1Wo9Oyy"
+    "X6x4bb9g8fJY/xksUxNdp2hpB6Qe6mRHtTmHE6srYK+wg1mi1hAWb/Qg2VSmT+j4ZhuaU6IBg6+r"
+    "B89d9VpARZHQAV+4NThskRvfOs2tsZMI8tiezZS0u6ugXAm3RXVLs/DtSmm04fSkUlZ7LDUfhmZ8"
+    "wRY8hdVX3jwUJ/keDu/GWujcVTMoqIhp6JXpew/6fy7s3N/AooK/LCQE37kDEVaatS7vBSk/B3oy"
+    "8+3ZwBDbzhzJSiA4jHcCMwW/0XdjM9AP61X817/93YcQQbiSX/Rzvy3zazP1Jgnbgbrv7eOtiRYh"
+    "0BHBwxbCPz497EaMFLd7lziXsbm4OeBvYmSe9DuHOU/XHHOq4/mZO8T3HUUmYhhMcrfpTM2thtPX"
+    "KU2q5ncveeICGJarNzB0hHA5tMw7WreP0h0gpFgExqv9pX5GD3pnGfTM0i5dKLhbKnUS9s3QeSTY"
+    "M0O/OFOOd8pqZhNzndvvU/y6YsB34Uo1tRfs0aul1hqt3eizz9OJDw25dh/+idqv5d+Xw/Cnst3h"
+    "l0O6aGzvmVDT8j8LQOkHudfBzx7wnHwNVg9aDDozf5lz8ERYWfsiPDp0an/cd1kmImxQ7QUFXO45"
+    "/qOkeJbZcHj19D7QiF3Rv5k5iTSAjNxzvyK7bZlwvG4tZBMIffqf+lUbql//tZQZTWmX7o72dP/V"
+    "M8CdRdObXR8PvNV6voF3VdNp4Obmi8CiOVxv6NyODPXglkFoN3hG7chp7NKKbC8YY1fQMSSVUkx5"
+    "eDLvvWWacwudLtEnp/O9l3fzfndrTwnXt/hN83jESW3AqvxCk78edPoTI8GB9yP8Xu0N1H5fNG+Q"
+    "yql9vZYX7iwbZfWhY2jfmvGbwNnA+0h3JbBoDJStcuL7dhQBh3gW0xkP8xtB5j3r3sTqFnPwHXf3"
+    "LpH4mEzWIwnLqX2R+7z+vQTy+v95Ymb5TIcHWmTlJbEiDPPx5NMvBOtzbKLhndfn7IyYuye7mtiM"
+    "c8XecmHYNakNADzv7Eo/T01yLbPJs697+u+hDiJ0LuAdV7h+ryTvNEVTYkDpHvCU4zrnXdAwYN2+"
+    "Fh50SYcpH6xcj8AJNJWjXD++uwucsk33uG1c5bilHLjJdfy+rV+ho9Dk1f5vkq5wAIrtJuFTfmA7"
+    "DfxfCNf0jqH+D1BLAwQUAAAACADlaq1cs/IYdRgCAACpBQAAEQAAAGFjbWFrZS9zb3VyY2VzLnB5"
+    "rVRNa9wwEL37Vww62cGx6aGXpQmEsj2VtmTTUghBaLVyIqqVhCSHLKX/vSNZ9rrb3W4O9cG2Pmb0"
+    "3ps3IoQsdb8VjgUB3DhRwzNzkulQg5Jrx9yuBqY34H+IwJ/Am95xAZ1UwjeEkKLonNkCpV0feico"
+    "Bbm1xgWM0SawII32eY9l4QlTjhu+4LAo6Orz19v3S7r8fgdX8JM0nNSA7/yxNn1X6e3Jr6IoNqID"
+    "KoNwdMDiaa83wpXOmLBIWWu4qMEJ3jsvn8UC1saoCi6vkZAP93HHw6IAfGQHCBJiZCM93UhXVsNK"
+    "fJxARhruH9KM6TH7PgGCzQuYZH/WFNwZBxakHpK7R2XWJbkgs/Q51saTo5xllXS2je+7Tr7E2Jk4"
+    "f8ZlQA2zVuhNaau0KpQ/iSAKdsDv/wOIMx5rWw7DLCDO5rJxo5TggUafjdUr0yB6Yyje0UKh0W6U"
+    "goa30RJts4JU82RY376Ln2sopzJUyZkzCMf8Mp0788rVnetFdYA298MEeByfx/zJ6Mspd24dH3XN"
+    "KbBGKtIow85KzhTcfLsFxXao2KsozJHMWXxg6IRDGrmbJxo4pvueOUXh4xAFb5q34B1vITghAK2l"
+    "xCPjO+gUCxnyhBj3YXuM+aEFgjNkbBb8P91sx1hiwN8lOhMzHn5WleFao+IlODZJkycR4r/FWQ13"
+    "4syWKEa+KBP1Ml4vjdTmVeXcH3sE9m9QSwMEFAAAAAgASZxSXVltW8VuBgAA8BAAABQAAABhY21h"
+    "a2UvdG9vbF9pbmRleC5webVXS2/bRhC+81csGAQlVZbOWY2MGonRGkmToPGhgCBQa3IlEaa4xO7K"
+    "jzjub+88dvmwHKOX+mJxOc9vvpkdxnH8RRlbW6daJ+q2UndCb+CHdbJpVCWc1o0VyXptDq2r9yqn"
+    "g/xtK/fqNO+k263XaR5Ffymrm5u63QpJOuJgSVs0YFuoG2XuxY1qK23EAbwYsV53sryWW2VP1msh"
+    "26oXgnB0Kza6AbEIgnE76chmJnRbKtGBtlEbZRQ8cYQCwyEjcivrFuS8tU5aK8iGisCjUZ00qrg6"
+    "1E0FXkvdgtQW7YhG6y4XlzvlUcC4Lertyet8HkUC/h7iqjY2novlEn6o0mlzn4k9QlO0dpWJPM9X"
+    "GYmKmLAC2Yc+RtDz2EoHWbL442MEwZEwBLWDxK0Pn/Qg/PX6bUDr9GR2QqIBNnwH1jba7E/7N5lo"
+    "1a2yLurhhKidSOabQ1vO1//Ici+vFdTPWFW4O5dbtQfR4lrdQznBJmYJDmwrO7vTjISviY1ud9oq"
+    "QggLXjtRIvwbo/fzaV0zoWS584X3DxAvP/toQ/XhXUT5spcM7F+r2xocMWEwgJBoLi4YRfSvkQ57"
+    "7ckXfDF0pgeg3MkWgoJiKiYEpkB1s+TfKGIFJ0oUACfQElbswXj9DZiGxOuMLpW1EapYKD4cD+Ex"
+    "qoBGCQ9Jq524rR1mfPbuz7MP58X7i68findn7/44X7yhtonjOIoQN1EUm4M7ADcLUe87bRwEBQaI"
+    "JTaK/Fmjt1tIMzxqy8qVdLJsgOqQi3/VH7EENmpTX4W3X+DRO/ZMqGp7XXDgXiYhEtNRgepMauBF"
+    "Edjen9gCWEX4VuEsWCtUK6+acN5oWRXQNdr4A4KwP0knIfXkDBENHJ3IOSPLPupSw5yC6uNZFUUA"
+    "mFgE2PKtch/hpzJJzLpxGkXF5dnvIMPNmlPloSjRbz2CCTj7ptrFpTmoNKIjcQnCFyg6pzRejabQ"
+    "L6di3OKhaUJHcieSFnmcA1ilW1qHnD10jeKfOBdWPb5z/2okULfOTxseTJXaCD+jCzRMNbOJVc0m"
+    "o8DAiFXkaJVikINbPOI8aGrF8YvT3o/TkM4kV3hFPQ7/Z+RzliPFg2l9cPMnfgH5h8deAHqbQYQZ"
+    "bqGcqkrITDqEh3/oExQxNx8hVJYk06kc32RTZR/IchNPk3xA/UdKMsawUHP5ZiV+FvHJkIJR0KUt"
+    "GgCOvBJJGHZYpqyfT8Jo7VKmApDkV5g+qrxW/npC1Bxp8P3RT9kcyPj588fi4tP787/Pv3qsRkVH"
+    "xLKBfB69KMLiFziPC2RLgpdcC1Bjm2eeQPj2KX+YCPQGRT0JUD6XXQeDNElA1ptLs0nzh9OUIXfm"
+    "fv4UJF/BjsraYU1ZJ6+dMmArSbFCXV7bgp7YkrorVefE56/nxmhzZHS5wubk/k5SytyWsmXOE9p9"
+    "TdBqACFUpsDK8KH4Lj7hbbCgfwTFk7Z+ATnQWnJ/bmDiVGNaD3iO2I1uLSr5JegkbAcEjj8EhCZV"
+    "HNLgKqbsEUEbp4OXFF42mMYIL/QY6jiV752nUeg63vMgAFKbTzqSZts0NhL3QU3bi+CAdcJBZeSh"
+    "cSSaY29lgFiaqzuHAR215E1uaIVUwAqC5BmP3uFEN/1vo3SoRJgxGY+RYdJw5MDNvQUuDlmhWI4y"
+    "Cdw8i0buryopuvnoOko6ShA6xODeZpW/K4IFim6JIhgHhcaNlQ6tgV5YwxO95yKDvRhBvmATBEbq"
+    "2///4D/M7ovwSTAbW53B4GsOFg7HZmc/WeH3WNj9CA3cqWAL2ilAGa4J1V8HxMMFbDA0cHN5ZfH/"
+    "lKfpi0wXqoENzpuDIoC15MjcKGaMB41yC1FaCzGZt3SLgKU0dBlLjX3i2jddeBLeFZ90Aq0hSTwU"
+    "JcctMk6fTjN6R4cYLwQ07FuJ79FMzDAmjOd4rYJmIRgwOE+ekhaefs9KaHcTuOUwnujnCMZeH7O2"
+    "dKfDR08CJjJqqvS5zOHtkj+HVi+mjmGPUg/YDwSfNDSz/YG/lpjo1BvPNC4FwCitQuM+ZhNro3bx"
+    "TcOGql7fJzCo+WsIYHkpKbx0nknqpbvoSRcOyrCf5hX0ypY9eGOvYaC95u/bxKbAg6mtRrWee4RA"
+    "OorluMrTGc0keTiawf23LY7dCVIDyVfZsVr/nctFI+0f1WwU8g9K9jh5Gn8hjLiMw6XklCc9vIRe"
+    "4e0tNNak0/4FUEsDBBQAAAAIAMCeUl09Bti5RA0AAFAjAAAPAAAAYWNtYWtlL3RyYWNlLnB5tVrb"
+    "kts2En3nV2CZh5CyTM/UvmzJq1Qmk/HuZB07NXaSrZqdoiARGtGiQBYJzljx+t/3dAPgRZIveVhX"
+    "xRZxafQN3acbCcPwhzYvsqfVRjZKmFqucn0vci0uN3W5syNKqAeljViX9U4aES0WcrWTWyWePrXT"
+    "ZWuSd02pF4s4CYLXldLCbJRY54UiUhtjqmb27FmbJ5Wq18qYMsnUgyhrsVis+BzMurMXi0RcPah6"
+    "L2brVq9mi6aSeiHyRshgVe6qQhnPDxgJq004E+G/QxwtSi1y0+DoWsns24Z5306FVo1RmVjuhcl3"
+    "KhHXWAMR6vtmsRCbsshmQTDBCO1Kl3ujaPwZBh7r3Bil/diM1qw2svbT7nemCiMbsYYcGH1W1eXq"
+    "WaOK9bO8XCwCIaKXuW7fg7ti/1zIonAMNqIq2oYVtdrABII2qqZRjcB0BY53SupHTKmpqPIK47le"
+    "FW2msvg5M8zb0lXVpjtm7/KXX1lEUa6PSJoNLLfOdd5shpRFtCnLbTMVlz/DoFNw+yrX76SQOmNd"
+    "ksaxrG74SDW0y6pstVkI/kfV9gBoRN+POYf9pd47mUW0kisIvCHaOAPn7XLibyqKfFnLOmfpm5XU"
+    "WmVTkSRJnIi3pZEF1tdKNKasQb/VmSLnKaG9+kdpZOLYgB7ggY5DTaKk1n9AoARb9b2yKsc6O12U"
+    "cDkBd+KzncnZWUggq4261VPYTwXW7+DE5PJVa2hUqPdwNBBkeqDFbtckbi/oN2wVEqyQJn/ApSpZ"
+    "ueWjhkCyNtMAzJlN2TjPtrLKIr+HFmg1ccwrybT8AaHg2aXxs+q9XBlvb7sWivg9B9XWgDl3VcFe"
+    "hGun9APGLi5/vvjXVfr25uLyav7i+uUVXSJr440qSMpambbWYGdNJoYGxH1RLmURwIirbRKEYRgE"
+    "7Phpum6xVqWpyHdVCU5hQtjN5KVugsCNrUoY6b2Brf0IWcqUZdH4AYoj/jd0d4+Q4D/LbpH1psEU"
+    "KdgyUkmzAX3PxS/4tBNmX3Fos+OXuIhySQ56DdEk3Goq3u4r9ZusnUQ2xvVe4neyWV+W91dwmf1U"
+    "cNToFgUBBmdwa+GXw5vLtl7Bd96vVGXENQ9f1XVZz4T4Rvye66x8bHiLXyvm4hUpG9PgWs0EHAF+"
+    "fyubBr928JC7ICCW5l5Fyb0y4Ole1VFoGQ/jIHiBBU6oKHwRTsUStySbe9mxIv3l5vVlev0aC0lT"
+    "UTgKX6DxjXjL7kzB396fzDm2yuguWa/ELYQmV4WSNXkodOKjnMgzilvsow+5elR1EqSvrl/9dJG+"
+    "vf4x/eHizRXOPk/Pzs7ovyAIMrUWaV6m/kZHsXj6nTAtIv9trg1FFHMn/ssaspruVM4f8C9Q9IIl"
+    "bB8ajGJe48zw+o01QbfPujpT5bEHCjlzkeUrExW5VklTFbmJKNtMxXnM+qBxFg7k7TyNEMf5WtBK"
+    "mqShOBgcAf4jok42i0LOKCB5FsfTg6nHfsrrpQ/5Ti/ropTGOdy6dyCky14/g7PPkjPLSgvZ/Go6"
+    "rW4bea+ibujm1zcX/7hKL/95/fLHm6tXIwHqNqnbtOVU88R9NXwDg2BVwEnZZ5RTLmLEZVkUakVJ"
+    "2Ic3pBdvX3IYcnYXuxKOKbSRBU6RskyaRuSRLPBYLBpOqjyDNCVrDb+dobtpc4ZZTv2EPrxfpbo5"
+    "XGiZm8Fijbklw99h4+3deJFne8aucduY2nnkXHz4OF6KgLDa0tk+WiUvMXB4aurggCPILg6qJwna"
+    "OGMTDObPekXp8jFtm15NA78YWC46rQbx1GsqBrI5xz1MBqRlljHdqbWe5fOELR6RbAaC9xMHCk5k"
+    "BYSYRfwV9+eYPOv5hxoGd3qkxFVb19jp9DZQp2E/MEmeUZbG/TzrpnImzwkTV3Ks9xGfnxXiyGZJ"
+    "owxYl21hoFoAFpNouVPxod4xNzDVwIhOsXpGAh8LjrtwoxpVAzNM9MQiC46op6Px8y5hW/hdN4av"
+    "01cJx8spch5E5ycnfO/YtGPXfDIXekwc/Oak+poAYqTjLyj21nLzROR0D9YhUxcfulF47DGf5x/D"
+    "Q8Xzhl71WblqKX32fka+3PNCa3bKyGiLrDwTfLlhO7YOIKpcqoJHT2wdHPohJCdA/CcqU+FqlJ9D"
+    "+pln+O2jFgYMD7DvhFSS4KPbzud9/Bh8nf18VTEXDQCGsnep99TcqB2uejza48LxeIsdnIqt2s8L"
+    "uVtm8K6ZULehacK78f4uhrtEOSTj57qT+60kH+25ZV2HLvKnLDbSHanCYZi7gz1Puk1WLr+HFcj6"
+    "spm5/7bgg3Vwd+gdH0bChIyQr1h6aN8d6HQ0HS/NcqR7uX+LcPorEhTZd9eEB4u66oSN6vWBD//z"
+    "Y78BVg4sEr+ZufTpMI4Dgw4BMN5KXa1sIcBBsn3DiKxWq7LOXC1vNsADvjaIEB6BQQ0F3y46WFgv"
+    "HAceTrjPYzThJ+bu8GiEDzwVy7HjNVWaMGdmeV4C8s9O7KGjKEgPJKaSTLHEKiJwP2OkylToRyf3"
+    "77TOli+QF4JbFSBCorhaA5iiUpoQgYmIRs2Nn968fiXK5TsgFNfi6PViaoqIY61g7BheyRzF2w3M"
+    "Co9gZBmFvpnyKK1MbDqVhVZXxElSScpkyW6b5XVkP5r527oFmFbvgULScsufgy1OHQRoqVRKsnZX"
+    "NZGpky62AUc2CsSoqGnmUTilwDML4xjOHP5H40vpVUm+MQ9bs376t3BkPTrFqZ79NKKL4GKhzVME"
+    "2A/yP/R1kWU2SZVdT2BCW6HuZkOlLpXKXFxS8SpK6hLZHkTeNQ6+VvGU3Eml+hDh8CeHSWjkIEhi"
+    "xF+8W2KMMstgjDE3jRPghqo0lPB9X7Am7udOagDl2l5GCDJUzwqQi36BsI9gUzGZUFxnfflSk8Gl"
+    "u953nQJv2F9dd4JkQLG+LLO9gP+QzByInot9rgqqqYZdLKYXLRZEEJ/QVbleUy+OSP8mixaRrGoJ"
+    "+7h2ARPB1eCNAGOirXyVxsfAR5L7REiqEQBuRJP/oRLP6J+6GXxSX1YdmMpBtjoxHW7PS8Lr4wqQ"
+    "J1D18MyoBvqcwf3+M5+eBta2Gzn3YdSh5/i4nLTsk5p5aJ1rFM+D+aytxySATEyPj/Ly/LQwTmMk"
+    "7CDk2b4b9gzGxlmeOLkN+1ZlSF6MHbdndzgZ5PDjxIZRK7Pbc+73nPd7oNcjJWMVKX/IOC37Tpyd"
+    "Ym7YluSjauo6RLRj4oqLqfhrr4ZPWI/VjXu+nYoH9s36CFIcg0hw9iD+Mu9Nz7d6S1f6eHHH8pa4"
+    "fCApj7cNwwdVQiMqH45oeuzGgeR4FhGC8r80J+Z8K/vEFAOSQxDCM/A/TOHvUwQttqwZap4g2kHP"
+    "4zkPRU/qbDsji8B5m1wjqWkk5ocpcAWFDa47p5zfkXBU0VDjso4e4pEtibw34tERH8f89DVwPEAU"
+    "ABJd4B0DpZNhmMOv73vd3r64m4oXfeT9kSIvBeYZtXpt8UR9yZxeFHQDwDR+jIhczScsC8P13zbx"
+    "uIPxWMsqWiNxvmAeXvRuaOHpnIlQQlvrJGU8m6Y95P++a5AmRKkBqV5jRD/XGvhrIinRbB8PvPxz"
+    "GM7/8ZWS7omcqIgp0zHDrN4Tl+kUmUO8zbwedTXt5NMHSlN3wRCKkMS+81VIRC6TukZ91HVcB3Cw"
+    "b8iMerR3I6D5QSW2d4+Shn2SO3jjLm5PPf7oz+dq2y3hYjtyycLDdeu1SwWaavZJXuwq7qd/aVFZ"
+    "5/e5RlKZuVsVjBsEDnNxznbPF+VaTJj2xD5f0DOCVo/kXf5pBncWmHdi+Zz0HQNANAFss+8QmO3v"
+    "dqVhZ8tIJbYI2TWEEgAe+BeUau94Sc8irFTmxF9z8kV7KMdWXo5AbVFB7BEEJT0++LhzyQPfiJdy"
+    "L0rAyEJW3M+3bNIjR6k97lXuDYZelbbKKvdbICDMFQXu3Lty2Vg0U0it4FOZ7/q5Tp5r+tHs6RkS"
+    "1D7dEHqaitT6FEl9wD53PhAQ22afUnnABanSgOrEaNQxcHxzB1v+PrenHV+7bv8td0oUv6kdL+ma"
+    "bvlxvF3C+bfdKIXs8THdEV3jTmfx0YputlB6IBWS6nnsoJPtLxFWGnbAxuvjTr3RUL9WvfGUjyIN"
+    "/pFXEWvaDg3V9+cSddkkXFctZaNoKPJHfSp5217UqSz9pQTeXWjqqXGV3uGhTyX2nXwfnbEOqEdL"
+    "e+LPbfqqjO+baKS3z6T+0CqC+OYfn0nL9Le7pmRNtkv85fKpf5+NEGpT1MA2mE9Fn9rnnb6/vpAa"
+    "5WrJ6BOVTPeUi6qTXloPXoBzfqaaOEYmrna6oBD2KOsMfkaBlh7dfLDlrgrRg7chsJb0XPpYl4g+"
+    "S+CJXfeWa59s85ree5loRE+r8H7dFPw+Klqdw9FlDeT8oCho6S1XAuXy3aqsUDAbVcX/j/Krf9zk"
+    "l0SSXDwTYa+YcJDU6MBPZeF4kLFOlFQ9hrAFdrik/+lkYFOUuHJ4g/fjEOSqsD6oHpZhLAwxeJym"
+    "Kb1aAaaf4X/qmB8HNihVfroWoz/yNuRjuNDRwf8AUEsDBBQAAAAIABSfUl1vx5YNhg4AAJ8lAAAP"
+    "AAAAYWNtYWtlL3VuaXR5LnB5lVptd9rIFf7Or5hVeroSwbJ3+6UHh2QdB6e0Cc6JcTepIUJIg61Y"
+    "SDoaEYe109/e594ZvQFxtt6zAWlm7tz73PcZLMu6TKJiI2zr83q1SC1HLNZRHKq+UPKLzP1YBGku"
+    "xaGIo0Xu5xuh0nUeSIXXqyyKZSh8JdJEismlsOfzg4M1kxvP547b6QxBYiOWmCfWSShzMZ8TOXUo"
+    "Vfa3X+dzkfm5ArHiRgrlr6Q4y6V8Pzm/wIbDi3cHo1dn4kb6WKmEf+1HybHwBe/QwX7FjV+A4pMo"
+    "CeJ1KOfz6VQosc5EkYruuCvSJRFeNTZZgdVAuliU5RKvpcfSghE8xn6gZ3Wu83SdQbR+EPtK9ef/"
+    "9YOVfytdnuxeMALni88yKPSWd1FxwyBkEHHhF8FNT9zdpEoatEQE9jvXMgGgBejO5yzDs/Hzw2e8"
+    "13PvWfTcDcDHIQbdIMvwNZFfCxKFwEl5NxFGOT7SfHPMb/EQZbLXWcb+teqVkwI/wJifQDV5cBN9"
+    "wfec8A9u/ORahq445cHTp09ZM4qHmWuwpggWMBljiy9+HvlJ0euoW4lRTVIpuVrEkLM0hITshGhA"
+    "3yda16rwNyBLNgEdRAUs5C4BIjLBg1jxVhhPhPzKmoOGikLmibD7oV/4/fnleDT56A0/nL65fDWc"
+    "9zqVYR2YFfN5T8jkC8A6OX178q+h114xd0Sai/4SQvc11t4iToNb2NEcLCYh6SNIE1XkayDGhmQM"
+    "i5i+S9dxKDRe/U6ni23upH9r1FOtS3PzZq1kaL4qaCBKEzxBpDxarAuWVMN9HacLeJTWk+p3hIgS"
+    "ViT7WKUtsQLEwDQiz4o3cL3kFqph/FS6ksVNlFxD+UuZy4RUEBU9rRzjG4KEwGqz0CddwB6hGTJ/"
+    "TN00tqjowDIm4AV+UCzTfFV6uDZv0IQSloQoyXdg5FTiYEkqq55JcHBCOxu/IN1dB40J5BsRzCnM"
+    "00yBLgGwTmo2RLmJBo7Ia+fvITYVIklJYRLOZZNSRCih0Ijn98jyiigA0YaS8PpWZoUoOXBc8TsY"
+    "S9fFLm+VFbCrGzFWpJ0gDSXowtgTlouWU0Q5ZvNYK1JJghCmMoQRg4KfpMlmla5VPaJK6WPiPUrg"
+    "34eCwsyNRov98AAuIpWm/ITlI4oLuSRGCK5llKt26BP2SsJXKV5A9GV0vcbUMnQa+65pQ5CVvxF+"
+    "nGPGRtz4MDtDKqS4fab1ziGMPPoAzgPDZSmEn2XSz8l0IR+4ybXTUxRhnDEQRkvWZmHiCmydyagg"
+    "zSR5CauJYhxR7DXFpICqrZmTgnbQQ9JKmuBTJuuVQQxyUdjrFBvEarmsabEySAVx5CvjfrSOom+a"
+    "K4MgWNZ7kv8oGS/djmVZnc4yT1fC85brAhB6nohWWZoDvgTC+mwmnY55t0w4lpWPqSq/5VKTIdtl"
+    "VmkTPVS96oEHGYd6IgLgDTJsOekdHjudJ2KYFMifWQo7ASbxHYVV7dR9jSxZHUKqDlg0Qgaab3SE"
+    "KBNIVLidVnwUA+T7FTyKMo3Vczod79S7uDw7G30YXvCgG9Br7/TDh+33tEDgM9AfX79atPxkMnk/"
+    "enk5IdLIBCZ02LAzIXLL86pg6HlT1Z3a+E912X8fGp76EMrqK8XUB+OYznRhGVIPn7DwCf7Pcv96"
+    "5U/VU6ZCM3p6inTf9jrg/fJiNH7tjU/eopA4Od1iLLeIDhsKSFTeSVSYAtafjM/HH9+eX158n8Z0"
+    "Ua+EVPeA4gns7x9+Ht7BHS4k8mcs9MeRfeQcc1owOZJcoc/JsYGAyNeJ4kjPWbVO/SDMy6qo7na8"
+    "12/OX5688c5f/nN4OtkL/Cf7RV/7GqR0XlydHPxnNr3r4u2zq0/Hz2fd584LjNB7/+APj8ZILy/6"
+    "Uxvjs+7UofHusUGFYD0bvRl6F5OTyeh0B9JqKywe2LPui+nCbtJ2QOvKnl4Njmc1zq+GZ6PxXvWQ"
+    "mrWLkppbhOrll2MQ+N5qKjqXjywejUt/2LvchMSmVYxeDceT0dlo+H57UXMLNoQTQZHJBJmwTPWs"
+    "RZuSGFINwmsc3eqIqCuRlegWKF/69SsyMXGPqrDjTU5ea7hGk9H5eK/GgTipnFY+cMx8oMj3wBHH"
+    "ISRe6KIWXx/0NLaMHTWV/ob5/atP98e2M+vCFu4tsoHh+PKt9/L81cddh6DdpotyxfQedvQNK6ff"
+    "AIk3+fhuuEdb04UJ4QAas16+h6vtJ38PwiCnqZ1djk8JB+/d+Wg8Gb5nP91ZQoFmyla9LeLUYZ7e"
+    "n4zelJFie/XOGnKNq6tP0xmYmOHZ6f7FqmLNyZvRycVjcWaH3KAyrE6HUpgpVSmyeyr6Q9r11z4V"
+    "C+JBjNFnOOLgOT32WUnIWhemFqf+o6xi+6Jbr+6iXI5hbbs183x+jDdHiEwDFOtLl3IgUY2Wol5O"
+    "YYc21hvSH/JS/UB/jckD4s1OlYvdojxN3GtZ2FZzU8odR5bjwgKjzOZi/cipyKHGpzri3368lsM8"
+    "T/NHdjoyQR/JOmkx3GL/+UD8qgE4aiGtm9pIKk8mPrqa0KZWCrk1TWMGmb70Szx4rGLF7DnJ15Lf"
+    "fSEAH5HZezOCZb8fDS+2pHfj9E7mttOU5AuXuQgZtqVn45+lDwHoS5LSv1CW1bYb0xt5pptSNvJ/"
+    "7vcRYlRxhc1mxnzAaGVF1ZgWjOzjB2KYGoJYsFo8X3VbE3qiqxkg7V7NHHrOBEpYkZFg2MBVWRyB"
+    "fM9yCN6sBMSZtZWENmztX0tbd5x9ro6Yecw3IhnuUe8MTGPqqvVyGX1tgYtNaAp2b9Q7Oxq1Amtn"
+    "dqMO2jMfNVETCGKo7dCm97QLEOwT2z1RSsWP+1QBR/z9BjV6eYbA7UGXKHTFaq10I6RuqOxutK62"
+    "XGXFpq/77I1TuTMKfUUdFcGTFzD0+6V1v3L59MH+hT2wfPrV+VY3rxZrbMUoVEWeSy10BBtjgZxv"
+    "FbrbRZerJHW1eloTOGbGpU4iCW1rq3uyanp7irA/SXNP71XTLcEXg4FWX01nBYjalVVrw2oeqKza"
+    "cWmLg6XVavdFhfZR5fk/5d8MT9zQeabeIA5MZbK7N8Wh1mTqbkwR1ZzdE0e99kzs6ucF3Ov7oJku"
+    "bLfVLBvNtseb5cbWPZPFPQa8tnXtqnLLtsfcS4YS1UiO6mix0Z0LclHZz7muSwWzjRAN81+kIeK0"
+    "ULcReA171SGB7o64y03T2t6Zh361Ldk9IpkBu7JoU5Bs2XONT4g8dNMTESWaHhyEQKpNAI08VeTi"
+    "GZr5ZHsp/QVYR6+volnrPXQYsOndW+0F1Z7i6UD80hqScbXq23dXHTyy6tjSxyk88RkE2iWygEJv"
+    "25y2GSnSrCcSjrKUl1g2g4pAzJltQUMzfxrQqvZeDTIJWWqj5EPYXtiWsHi8hprTBqyXq+g0a2SO"
+    "NuVlRs6ztzIsnYPIOG12/CimZa1SsDm9SkzbWlxmuyCy5bl+iAiQVfHV2dUK7frYahrfWm/cjueU"
+    "Ttc42HjU5X7kEPCvDftEVdyzV/hxvG3ZNBvOwh5Eq76rDA6ldcPk8mGJTUu/C+jqMUTqALoXjt+q"
+    "o5WOPh7yLgI/0QR1Z9qQn9+u/CBPt18+ERM+Tf+/j5X2NHouUyRK27tEoUyKaBkhcDVGeOi3LE9R"
+    "yPM5Ljk20hWdvpmwSidVe9TbwIPPsozAKI/4UUtaPjFDpQEpgLRlOQ3gDE1+Y1c7GeoDMqHmiUDb"
+    "ZJxenVV5fz3f5Kr2VHHA9qjb+e+SYcYHdstGeFm7M95a35r+sC9PbU/RrNRN3Q8IbvtgPaHBe0Pj"
+    "GoeGZ+yTt6ztPT4dtlHHsxJ6YmG+bTUoZQ+EF7bvNkxG/FUs3MbuVOsttib4zQnOPmfia8J3cWkX"
+    "yLMvzT1OuuS7L/ZNeigvhmx6W1Va0g9QtJfnuvriKZbLAu6EeZy3mXB5YKzLYf6H6v0ZRSw+MLUB"
+    "ir+OC2/p81XYgOY4xnVNrQxgdG1i2gJ9st0XYRRocnRTkH+fJM0r8c8ggtdozGEyOqRoMQ2jzGNP"
+    "bPXrvXLvRhPWYb3twvnOD25F11Dt6quBRQ2xj4I+RSXWbOo1jKbMw7+cHukoGSoOZe5qRMvDAX0L"
+    "gLIukREf25+ihcjpYqpiMyTboLsYP6R2WM9Oy1P88Li8RABDTJo0HCm+yaH7UptOM/mAq7o78pVY"
+    "q7UfO24pJ38SqEC/QsEkIsS9xKssgLWlmyUCr1hnsbxqos3f2RdmMzaQ+29VPlN5QGiYbsfASjdB"
+    "MBh/tQh9kXHAs7NmQVw3BjvNZx60iv9q5s7RCP0FKZwpMScDLLC54RzwqXw7grXaYnMjSsWFvl1w"
+    "zSdx4JK/9kTG/drOOIQhLmm8EXfojxis37TkKBmDGKTpXVFIVW5pH1fYgN3GKm9x7w0B6mUeh2Dn"
+    "yKgw/TrkIovz6NmWSYBKP7keWOtiefB3FIKSjoDUwDJX9NbOQdH5BZ8Ska39Gd4JJ+k8zmvdLu/p"
+    "4OvmvYWkWfMnOOCrk8/oW2yz5gfcUIqmWqpK1e3CWN/l0u0nxhVZUdOPUMgWJr7ZJd89OpBpM0om"
+    "jS7G0HLQ1DTOzyhs85F1srFNPlKcizCRnY1djXZ3dgs4Q7JsMluO1JSwnkHJ7QfNCR3mtbdqynxV"
+    "CjoradqMPeQm4jOnrntrP66CRZNSQx5WZQkqlEBkV1oBaGG2Ya9ZqKB1xHPxS6t0JZImzdzlKIxN"
+    "ntHRyqZIrk+7eiWIzWzDeYS+VSmkdSGs22lzz2/zDwlySbsU0vwWgxIxkTO/dKBEAmHGUfLZrxtp"
+    "46TW4aF4Xf2ABd26/kmMML/LOC5pcMpIsbXZyZ0mlngK5rS913b7c8mqoHOoXKo0/iJtx/WVl6Uq"
+    "+mo736xp8nPdrBsETG3ErDUDig5lN49EEofaYC50t45ttCp8/pHDdlBpqJ9qIf0F29CPh5LCXd2G"
+    "UW7rBzWgs2DKpcDUS2/50amXaA0zazqK7DDY2ebnf1BLAwQUAAAACAA3Y8Vc4CVESGwFAACCDwAA"
+    "EAAAAGFjbWFrZS91cGxvYWQucHmNV91u6zYMvs9TcB6G2Vvq3qcnBTasAw4w7BTbwXZRFI5iy41O"
+    "ZMuQ5KY9QW/3AHvEPclIyfJPkrYJ0NqyqI8U+ZGioii6eWpYXQD96baGRjJbKl1B20jF8BvPRcNN"
+    "GkXRbFZqVUGWla1tNc8yEFWjtMW1tbLMClWb2az7JtXDg6gfwtC060arnBvjQRpmN1KsA8ItDjt4"
+    "lldsy9N1K2QRpn+mwa1k9UQkV1VFZgcVjRQ28/ZO5FBxw7UV3ATRXEnJGsOzAncpcmZ5RgZlRjKz"
+    "4WYO3Dkls7wif/DZDLcDy7Cp9IHb3/CV6zjyOqJkNpsVvIRMmYz0xR6BFwsoRG7vjNVzwH/3c9jy"
+    "5wW9JnBxTc/FDPCH/v2Do1trsBsOn/68MA3upBQ5PDItWG1BlbBa4eLVag4lkxINgTXLt2CVW7Nm"
+    "hhN4OnOAn2r4W9SF2uF23Dr4EaJ05z9FqxUIA1YLXkAptLFXgFEHhAWFYLrngXFgMfl5t+HeutUq"
+    "4CAMISMUWxte22SwpLOV5rTbGC9Sh/V5g58qobXSpoOzSkmTfqDHdZpXBS67PPF5pFUqtW0bh2c3"
+    "zMJPumhFreDjLzeOysyPL3IpAIPvGO3s15wV5Lmwv9Q+2TREwD1FCX30KNJxhHlhRcVTZaIE0EtR"
+    "lKRS7TD8CSyXEAWn+kjSb4dkmWCU0R7d8dL7f+5AMPqiiZN+GareDSD0866D3Ww0mAAj6hSr4yE5"
+    "LfM5nOFec75RsuA6Y1JgdMwb/KSVA0Gnsz1XO39fGPssOZgNZZVVW14baA1yStRGFEeh9fakmGuW"
+    "6xpp5Kn6sf7Cc+vJQIIXJseMLTzsBs00x0G+nISYctBBsUcmJFujTZ0FXRnrVJrg3T3l+8vY0/Df"
+    "P//CxFoSCeLIvqn0sTiKYKKMMzdEu09hHJsQ7f3UGRnTD+blGPWE1AFASUULiw4vxdPrAGOpqZXH"
+    "xoVMUK09pAfyev/iJht8Pap2WJkir31PjxfnQySn9uyMLqMk5FgzEB313EVOkvB9VudnwaPPB8T8"
+    "AJEmCTD3zEDPZVSslocgJ1zcV4J+lRjy7kDNqeX3o/y/Cxj3bl15nuNOhG3YaXnovFPSZEPZjAsH"
+    "iobyECpDZ3R3RD6TmWeXhvHZdYs68dQY8+rN3E8/KHONdbw/U/q+A80TNR3VNg081Aq3cn5Ndmvc"
+    "GfROqPsok4LTdXzrMPaENhTvcb2eWLXbTmrx6VK+PdCKB3n7NNIpJzr97Ksa5Rka5aHGiuXKjFVW"
+    "E5Xd9Ks6qzN0Vtsx8Qi3Y17XWU359wblDMfqJDNq297smgICTEPsuhrXkyg8L743YZro0POLBocH"
+    "djQSPHFao0+w5/UJ0e//JA6m1oNmVQ/EHvHcKvgBni9MZ6WlT0O/zGJ/eqgxdAQTO1HuOF6aCUyS"
+    "v5hs+Q21Y/EkkmVUCWOoV5pcBYAamW/0yxWdsJYaxlxpTimYbzh2o87RYzcPRPIm5fYJTaY491vq"
+    "JzBBC+y347Pbl84ZPcBd5AmTEmFcCRwRyAl9C7cDngEptrilUE36rtC1B5eudlymaQo5q+FZcLyS"
+    "XGLnUWJ0vNMNXnquOlzDKo7e1hUa+dVdh4CZ9+4amejDTBcUXONvPuHeNU6jd6Dig1tLTFGfk1eS"
+    "0BbiPjuvxihSL4ab1XGmzeGHORT6OcNFCwyr4/avTBrucvB3VXNPJWp8lq8kNmlJh2CNdCThVH6k"
+    "II3ubjHiTchLMm+QNpq2eEMlwHsResI+Q3dR7FICL3GpqEsVFi7gO9eP4+3oixJ1TOqS3oDggEG/"
+    "i4UbDpfaFEXcwrnPguVn3XJ83xVL9KT3gotrVgidam6UfORxgmr+B1BLAwQUAAAACABDoFJdyZvs"
+    "QwoJAADAGQAADwAAAGFjbWFrZS93YXRjaC5weZVYbY/buBH+rl/Bc4BW2nN07fVL4cBFL3cJGjTI"
+    "BdgcUmCxkLkWvVZXJgWR3l3f3va395khJUqyfcn5gyWRw5nhvDwz5Gw2W63keifvlFibXVPVSrx8"
+    "+SDdertaLUSrbvZVXQop7J3CmHjYKi0qZ4U1+3atrFhvpb5VeZJ82irB61QpNmBjhWyVcBgNSzem"
+    "LlUr0ofKbc3eMRfPvaxatXamPWRzXtAagzmzoY+krvQdWNbVTSvbitjqkqnWBvzp4x7jUrsgoFso"
+    "FutaWrtY/c9vL2dZ+Wv6/1hLvVokYQ9zsVWSVs7FasVUhWlcDgMweyWhvBd/+LMFSXjPm9Y0qnXQ"
+    "abXKBfZ/4C03pq6h8M0BpNZJBzapNkI9ulaKUjVKl0qvD/Ok24iVOyWMFupetQfx82X2Cva+2bfW"
+    "0VasvMemK1ia+K4dWO+1q2rQkCTYWpdWaOO2lb4VWj0kG9My31LdmL1eK1Fpp9p7WedisVNuu1hd"
+    "skc+k7dyqHirVkJDCQv3SheM2wnzDraJVqr07oGLZaOg3aaCjoskuRCLUjq5WL3+5d37nxA2Hyr9"
+    "X4kt1QeRyhAqAlp5OwtVVi57FZdd/vvNpx//hXWDaGlaBfvCO9a0LFYHrmAIc1fawK7f0WtTKrxO"
+    "eX58/8MHcFxsYIFpDBBveKrgLzj5Vlaa+FLYClmW2DWUbdXO3GPPiZiGxVzIM2EgUmRTu95WDsbb"
+    "tzREQeW9Th/MrNLrel/SJAIekvrs+q6LM6/Kw9ZYBfoXYQH4W+WCR+CMh22FRWupwZXSRCAIYN4+"
+    "VbI8mc1mSbJpzU4UxWZPKhWFqHaNaR2CG1EjXWW0TZIwZmz35qqd8ivJoJxLFId+sh+aQ1NVl56w"
+    "kW4L4R3RR3wG4UPzd9N9Jo5IYp4Hss5YBVEVPpaShCNNLMWMWc4SH0I04E05SygA6LuBBNig+PwD"
+    "CN78VFz+8vbtu/+8ucQcOP6qNEyawoBCPM0orGZzMaOY4ufa/4dH0/jn4yM/L/nf8v/W/4dHINwG"
+    "Qofv5yRLCq/lUIV0LBM0vLPi54+f+t35sJslL8SbkkDTGcoHRAalJIIHOS9ol3NOX0IRmq9aJDES"
+    "X7s8KcgYxdt37yfbforSoMFxQM+esyRJ/tl7O+F/8aOHhAVbjfNlQYF5ZV17TfwpItJSbeS+dsVG"
+    "MrQvQZDxgpBXf2TJzpQVSL56DS/CDIK+VrooUqvqTSZe/oOg0KvtNUFCaAESJsh5K5n4No4EXUdj"
+    "nTJkGpYRql5KEAoNXcuSboypvahqw+gK2WLgiCM1PrV7lQy+kZy8jhC6dZbKJqJllnFRMjanbMtt"
+    "UwNrHh0Lz67+es1SprHeaWqBFSlVV1ZzDtipmmhTYNEeM2W15m+g7r6p1RVMNie7XV/zvj4Yrbzu"
+    "rj3ETSDOOGuXgB/rUuhHwlDZWV7m/age16pxKHFv2ta0UwvwJxUvNlVgGIlG4oJdVV7ZgoSg9tfm"
+    "obCHHQGhXb6VtVXZmL7zBeyq8rOWVWxYpoIWbKEjLvTzxvTU3pJsv2xErOpqECBe6gmtUEuXgtVx"
+    "aXY0C65XXg6FfWodCIsd4XOhAcD+21a/qrj0nKHpR6hQacRaCIoAsAUBAgmJIdwDBYfHCaeT5QTA"
+    "QqfeCuhrkBz6djnbu83LvwPWFMm3yxkqbi3XimxsxWasUIj3CEunID+lZJRlmn1VKA2Y9WmKrN2k"
+    "aBF/L8LnBKZfTIER/gWBYSztFWEwWYJdfqcONsVCAeHhYz7QlxFmGedAGFdFwg52lk8NJ0lD4TlY"
+    "9afBKgpzTF011+KbJY3j7dmzInN4FB80gX4n6BUutWzs1nDjyb2gDC06vi98ZaV0uyBjGHHhyxMP"
+    "kHNs7pH3c+jwpbigunQhUmrsuFsM7Day4h5ZbaiJB6LAn4ANQlruGo+ODR5IbX/C4Ezlftl3Qwir"
+    "O8t2GfZ/ebevYUWodOVQEnrDEqhHM8dNLriBiTP9ZqcTtMdFbGfEb4yRSFV6RLKL+No15AuxqY2k"
+    "5P9L/rc43TXuw+nvg/vGENzpn0e1QR0/kDPW1PdqgCpM3u8F1P37OeJOW9B2r2OC/qCx7FUfE4Ax"
+    "gQuMM6jNfpCtf8aEJzYLX3LE+ugM4cWxhwZ+A+VCP/QVfX+WU2CM9CR22AQ9+okX4p2HI6qTVuyk"
+    "Iyk4ByNwu26dDbenTjrogvjd5Uc2IOOWhT/dLgUBTDpxXnYdgeHryJDprHXFZ8CJtegHHXs2eM+J"
+    "b/R0xjnDTbtmRrEBvx6xObWHb5fMfQzmZ2dIEOCJBKW+sc3pCM+FjRpgPxQO8370dAFnNdVjAwxQ"
+    "ZX6LIALbE6S9Orls6PyVkgkoddMRhyusvs4GJskGvv+gCJXCrnBE7DxeaVuVw+uNjM/+1BNoOj4i"
+    "Bab+7/w5NhebpSWjUNHJqeIxhjP5uBcIvYvUh7QlXDeMgu2wizFoVKn1Uo13rCHGE1bXY738Xc0y"
+    "wAj1NEfp76sxaJ7QLY77hSzWogE3aMpfRRcwIHyOmc9S+pb8fLGNLv1CY0qqPffEbFET+rfe9OP4"
+    "iK3wXDz1GdZDYfY8aeZClcfYoJT0uwsgNmqeYv8/WE++83179Fk78Vkb9R6l2wA6H2TlogFH7Qj9"
+    "gGuva7O+CxdF3ie+ToarFD9B0evvmbboyuBPh6L8iod1f89gRzD5sKWLCTqqjO1J3Whua6WadFQz"
+    "xhG83rct+voz0RZivCP6ZjkIqePsvgHS3v1hvbr6lE3Ajbf++3r1RMtOxS8pNd0yr+9ng3kx41vT"
+    "uNl5tyo7naphdhpc3U1dzDO62gvBGSYXXbRw5CBWx6WVi2ogvfD3C+nobm8+ubMTk45rUlRJASjM"
+    "a0f5yYjRBVh3I3BccDrsyRvTpDhgcVdwnpG/izh23ASKThzAhsKobV5Oce680P5yYio3omLH+UQ5"
+    "i+B6TuCAY0/d5cZA5dP178TGuq/T9MFj5Mzpfro7hxtpFR1kCf3P3Wl8kR+fjMNsCBAuZ01ON6UM"
+    "jNPrMn8+996sdOHr7ml3BqmewbBXGkUKBe8kBmkotoJoqo4bqpBtox2FMZY7KBBRy6+uENPqcKr7"
+    "iwUj+T9QSwECFAMUAAAACADlaq1caqnFwVgAAABXAAAAEgAAAAAAAAAAAAAApIEAAAAAYWNtYWtl"
+    "L19faW5pdF9fLnB5UEsBAhQDFAAAAAgA5WqtXBviquhRAAAAVQAAABIAAAAAAAAAAAAAAKSBiAAA"
+    "AGFjbWFrZS9fX21haW5fXy5weVBLAQIUAxQAAAAIAIieUl0Fohl+hhAAAIEvAAAPAAAAAAAAAAAA"
+    "AACkgQkBAABhY21ha2UvYmF0Y2gucHlQSwECFAMUAAAACADhnVJdVJDb8uIQAAANNwAADwAAAAAA"
+    "AAAAAAAApIG8EQAAYWNtYWtlL2JlbmNoLnB5UEsBAhQDFAAAAAgAfJxSXYdh7PTDBwAAIhYAABUA"
+    "AAAAAAAAAAAAAKSByyIAAGFjbWFrZS9ib2FyZF9pbmRleC5weVBLAQIUAxQAAAAIAOVqrVyU+/MQ"
+    "wAMAAE4NAAAUAAAAAAAAAAAAAACkgcEqAABhY21ha2UvYm9hcmRfbGlzdC5weVBLAQIUAxQAAAAI"
+    "AKeeUl1kD8UM6iUAAAKIAAAPAAAAAAAAAAAAAACkgbMuAABhY21ha2UvYnVpbGQucHlQSwECFAMU"
+    "AAAACADlaq1cUyUL6YIEAAAJDAAAHAAAAAAAAAAAAAAApIHKVAAAYWNtYWtlL2J1aWxkX29wdGlv"
+    "bnNfanNvbi5weVBLAQIUAxQAAAAIAEmcUl2tgr7RVQ8AAJAtAAAVAAAAAAAAAAAAAACkgYZZAABh"
+    "Y21ha2UvYnVpbGRfdGltZXMucHlQSwECFAMUAAAACAAQnlJdBZgXpjkYAAC/SQAAFwAAAAAAAAAA"
+    "AAAApIEOaQAAYWNtYWtlL2NhY2hlX2NvbXBpbGUucHlQSwECFAMUAAAACABHnlJdWAcK4bQPAAAK"
+    "LwAAGgAAAAAAAAAAAAAApIF8gQAAYWNtYWtlL2NhY2hlX2ludmFsaWRhdGUucHlQSwECFAMUAAAA"
+    "CADAnlJdmwyCFJIsAABevgAADQAAAAAAAAAAAAAApIFokQAAYWNtYWtlL2NsaS5weVBLAQIUAxQA"
+    "AAAIAOyeUl1n/7obyiMAALd6AAASAAAAAAAAAAAAAACkgSW+AABhY21ha2UvY21ha2VnZW4ucHlQ"
+    "SwECFAMUAAAACADlaq1cUtFnMQQEAADnBwAAEQAAAAAAAAAAAAAApIEf4gAAYWNtYWtlL2NvbW1h"
+    "bmQucHlQSwECFAMUAAAACADlaq1cTLzSQowCAABeBwAAEAAAAAAAAAAAAAAApIFS5gAAYWNtYWtl"
+    "L2NvbmZpZy5weVBLAQIUAxQAAAAIAEmcUl2zmyfsDwcAANcVAAATAAAAAAAAAAAAAACkgQzpAABh"
+    "Y21ha2UvZGlzY292ZXJ5LnB5UEsBAhQDFAAAAAgASZxSXb3eJ6jJBgAAXxAAABQAAAAAAAAAAAAA"
+    "AKSBTPAAAGFjbWFrZS9kaXNrX2NhY2hlLnB5UEsBAhQDFAAAAAgALqBSXZsMLsfSCAAAgxcAAA0A"
+    "AAAAAAAAAAAAAKSBR/cAAGFjbWFrZS9lbGYucHlQSwECFAMUAAAACADhnVJdcmIkk6wQAAD9MQAA"
+    "FgAAAAAAAAAAAAAApIFEAAEAYWNtYWtlL2V4cGFuZF9ncmFwaC5weVBLAQIUAxQAAAAIAOVqrVx0"
+    "nz8H9AUAACcPAAAOAAAAAAAAAAAAAACkgSQRAQBhY21ha2UvZnFibi5weVBLAQIUAxQAAAAIAGCg"
+    "Ul2f0ZWQcxcAAI1IAAAPAAAAAAAAAAAAAACkgUQXAQBhY21ha2UvaG9va3MucHlQSwECFAMUAAAA"
+    "CAADnlJdL3kA5vAKAADdHQAAFwAAAAAAAAAAAAAApIHkLgEAYWNtYWtlL2luY2x1ZGVfY2FjaGUu"
+    "cHlQSwECFAMUAAAACAAbnlJdLmbzBWYeAAAGYwAAEwAAAAAAAAAAAAAApIEJOgEAYWNtYWtlL2xp"
+    "YnJhcmllcy5weVBLAQIUAxQAAAAIAPGdUl0O8n47OQgAABYYAAAXAAAAAAAAAAAAAACkgaBYAQBh"
+    "Y21ha2UvbGlicmFyeV9pbmRleC5weVBLAQIUAxQAAAAIAOVqrVyLGnuWGQEAAA4CAAAWAAAAAAAA"
+    "AAAAAACkgQ5hAQBhY21ha2UvbG9nZ2luZ191dGlsLnB5UEsBAhQDFAAAAAgAp55SXQ2op7cHDwAA"
+    "DyoAABAAAAAAAAAAAAAAAKSBW2IBAGFjbWFrZS9tYXRyaXgucHlQSwECFAMUAAAACABJnFJdiErQ"
+    "f+QIAAAVGQAAEwAAAAAAAAAAAAAApIGQcQEAYWNtYWtlL25pbmphX2xvZy5weVBLAQIUAxQAAAAI"
+    "AEmcUl36pK7qbgoAAK0cAAASAAAAAAAAAAAAAACkgaV6AQBhY21ha2UvbmluamFnZW4ucHlQSwEC"
+    "FAMUAAAACADAnlJdj/Ok5r4UAAA2PwAAFgAAAAAAAAAAAAAApIFDhQEAYWNtYWtlL29iamVjdF9j"
+    "YWNoZS5weVBLAQIUAxQAAAAIAOVqrVwfiF9j0gIAAI0GAAATAAAAAAAAAAAAAACkgTWaAQBhY21h"
+    "a2UvcGFyc2VfdHh0LnB5UEsBAhQDFAAAAAgA7J5SXUCChSm2CQAADRcAAA0AAAAAAAAAAAAAAKSB"
+    "OJ0BAGFjbWFrZS9wY2gucHlQSwECFAMUAAAACABHnlJdGC3tsbwOAADyLQAAFwAAAAAAAAAAAAAA"
+    "pIEZpwEAYWNtYWtlL3BsYW5fc25hcHNob3QucHlQSwECFAMUAAAACADhnVJdwxoBVSoWAABNRAAA"
+    "FAAAAAAAAAAAAAAApIEKtgEAYWNtYWtlL3Byb3BlcnRpZXMucHlQSwECFAMUAAAACAByn1Jdr6B5"
+    "eFsTAABDOwAAFAAAAAAAAAAAAAAApIFmzAEAYWNtYWtlL3Byb3RvdHlwZXMucHlQSwECFAMUAAAA"
+    "CABJnFJdWt0sICcLAAAGIQAAGAAAAAAAAAAAAAAApIHz3wEAYWNtYWtlL3Jlc3BvbnNlX2ZpbGVz"
+    "LnB5UEsBAhQDFAAAAAgASZxSXTq0iZmBDwAA4C4AABAAAAAAAAAAAAAAAKSBUOsBAGFjbWFrZS9z"
+    "ZXJ2ZXIucHlQSwECFAMUAAAACAAuoFJdDl5bBysUAABdPAAAGAAAAAAAAAAAAAAApIH/+gEAYWNt"
+    "YWtlL3NpemVfYnJlYWtkb3duLnB5UEsBAhQDFAAAAAgASZxSXbOVwKIUCwAAiCAAABMAAAAAAAAA"
+    "AAAAAKSBYA8CAGFjbWFrZS9zaXplX2RpZmYucHlQSwECFAMUAAAACAAuoFJdT93Zs+AOAABqLwAA"
+    "FQAAAAAAAAAAAAAApIGlGgIAYWNtYWtlL3NpemVfcmVwb3J0LnB5UEsBAhQDFAAAAAgASZxSXZVV"
+    "//KUDAAAGyQAABAAAAAAAAAAAAAAAKSBuCkCAGFjbWFrZS9za2V0Y2gucHlQSwECFAMUAAAACADl"
+    "aq1cs/IYdRgCAACpBQAAEQAAAAAAAAAAAAAApIF6NgIAYWNtYWtlL3NvdXJjZXMucHlQSwECFAMU"
+    "AAAACABJnFJdWW1bxW4GAADwEAAAFAAAAAAAAAAAAAAApIHBOAIAYWNtYWtlL3Rvb2xfaW5kZXgu"
+    "cHlQSwECFAMUAAAACADAnlJdPQbYuUQNAABQIwAADwAAAAAAAAAAAAAApIFhPwIAYWNtYWtlL3Ry"
+    "YWNlLnB5UEsBAhQDFAAAAAgAFJ9SXW/Hlg2GDgAAnyUAAA8AAAAAAAAAAAAAAKSB0kwCAGFjbWFr"
+    "ZS91bml0eS5weVBLAQIUAxQAAAAIADdjxVzgJURIbAUAAIIPAAAQAAAAAAAAAAAAAACkgYVbAgBh"
+    "Y21ha2UvdXBsb2FkLnB5UEsBAhQDFAAAAAgAQ6BSXcmb7EMKCQAAwBkAAA8AAAAAAAAAAAAAAKSB"
+    "H2ECAGFjbWFrZS93YXRjaC5weVBLBQYAAAAALgAuAKILAABWagIAAAA="
 )
 # codespell:ignore-end
 
 
 def _bundle_bytes() -> bytes:
-    return base64.standard_b64decode("".join(_BUNDLE_CHUNKS))
+    import base64
+
+    return base64.standard_b64decode(_BUNDLE_B64)
+
 
+def _write_bundle_zip(path: str) -> None:
+    """Write the bundle to *path* uncompressed, with an unchecked hash-based ``.pyc`` per module."""
+    import hashlib
+    import importlib.util
+    import io
+    import marshal
+    import tempfile
+    import zipfile
 
-def _bundle_root() -> Path:
-    digest = hashlib.sha256(_bundle_bytes()).hexdigest()[:20]
-    root = Path.home() / ".cache" / "arduino_cmake_portable" / digest
-    marker = root / ".ok"
-    init = root / "acmake" / "__init__.py"
-    if marker.is_file() and init.is_file():
-        return root
-    if root.exists():
-        shutil.rmtree(root, ignore_errors=True)
-    root.mkdir(parents=True, exist_ok=True)
     data = _bundle_bytes()
-    with zipfile.ZipFile(io.BytesIO(data), "r") as zf:
-        zf.extractall(root)
-    marker.write_text("1", encoding="ascii")
-    return root
+    if hashlib.sha256(data).hexdigest() != _BUNDLE_DIGEST:
+        raise SystemExit(f"{__file__}: embedded bundle does not match its digest")
+    buf = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as src, zipfile.ZipFile(buf, "w") as dst:
+        for info in src.infolist():
+            body = src.read(info)
+            dst.writestr(zipfile.ZipInfo(info.filename, info.date_time), body)
+            if not info.filename.endswith(".py"):
+                continue
+            code = compile(body, os.path.join(path, info.filename), "exec", dont_inherit=True)
+            pyc = (
+                importlib.util.MAGIC_NUMBER
+                + (1).to_bytes(4, "little")
+                + importlib.util.source_hash(body)
+                + marshal.dumps(code)
+            )
+            dst.writestr(zipfile.ZipInfo(info.filename + "c", info.date_time), pyc)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf.getvalue())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _private_temp_dir() -> str | None:
+    """Per-user ``<temp>/arduino_cmake_portable-<uid>``, created 0700.
+
+    ``None`` unless it is a real directory owned by this user with no group / other
+    access: its zip is imported without checking it again.
+    """
+    import stat
+    import tempfile
+
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:
+        return None
+    uid = getuid()
+    path = os.path.join(tempfile.gettempdir(), f"arduino_cmake_portable-{uid}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != uid or st.st_mode & 0o077:
+        return None
+    return path
+
+
+def _bundle_zip() -> str:
+    """Cached bundle zip (under ``~/.cache``, else a private temp folder), written if missing."""
+    name = f"{_BUNDLE_DIGEST[:20]}-{sys.implementation.cache_tag}.zip"
+    home = os.path.join(os.path.expanduser("~"), ".cache", "arduino_cmake_portable", name)
+    if os.path.isfile(home):
+        return home
+    try:
+        _write_bundle_zip(home)
+        return home
+    except OSError:
+        pass
+    # Home is not writable. A zip in a shared temp folder could have been planted by
+    # another user, so it is only reused from a private per-user folder; without one (no
+    # POSIX uids, or the folder is not ours alone) it is written afresh on every run.
+    import tempfile
+
+    private = _private_temp_dir()
+    temp = os.path.join(private or tempfile.gettempdir(), name)
+    if private is not None and os.path.isfile(temp):
+        return temp
+    try:
+        if private is None:
+            import atexit
+            import shutil
+
+            fresh = tempfile.mkdtemp(prefix="arduino_cmake_portable-")
+            atexit.register(shutil.rmtree, fresh, ignore_errors=True)
+            temp = os.path.join(fresh, name)
+        _write_bundle_zip(temp)
+    except OSError:
+        raise SystemExit(f"{__file__}: cannot write {home} or {temp}") from None
+    return temp
 
 
 def _run() -> int:
-    root = _bundle_root()
-    sroot = str(root)
-    if sroot not in sys.path:
-        sys.path.insert(0, sroot)
+    path = _bundle_zip()
+    if path not in sys.path:
+        sys.path.insert(0, path)
     from acmake.cli import main
 
     return int(main())